@@ -1,15 +1,37 @@
 """API module for HTTP endpoints"""
 
-from .api_keys import router as api_keys_router
-from .gdpr import router as gdpr_router
-from .health import router as health_router
-from .scim import router as scim_router
-from .service_principals import router as service_principals_router
+from typing import TYPE_CHECKING
+
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
+
+# Routers are loaded on first access: the GDPR and SCIM routers pull in the
+# compliance storage backends and Keycloak clients, which CLI commands and
+# transports that do not mount them should not pay for.
+if TYPE_CHECKING:
+    from .api_keys import router as api_keys_router
+    from .debug import router as debug_router
+    from .gdpr import router as gdpr_router
+    from .health import router as health_router
+    from .scim import router as scim_router
+    from .service_principals import router as service_principals_router
 
 __all__ = [
     "api_keys_router",
+    "debug_router",
     "gdpr_router",
     "health_router",
     "scim_router",
     "service_principals_router",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "api_keys_router": "mcp_server_langgraph.api.api_keys:router",
+        "debug_router": "mcp_server_langgraph.api.debug:router",
+        "gdpr_router": "mcp_server_langgraph.api.gdpr:router",
+        "health_router": "mcp_server_langgraph.api.health:router",
+        "scim_router": "mcp_server_langgraph.api.scim:router",
+        "service_principals_router": "mcp_server_langgraph.api.service_principals:router",
+    },
+)
@@ -0,0 +1,121 @@
+"""
+Debug Endpoints
+
+Runtime diagnostics for operators. All endpoints require the admin role.
+
+Endpoints:
+- GET /debug/loop - Event-loop lag statistics and recent blocking-call stack samples
+- GET /debug/profile?seconds=30 - Sampling CPU/wall-clock profile (opt-in, DEBUG_PROFILER_ENABLED)
+- GET /debug/graph-stats - Agent graph nodes ranked by cumulative cost
+"""
+
+import asyncio
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from mcp_server_langgraph.auth.middleware import get_current_user
+from mcp_server_langgraph.core.config import settings
+from mcp_server_langgraph.core.graph_instrumentation import RankBy, get_graph_stats
+from mcp_server_langgraph.observability.loop_monitor import get_loop_monitor
+from mcp_server_langgraph.observability.profiler import StackSampler
+from mcp_server_langgraph.observability.telemetry import logger
+
+
+async def require_admin(current_user: dict[str, Any] = Depends(get_current_user)) -> dict[str, Any]:
+    """Allow only users with the admin role."""
+    if "admin" not in current_user.get("roles", []):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Debug endpoints require admin privileges",
+        )
+    return current_user
+
+
+router = APIRouter(
+    prefix="/debug",
+    tags=["Debug"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/loop")
+async def loop_stats() -> dict[str, Any]:
+    """
+    Event-loop lag and blocking-call report.
+
+    Lag percentiles cover the monitor's recent sample window. Blocking
+    events (debug mode, EVENT_LOOP_BLOCKING_THRESHOLD_MS > 0) include the
+    loop thread's stack at detection time and the module it was attributed to.
+    """
+    monitor = get_loop_monitor()
+    if monitor is None:
+        return {"running": False, "message": "Event loop monitor not started (EVENT_LOOP_MONITOR_ENABLED=false?)"}
+    return monitor.snapshot()
+
+
+# Only one profile runs at a time (concurrent samplers would double the overhead)
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/profile", response_model=None)
+async def profile(
+    seconds: float = Query(30.0, gt=0, description="Sampling duration"),
+    format: Literal["collapsed", "speedscope", "summary"] = Query("collapsed", description="Output format"),
+    interval_ms: float = Query(10.0, ge=1.0, le=1000.0, description="Sampling interval"),
+) -> Response:
+    """
+    Sample every thread's stack for `seconds` and return the profile.
+
+    Samples are grouped by agent stage (graph node / tool tags) as the root
+    frame in collapsed output and as separate profiles in speedscope output.
+    Open speedscope JSON at https://www.speedscope.app; pipe collapsed output
+    to flamegraph.pl or inferno-flamegraph for an SVG.
+    """
+    if not getattr(settings, "debug_profiler_enabled", False):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiler disabled (DEBUG_PROFILER_ENABLED=false)")
+
+    max_seconds = getattr(settings, "debug_profiler_max_seconds", 120)
+    if seconds > max_seconds:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"seconds must be <= {max_seconds}")
+
+    if _profile_lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A profile is already running")
+
+    async with _profile_lock:
+        sampler = StackSampler(interval=interval_ms / 1000)
+        logger.info("Profiling started", extra={"seconds": seconds, "interval_ms": interval_ms})
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            sampler.stop()
+        logger.info("Profiling finished", extra=sampler.summary())
+
+    if format == "speedscope":
+        return JSONResponse(
+            sampler.speedscope(),
+            headers={"Content-Disposition": 'attachment; filename="profile.speedscope.json"'},
+        )
+    if format == "summary":
+        return JSONResponse(sampler.summary())
+    return PlainTextResponse(sampler.collapsed())
+
+
+@router.get("/graph-stats")
+async def graph_stats(
+    by: RankBy = Query("duration", description="Cost to rank nodes by"),
+    reset: bool = Query(False, description="Clear the statistics after reading them"),
+) -> dict[str, Any]:
+    """
+    Per-node agent graph statistics since startup (or the last reset).
+
+    Nodes are ranked by cumulative cost - total duration, total LLM tokens,
+    mean returned state size or call count - with each node's share of the total.
+    """
+    stats = get_graph_stats()
+    nodes = stats.ranked(by)
+    if reset:
+        stats.reset()
+    return {"ranked_by": by, "nodes": nodes}
@@ -85,6 +85,9 @@ def register_exception_handlers(app: FastAPI) -> None:
         if exc.status_code == 429:
             retry_after = exc.metadata.get("retry_after", 60)
             headers["Retry-After"] = str(retry_after)
+        elif getattr(exc, "retry_after", None):
+            # Load-shed / overload errors carry their own retry hint
+            headers["Retry-After"] = str(int(exc.retry_after))  # type: ignore[attr-defined]
 
         # Return JSON response
         return JSONResponse(
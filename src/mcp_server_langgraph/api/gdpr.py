@@ -17,10 +17,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response,
 from pydantic import BaseModel, ConfigDict, Field
 
 from mcp_server_langgraph.auth.session import SessionStore, get_session_store
-from mcp_server_langgraph.compliance.gdpr.data_deletion import DataDeletionService
-from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService, UserDataExport
 from mcp_server_langgraph.compliance.gdpr.factory import GDPRStorage, get_gdpr_storage_dependency
 from mcp_server_langgraph.compliance.gdpr.storage import ConsentRecord as GDPRConsentRecord
+from mcp_server_langgraph.compliance.gdpr.storage import UserDataExport
 from mcp_server_langgraph.core.security import sanitize_header_value
 from mcp_server_langgraph.observability.telemetry import logger, tracer
 
@@ -150,7 +149,9 @@ async def get_user_data(
 
         email = user.get("email", f"{username}@example.com")
 
-        # Create export service with storage backend
+        # Create export service with storage backend (loaded on first request, not at startup)
+        from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService
+
         export_service = DataExportService(session_store=session_store, gdpr_storage=gdpr_storage)
 
         # Export all user data
@@ -201,7 +202,9 @@ async def export_user_data(
         username = str(user.get("username") or "")
         email = str(user.get("email", f"{username}@example.com"))
 
-        # Create export service with storage backend
+        # Create export service with storage backend (loaded on first request, not at startup)
+        from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService
+
         export_service = DataExportService(session_store=session_store, gdpr_storage=gdpr_storage)
 
         # Export data in requested format
@@ -354,7 +357,9 @@ async def delete_user_account(
             },
         )
 
-        # Create deletion service with storage backend
+        # Create deletion service with storage backend (loaded on first request, not at startup)
+        from mcp_server_langgraph.compliance.gdpr.data_deletion import DataDeletionService
+
         # Note: OpenFGA client should be passed from FastAPI app state for proper lifecycle
         # For production, add OpenFGA client to app startup and inject via Depends()
         # Example: openfga_client = Depends(get_openfga_client)
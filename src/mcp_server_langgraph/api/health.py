@@ -7,10 +7,14 @@ systems are properly initialized before the app accepts requests.
 This module prevents the classes of issues found in OpenAI Codex audit from recurring.
 """
 
+from typing import Any
+
 from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 from mcp_server_langgraph.core.config import settings
+from mcp_server_langgraph.infrastructure.warmup import get_warmup_state
 from mcp_server_langgraph.observability.telemetry import logger
 
 router = APIRouter(prefix="/api/v1/health", tags=["health"])
@@ -173,6 +177,23 @@ async def validate_database_connectivity_async() -> tuple[bool, str]:
     return await check_database_connectivity(postgres_url, timeout=5.0)
 
 
+def validate_warmup_complete() -> tuple[bool, str]:
+    """
+    Validate that startup warm-up is not still running.
+
+    Returns:
+        Tuple of (is_healthy, message)
+    """
+    warmup = get_warmup_state()
+    if not warmup.ready:
+        return False, "Warm-up in progress"
+
+    failed = [name for name, step in warmup.steps.items() if step["status"] in ("failed", "timeout")]
+    if failed:
+        return True, f"Warm-up complete with warnings: {', '.join(failed)} did not warm"
+    return True, f"Warm-up {warmup.status}"
+
+
 def run_startup_validation() -> None:
     """
     Run all startup validations and raise SystemValidationError if critical checks fail.
@@ -262,6 +283,7 @@ async def health_check() -> HealthCheckResult:
         "api_key_cache": validate_api_key_cache_configured(),
         "docker_sandbox": validate_docker_sandbox_security(),
         "database_connectivity": await validate_database_connectivity_async(),
+        "warmup": validate_warmup_complete(),
     }
 
     # Convert to bool dict and collect errors/warnings
@@ -287,3 +309,42 @@ async def health_check() -> HealthCheckResult:
         errors=errors,
         warnings=warnings,
     )
+
+
+class ReadinessResult(BaseModel):
+    """Readiness result model"""
+
+    ready: bool
+    warmup: dict[str, Any]
+
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    summary="Readiness Check",
+    description="Report ready once startup warm-up has completed",
+    responses={503: {"model": ReadinessResult, "description": "Warm-up still running"}},
+)
+async def readiness_check() -> JSONResponse:
+    """
+    Readiness endpoint gated on startup warm-up.
+
+    Returns 503 while the agent graph, tokenizer, JWKS, OpenFGA client and
+    connection pools are still being prepared, so rollouts only send traffic
+    to warm pods. Failed warm-up steps are listed but do not block readiness.
+
+    Example:
+        ```
+        GET /api/v1/health/ready
+        {
+            "ready": true,
+            "warmup": {"status": "complete", "duration_ms": 5210.4, "steps": {...}}
+        }
+        ```
+    """
+    warmup = get_warmup_state()
+    result = ReadinessResult(ready=warmup.ready, warmup=warmup.snapshot())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if warmup.ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=result.model_dump(),
+    )
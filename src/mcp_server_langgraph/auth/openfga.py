@@ -192,7 +192,7 @@ class OpenFGAClient:
         timeout=30,
         fallback=lambda self, *args, **kwargs: self._circuit_breaker_fallback(*args, **kwargs),
     )
-    @retry_with_backoff()  # Uses global config (prod: 3 attempts, test: 1 attempt for fast tests)
+    @retry_with_backoff(budget="openfga")  # Uses global config (prod: 3 attempts, test: 1 attempt for fast tests)
     @with_timeout(operation_type="auth")
     @with_bulkhead(resource_type="openfga")
     async def check_permission(
@@ -227,9 +227,8 @@ class OpenFGAClient:
         """
         await self._ensure_initialized()  # Lazy initialization
         with tracer.start_as_current_span("openfga.check") as span:
-            span.set_attribute("user", user)
-            span.set_attribute("relation", relation)
-            span.set_attribute("object", object)
+            if span.is_recording():  # Sampled-out spans skip attribute work
+                span.set_attributes({"user": user, "relation": relation, "object": object})
 
             try:
                 request = ClientCheckRequest(user=user, relation=relation, object=object, contextual_tuples=[])
@@ -282,7 +281,7 @@ class OpenFGAClient:
                     )
 
     @circuit_breaker(name="openfga")
-    @retry_with_backoff()  # Uses global config (prod: 3 attempts, test: 1 attempt for fast tests)
+    @retry_with_backoff(budget="openfga")  # Uses global config (prod: 3 attempts, test: 1 attempt for fast tests)
     @with_timeout(operation_type="auth")
     async def write_tuples(self, tuples: list[dict[str, str]]) -> None:
         """
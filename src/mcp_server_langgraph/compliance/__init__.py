@@ -7,17 +7,22 @@ This package provides:
 - Data retention policies and automated cleanup
 """
 
-from mcp_server_langgraph.compliance.gdpr.data_deletion import DataDeletionService
-from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService
-from mcp_server_langgraph.compliance.gdpr.storage import (
-    AuditLogEntry,
-    AuditLogStore,
-    ConversationStore,
-    InMemoryAuditLogStore,
-    InMemoryConversationStore,
-)
-from mcp_server_langgraph.compliance.retention import DataRetentionService
-from mcp_server_langgraph.compliance.soc2.evidence import EvidenceCollector
+from typing import TYPE_CHECKING
+
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
+
+# Services are loaded on first access: they pull in the OpenFGA client, asyncpg,
+# YAML policy loading and the SOC2 collectors.
+if TYPE_CHECKING:
+    from mcp_server_langgraph.compliance.gdpr.data_deletion import DataDeletionService as DataDeletionService
+    from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService as DataExportService
+    from mcp_server_langgraph.compliance.gdpr.storage import AuditLogEntry as AuditLogEntry
+    from mcp_server_langgraph.compliance.gdpr.storage import AuditLogStore as AuditLogStore
+    from mcp_server_langgraph.compliance.gdpr.storage import ConversationStore as ConversationStore
+    from mcp_server_langgraph.compliance.gdpr.storage import InMemoryAuditLogStore as InMemoryAuditLogStore
+    from mcp_server_langgraph.compliance.gdpr.storage import InMemoryConversationStore as InMemoryConversationStore
+    from mcp_server_langgraph.compliance.retention import DataRetentionService as DataRetentionService
+    from mcp_server_langgraph.compliance.soc2.evidence import EvidenceCollector as EvidenceCollector
 
 __all__ = [
     # GDPR
@@ -34,3 +39,18 @@ __all__ = [
     # SOC2
     "EvidenceCollector",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DataDeletionService": "mcp_server_langgraph.compliance.gdpr.data_deletion",
+        "DataExportService": "mcp_server_langgraph.compliance.gdpr.data_export",
+        "AuditLogEntry": "mcp_server_langgraph.compliance.gdpr.storage",
+        "AuditLogStore": "mcp_server_langgraph.compliance.gdpr.storage",
+        "ConversationStore": "mcp_server_langgraph.compliance.gdpr.storage",
+        "InMemoryAuditLogStore": "mcp_server_langgraph.compliance.gdpr.storage",
+        "InMemoryConversationStore": "mcp_server_langgraph.compliance.gdpr.storage",
+        "DataRetentionService": "mcp_server_langgraph.compliance.retention",
+        "EvidenceCollector": "mcp_server_langgraph.compliance.soc2.evidence",
+    },
+)
@@ -7,8 +7,8 @@ Provides data subject rights as required by GDPR:
 - Right to portability (structured data export)
 """
 
-from mcp_server_langgraph.compliance.gdpr.data_deletion import DataDeletionService
-from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService
+from typing import TYPE_CHECKING
+
 from mcp_server_langgraph.compliance.gdpr.storage import (
     AuditLogEntry,
     AuditLogStore,
@@ -16,6 +16,13 @@ from mcp_server_langgraph.compliance.gdpr.storage import (
     InMemoryAuditLogStore,
     InMemoryConversationStore,
 )
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
+
+# The services depend on the OpenFGA client and the PostgreSQL storage backend -
+# load them on first access.
+if TYPE_CHECKING:
+    from mcp_server_langgraph.compliance.gdpr.data_deletion import DataDeletionService as DataDeletionService
+    from mcp_server_langgraph.compliance.gdpr.data_export import DataExportService as DataExportService
 
 __all__ = [
     "AuditLogEntry",
@@ -26,3 +33,11 @@ __all__ = [
     "InMemoryAuditLogStore",
     "InMemoryConversationStore",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DataDeletionService": "mcp_server_langgraph.compliance.gdpr.data_deletion",
+        "DataExportService": "mcp_server_langgraph.compliance.gdpr.data_export",
+    },
+)
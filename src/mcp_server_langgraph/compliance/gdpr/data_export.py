@@ -7,53 +7,13 @@ import io
 from datetime import datetime, UTC
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
-
 from mcp_server_langgraph.auth.session import SessionStore
 from mcp_server_langgraph.compliance.gdpr.factory import GDPRStorage
+from mcp_server_langgraph.compliance.gdpr.storage import UserDataExport
 from mcp_server_langgraph.compliance.metrics import record_gdpr_data_export
 from mcp_server_langgraph.observability.telemetry import logger, tracer
 
 
-class UserDataExport(BaseModel):
-    """
-    Complete user data export for GDPR compliance
-
-    Includes all personal data associated with a user.
-    """
-
-    export_id: str = Field(..., description="Unique export identifier")
-    export_timestamp: str = Field(..., description="ISO timestamp of export")
-    user_id: str = Field(..., description="User identifier")
-    username: str = Field(..., description="Username")
-    email: str = Field(..., description="User email address")
-    profile: dict[str, Any] = Field(default_factory=dict, description="User profile data")
-    sessions: list[dict[str, Any]] = Field(default_factory=list, description="Active and recent sessions")
-    conversations: list[dict[str, Any]] = Field(default_factory=list, description="Conversation history")
-    preferences: dict[str, Any] = Field(default_factory=dict, description="User preferences and settings")
-    audit_log: list[dict[str, Any]] = Field(default_factory=list, description="User activity audit log")
-    consents: list[dict[str, Any]] = Field(default_factory=list, description="Consent records")
-    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "export_id": "exp_20250101120000_user123",
-                "export_timestamp": "2025-01-01T12:00:00Z",
-                "user_id": "user:alice",
-                "username": "alice",
-                "email": "alice@acme.com",
-                "profile": {"name": "Alice", "created_at": "2024-01-01"},
-                "sessions": [{"session_id": "sess_123", "created_at": "2025-01-01T10:00:00Z"}],
-                "conversations": [],
-                "preferences": {"theme": "dark"},
-                "audit_log": [],
-                "consents": [],
-            }
-        }
-    )
-
-
 class DataExportService:
     """
     Service for exporting user data for GDPR compliance
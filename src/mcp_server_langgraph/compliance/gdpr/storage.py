@@ -161,6 +161,47 @@ class ConsentRecord(BaseModel):
     )
 
 
+class UserDataExport(BaseModel):
+    """
+    Complete user data export for GDPR compliance
+
+    Includes all personal data associated with a user. Defined here rather than
+    in data_export so the API can use it as a response model without loading
+    the export service.
+    """
+
+    export_id: str = Field(..., description="Unique export identifier")
+    export_timestamp: str = Field(..., description="ISO timestamp of export")
+    user_id: str = Field(..., description="User identifier")
+    username: str = Field(..., description="Username")
+    email: str = Field(..., description="User email address")
+    profile: dict[str, Any] = Field(default_factory=dict, description="User profile data")
+    sessions: list[dict[str, Any]] = Field(default_factory=list, description="Active and recent sessions")
+    conversations: list[dict[str, Any]] = Field(default_factory=list, description="Conversation history")
+    preferences: dict[str, Any] = Field(default_factory=dict, description="User preferences and settings")
+    audit_log: list[dict[str, Any]] = Field(default_factory=list, description="User activity audit log")
+    consents: list[dict[str, Any]] = Field(default_factory=list, description="Consent records")
+    metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "export_id": "exp_20250101120000_user123",
+                "export_timestamp": "2025-01-01T12:00:00Z",
+                "user_id": "user:alice",
+                "username": "alice",
+                "email": "alice@acme.com",
+                "profile": {"name": "Alice", "created_at": "2024-01-01"},
+                "sessions": [{"session_id": "sess_123", "created_at": "2025-01-01T10:00:00Z"}],
+                "conversations": [],
+                "preferences": {"theme": "dark"},
+                "audit_log": [],
+                "consents": [],
+            }
+        }
+    )
+
+
 # ============================================================================
 # Storage Interfaces
 # ============================================================================
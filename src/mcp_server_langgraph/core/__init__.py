@@ -1,8 +1,15 @@
 """Core functionality for MCP server."""
 
-from mcp_server_langgraph.core.agent import AgentState, agent_graph
+from typing import TYPE_CHECKING
+
 from mcp_server_langgraph.core.config import Settings, settings
 from mcp_server_langgraph.core.feature_flags import FeatureFlags, feature_flags
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
+
+# The agent graph pulls in LangGraph, LiteLLM and Qdrant - load it on first use
+if TYPE_CHECKING:
+    from mcp_server_langgraph.core.agent import AgentState as AgentState
+    from mcp_server_langgraph.core.agent import agent_graph as agent_graph
 
 __all__ = [
     "AgentState",
@@ -12,3 +19,11 @@ __all__ = [
     "feature_flags",
     "settings",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AgentState": "mcp_server_langgraph.core.agent",
+        "agent_graph": "mcp_server_langgraph.core.agent",
+    },
+)
@@ -21,20 +21,14 @@ from langgraph.graph import END, START, StateGraph
 
 from mcp_server_langgraph.core.config import settings
 from mcp_server_langgraph.core.context_manager import ContextManager
+from mcp_server_langgraph.core.graph_instrumentation import instrument_node
+from mcp_server_langgraph.core.prompts import TOOL_PLAN_PROMPT
 from mcp_server_langgraph.core.url_utils import ensure_redis_password_encoded
 from mcp_server_langgraph.llm.factory import create_llm_from_config
 from mcp_server_langgraph.llm.verifier import OutputVerifier
+from mcp_server_langgraph.observability.profiler import run_tagged, tag_stage
 from mcp_server_langgraph.observability.telemetry import logger
 
-# Import Dynamic Context Loader if enabled
-try:
-    from mcp_server_langgraph.core.dynamic_context_loader import DynamicContextLoader, search_and_load_context
-
-    DYNAMIC_CONTEXT_AVAILABLE = True
-except ImportError:
-    DYNAMIC_CONTEXT_AVAILABLE = False
-    # Logger warning deferred to runtime to avoid initialization issues
-
 # Import Redis checkpointer if available
 try:
     from langgraph.checkpoint.redis import RedisSaver
@@ -107,6 +101,23 @@ def _initialize_pydantic_agent() -> Any:
         return None
 
 
+def _configure_compact_checkpointer(checkpointer: Any, effective_settings: Any) -> Any:
+    """Apply checkpoint compression/keyframe settings to a compact checkpointer"""
+    checkpointer.configure(
+        compression=effective_settings.checkpoint_compression,
+        min_bytes=effective_settings.checkpoint_compression_min_bytes,
+        keyframe_interval=effective_settings.checkpoint_keyframe_interval,
+    )
+    logger.info(
+        "Compact checkpoint serialization enabled",
+        extra={
+            "compression": effective_settings.checkpoint_compression,
+            "keyframe_interval": effective_settings.checkpoint_keyframe_interval,
+        },
+    )
+    return checkpointer
+
+
 def _create_checkpointer(settings_to_use: Any | None = None) -> Any:
     """
     Create checkpointer backend based on configuration
@@ -121,6 +132,7 @@ def _create_checkpointer(settings_to_use: Any | None = None) -> Any:
     effective_settings = settings_to_use if settings_to_use is not None else settings
 
     backend = effective_settings.checkpoint_backend.lower()
+    compact = getattr(effective_settings, "checkpoint_serializer", "json") == "compact"
 
     if backend == "redis":
         if not REDIS_CHECKPOINTER_AVAILABLE:
@@ -145,12 +157,19 @@ def _create_checkpointer(settings_to_use: Any | None = None) -> Any:
             # and returns a context manager in langgraph-checkpoint-redis 0.1.2+
             # Ensure password is URL-encoded to prevent parsing errors (defense-in-depth)
             encoded_redis_url = ensure_redis_password_encoded(effective_settings.checkpoint_redis_url)
-            checkpointer_ctx = RedisSaver.from_conn_string(
+            saver_cls = RedisSaver
+            if compact:
+                from mcp_server_langgraph.core.checkpoint_serializer import CompactRedisSaver
+
+                saver_cls = CompactRedisSaver
+            checkpointer_ctx = saver_cls.from_conn_string(
                 redis_url=encoded_redis_url,
             )
 
             # Enter the context manager to get the actual RedisSaver instance
             checkpointer = checkpointer_ctx.__enter__()
+            if compact:
+                _configure_compact_checkpointer(checkpointer, effective_settings)
 
             # Store context manager reference for proper cleanup on shutdown
             # This prevents resource leaks (Redis connections, file descriptors)
@@ -168,6 +187,10 @@ def _create_checkpointer(settings_to_use: Any | None = None) -> Any:
 
     elif backend == "memory":
         logger.info("Using in-memory checkpointer (not suitable for multi-replica deployments)")
+        if compact:
+            from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+            return _configure_compact_checkpointer(CompactMemorySaver(), effective_settings)
         return MemorySaver()
 
     else:
@@ -272,7 +295,7 @@ def _fallback_routing(state: AgentState, last_message: HumanMessage) -> AgentSta
     }
 
 
-def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:  # noqa: C901
+def _create_agent_graph_singleton(settings_override: Any | None = None, model_override: Any | None = None) -> Any:  # noqa: C901
     """
     Create the LangGraph agent using functional API with LiteLLM and observability.
 
@@ -285,16 +308,19 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
     Args:
         settings_override: Optional Settings instance to override global settings.
                           If None, uses the global settings object.
+        model_override: Optional chat model used instead of the configured LLM.
+                        Pydantic AI routing/generation is skipped so every model
+                        call goes through it (used by the warm-up dry run).
     """
 
     # Use override settings if provided, otherwise use global settings
     effective_settings = settings_override if settings_override is not None else settings
 
     # Initialize the model via LiteLLM factory
-    model = create_llm_from_config(effective_settings)
+    model = model_override if model_override is not None else create_llm_from_config(effective_settings)
 
     # Initialize Pydantic AI agent if available
-    pydantic_agent = _initialize_pydantic_agent()
+    pydantic_agent = _initialize_pydantic_agent() if model_override is None else None
 
     # Initialize context manager for compaction
     context_manager = ContextManager(compaction_threshold=8000, target_after_compaction=4000, recent_message_count=5)
@@ -305,8 +331,11 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
     # Initialize dynamic context loader if enabled
     enable_dynamic_loading = getattr(effective_settings, "enable_dynamic_context_loading", False)
     context_loader = None
-    if enable_dynamic_loading and DYNAMIC_CONTEXT_AVAILABLE:
+    if enable_dynamic_loading:
         try:
+            # Imported here so Qdrant and the embedding backends only load when the feature is on
+            from mcp_server_langgraph.core.dynamic_context_loader import DynamicContextLoader
+
             context_loader = DynamicContextLoader()
             logger.info("Dynamic context loader initialized")
         except Exception as e:
@@ -317,6 +346,7 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
     enable_context_compaction = getattr(effective_settings, "enable_context_compaction", True)
     enable_verification = getattr(effective_settings, "enable_verification", True)
     max_refinement_attempts = getattr(effective_settings, "max_refinement_attempts", 3)
+    enable_tool_dag = getattr(effective_settings, "enable_tool_dag_execution", False)
 
     # Define node functions
 
@@ -336,12 +366,16 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
             try:
                 logger.info("Loading dynamic context")
 
-                # Search for relevant context
+                # Stream progressive discovery into the loader: the first references load
+                # while later searches run, and searching stops once the budget is full
                 query = last_message.content if isinstance(last_message.content, str) else str(last_message.content)
-                loaded_contexts = await search_and_load_context(
-                    query=query,
-                    loader=context_loader,
+                references = context_loader.iter_progressive_discover(
+                    query,
+                    max_iterations=getattr(effective_settings, "dynamic_context_discovery_iterations", 2),
                     top_k=getattr(effective_settings, "dynamic_context_top_k", 3),
+                )
+                loaded_contexts = await context_loader.load_batch(
+                    references,
                     max_tokens=getattr(effective_settings, "dynamic_context_max_tokens", 2000),
                 )
 
@@ -477,7 +511,9 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
         Features:
         - Serial execution (default): Tools executed one at a time
         - Parallel execution (if enabled): Independent tools run concurrently
-        - Automatic dependency detection and topological sorting
+        - DAG execution (if enabled): a call can take another call's output via a
+          "$<n>.result" argument placeholder (n = 1-based position in the message or
+          the tool call ID), and starts as soon as that output is ready
         - Graceful error handling with informative error messages
         - Comprehensive logging and telemetry
 
@@ -517,10 +553,10 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
         # Check if parallel execution is enabled (use effective_settings for DI support)
         enable_parallel = getattr(effective_settings, "enable_parallel_execution", False)
 
-        if enable_parallel and len(tool_calls) > 1:
+        if (enable_parallel or enable_tool_dag) and len(tool_calls) > 1:
             # Use parallel execution for multiple tool calls
-            logger.info(f"Using parallel execution for {len(tool_calls)} tools")
-            tool_messages = await _execute_tools_parallel(tool_calls)
+            logger.info(f"Using {'DAG' if enable_tool_dag else 'parallel'} execution for {len(tool_calls)} tools")
+            tool_messages = await _execute_tools_parallel(tool_calls, resolve_references=enable_tool_dag)
         else:
             # Use serial execution (default or single tool)
             if enable_parallel:
@@ -558,10 +594,10 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
 
                     if hasattr(tool, "ainvoke"):
                         # Async tool
-                        result_content = await tool.ainvoke(tool_args)
+                        result_content = await run_tagged(f"tool:{tool_name}", tool.ainvoke(tool_args))
                     else:
                         # Sync tool - invoke directly
-                        result_content = tool.invoke(tool_args)
+                        result_content = tag_stage(f"tool:{tool_name}", tool.invoke)(tool_args)
 
                     logger.info(
                         f"Tool '{tool_name}' executed successfully",
@@ -586,11 +622,17 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
 
         return tool_messages
 
-    async def _execute_tools_parallel(tool_calls: list[dict]) -> list:  # type: ignore[type-arg]
-        """Execute tools in parallel using ParallelToolExecutor"""
+    async def _execute_tools_parallel(tool_calls: list[dict], resolve_references: bool = False) -> list:  # type: ignore[type-arg]
+        """
+        Execute tools in parallel using ParallelToolExecutor
+
+        With resolve_references, "$<n>.result" placeholders in a call's arguments
+        (n = 1-based position of another call, or its ID) are dependencies whose
+        outputs are substituted before the call runs.
+        """
         from langchain_core.messages import ToolMessage
 
-        from mcp_server_langgraph.core.parallel_executor import ParallelToolExecutor, ToolInvocation
+        from mcp_server_langgraph.core.parallel_executor import ParallelToolExecutor, ToolInvocation, find_references
         from mcp_server_langgraph.tools import get_tool_by_name
 
         # Create parallel executor (use effective_settings for DI support)
@@ -616,13 +658,18 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
                 raise ValueError(msg)
 
             if hasattr(tool, "ainvoke"):
-                return await tool.ainvoke(arguments)
+                return await run_tagged(f"tool:{tool_name}", tool.ainvoke(arguments))
             else:
-                return tool.invoke(arguments)
+                return tag_stage(f"tool:{tool_name}", tool.invoke)(arguments)
+
+        # Positional aliases: the LLM can't know tool call IDs when it writes the plan
+        aliases = {str(i): inv.invocation_id for i, inv in enumerate(invocations, 1)} if resolve_references else None
 
         # Execute tools in parallel
         try:
-            results = await executor.execute_parallel(invocations, execute_single_tool)
+            results = await executor.execute_parallel(
+                invocations, execute_single_tool, resolve_references=resolve_references, aliases=aliases
+            )
 
             # Convert results to ToolMessage objects
             tool_messages = []
@@ -645,7 +692,23 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
             logger.error(f"Parallel tool execution failed: {e}", exc_info=True)
             # Fall back to serial execution on failure
             logger.warning("Falling back to serial execution due to parallel execution failure")
-            return await _execute_tools_serial(tool_calls)
+            if not resolve_references:
+                return await _execute_tools_serial(tool_calls)
+
+            # Serial execution can't resolve references: calls using them would get the raw
+            # "$<n>.result" strings as arguments, so they are reported as errors instead
+            plain_calls = [tc for tc in tool_calls if not find_references(tc.get("args", {}))]
+            serial_messages = iter(await _execute_tools_serial(plain_calls))
+            tool_messages = []
+            for index, tool_call in enumerate(tool_calls):
+                if find_references(tool_call.get("args", {})):
+                    tool_name = tool_call.get("name", "unknown")
+                    content = f"Error executing tool '{tool_name}': tool result references could not be resolved: {e!s}"
+                    tool_call_id = tool_call.get("id", f"call_{index}")
+                    tool_messages.append(ToolMessage(content=content, tool_call_id=tool_call_id, name=tool_name))
+                else:
+                    tool_messages.append(next(serial_messages))
+            return tool_messages
 
     async def generate_response(state: AgentState) -> AgentState:
         """Generate final response using LLM with Pydantic AI validation"""
@@ -654,8 +717,8 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
         messages_list = list(messages)
 
         # Add refinement context if this is a refinement attempt
-        refinement_attempts = state.get("refinement_attempts", 0)
-        if refinement_attempts > 0 and state.get("verification_feedback"):  # type: ignore[operator]
+        refinement_attempts = state.get("refinement_attempts", 0) or 0
+        if refinement_attempts > 0 and state.get("verification_feedback"):
             refinement_prompt = SystemMessage(
                 content=f"<refinement_guidance>\n"
                 f"Previous response had issues. Please refine based on this feedback:\n"
@@ -664,6 +727,10 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
             )
             messages_list = [refinement_prompt] + messages_list
 
+        if enable_tool_dag:
+            # The model only writes "$<n>.result" references if it is told the convention
+            messages_list = [SystemMessage(content=TOOL_PLAN_PROMPT)] + messages_list
+
         # Use Pydantic AI for structured response if available
         if pydantic_agent:
             try:
@@ -821,13 +888,15 @@ def _create_agent_graph_singleton(settings_override: Any | None = None) -> Any:
     workflow = StateGraph(AgentState)
 
     # Add nodes (Load → Gather → Route → Act → Verify → Repeat)
-    workflow.add_node("load_context", load_dynamic_context)  # Just-in-Time Context Loading
-    workflow.add_node("compact", compact_context)  # Gather Context (Compaction)
-    workflow.add_node("router", route_input)  # Route Decision
-    workflow.add_node("tools", use_tools)  # Take Action (tools)
-    workflow.add_node("respond", generate_response)  # Take Action (response)
-    workflow.add_node("verify", verify_response)  # Verify Work
-    workflow.add_node("refine", refine_response)  # Repeat (refinement)
+    # Each node records duration/tokens/cache hits/state size (agent.node.* metrics, /debug/graph-stats)
+    # and is tagged so /debug/profile samples can be grouped by agent stage
+    workflow.add_node("load_context", instrument_node("load_dynamic_context", load_dynamic_context))  # JIT Context Loading
+    workflow.add_node("compact", instrument_node("compact_context", compact_context))  # Gather Context (Compaction)
+    workflow.add_node("router", instrument_node("route_input", route_input))  # Route Decision
+    workflow.add_node("tools", instrument_node("use_tools", use_tools))  # Take Action (tools)
+    workflow.add_node("respond", instrument_node("generate_response", generate_response))  # Take Action (response)
+    workflow.add_node("verify", instrument_node("verify_response", verify_response))  # Verify Work
+    workflow.add_node("refine", instrument_node("refine_response", refine_response))  # Repeat (refinement)
 
     # Add edges for full agentic loop with dynamic context loading
     workflow.add_edge(START, "load_context")  # Start with JIT context loading
@@ -27,6 +27,7 @@ import redis
 from cachetools import TTLCache
 
 from mcp_server_langgraph.core.config import settings
+from mcp_server_langgraph.core.graph_instrumentation import record_node_cache_access
 from mcp_server_langgraph.observability.telemetry import logger, tracer
 
 P = ParamSpec("P")
@@ -395,6 +396,7 @@ class CacheService:
 
     def _emit_cache_hit_metric(self, layer: str, key: str) -> None:
         """Emit cache hit metric"""
+        record_node_cache_access(hit=True)
         try:
             from mcp_server_langgraph.observability.telemetry import config
 
@@ -417,6 +419,7 @@ class CacheService:
 
     def _emit_cache_miss_metric(self, layer: str, key: str) -> None:
         """Emit cache miss metric"""
+        record_node_cache_access(hit=False)
         try:
             from mcp_server_langgraph.observability.telemetry import config
 
@@ -0,0 +1,350 @@
+"""
+Compact checkpoint storage for conversation state.
+
+AgentState.messages is append-only, and RedisSaver stores the full channel
+values inline with every checkpoint, so each step of a long conversation
+rewrites every message as JSON. This module adds:
+
+- CompactSerializer: LangGraph's msgpack encoding (ormsgpack with extension
+  types for LangChain messages) plus zstd/lz4 compression for payloads above
+  a size threshold.
+- CompactCheckpointMixin: stores the messages channel as a compressed blob
+  holding only the messages added since the lineage's last keyframe
+  checkpoint. A full keyframe is written every keyframe_interval checkpoints,
+  when the thread branches, or when earlier messages changed (compaction),
+  so loading a checkpoint reads at most its keyframe plus itself.
+
+Delta detection compares the new checkpoint's messages against the keyframe
+this process wrote (or loaded) for the thread; another replica simply
+starts a new keyframe.
+
+Example:
+    >>> saver = CompactMemorySaver().configure(compression="zstd", keyframe_interval=20)
+    >>> graph = workflow.compile(checkpointer=saver)
+"""
+
+import base64
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import Checkpoint, CheckpointMetadata, CheckpointTuple, ChannelVersions
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from mcp_server_langgraph.core.exceptions import DataIntegrityError
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+try:
+    from langgraph.checkpoint.redis import RedisSaver
+
+    REDIS_SAVER_AVAILABLE = True
+except ImportError:
+    REDIS_SAVER_AVAILABLE = False
+
+MARKER_KEY = "__compact_messages__"
+DEFAULT_KEYFRAME_INTERVAL = 20
+DEFAULT_COMPRESSION_MIN_BYTES = 1024
+# Threads whose lineage is tracked for delta writes (least recently written evicted first)
+MAX_TRACKED_THREADS = 4096
+
+
+class CompactSerializer(JsonPlusSerializer):
+    """
+    msgpack serializer with optional compression above a size threshold.
+
+    Compressed payloads are tagged "msgpack+zstd" / "msgpack+lz4" so they can
+    be read back regardless of the current compression setting.
+    """
+
+    def __init__(self, compression: str = "zstd", min_bytes: int = DEFAULT_COMPRESSION_MIN_BYTES) -> None:
+        super().__init__()
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            msg = "zstd checkpoint compression requires the zstandard package"
+            raise ImportError(msg)
+        if compression == "lz4" and not LZ4_AVAILABLE:
+            msg = "lz4 checkpoint compression requires the lz4 package"
+            raise ImportError(msg)
+        if compression not in ("zstd", "lz4", "none"):
+            msg = f"Unknown checkpoint compression {compression!r}. Supported: 'zstd', 'lz4', 'none'"
+            raise ValueError(msg)
+        self.compression = compression
+        self.min_bytes = min_bytes
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = super().dumps_typed(obj)
+        if type_ != "msgpack" or self.compression == "none" or len(data) < self.min_bytes:
+            return type_, data
+        if self.compression == "zstd":
+            return "msgpack+zstd", zstandard.ZstdCompressor(level=3).compress(data)
+        return "msgpack+lz4", lz4.frame.compress(data)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == "msgpack+zstd":
+            if not ZSTD_AVAILABLE:
+                msg = "Checkpoint is zstd-compressed but the zstandard package is not installed"
+                raise ImportError(msg)
+            return super().loads_typed(("msgpack", zstandard.ZstdDecompressor().decompress(payload)))
+        if type_ == "msgpack+lz4":
+            if not LZ4_AVAILABLE:
+                msg = "Checkpoint is lz4-compressed but the lz4 package is not installed"
+                raise ImportError(msg)
+            return super().loads_typed(("msgpack", lz4.frame.decompress(payload)))
+        return super().loads_typed(data)
+
+
+@dataclass
+class _Lineage:
+    """Last keyframe written or loaded for a (thread_id, checkpoint_ns)"""
+
+    keyframe_id: str
+    keyframe_messages: list[Any]
+    head_id: str
+    deltas: int = 0
+
+
+def _same_prefix(messages: Sequence[Any], prefix: Sequence[Any]) -> bool:
+    if len(messages) < len(prefix):
+        return False
+    # Identity first: LangGraph passes the same message objects from step to step
+    return all(new is old or new == old for new, old in zip(messages, prefix, strict=False))
+
+
+class CompactCheckpointMixin:
+    """
+    Checkpoint saver mixin that stores the messages channel compactly.
+
+    Mix in ahead of a BaseCheckpointSaver subclass. The messages channel value
+    is replaced by a JSON-safe marker before the saver stores it, and expanded
+    back into the full message list on get_tuple()/list().
+    """
+
+    messages_channel = "messages"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.compact_serde = CompactSerializer(compression="zstd" if ZSTD_AVAILABLE else "none")
+        self.keyframe_interval = DEFAULT_KEYFRAME_INTERVAL
+        self._lineages: OrderedDict[tuple[str, str], _Lineage] = OrderedDict()
+        self._lineage_lock = threading.Lock()
+
+    def configure(
+        self,
+        compression: str = "zstd",
+        min_bytes: int = DEFAULT_COMPRESSION_MIN_BYTES,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> Any:
+        """
+        Set compression and keyframe spacing.
+
+        Args:
+            compression: "zstd", "lz4" or "none"
+            min_bytes: Only compress encoded payloads at least this large
+            keyframe_interval: Checkpoints per full keyframe (1 disables deltas)
+
+        Returns:
+            self, for chaining after construction
+        """
+        self.compact_serde = CompactSerializer(compression=compression, min_bytes=min_bytes)
+        self.keyframe_interval = max(1, keyframe_interval)
+        return self
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def _compact(self, config: RunnableConfig, checkpoint: Checkpoint) -> Checkpoint:
+        values = checkpoint.get("channel_values") or {}
+        messages = values.get(self.messages_channel)
+        if not isinstance(messages, list):
+            # Channel not set yet, or already compacted (savers whose async methods call the sync ones)
+            return checkpoint
+
+        configurable = config["configurable"]
+        key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+        parent_id = configurable.get("checkpoint_id")
+
+        with self._lineage_lock:
+            lineage = self._lineages.get(key)
+            if (
+                lineage is not None
+                and lineage.head_id == parent_id
+                and lineage.deltas + 1 < self.keyframe_interval
+                and _same_prefix(messages, lineage.keyframe_messages)
+            ):
+                lineage.deltas += 1
+                base: str | None = lineage.keyframe_id
+                base_count = len(lineage.keyframe_messages)
+            else:
+                lineage = _Lineage(keyframe_id=checkpoint["id"], keyframe_messages=list(messages), head_id=checkpoint["id"])
+                self._lineages[key] = lineage
+                base, base_count = None, 0
+            lineage.head_id = checkpoint["id"]
+            self._lineages.move_to_end(key)
+            while len(self._lineages) > MAX_TRACKED_THREADS:
+                self._lineages.popitem(last=False)
+            seq = lineage.deltas
+
+        type_, data = self.compact_serde.dumps_typed(messages[base_count:])
+        marker = {
+            MARKER_KEY: 1,
+            "type": type_,
+            "data": base64.b64encode(data).decode("ascii"),
+            "base": base,
+            "base_count": base_count,
+            "seq": seq,
+        }
+        return {**checkpoint, "channel_values": {**values, self.messages_channel: marker}}
+
+    def _marker(self, tup: CheckpointTuple) -> dict[str, Any] | None:
+        value = tup.checkpoint.get("channel_values", {}).get(self.messages_channel)
+        return value if isinstance(value, dict) and MARKER_KEY in value else None
+
+    def _decode(self, marker: dict[str, Any]) -> list[Any]:
+        messages = self.compact_serde.loads_typed((marker["type"], base64.b64decode(marker["data"])))
+        return list(messages or [])
+
+    @staticmethod
+    def _base_config(tup: CheckpointTuple, marker: dict[str, Any]) -> RunnableConfig:
+        configurable = tup.config["configurable"]
+        return {
+            "configurable": {
+                "thread_id": configurable["thread_id"],
+                "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                "checkpoint_id": marker["base"],
+            }
+        }
+
+    def _with_messages(self, tup: CheckpointTuple, messages: list[Any]) -> CheckpointTuple:
+        values = {**tup.checkpoint["channel_values"], self.messages_channel: messages}
+        return tup._replace(checkpoint={**tup.checkpoint, "channel_values": values})
+
+    def _join(self, tup: CheckpointTuple, marker: dict[str, Any], base: CheckpointTuple | None) -> CheckpointTuple:
+        if base is None:
+            msg = f"Keyframe checkpoint {marker['base']} for checkpoint {tup.checkpoint['id']} is missing"
+            raise DataIntegrityError(msg)
+        base_messages = base.checkpoint["channel_values"][self.messages_channel]
+        return self._with_messages(tup, base_messages[: marker["base_count"]] + self._decode(marker))
+
+    def _track(self, tup: CheckpointTuple, marker: dict[str, Any]) -> None:
+        """Let the next put() after loading this checkpoint write a delta."""
+        configurable = tup.config["configurable"]
+        messages = tup.checkpoint["channel_values"][self.messages_channel]
+        keyframe_id = marker["base"] or tup.checkpoint["id"]
+        keyframe_messages = messages[: marker["base_count"]] if marker["base"] else messages
+        with self._lineage_lock:
+            key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""))
+            self._lineages[key] = _Lineage(keyframe_id, list(keyframe_messages), tup.checkpoint["id"], marker["seq"])
+            self._lineages.move_to_end(key)
+
+    def _expand(self, tup: CheckpointTuple | None, get_base: Callable[[RunnableConfig], CheckpointTuple | None]) -> Any:
+        if tup is None or (marker := self._marker(tup)) is None:
+            return tup
+        if marker["base"] is None:
+            return self._with_messages(tup, self._decode(marker))
+        return self._join(tup, marker, get_base(self._base_config(tup, marker)))
+
+    # ------------------------------------------------------------------
+    # BaseCheckpointSaver API
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return super().put(config, self._compact(config, checkpoint), metadata, new_versions)  # type: ignore[misc,no-any-return]
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await super().aput(config, self._compact(config, checkpoint), metadata, new_versions)  # type: ignore[misc,no-any-return]
+
+    def _get_expanded(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self._expand(super().get_tuple(config), self._get_expanded)  # type: ignore[misc,no-any-return]
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        tup = super().get_tuple(config)  # type: ignore[misc]
+        marker = self._marker(tup) if tup is not None else None
+        expanded = self._expand(tup, self._get_expanded)
+        if marker is not None:
+            self._track(expanded, marker)
+        return expanded  # type: ignore[no-any-return]
+
+    async def _aget_expanded(self, config: RunnableConfig) -> CheckpointTuple | None:
+        tup = await super().aget_tuple(config)  # type: ignore[misc]
+        if tup is None or (marker := self._marker(tup)) is None or marker["base"] is None:
+            return self._expand(tup, self._get_expanded)  # type: ignore[no-any-return]
+        return self._join(tup, marker, await self._aget_expanded(self._base_config(tup, marker)))
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        tup = await super().aget_tuple(config)  # type: ignore[misc]
+        marker = self._marker(tup) if tup is not None else None
+        if marker is None:
+            return tup  # type: ignore[no-any-return]
+        if marker["base"] is None:
+            expanded = self._with_messages(tup, self._decode(marker))
+        else:
+            expanded = self._join(tup, marker, await self._aget_expanded(self._base_config(tup, marker)))
+        self._track(expanded, marker)
+        return expanded
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,  # noqa: A002 - matches BaseCheckpointSaver.list
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        for tup in super().list(config, filter=filter, before=before, limit=limit):  # type: ignore[misc]
+            yield self._expand(tup, self._get_expanded)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,  # noqa: A002 - matches BaseCheckpointSaver.alist
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        async for tup in super().alist(config, filter=filter, before=before, limit=limit):  # type: ignore[misc]
+            marker = self._marker(tup)
+            if marker is None or marker["base"] is None:
+                yield self._expand(tup, self._get_expanded)
+            else:
+                yield self._join(tup, marker, await self._aget_expanded(self._base_config(tup, marker)))
+
+
+class CompactMemorySaver(CompactCheckpointMixin, MemorySaver):
+    """In-memory checkpointer with compact message storage"""
+
+
+if REDIS_SAVER_AVAILABLE:
+
+    class CompactRedisSaver(CompactCheckpointMixin, RedisSaver):
+        """Redis checkpointer with compact message storage"""
@@ -53,6 +53,21 @@ class Settings(BaseSettings):
     enable_console_export: bool = True
     enable_tracing: bool = True
     enable_metrics: bool = True
+    # Trace sampling (see observability/sampling.py)
+    otel_traces_sampler_ratio: float = 1.0  # Head-sampling ratio for traces matching no rule
+    otel_sampling_rules: str = ""  # e.g. "openfga.check=0.01,route:/health*=0" (first match wins)
+    otel_tail_sampling_enabled: bool = False  # Keep head-dropped traces that error or are slow
+    otel_tail_sampling_slow_ms: float = 2000.0  # Root span duration that counts as slow
+    # Event-loop monitoring (see observability/loop_monitor.py)
+    event_loop_monitor_enabled: bool = True  # Export event_loop_lag_seconds at /metrics
+    event_loop_monitor_interval_ms: float = 100.0  # Drift sampling interval
+    event_loop_blocking_threshold_ms: float = 0.0  # >0 samples stacks of callbacks blocking longer (/debug/loop)
+    debug_profiler_enabled: bool = False  # Opt-in sampling profiler at /debug/profile (admin only)
+    debug_profiler_max_seconds: int = 120  # Longest profile a single request may take
+    # Startup warm-up (see infrastructure/warmup.py); readiness waits for it
+    warmup_enabled: bool = True  # Pre-build graph, tokenizer, JWKS, OpenFGA and pools before serving
+    warmup_timeout_seconds: float = 60.0  # Per-step timeout; a slow step is reported, not fatal
+    warmup_dry_run_enabled: bool = True  # Run one synthetic turn through the graph with a stub LLM
 
     # Prometheus (for SLA monitoring and compliance metrics)
     prometheus_url: str = "http://prometheus:9090"
@@ -89,6 +104,8 @@ class Settings(BaseSettings):
     log_format: str = "json"  # "json" or "text"
     log_json_indent: int | None = None  # None for compact, 2 for pretty-print
     enable_file_logging: bool = False  # Opt-in file-based log rotation (for persistent storage)
+    log_async: bool = False  # Format/write logs on a background thread (QueueHandler + QueueListener)
+    log_queue_size: int = 10000  # Async log queue bound; records beyond it are dropped and counted
 
     # LLM Provider (litellm integration)
     llm_provider: str = "google"  # google, anthropic, openai, ollama, azure, bedrock, vertex_ai
@@ -192,6 +209,11 @@ class Settings(BaseSettings):
     qdrant_collection_name: str = "mcp_context"  # Collection name for context storage
     dynamic_context_max_tokens: int = 2000  # Max tokens to load from dynamic context
     dynamic_context_top_k: int = 3  # Number of top results from semantic search
+    dynamic_context_discovery_iterations: int = 2  # Progressive discovery searches (stops early once the token budget is full)
+    enable_hybrid_search: bool = True  # Fuse BM25 (lexical) and vector results; exact ID/symbol hits skip embedding
+    hybrid_search_rrf_k: int = 60  # Reciprocal-rank fusion damping constant
+    hybrid_search_candidates: int = 20  # Candidates fetched from each retriever before fusion/re-ranking
+    hybrid_search_reranker_model: str | None = None  # Optional cross-encoder, e.g. "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
     # Embedding Configuration
     embedding_provider: str = "google"  # "google" (Gemini API) or "local" (sentence-transformers)
@@ -214,6 +236,7 @@ class Settings(BaseSettings):
     # Parallel Tool Execution - Anthropic Best Practice
     enable_parallel_execution: bool = False  # Enable parallel tool execution
     max_parallel_tools: int = 5  # Maximum concurrent tool executions
+    enable_tool_dag_execution: bool = False  # Run tool calls as a DAG, resolving "$<n>.result" references
 
     # Enhanced Note-Taking - Anthropic Best Practice
     enable_llm_extraction: bool = False  # Use LLM for structured note extraction
@@ -255,10 +278,14 @@ class Settings(BaseSettings):
     # Docker-specific settings
     code_execution_docker_image: str = "python:3.12-slim"  # Docker image for execution
     code_execution_docker_socket: str = "/var/run/docker.sock"  # Docker socket path
+    code_execution_pool_min_idle: int = 2  # Pre-warmed single-use containers kept ready (0 disables the pool)
+    code_execution_pool_max_total: int = 8  # Maximum pooled containers alive at once (idle + in use)
 
     # Kubernetes-specific settings
     code_execution_k8s_namespace: str = "default"  # Kubernetes namespace for jobs
     code_execution_k8s_job_ttl: int = 300  # Kubernetes job TTL in seconds (cleanup)
+    code_execution_k8s_pool_min_idle: int = 0  # Pre-scheduled executor pods kept ready (0 disables; needs pods/exec RBAC)
+    code_execution_k8s_pool_max_total: int = 8  # Maximum pooled executor pods alive at once
 
     # Conversation Checkpointing (for distributed state across replicas)
     checkpoint_backend: str = "memory"  # "memory", "redis"
@@ -267,6 +294,12 @@ class Settings(BaseSettings):
         validation_alias="redis_checkpoint_url",  # Accept both names
     )
     checkpoint_redis_ttl: int = 604800  # 7 days TTL for conversation checkpoints
+    # Compact checkpoints (see core/checkpoint_serializer.py): msgpack messages, compressed,
+    # written as deltas against a keyframe checkpoint instead of the full history each step
+    checkpoint_serializer: str = "json"  # "json" (saver default), "compact"
+    checkpoint_compression: str = "zstd"  # "zstd", "lz4", "none" (compact serializer only)
+    checkpoint_compression_min_bytes: int = 1024  # Smaller payloads are stored uncompressed
+    checkpoint_keyframe_interval: int = 20  # Full message history written every N checkpoints
 
     # OpenFGA
     openfga_api_url: str = "http://localhost:8080"
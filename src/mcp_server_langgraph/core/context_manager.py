@@ -93,9 +93,14 @@ class ContextManager:
         total_tokens = sum(count_tokens(self._message_to_text(msg), model=model_name) for msg in messages)
 
         with tracer.start_as_current_span("context.check_compaction") as span:
-            span.set_attribute("message.count", len(messages))
-            span.set_attribute("token.count", total_tokens)
-            span.set_attribute("needs.compaction", total_tokens > self.compaction_threshold)
+            if span.is_recording():  # Sampled-out spans skip attribute work
+                span.set_attributes(
+                    {
+                        "message.count": len(messages),
+                        "token.count": total_tokens,
+                        "needs.compaction": total_tokens > self.compaction_threshold,
+                    }
+                )
 
             if total_tokens > self.compaction_threshold:
                 logger.info(
@@ -3,13 +3,16 @@ Dynamic Context Loading with Qdrant Vector Store
 
 Implements Anthropic's Just-in-Time context loading strategy:
 - Semantic search for relevant context
+- Hybrid BM25 + vector retrieval for identifiers and code symbols
 - Progressive discovery patterns
 - Lightweight context references
 """
 
 import asyncio
 import base64
+import heapq
 import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import datetime, timedelta, UTC
 from functools import lru_cache
 from typing import Any
@@ -22,6 +25,13 @@ from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, FieldCondition, Filter, MatchValue, PointStruct, VectorParams
 
 from mcp_server_langgraph.core.config import settings
+from mcp_server_langgraph.core.hybrid_retriever import (
+    BM25Index,
+    Reranker,
+    cross_encoder_reranker,
+    reciprocal_rank_fusion,
+    symbol_term,
+)
 from mcp_server_langgraph.observability.telemetry import logger, metrics, tracer
 from mcp_server_langgraph.utils.response_optimizer import count_tokens
 
@@ -157,6 +167,8 @@ class DynamicContextLoader:
         embedding_provider: str | None = None,
         embedding_dimensions: int | None = None,
         cache_size: int | None = None,
+        enable_hybrid_search: bool | None = None,
+        reranker: Reranker | None = None,
     ):
         """
         Initialize dynamic context loader with encryption and retention support.
@@ -169,6 +181,10 @@ class DynamicContextLoader:
             embedding_provider: "google" or "local" (defaults to settings.embedding_provider)
             embedding_dimensions: Embedding dimensions (defaults to settings.embedding_dimensions)
             cache_size: LRU cache size for loaded contexts (defaults to settings.context_cache_size)
+            enable_hybrid_search: Fuse BM25 and vector results in hybrid_search()
+                (defaults to settings.enable_hybrid_search)
+            reranker: Optional re-ranker for fused results (defaults to a cross-encoder
+                when settings.hybrid_search_reranker_model is set)
 
         Note:
             For regulated workloads (HIPAA, GDPR, etc.):
@@ -230,6 +246,17 @@ class DynamicContextLoader:
         # LRU cache for loaded contexts
         self._load_context_cached = lru_cache(maxsize=cache_size)(self._load_context_impl)
 
+        # Lexical side of hybrid search, fed by index_context() (and rebuild_lexical_index())
+        self.enable_hybrid_search = settings.enable_hybrid_search if enable_hybrid_search is None else enable_hybrid_search
+        self.rrf_k = settings.hybrid_search_rrf_k
+        self.hybrid_candidates = settings.hybrid_search_candidates
+        self.lexical_index = BM25Index()
+        self._lexical_entries: dict[str, tuple[ContextReference, float]] = {}  # ref_id -> (reference, expires_at)
+        self._lexical_expiry: list[tuple[float, str]] = []  # min-heap of (expires_at, ref_id)
+        if reranker is None and settings.hybrid_search_reranker_model:
+            reranker = cross_encoder_reranker(settings.hybrid_search_reranker_model)
+        self.reranker = reranker
+
         logger.info(
             "DynamicContextLoader initialized",
             extra={
@@ -241,6 +268,8 @@ class DynamicContextLoader:
                 "encryption_enabled": self.enable_encryption,
                 "retention_days": self.retention_days,
                 "auto_deletion_enabled": self.enable_auto_deletion,
+                "hybrid_search_enabled": self.enable_hybrid_search,
+                "reranker_enabled": self.reranker is not None,
             },
         )
 
@@ -358,6 +387,12 @@ class DynamicContextLoader:
                 # Upsert to Qdrant
                 await asyncio.to_thread(self.client.upsert, collection_name=self.collection_name, points=[point])
 
+                self._index_lexical(
+                    ContextReference(ref_id=ref_id, ref_type=ref_type, summary=summary, metadata=metadata or {}),
+                    content,
+                    expires_at,
+                )
+
                 logger.info(f"Indexed context: {ref_id}", extra={"ref_type": ref_type, "summary": summary})
                 metrics.successful_calls.add(1, {"operation": "index_context", "type": ref_type})
 
@@ -440,6 +475,181 @@ class DynamicContextLoader:
                 metrics.failed_calls.add(1, {"operation": "semantic_search", "error": type(e).__name__})
                 return []
 
+    def _index_lexical(self, reference: ContextReference, content: str, expires_at: float) -> None:
+        """Add a context to the BM25 index (ID, summary and plaintext content)."""
+        self._purge_expired_lexical()
+        self.lexical_index.add(reference.ref_id, f"{reference.ref_id} {reference.summary} {content}")
+        self._lexical_entries[reference.ref_id] = (reference, expires_at)
+        if self.enable_auto_deletion and expires_at != float("inf"):
+            heapq.heappush(self._lexical_expiry, (expires_at, reference.ref_id))
+
+    def _purge_expired_lexical(self) -> None:
+        """
+        Drop contexts past their retention from the BM25 index.
+
+        The index holds terms from decrypted content, so expired contexts are
+        removed rather than just filtered out of results.
+        """
+        now = time.time()
+        while self._lexical_expiry and self._lexical_expiry[0][0] <= now:
+            expires_at, ref_id = heapq.heappop(self._lexical_expiry)
+            entry = self._lexical_entries.get(ref_id)
+            # Skip heap entries superseded by re-indexing with a later expiry
+            if entry is not None and entry[1] == expires_at:
+                del self._lexical_entries[ref_id]
+                self.lexical_index.remove(ref_id)
+
+    def _lexical_candidate(self, ref_id: str, ref_type_filter: str | None) -> bool:
+        """Whether a lexical hit is still retained and matches the type filter."""
+        reference, expires_at = self._lexical_entries[ref_id]
+        if ref_type_filter and reference.ref_type != ref_type_filter:
+            return False
+        return not (self.enable_auto_deletion and expires_at <= time.time())
+
+    async def rebuild_lexical_index(self, batch_size: int = 256) -> int:
+        """
+        Rebuild the BM25 index from everything stored in the Qdrant collection.
+
+        index_context() keeps the index current for contexts indexed by this
+        process; call this once at startup to also cover earlier ones.
+
+        Args:
+            batch_size: Points fetched per scroll request
+
+        Returns:
+            Number of contexts indexed
+        """
+        with tracer.start_as_current_span("context.rebuild_lexical_index") as span:
+            indexed = 0
+            offset = None
+            while True:
+                points, offset = await asyncio.to_thread(
+                    self.client.scroll,
+                    collection_name=self.collection_name,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False,
+                )
+                for point in points:
+                    payload = point.payload
+                    if payload is None:
+                        continue
+                    expires_at = payload.get("expires_at", float("inf"))
+                    if self.enable_auto_deletion and expires_at <= time.time():
+                        continue  # Past retention, awaiting deletion
+                    content = payload["content"]
+                    if payload.get("encrypted", False):
+                        content = self._decrypt_content(content)
+                    reference = ContextReference(
+                        ref_id=payload["ref_id"],
+                        ref_type=payload["ref_type"],
+                        summary=payload["summary"],
+                        metadata=payload.get("metadata", {}),
+                    )
+                    self._index_lexical(reference, content, expires_at)
+                    indexed += 1
+                if offset is None:
+                    break
+
+            span.set_attribute("contexts.count", indexed)
+            logger.info("Lexical index rebuilt", extra={"collection": self.collection_name, "contexts": indexed})
+            return indexed
+
+    async def hybrid_search(
+        self,
+        query: str,
+        top_k: int = 5,
+        ref_type_filter: str | None = None,
+        min_score: float = 0.5,
+    ) -> list[ContextReference]:
+        """
+        Search with BM25 and vector similarity, fused by reciprocal rank.
+
+        - Queries that are a single ID or code symbol ("ref_123",
+          "ParallelToolExecutor") with an exact lexical match are answered
+          from the BM25 index alone - no embedding call is made.
+        - Otherwise BM25 and semantic_search() results are fused with
+          reciprocal-rank fusion and optionally re-ranked.
+
+        With hybrid search disabled, or before anything has been indexed
+        lexically, this is exactly semantic_search().
+
+        Args:
+            query: Search query
+            top_k: Number of results
+            ref_type_filter: Optional filter by ref_type
+            min_score: Minimum similarity score (0-1) for vector results
+
+        Returns:
+            List of context references sorted by relevance. relevance_score is
+            the re-ranker score when re-ranking, otherwise the fused score
+            normalized so that 1.0 means ranked first by every retriever
+        """
+        self._purge_expired_lexical()
+        if not self.enable_hybrid_search or not len(self.lexical_index):
+            return await self.semantic_search(query, top_k=top_k, ref_type_filter=ref_type_filter, min_score=min_score)
+
+        with tracer.start_as_current_span("context.hybrid_search") as span:
+            span.set_attribute("query", query)
+            span.set_attribute("top_k", top_k)
+
+            def is_candidate(ref_id: str) -> bool:
+                return self._lexical_candidate(ref_id, ref_type_filter)
+
+            # Exact identifier / symbol lookups: BM25 only, no embedding
+            term = symbol_term(query)
+            if term is not None:
+                exact = self.lexical_index.documents_with_term(term)
+                lexical = self.lexical_index.search(
+                    query, top_k, doc_filter=lambda ref_id: ref_id in exact and is_candidate(ref_id)
+                )
+                if lexical:
+                    best = lexical[0][1]
+                    references = [
+                        self._lexical_entries[ref_id][0].model_copy(update={"relevance_score": score / best})
+                        for ref_id, score in lexical
+                    ]
+                    span.set_attribute("route", "lexical")
+                    span.set_attribute("results.count", len(references))
+                    metrics.successful_calls.add(1, {"operation": "hybrid_search", "route": "lexical"})
+                    return references
+
+            candidates = max(top_k, self.hybrid_candidates)
+            lexical = self.lexical_index.search(query, candidates, doc_filter=is_candidate)
+            vector = await self.semantic_search(query, top_k=candidates, ref_type_filter=ref_type_filter, min_score=min_score)
+
+            fused = reciprocal_rank_fusion([[ref.ref_id for ref in vector], [ref_id for ref_id, _ in lexical]], k=self.rrf_k)
+            by_id = {ref_id: self._lexical_entries[ref_id][0] for ref_id, _ in lexical}
+            by_id.update((ref.ref_id, ref) for ref in vector)
+            best_possible = 2 / (self.rrf_k + 1)
+            references = [
+                by_id[ref_id].model_copy(update={"relevance_score": min(score / best_possible, 1.0)})
+                for ref_id, score in fused
+            ]
+
+            if self.reranker is not None and len(references) > 1:
+                references = await self._rerank(query, references)
+
+            references = references[:top_k]
+            span.set_attribute("route", "fused")
+            span.set_attribute("results.count", len(references))
+            metrics.successful_calls.add(1, {"operation": "hybrid_search", "route": "fused"})
+            return references
+
+    async def _rerank(self, query: str, references: list[ContextReference]) -> list[ContextReference]:
+        """Re-order references by the re-ranker's score on their summaries; keeps the order on failure."""
+        if self.reranker is None:
+            return references
+        try:
+            scores = await asyncio.to_thread(self.reranker, query, [ref.summary for ref in references])
+        except Exception as e:
+            logger.warning(f"Re-ranking failed, keeping fused order: {e}")
+            return references
+
+        ranked = sorted(zip(scores, references, strict=True), key=lambda pair: pair[0], reverse=True)
+        return [ref.model_copy(update={"relevance_score": float(score)}) for score, ref in ranked]
+
     async def progressive_discover(
         self,
         initial_query: str,
@@ -449,7 +659,9 @@ class DynamicContextLoader:
         """
         Progressive discovery: iteratively refine search based on results.
 
-        Implements Anthropic's "Progressive Disclosure" pattern.
+        Implements Anthropic's "Progressive Disclosure" pattern. Collects the
+        whole stream from iter_progressive_discover(); prefer the iterator
+        when results can be consumed as they arrive.
 
         Args:
             initial_query: Starting search query
@@ -459,45 +671,102 @@ class DynamicContextLoader:
         Returns:
             Aggregated context references from all iterations
         """
+        return [ref async for ref in self.iter_progressive_discover(initial_query, max_iterations, expansion_keywords)]
+
+    async def iter_progressive_discover(
+        self,
+        initial_query: str,
+        max_iterations: int = 3,
+        expansion_keywords: list[str] | None = None,
+        top_k: int = 5,
+    ) -> AsyncIterator[ContextReference]:
+        """
+        Stream progressive discovery results as each search completes.
+
+        Searches run in a background task, so the next iteration's search
+        overlaps with whatever the caller does with the references already
+        yielded (e.g. loading them). Closing the iterator early - as
+        load_batch() does once its token budget is met - cancels the
+        remaining searches.
+
+        Each iteration expands the query with the next expansion keyword,
+        or, without keywords, with the summary of the previous iteration's
+        most relevant new result. Discovery stops early when an iteration
+        finds nothing new or the keywords run out.
+
+        Args:
+            initial_query: Starting search query
+            max_iterations: Maximum search iterations
+            expansion_keywords: Keywords to expand search, one per iteration after the first
+            top_k: Results per search
+
+        Yields:
+            New (deduplicated) context references, most relevant first per iteration
+        """
+        queue: asyncio.Queue[ContextReference | None] = asyncio.Queue()
+        searches = asyncio.create_task(
+            self._run_progressive_discovery(queue, initial_query, max_iterations, expansion_keywords, top_k)
+        )
+        try:
+            while (ref := await queue.get()) is not None:
+                yield ref
+            await searches  # Surface search failures
+        finally:
+            searches.cancel()
+
+    async def _run_progressive_discovery(
+        self,
+        queue: asyncio.Queue[ContextReference | None],
+        initial_query: str,
+        max_iterations: int,
+        expansion_keywords: list[str] | None,
+        top_k: int,
+    ) -> None:
+        """Run the discovery searches, queueing new references; None marks the end."""
         with tracer.start_as_current_span("context.progressive_discover") as span:
             span.set_attribute("initial_query", initial_query)
             span.set_attribute("max_iterations", max_iterations)
 
-            all_references = []
-            seen_ids = set()
+            seen_ids: set[str] = set()
             current_query = initial_query
+            iterations = 0
 
-            for iteration in range(max_iterations):
-                logger.info(f"Progressive discovery iteration {iteration + 1}/{max_iterations}")
+            try:
+                for iteration in range(max_iterations):
+                    iterations = iteration + 1
+                    logger.info(f"Progressive discovery iteration {iterations}/{max_iterations}")
 
-                # Search with current query
-                results = await self.semantic_search(current_query, top_k=5)
+                    # Search with current query
+                    results = await self.hybrid_search(current_query, top_k=top_k)
 
-                # Add new results
-                for ref in results:
-                    if ref.ref_id not in seen_ids:
-                        all_references.append(ref)
+                    # Hand new results to the consumer straight away
+                    new_results = [ref for ref in results if ref.ref_id not in seen_ids]
+                    for ref in new_results:
                         seen_ids.add(ref.ref_id)
-
-                # Stop if no new results
-                if not results:
-                    logger.info(f"No new results in iteration {iteration + 1}, stopping")
-                    break
-
-                # Expand query for next iteration
-                if expansion_keywords and iteration < max_iterations - 1:
-                    current_query = f"{current_query} {expansion_keywords[iteration]}"
-
-            span.set_attribute("total_references", len(all_references))
-            span.set_attribute("iterations_completed", iteration + 1)
+                        queue.put_nowait(ref)
+
+                    # Stop if no new results
+                    if not new_results:
+                        logger.info(f"No new results in iteration {iterations}, stopping")
+                        break
+
+                    # Expand query for next iteration
+                    if expansion_keywords is None:
+                        current_query = f"{initial_query} {new_results[0].summary}"
+                    elif iteration < len(expansion_keywords):
+                        current_query = f"{current_query} {expansion_keywords[iteration]}"
+                    else:
+                        break
+            finally:
+                queue.put_nowait(None)
+                span.set_attribute("total_references", len(seen_ids))
+                span.set_attribute("iterations_completed", iterations)
 
             logger.info(
                 "Progressive discovery completed",
-                extra={"iterations": iteration + 1, "total_references": len(all_references)},
+                extra={"iterations": iterations, "total_references": len(seen_ids)},
             )
 
-            return all_references
-
     async def load_context(self, reference: ContextReference) -> LoadedContext:
         """
         Load full context from a reference.
@@ -574,41 +843,67 @@ class DynamicContextLoader:
             metrics.failed_calls.add(1, {"operation": "load_context", "error": type(e).__name__})
             raise
 
-    async def load_batch(self, references: list[ContextReference], max_tokens: int = 4000) -> list[LoadedContext]:
+    async def load_batch(
+        self,
+        references: Iterable[ContextReference] | AsyncIterable[ContextReference],
+        max_tokens: int = 4000,
+    ) -> list[LoadedContext]:
         """
         Load multiple contexts up to token limit.
 
-        Implements token-aware batching.
+        Implements token-aware batching. References may be streamed (e.g. from
+        iter_progressive_discover()): each is loaded as soon as it arrives, and
+        the stream is closed as soon as the budget is used up, so no further
+        searches run.
 
         Args:
-            references: List of references to load
+            references: References to load, as a list or an async stream
             max_tokens: Maximum total tokens
 
         Returns:
             List of loaded contexts within token budget
         """
         with tracer.start_as_current_span("context.load_batch") as span:
-            loaded = []
+            loaded: list[LoadedContext] = []
             total_tokens = 0
 
-            for ref in references:
-                context = await self.load_context(ref)
+            try:
+                async for ref in self._iterate_references(references):
+                    context = await self.load_context(ref)
+
+                    if total_tokens + context.token_count > max_tokens:
+                        logger.info(
+                            f"Token limit reached, loaded {len(loaded)} contexts",
+                            extra={"total_tokens": total_tokens, "limit": max_tokens},
+                        )
+                        break
 
-                if total_tokens + context.token_count <= max_tokens:
                     loaded.append(context)
                     total_tokens += context.token_count
-                else:
-                    logger.info(
-                        f"Token limit reached, loaded {len(loaded)}/{len(references)} contexts",
-                        extra={"total_tokens": total_tokens, "limit": max_tokens},
-                    )
-                    break
+                    if total_tokens >= max_tokens:
+                        # Budget exactly used - don't wait for more references
+                        break
+            finally:
+                aclose = getattr(references, "aclose", None)
+                if aclose is not None:
+                    await aclose()
 
             span.set_attribute("contexts_loaded", len(loaded))
             span.set_attribute("total_tokens", total_tokens)
 
             return loaded
 
+    @staticmethod
+    async def _iterate_references(
+        references: Iterable[ContextReference] | AsyncIterable[ContextReference],
+    ) -> AsyncIterator[ContextReference]:
+        if isinstance(references, AsyncIterable):
+            async for ref in references:
+                yield ref
+        else:
+            for ref in references:
+                yield ref
+
     def to_messages(self, loaded_contexts: list[LoadedContext]) -> list[BaseMessage]:
         """
         Convert loaded contexts to LangChain messages.
@@ -653,7 +948,7 @@ async def search_and_load_context(
         loader = DynamicContextLoader()
 
     # Search
-    references = await loader.semantic_search(query, top_k=top_k)
+    references = await loader.hybrid_search(query, top_k=top_k)
 
     # Load within budget
     loaded = await loader.load_batch(references, max_tokens=max_tokens)
@@ -563,6 +563,41 @@ class BulkheadRejectedError(ResilienceError):
         return "Service is under heavy load. Please try again in a moment."
 
 
+class AdmissionRejectedError(ResilienceError):
+    """Request shed by admission control (estimated queue wait exceeds its budget).
+
+    The retry_after attribute holds the estimated wait in seconds, surfaced to
+    clients as a Retry-After header.
+    """
+
+    default_message = "Request rejected by admission control"
+    default_error_code = "resilience.admission_rejected"
+    default_status_code = 503
+
+    def __init__(
+        self,
+        message: str | None = None,
+        retry_after: float | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize AdmissionRejectedError.
+
+        Args:
+            message: Human-readable error message
+            retry_after: Seconds the client should wait before retrying
+            **kwargs: Additional arguments passed to parent
+        """
+        # Set retry_after BEFORE calling super().__init__ because
+        # _generate_user_message() is called during parent initialization
+        self.retry_after = retry_after
+        super().__init__(message=message, **kwargs)
+
+    def _generate_user_message(self) -> str:
+        if self.retry_after:
+            return f"Service is under heavy load. Please wait {int(self.retry_after)} seconds and try again."
+        return "Service is under heavy load. Please try again in a moment."
+
+
 # ==============================================================================
 # Storage Errors (500 - Server Error)
 # ==============================================================================
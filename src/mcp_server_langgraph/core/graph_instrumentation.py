@@ -0,0 +1,238 @@
+"""
+Per-node instrumentation for the agent graph.
+
+instrument_node() wraps a LangGraph node so that every execution records:
+- duration
+- LLM tokens consumed by calls made inside the node
+- cache hits/misses inside the node
+- the approximate size of the state it returns
+
+These values are recorded as agent.node.* histograms and as attributes
+on an agent.node.<name> span. They are also added to a process-wide
+GraphStats summary that /debug/graph-stats ranks by cumulative cost.
+
+Tokens and cache hits are attributed through a ContextVar: the LLM metrics
+and CacheService call record_node_llm_tokens() / record_node_cache_access(),
+which add to the usage of whichever node is running in the current context.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar, cast
+
+from mcp_server_langgraph.observability.profiler import tag_stage
+from mcp_server_langgraph.observability.telemetry import (
+    agent_node_cache_hits_histogram,
+    agent_node_duration_histogram,
+    agent_node_state_size_histogram,
+    agent_node_tokens_histogram,
+    tracer,
+)
+
+RankBy = Literal["duration", "tokens", "state_bytes", "calls"]
+
+NodeFunc = TypeVar("NodeFunc", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass
+class NodeUsage:
+    """Resources used by one node execution."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_calls: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+_current_node_usage: ContextVar[NodeUsage | None] = ContextVar("agent_node_usage", default=None)
+
+
+def record_node_llm_tokens(prompt_tokens: int, completion_tokens: int) -> None:
+    """Attribute an LLM call's tokens to the running graph node (no-op outside a node)."""
+    usage = _current_node_usage.get()
+    if usage is not None:
+        usage.prompt_tokens += prompt_tokens
+        usage.completion_tokens += completion_tokens
+        usage.llm_calls += 1
+
+
+def record_node_cache_access(hit: bool) -> None:
+    """Attribute a cache lookup to the running graph node (no-op outside a node)."""
+    usage = _current_node_usage.get()
+    if usage is not None:
+        if hit:
+            usage.cache_hits += 1
+        else:
+            usage.cache_misses += 1
+
+
+def estimate_state_bytes(state: Any) -> int:
+    """
+    Approximate serialized size of a node's returned state.
+
+    Message contents are measured directly (they dominate the size) and the
+    remaining keys are JSON-encoded, so no full checkpoint serialization is
+    needed on every node.
+    """
+    if not isinstance(state, dict):
+        return 0
+    size = 0
+    for key, value in state.items():
+        if key == "messages" and isinstance(value, list):
+            size += sum(len(str(getattr(message, "content", message)).encode()) for message in value)
+        else:
+            size += len(json.dumps(value, default=str).encode())
+    return size
+
+
+@dataclass
+class NodeStats:
+    """Cumulative statistics for one graph node."""
+
+    calls: int = 0
+    errors: int = 0
+    total_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    total_tokens: int = 0
+    llm_calls: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    total_state_bytes: int = 0
+    durations_ms: list[float] = field(default_factory=list)  # Recent window for percentiles
+
+    def to_dict(self) -> dict[str, Any]:
+        recent = sorted(self.durations_ms)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_duration_ms": round(self.total_duration_ms, 2),
+            "mean_duration_ms": round(self.total_duration_ms / self.calls, 2) if self.calls else 0.0,
+            "p95_duration_ms": round(p95, 2),
+            "max_duration_ms": round(self.max_duration_ms, 2),
+            "total_tokens": self.total_tokens,
+            "llm_calls": self.llm_calls,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "mean_state_bytes": self.total_state_bytes // self.calls if self.calls else 0,
+        }
+
+
+class GraphStats:
+    """Process-wide per-node summary for /debug/graph-stats."""
+
+    _RANK_KEYS: dict[str, str] = {
+        "duration": "total_duration_ms",
+        "tokens": "total_tokens",
+        "state_bytes": "mean_state_bytes",
+        "calls": "calls",
+    }
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._nodes: dict[str, NodeStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, node: str, duration_ms: float, usage: NodeUsage, state_bytes: int, error: bool) -> None:
+        with self._lock:
+            stats = self._nodes.setdefault(node, NodeStats())
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.total_duration_ms += duration_ms
+            stats.max_duration_ms = max(stats.max_duration_ms, duration_ms)
+            stats.total_tokens += usage.total_tokens
+            stats.llm_calls += usage.llm_calls
+            stats.cache_hits += usage.cache_hits
+            stats.cache_misses += usage.cache_misses
+            stats.total_state_bytes += state_bytes
+            stats.durations_ms.append(duration_ms)
+            if len(stats.durations_ms) > self.window:
+                del stats.durations_ms[: len(stats.durations_ms) - self.window]
+
+    def ranked(self, by: RankBy = "duration") -> list[dict[str, Any]]:
+        """Nodes ordered by cumulative cost (highest first), with their share of the total."""
+        with self._lock:
+            rows = [{"node": node, **stats.to_dict()} for node, stats in self._nodes.items()]
+        key = self._RANK_KEYS[by]
+        total = sum(row[key] for row in rows) or 1
+        for row in rows:
+            row["share"] = round(row[key] / total, 4)
+        return sorted(rows, key=lambda row: row[key], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._nodes.clear()
+
+
+_graph_stats = GraphStats()
+
+
+def get_graph_stats() -> GraphStats:
+    """Return the process-wide graph node statistics."""
+    return _graph_stats
+
+
+def instrument_node(name: str, func: NodeFunc) -> NodeFunc:
+    """
+    Wrap an async graph node with per-node metrics, a span and a profiler stage tag.
+
+    Example:
+        >>> workflow.add_node("respond", instrument_node("generate_response", generate_response))
+    """
+    tagged = tag_stage(f"node:{name}", func)
+    attributes = {"node": name}
+    duration_histogram = agent_node_duration_histogram.bind(attributes)
+    tokens_histogram = agent_node_tokens_histogram.bind(attributes)
+    cache_hits_histogram = agent_node_cache_hits_histogram.bind(attributes)
+    state_size_histogram = agent_node_state_size_histogram.bind(attributes)
+
+    @functools.wraps(func)
+    async def instrumented(state: Any) -> Any:
+        usage = NodeUsage()
+        token = _current_node_usage.set(usage)
+        with tracer.start_as_current_span(f"agent.node.{name}") as span:
+            started = time.perf_counter()
+            error = False
+            result = None
+            try:
+                result = await tagged(state)
+                return result
+            except BaseException:
+                error = True
+                raise
+            finally:
+                duration_ms = (time.perf_counter() - started) * 1000
+                _current_node_usage.reset(token)
+                state_bytes = estimate_state_bytes(result)
+
+                duration_histogram.record(duration_ms)
+                tokens_histogram.record(usage.total_tokens)
+                cache_hits_histogram.record(usage.cache_hits)
+                state_size_histogram.record(state_bytes)
+                _graph_stats.record(name, duration_ms, usage, state_bytes, error)
+
+                if span.is_recording():
+                    span.set_attributes(
+                        {
+                            "agent.node": name,
+                            "agent.node.duration_ms": duration_ms,
+                            "agent.node.llm_calls": usage.llm_calls,
+                            "agent.node.prompt_tokens": usage.prompt_tokens,
+                            "agent.node.completion_tokens": usage.completion_tokens,
+                            "agent.node.cache_hits": usage.cache_hits,
+                            "agent.node.cache_misses": usage.cache_misses,
+                            "agent.node.state_bytes": state_bytes,
+                        }
+                    )
+
+    return cast(NodeFunc, instrumented)
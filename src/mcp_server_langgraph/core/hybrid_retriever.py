@@ -0,0 +1,224 @@
+"""
+Hybrid Retrieval Building Blocks
+
+Lexical search to complement vector similarity in dynamic context loading:
+- Identifier-aware tokenization (snake_case, camelCase, dotted paths, IDs)
+- Incremental in-memory BM25 inverted index
+- Reciprocal-rank fusion of ranked result lists
+- Optional cross-encoder re-ranking
+
+Embeddings are good at paraphrase but routinely miss exact identifiers
+("ref_8f2c", "ParallelToolExecutor", "user-042"); BM25 finds those directly
+and needs no embedding call to do so.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from collections.abc import Callable, Sequence
+
+# Words, optionally joined by path/module separators: "core.agent", "user-042", "a/b.py"
+_TOKEN_PATTERN = re.compile(r"\w+(?:[.\-/:]+\w+)*")
+# Pieces of a compound identifier: "HTTPServerError" -> HTTP, Server, Error
+_SUBTOKEN_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+_SYMBOL_HINT_PATTERN = re.compile(r"[_.\-/:\d]|[a-z][A-Z]")
+
+Reranker = Callable[[str, Sequence[str]], Sequence[float]]
+"""Scores (query, passages) pairs; higher is more relevant."""
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase BM25 terms.
+
+    Compound identifiers are kept whole (so exact lookups stay precise) and
+    also split into their parts (so "tool executor" still matches
+    "ParallelToolExecutor").
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in order of appearance, including compound parts
+    """
+    terms: list[str] = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        word = match.group()
+        terms.append(word.lower())
+        parts = _SUBTOKEN_PATTERN.findall(word)
+        if len(parts) > 1:
+            terms.extend(part.lower() for part in parts)
+    return terms
+
+
+def symbol_term(query: str) -> str | None:
+    """
+    Return the query as a single index term if it looks like an ID or code symbol.
+
+    A symbol is one whitespace-free token containing an underscore, digit,
+    separator or camelCase hump, e.g. "ref_123", "core.agent", "getUser()".
+
+    Args:
+        query: Search query
+
+    Returns:
+        Lowercase term to look up, or None for natural-language queries
+    """
+    candidate = query.strip().strip("`'\"").removesuffix("()")
+    if not candidate or not _TOKEN_PATTERN.fullmatch(candidate):
+        return None
+    if not _SYMBOL_HINT_PATTERN.search(candidate):
+        return None
+    return candidate.lower()
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> list[tuple[str, float]]:
+    """
+    Fuse ranked lists of IDs with reciprocal-rank fusion.
+
+    Each ID scores sum(1 / (k + rank)) over the lists it appears in, so items
+    ranked well by several retrievers rise to the top without having to
+    calibrate their raw scores against each other.
+
+    Args:
+        rankings: Ranked ID lists, best first
+        k: Damping constant (60 in the original RRF paper)
+
+    Returns:
+        (id, fused score) pairs, best first
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class BM25Index:
+    """
+    In-memory Okapi BM25 inverted index, updated one document at a time.
+
+    Thread-safe: documents may be added while searches run in worker threads.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization (0 = none, 1 = full)
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._doc_terms: dict[str, list[str]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._doc_lengths
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document, replacing any previous version with the same ID."""
+        term_counts = Counter(tokenize(text))
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term, count in term_counts.items():
+                self._postings.setdefault(term, {})[doc_id] = count
+            length = sum(term_counts.values())
+            self._doc_lengths[doc_id] = length
+            self._doc_terms[doc_id] = list(term_counts)
+            self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        """Drop a document from the index (no-op if absent)."""
+        with self._lock:
+            self._remove_locked(doc_id)
+
+    def _remove_locked(self, doc_id: str) -> None:
+        length = self._doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._doc_terms.pop(doc_id):
+            del self._postings[term][doc_id]
+            if not self._postings[term]:
+                del self._postings[term]
+
+    def documents_with_term(self, term: str) -> set[str]:
+        """IDs of documents containing the exact (lowercase) term."""
+        with self._lock:
+            return set(self._postings.get(term, ()))
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        doc_filter: Callable[[str], bool] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Rank documents against a query.
+
+        Args:
+            query: Search query
+            top_k: Maximum number of results
+            doc_filter: Optional predicate restricting which document IDs may be returned
+
+        Returns:
+            (doc_id, BM25 score) pairs, best first; documents sharing no term are omitted
+        """
+        with self._lock:
+            num_docs = len(self._doc_lengths)
+            if num_docs == 0:
+                return []
+            avg_length = self._total_length / num_docs
+
+            scores: dict[str, float] = {}
+            for term in set(tokenize(query)):
+                docs = self._postings.get(term)
+                if not docs:
+                    continue
+                idf = math.log(1 + (num_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                for doc_id, tf in docs.items():
+                    if doc_filter is not None and not doc_filter(doc_id):
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def cross_encoder_reranker(model_name: str) -> Reranker:
+    """
+    Build a re-ranker from a sentence-transformers cross-encoder.
+
+    Args:
+        model_name: Cross-encoder model, e.g. "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+    Returns:
+        Reranker scoring each passage against the query
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    try:
+        from sentence_transformers import CrossEncoder
+    except ImportError:
+        msg = (
+            "sentence-transformers is required for cross-encoder re-ranking. "
+            "Add 'sentence-transformers' to pyproject.toml dependencies, then run: uv sync"
+        )
+        raise ImportError(msg)
+
+    model = CrossEncoder(model_name)
+
+    def rerank(query: str, passages: Sequence[str]) -> Sequence[float]:
+        return [float(score) for score in model.predict([(query, passage) for passage in passages])]
+
+    return rerank
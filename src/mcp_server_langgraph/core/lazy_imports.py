@@ -0,0 +1,46 @@
+"""
+Lazy package exports.
+
+Package __init__ modules use lazy_exports() instead of eager re-exports so
+that importing a light module (e.g. mcp_server_langgraph.core.config) does
+not drag in LangGraph, LiteLLM, Qdrant, Docker/Kubernetes clients and every
+router. Each export is imported from its defining module on first attribute
+access and cached in the package namespace.
+
+Example:
+    >>> __getattr__ = lazy_exports(__name__, {"agent_graph": "mcp_server_langgraph.core.agent"})
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ (PEP 562) that resolves exports on first use.
+
+    Args:
+        package: The package's __name__
+        exports: Export name -> module that defines it, or "module:attribute" when
+            the export is renamed. A module path equal to "<package>.<name>"
+            exports the submodule itself.
+
+    Returns:
+        Function suitable for assignment to the package's __getattr__
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        module_name, _, attribute = target.partition(":")
+        module = importlib.import_module(module_name)
+        value = module if module_name == f"{package}.{name}" else getattr(module, attribute or name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -2,16 +2,31 @@
 Parallel Tool Execution
 
 Implements Anthropic's parallelization pattern for independent operations.
+
+Tool calls form a DAG: each one starts as soon as the calls it depends on
+have finished. With reference resolution enabled, a call's arguments can use
+another call's output via a "$<id>.result" placeholder, which both adds the
+dependency and is replaced by that output before the call runs:
+
+    [
+        {"id": "1", "name": "search", "args": {"query": "LangGraph"}},
+        {"id": "2", "name": "summarize", "args": {"text": "$1.result"}},
+    ]
+
+A placeholder that is the entire argument value is replaced by the raw result;
+one embedded in a longer string is replaced by the result's text.
 """
 
 import asyncio
+import re
 import time
-from collections import deque
+from collections import defaultdict, deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
 from mcp_server_langgraph.observability.telemetry import logger, metrics, tracer
+from mcp_server_langgraph.resilience.deadline import get_remaining_time
 
 
 @dataclass
@@ -35,14 +50,59 @@ class ToolResult:
     duration_ms: float = 0.0
 
 
+REFERENCE_PATTERN = re.compile(r"\$([\w-]+)\.result")
+
+
+def find_references(value: Any) -> set[str]:
+    """
+    Collect the invocation IDs referenced by "$<id>.result" placeholders.
+
+    Args:
+        value: Tool arguments (strings, dicts and lists are searched recursively)
+
+    Returns:
+        Referenced IDs
+    """
+    if isinstance(value, str):
+        return set(REFERENCE_PATTERN.findall(value))
+    if isinstance(value, dict):
+        return set().union(*(find_references(v) for v in value.values()))
+    if isinstance(value, list | tuple):
+        return set().union(*(find_references(v) for v in value))
+    return set()
+
+
+def substitute_references(value: Any, results: dict[str, Any]) -> Any:
+    """
+    Replace "$<id>.result" placeholders with the referenced outputs.
+
+    Args:
+        value: Tool arguments (strings, dicts and lists are rewritten recursively)
+        results: Output of each referenced invocation, by ID
+
+    Returns:
+        Arguments with placeholders replaced
+    """
+    if isinstance(value, str):
+        whole = REFERENCE_PATTERN.fullmatch(value)
+        if whole:
+            return results[whole.group(1)]
+        return REFERENCE_PATTERN.sub(lambda m: str(results[m.group(1)]), value)
+    if isinstance(value, dict):
+        return {k: substitute_references(v, results) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [substitute_references(v, results) for v in value]
+    return value
+
+
 class ParallelToolExecutor:
     """
     Executes tools in parallel when they have no dependencies.
 
     Implements Anthropic's parallelization pattern:
     - Detects independent operations
-    - Schedules parallel execution
-    - Respects dependencies
+    - Starts each tool as soon as its dependencies finish
+    - Optionally feeds dependency outputs into dependent calls
     - Aggregates results
     """
 
@@ -52,35 +112,56 @@ class ParallelToolExecutor:
 
         Args:
             max_parallelism: Maximum concurrent tool executions
-            task_timeout_seconds: Optional timeout for each task (None = no timeout)
+            task_timeout_seconds: Optional timeout for each task (None = no timeout).
+                Always bounded by the request deadline when one is set.
         """
         self.max_parallelism = max_parallelism
         self.task_timeout_seconds = task_timeout_seconds
         self.semaphore = asyncio.Semaphore(max_parallelism)
 
     async def execute_parallel(
-        self, invocations: list[ToolInvocation], tool_executor: Callable[[str, dict[str, Any]], Any]
+        self,
+        invocations: list[ToolInvocation],
+        tool_executor: Callable[[str, dict[str, Any]], Any],
+        resolve_references: bool = False,
+        aliases: dict[str, str] | None = None,
     ) -> list[ToolResult]:
         """
         Execute tool invocations in parallel where possible.
 
+        Invocations run as a DAG: each starts as soon as all of its
+        dependencies have finished, rather than waiting for the whole
+        previous dependency level.
+
         Args:
             invocations: List of tool invocations
             tool_executor: Async function to execute a single tool
+            resolve_references: Derive dependencies from "$<id>.result" placeholders in
+                the arguments and substitute the referenced outputs before each call.
+                A call whose dependency failed is skipped with an error.
+            aliases: Extra names placeholders may use for an invocation ID
+                (e.g. 1-based positions, since an LLM can't know call IDs in advance)
 
         Returns:
             List of tool results
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
         """
         with tracer.start_as_current_span("tools.parallel_execute") as span:
             span.set_attribute("total_invocations", len(invocations))
 
+            aliases = aliases or {}
+            if resolve_references:
+                invocations = self._with_reference_dependencies(invocations, aliases)
+
             # Build dependency graph
             dependency_graph = self._build_dependency_graph(invocations)
 
-            # Topological sort for execution order
+            # Topological sort validates the graph (no cycles)
             execution_order = self._topological_sort(dependency_graph)
 
-            # Group by dependency level (all items in same level can run in parallel)
+            # Depth of the graph: the critical path in number of tool calls
             levels = self._group_by_level(execution_order, dependency_graph, invocations)
 
             span.set_attribute("parallelization_levels", len(levels))
@@ -94,20 +175,7 @@ class ParallelToolExecutor:
                 },
             )
 
-            # Execute level by level
-            all_results = {}
-
-            for level_idx, level_invocations in enumerate(levels):
-                logger.info(f"Executing level {level_idx + 1}/{len(levels)} with {len(level_invocations)} tools")
-
-                # Execute all invocations in this level in parallel
-                tasks = [self._execute_single(inv, tool_executor) for inv in level_invocations]
-
-                level_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Store results
-                for inv, result in zip(level_invocations, level_results, strict=False):
-                    all_results[inv.invocation_id] = result
+            all_results = await self._execute_dag(invocations, dependency_graph, tool_executor, resolve_references, aliases)
 
             # Convert to list maintaining original order
             results = [all_results[inv.invocation_id] for inv in invocations]
@@ -123,18 +191,130 @@ class ParallelToolExecutor:
             if failed > 0:
                 metrics.failed_calls.add(failed, {"operation": "parallel_tool_execution"})
 
-            return results  # type: ignore[return-value]
+            return results
+
+    async def _execute_dag(
+        self,
+        invocations: list[ToolInvocation],
+        graph: dict[str, list[str]],
+        tool_executor: Callable[..., Any],
+        resolve_references: bool,
+        aliases: dict[str, str],
+    ) -> dict[str, ToolResult]:
+        """Run invocations, starting each one the moment its last dependency finishes."""
+        inv_lookup = {inv.invocation_id: inv for inv in invocations}
+        waiting_on = {node: set(deps) for node, deps in graph.items()}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for node, deps in graph.items():
+            for dep in deps:
+                dependents[dep].append(node)
+
+        results: dict[str, ToolResult] = {}
+        running: dict[asyncio.Task[ToolResult], str] = {}
+
+        def start(node: str) -> None:
+            invocation = inv_lookup[node]
+            if resolve_references:
+                coro = self._execute_resolved(invocation, results, tool_executor, aliases)
+            else:
+                coro = self._execute_single(invocation, tool_executor)
+            running[asyncio.ensure_future(coro)] = node
+
+        for node, pending in waiting_on.items():
+            if not pending:
+                start(node)
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = running.pop(task)
+                    try:
+                        results[node] = task.result()
+                    except Exception as e:
+                        results[node] = ToolResult(
+                            invocation_id=node, tool_name=inv_lookup[node].tool_name, result=None, error=e
+                        )
+
+                    for dependent in dependents[node]:
+                        waiting_on[dependent].discard(node)
+                        if not waiting_on[dependent]:
+                            start(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+
+        return results
+
+    async def _execute_resolved(
+        self,
+        invocation: ToolInvocation,
+        results: dict[str, ToolResult],
+        tool_executor: Callable[..., Any],
+        aliases: dict[str, str],
+    ) -> ToolResult:
+        """Substitute dependency outputs into the arguments, then execute."""
+        referenced = {ref: aliases.get(ref, ref) for ref in find_references(invocation.arguments)}
+
+        unknown = sorted(ref for ref, target in referenced.items() if target not in results)
+        failed = sorted(ref for ref, target in referenced.items() if target in results and results[target].error)
+        if unknown or failed:
+            reason = f"unknown tool result reference(s): {unknown}" if unknown else f"dependency failed: {failed}"
+            return ToolResult(
+                invocation_id=invocation.invocation_id,
+                tool_name=invocation.tool_name,
+                result=None,
+                error=RuntimeError(f"Skipped '{invocation.tool_name}': {reason}"),
+            )
+
+        outputs = {ref: results[target].result for ref, target in referenced.items()}
+        arguments = substitute_references(invocation.arguments, outputs)
+        resolved = ToolInvocation(
+            tool_name=invocation.tool_name,
+            arguments=arguments,
+            invocation_id=invocation.invocation_id,
+            dependencies=invocation.dependencies,
+        )
+        return await self._execute_single(resolved, tool_executor)
+
+    def _with_reference_dependencies(self, invocations: list[ToolInvocation], aliases: dict[str, str]) -> list[ToolInvocation]:
+        """Add a dependency for every placeholder that names another invocation."""
+        known = {inv.invocation_id for inv in invocations}
+        updated = []
+        for inv in invocations:
+            targets = {aliases.get(ref, ref) for ref in find_references(inv.arguments)}
+            # Unknown references are reported when the invocation runs, not treated as graph edges
+            extra = sorted(targets & known - set(inv.dependencies) - {inv.invocation_id})
+            updated.append(
+                ToolInvocation(
+                    tool_name=inv.tool_name,
+                    arguments=inv.arguments,
+                    invocation_id=inv.invocation_id,
+                    dependencies=[*inv.dependencies, *extra],
+                )
+            )
+        return updated
 
     async def _execute_single(self, invocation: ToolInvocation, tool_executor: Callable[..., Any]) -> ToolResult:
         """Execute a single tool invocation with optional timeout."""
         async with self.semaphore:  # Limit concurrency
             start_time = time.time()
 
+            # Bound the task timeout by the request deadline
+            timeout_seconds = self.task_timeout_seconds
+            remaining = get_remaining_time()
+            if remaining is not None:
+                timeout_seconds = remaining if timeout_seconds is None else min(timeout_seconds, remaining)
+
             try:
+                if timeout_seconds is not None and timeout_seconds <= 0:
+                    # Request deadline already passed: don't start the tool
+                    raise TimeoutError
+
                 # Apply timeout if configured
-                if self.task_timeout_seconds is not None:
+                if timeout_seconds is not None:
                     result = await asyncio.wait_for(
-                        tool_executor(invocation.tool_name, invocation.arguments), timeout=self.task_timeout_seconds
+                        tool_executor(invocation.tool_name, invocation.arguments), timeout=timeout_seconds
                     )
                 else:
                     result = await tool_executor(invocation.tool_name, invocation.arguments)
@@ -148,12 +328,17 @@ class ParallelToolExecutor:
                     duration_ms=duration_ms,
                 )
 
-            except TimeoutError:
+            except TimeoutError as e:
                 duration_ms = (time.time() - start_time) * 1000
-                timeout_error = TimeoutError(f"Tool '{invocation.tool_name}' exceeded timeout of {self.task_timeout_seconds}s")
+                # With no bound applied, the tool raised TimeoutError itself (e.g. an HTTP client timeout)
+                timeout_error = (
+                    e
+                    if timeout_seconds is None
+                    else TimeoutError(f"Tool '{invocation.tool_name}' exceeded timeout of {timeout_seconds:g}s")
+                )
                 logger.warning(
                     f"Tool execution timeout: {invocation.tool_name}",
-                    extra={"timeout_seconds": self.task_timeout_seconds, "duration_ms": duration_ms},
+                    extra={"timeout_seconds": timeout_seconds, "duration_ms": duration_ms},
                 )
 
                 return ToolResult(
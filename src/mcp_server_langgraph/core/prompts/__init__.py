@@ -13,11 +13,13 @@ References:
 
 from mcp_server_langgraph.core.prompts.response_prompt import RESPONSE_SYSTEM_PROMPT
 from mcp_server_langgraph.core.prompts.router_prompt import ROUTER_SYSTEM_PROMPT
+from mcp_server_langgraph.core.prompts.tool_plan_prompt import TOOL_PLAN_PROMPT
 from mcp_server_langgraph.core.prompts.verification_prompt import VERIFICATION_SYSTEM_PROMPT
 
 __all__ = [
     "RESPONSE_SYSTEM_PROMPT",
     "ROUTER_SYSTEM_PROMPT",
+    "TOOL_PLAN_PROMPT",
     "VERIFICATION_SYSTEM_PROMPT",
     "get_prompt",
     "get_prompt_version",
@@ -39,6 +41,10 @@ _PROMPT_VERSIONS: dict[str, dict[str, str]] = {
         "v1": VERIFICATION_SYSTEM_PROMPT,
         "latest": VERIFICATION_SYSTEM_PROMPT,
     },
+    "tool_plan": {
+        "v1": TOOL_PLAN_PROMPT,
+        "latest": TOOL_PLAN_PROMPT,
+    },
 }
 
 # Current version metadata
@@ -46,6 +52,7 @@ _PROMPT_METADATA: dict[str, dict[str, str]] = {
     "router": {"current_version": "v1", "created": "2025-01-15", "last_updated": "2025-01-15"},
     "response": {"current_version": "v1", "created": "2025-01-15", "last_updated": "2025-01-15"},
     "verification": {"current_version": "v1", "created": "2025-01-15", "last_updated": "2025-01-15"},
+    "tool_plan": {"current_version": "v1", "created": "2026-10-19", "last_updated": "2026-10-19"},
 }
 
 
@@ -54,7 +61,7 @@ def get_prompt(prompt_name: str, version: str | None = None) -> str:
     Get a prompt by name with optional versioning.
 
     Args:
-        prompt_name: Name of the prompt ("router", "response", "verification")
+        prompt_name: Name of the prompt ("router", "response", "verification", "tool_plan")
         version: Optional version string (default: "latest")
 
     Returns:
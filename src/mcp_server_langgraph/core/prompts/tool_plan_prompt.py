@@ -0,0 +1,30 @@
+"""
+Tool Plan Prompt with XML Structure
+
+Added to the system prompt when enable_tool_dag_execution is on, so the model
+knows it can chain tool calls in one turn:
+- Placeholder syntax for another call's output
+- When to chain calls vs. wait for results
+- Example plan
+"""
+
+TOOL_PLAN_PROMPT = """<tool_plan>
+You can request several tool calls in one turn and chain them: an argument of one call can use
+the output of another call in the same turn.
+
+<instructions>
+1. Write "$<n>.result" in an argument to use the output of the n-th tool call of this turn
+   (1-based, in the order you list the calls). The placeholder is replaced by that output
+   before the call runs; it may be the whole argument or part of a longer string.
+2. A call that uses a placeholder runs as soon as the call it references finishes.
+   Calls without placeholders run in parallel.
+3. Only reference calls of the same turn. A call must not reference itself,
+   and references must not form a cycle.
+4. If a referenced call fails, every call that depends on it is skipped and reported as an error.
+</instructions>
+
+<example>
+1. web_search(query="current population of Lisbon")
+2. calculator(expression="$1.result * 2")
+</example>
+</tool_plan>"""
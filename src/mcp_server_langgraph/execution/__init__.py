@@ -4,29 +4,19 @@ Code execution module for MCP server
 Provides secure sandboxed code execution with resource limits and security controls.
 """
 
+from typing import TYPE_CHECKING
+
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
 from mcp_server_langgraph.execution.code_validator import CodeValidationError, CodeValidator, ValidationResult
 from mcp_server_langgraph.execution.resource_limits import ResourceLimitError, ResourceLimits
-from mcp_server_langgraph.execution.sandbox import ExecutionResult, Sandbox, SandboxError
-
-# Optional: KubernetesSandbox requires kubernetes package
-# Import conditionally to avoid failures when kubernetes is not installed
-try:
-    from mcp_server_langgraph.execution.kubernetes_sandbox import KubernetesSandbox
-
-    _KUBERNETES_AVAILABLE = True
-except ImportError:
-    KubernetesSandbox = None  # type: ignore
-    _KUBERNETES_AVAILABLE = False
+from mcp_server_langgraph.execution.sandbox import ExecutionResult, OutputCallback, Sandbox, SandboxError
 
-# Optional: DockerSandbox requires docker package
-# Import conditionally to avoid failures when docker is not installed
-try:
-    from mcp_server_langgraph.execution.docker_sandbox import DockerSandbox
-
-    _DOCKER_AVAILABLE = True
-except ImportError:
-    DockerSandbox = None  # type: ignore
-    _DOCKER_AVAILABLE = False
+# Sandbox backends import the docker / kubernetes clients (optional dependencies,
+# and slow to import) - they are loaded on first access. Accessing KubernetesSandbox
+# without the kubernetes package installed raises ImportError.
+if TYPE_CHECKING:
+    from mcp_server_langgraph.execution.docker_sandbox import DockerSandbox as DockerSandbox
+    from mcp_server_langgraph.execution.kubernetes_sandbox import KubernetesSandbox as KubernetesSandbox
 
 __all__ = [
     "CodeValidationError",
@@ -34,9 +24,18 @@ __all__ = [
     "DockerSandbox",
     "ExecutionResult",
     "KubernetesSandbox",
+    "OutputCallback",
     "ResourceLimitError",
     "ResourceLimits",
     "Sandbox",
     "SandboxError",
     "ValidationResult",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DockerSandbox": "mcp_server_langgraph.execution.docker_sandbox",
+        "KubernetesSandbox": "mcp_server_langgraph.execution.kubernetes_sandbox",
+    },
+)
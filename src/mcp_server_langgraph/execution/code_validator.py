@@ -3,10 +3,35 @@ Code validator for secure Python code execution
 
 Uses AST-based validation to detect dangerous patterns and enforce import whitelists.
 Security-first design following defense-in-depth principles.
+
+Agents often resubmit the same or near-identical code, so results are cached
+by content hash, and a single regex pass rejects obvious violations (blocked
+imports, blocked builtin calls) before the code is parsed.
 """
 
 import ast
+import bisect
+import hashlib
+import io
+import re
+import threading
+import time
+import tokenize
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import ClassVar
+
+from mcp_server_langgraph.observability.telemetry import code_validation_duration_histogram
+
+# Validation results kept across CodeValidator instances (content hash + allowlist -> result)
+VALIDATION_CACHE_SIZE = 1024
+
+_validation_latency = {
+    outcome: code_validation_duration_histogram.bind({"outcome": outcome}) for outcome in ("cache_hit", "prefilter", "parsed")
+}
+
+# Tokens after which a NAME begins a new statement
+_STATEMENT_BOUNDARY_TOKENS = frozenset({tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING})
 
 
 class CodeValidationError(Exception):
@@ -125,6 +150,10 @@ class CodeValidator:
         "func_globals",  # Python 2
     }
 
+    _cache: ClassVar[OrderedDict[tuple[str, frozenset[str]], ValidationResult]] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    _prefilter: ClassVar[re.Pattern[str] | None] = None
+
     def __init__(self, allowed_imports: list[str] | None = None):
         """
         Initialize code validator.
@@ -138,12 +167,120 @@ class CodeValidator:
         """
         Validate Python code for security issues.
 
+        Results are cached per (code, allowed imports), so repeated
+        submissions skip parsing entirely.
+
         Args:
             code: Python source code to validate
 
         Returns:
             ValidationResult with validation status and any errors/warnings
         """
+        start = time.perf_counter()
+        key = (hashlib.sha256(code.encode("utf-8", "surrogatepass")).hexdigest(), frozenset(self.allowed_imports))
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            outcome = "cache_hit"
+            result = cached
+        else:
+            errors = self._prefilter_errors(code)
+            if errors:
+                outcome = "prefilter"
+                result = ValidationResult(is_valid=False, errors=errors)
+            else:
+                outcome = "parsed"
+                result = self._validate_ast(code)
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > VALIDATION_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        _validation_latency[outcome].record((time.perf_counter() - start) * 1000)
+        # Callers get their own lists; the cached result stays untouched
+        return ValidationResult(is_valid=result.is_valid, errors=list(result.errors), warnings=list(result.warnings))
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached validation results."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _prefilter_errors(cls, code: str) -> list[str]:
+        """
+        Find obvious violations with one regex pass, before parsing.
+
+        Matches blocked-module imports at the start of a line and calls of
+        blocked builtins. Every regex hit is confirmed against the token
+        stream, so text inside strings (including multi-line strings) and
+        comments is never rejected; if the code cannot be tokenized, the
+        AST check decides. Returns the errors the AST check would report for
+        the same constructs.
+        """
+        if cls._prefilter is None:
+            modules = "|".join(re.escape(m) for m in sorted(cls.BLOCKED_MODULES, key=len, reverse=True))
+            builtins = "|".join(re.escape(b) for b in sorted(cls.BLOCKED_BUILTINS, key=len, reverse=True))
+            cls._prefilter = re.compile(
+                rf"^[ \t]*(?P<kind>import|from)[ \t]+(?P<module>(?:{modules})(?:\.\w+)*)\b"
+                rf"|(?<![\w.])(?<!def )(?<!class )(?P<builtin>{builtins})[ \t]*\(",
+                re.MULTILINE,
+            )
+
+        hits = list(cls._prefilter.finditer(code))
+        if not hits:
+            return []
+        statement_starts, call_names = cls._code_name_positions(code)
+        line_offsets = [0]
+        line_offsets.extend(i + 1 for i, char in enumerate(code) if char == "\n")
+
+        def position(offset: int) -> tuple[int, int]:
+            row = bisect.bisect_right(line_offsets, offset)
+            return row, offset - line_offsets[row - 1]
+
+        errors = []
+        for match in hits:
+            if match["module"]:
+                if position(match.start("kind")) not in statement_starts:
+                    continue
+                if match["kind"] == "import":
+                    errors.append(f"Import of blocked module '{match['module']}' not allowed")
+                else:
+                    errors.append(f"Import from blocked module '{match['module']}' not allowed")
+            elif position(match.start("builtin")) in call_names:
+                errors.append(f"Call to blocked builtin '{match['builtin']}' not allowed")
+        return errors
+
+    @staticmethod
+    def _code_name_positions(code: str) -> tuple[set[tuple[int, int]], set[tuple[int, int]]]:
+        """
+        Tokenize code and return the (row, col) positions of NAME tokens.
+
+        The first set holds names that start a statement, the second names
+        that are not the target of ``def``/``class``. Both are empty when the
+        code does not tokenize, so the pre-filter rejects nothing.
+        """
+        statement_starts: set[tuple[int, int]] = set()
+        call_names: set[tuple[int, int]] = set()
+        previous: tokenize.TokenInfo | None = None
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(code).readline):
+                if token.type == tokenize.NAME:
+                    if previous is None or previous.type in _STATEMENT_BOUNDARY_TOKENS:
+                        statement_starts.add(token.start)
+                    if previous is None or previous.string not in ("def", "class"):
+                        call_names.add(token.start)
+                if token.type not in (tokenize.COMMENT, tokenize.NL):
+                    previous = token
+        except (tokenize.TokenError, SyntaxError):
+            return set(), set()
+        return statement_starts, call_names
+
+    def _validate_ast(self, code: str) -> ValidationResult:
+        """Full validation: parse the code and walk it with SecurityVisitor."""
         errors: list[str] = []
         warnings: list[str] = []
 
@@ -0,0 +1,280 @@
+"""
+Warm pool of pre-created sandbox containers
+
+Cold-starting a container dominates the latency of short snippets. The pool
+keeps up to `min_idle` containers created and started ahead of time, each
+running an executor that blocks on stdin until it is handed code. Every
+container runs exactly one snippet: after use it is removed in the background
+and the pool is topped back up, so no state leaks between executions.
+With `max_idle_age` set, idle containers are also replaced before they reach
+that age, for backends whose containers expire on their own.
+
+The pool is backend-agnostic - it only calls the `create` and `destroy`
+callables it is given (DockerSandbox passes its executor-container factory
+and _cleanup_container).
+
+Example:
+    >>> pool = ContainerPool(create=make_container, destroy=remove_container, min_idle=2, max_total=8)
+    >>> container = pool.acquire()
+    >>> ...  # run one snippet
+    >>> pool.release(container)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from mcp_server_langgraph.execution.sandbox import SandboxError
+from mcp_server_langgraph.observability.telemetry import (
+    sandbox_pool_acquire_duration_histogram,
+    sandbox_pool_acquisitions_counter,
+    sandbox_pool_idle_gauge,
+)
+
+logger = logging.getLogger(__name__)
+
+_pool_hits = sandbox_pool_acquisitions_counter.bind({"result": "hit"})
+_pool_misses = sandbox_pool_acquisitions_counter.bind({"result": "miss"})
+
+
+class ContainerPool:
+    """
+    Thread-safe pool of single-use, pre-warmed containers.
+
+    Attributes:
+        min_idle: Containers kept warm and waiting (0 = create on demand only)
+        max_total: Upper bound on containers alive at once (idle + in use + being removed)
+        acquire_timeout: Seconds acquire() waits for capacity before failing
+        max_idle_age: Seconds an idle container may wait before it is replaced (None = no limit)
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], Any],
+        destroy: Callable[[Any], None],
+        min_idle: int = 2,
+        max_total: int = 8,
+        acquire_timeout: float = 30.0,
+        is_usable: Callable[[Any], bool] | None = None,
+        max_idle_age: float | None = None,
+    ):
+        """
+        Initialize the pool and start warming `min_idle` containers.
+
+        Args:
+            create: Creates and starts a container ready to receive code
+            destroy: Stops and removes a container
+            min_idle: Number of containers to keep warm
+            max_total: Maximum number of containers alive at once
+            acquire_timeout: How long acquire() waits when the pool is at max_total
+            is_usable: Optional check that an idle container is still alive before handing it out
+            max_idle_age: Replace idle containers older than this many seconds,
+                counted from the start of their creation (None = keep them indefinitely)
+
+        Raises:
+            ValueError: If the sizes are inconsistent
+        """
+        if max_total < 1 or min_idle < 0 or min_idle > max_total:
+            msg = f"Invalid pool sizes: min_idle={min_idle}, max_total={max_total}"
+            raise ValueError(msg)
+
+        self.min_idle = min_idle
+        self.max_total = max_total
+        self.acquire_timeout = acquire_timeout
+        self._create = create
+        self._destroy = destroy
+        self._is_usable = is_usable
+        self.max_idle_age = max_idle_age
+
+        self._cond = threading.Condition()
+        self._idle: deque[Any] = deque()
+        self._total = 0  # idle + in use + warming + being removed
+        self._warming = 0
+        self._closed = False
+        self._warmed_at: dict[Any, float] = {}
+        self._expiry_timers: dict[Any, threading.Timer] = {}
+        self._workers = ThreadPoolExecutor(max_workers=min(max_total, 4), thread_name_prefix="sandbox-pool")
+
+        self._replenish()
+
+    @property
+    def idle_count(self) -> int:
+        """Number of warm containers ready to hand out."""
+        return len(self._idle)
+
+    @property
+    def total_count(self) -> int:
+        """Number of containers currently alive."""
+        return self._total
+
+    def acquire(self) -> Any:
+        """
+        Take a container for a single execution.
+
+        Returns a warm container when one is idle (a hit). Otherwise creates
+        one inline (a miss), or waits for capacity when max_total containers
+        are already alive.
+
+        Returns:
+            A started container waiting for code on stdin
+
+        Raises:
+            SandboxError: If the pool is closed or no capacity frees up in time
+        """
+        start = time.perf_counter()
+        deadline = start + self.acquire_timeout
+        container = None
+
+        while container is None:
+            with self._cond:
+                while not self._idle and self._total >= self.max_total and not self._closed:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        msg = f"Sandbox pool exhausted: {self.max_total} containers in use after {self.acquire_timeout:g}s"
+                        raise SandboxError(msg)
+                    self._cond.wait(remaining)
+                if self._closed:
+                    msg = "Sandbox pool is closed"
+                    raise SandboxError(msg)
+
+                if self._idle:
+                    candidate, hit = self._idle.popleft(), True
+                    warmed_at = self._forget(candidate)
+                else:
+                    self._total += 1
+                    candidate, hit, warmed_at = None, False, None
+                sandbox_pool_idle_gauge.set(len(self._idle))
+
+            if hit:
+                if self._is_expired(warmed_at):
+                    logger.debug("Discarding expired container from sandbox pool")
+                    self.release(candidate)
+                elif self._is_usable is None or self._is_usable(candidate):
+                    container = candidate
+                else:
+                    logger.warning("Discarding dead container from sandbox pool")
+                    self.release(candidate)
+                continue
+
+            try:
+                container = self._create()
+            except Exception:
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+                raise
+
+        self._replenish()
+        (_pool_hits if hit else _pool_misses).add(1)
+        sandbox_pool_acquire_duration_histogram.record((time.perf_counter() - start) * 1000)
+        return container
+
+    def release(self, container: Any) -> None:
+        """
+        Hand back a used container.
+
+        Containers are never reused: it is removed in the background and the
+        freed slot is used to warm a fresh one.
+        """
+        try:
+            self._workers.submit(self._destroy_and_refill, container)
+        except RuntimeError:
+            # Pool closed - remove inline
+            self._destroy_and_refill(container)
+
+    def close(self) -> None:
+        """Stop warming and remove all idle containers."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            for container in idle:
+                self._forget(container)
+            self._cond.notify_all()
+        sandbox_pool_idle_gauge.set(0)
+        for container in idle:
+            self._destroy_and_refill(container)
+        self._workers.shutdown(wait=False, cancel_futures=True)
+
+    def _is_expired(self, warmed_at: float | None) -> bool:
+        return self.max_idle_age is not None and warmed_at is not None and time.monotonic() - warmed_at >= self.max_idle_age
+
+    def _forget(self, container: Any) -> float | None:
+        """Drop an idle container's age tracking (caller holds the lock); returns when it was warmed."""
+        timer = self._expiry_timers.pop(container, None)
+        if timer is not None:
+            timer.cancel()
+        return self._warmed_at.pop(container, None)
+
+    def _expire(self, container: Any) -> None:
+        """Replace a container that sat idle for max_idle_age."""
+        with self._cond:
+            if container not in self._idle:
+                return  # Already handed out or removed
+            self._idle.remove(container)
+            self._forget(container)
+            sandbox_pool_idle_gauge.set(len(self._idle))
+        logger.debug("Replacing idle sandbox container that reached max_idle_age")
+        self.release(container)
+
+    def _destroy_and_refill(self, container: Any) -> None:
+        try:
+            self._destroy(container)
+        except Exception as e:
+            logger.warning(f"Failed to remove pooled container: {e}")
+        finally:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+        self._replenish()
+
+    def _replenish(self) -> None:
+        """Schedule container creation until min_idle are idle or warming."""
+        with self._cond:
+            if self._closed:
+                return
+            wanted = min(self.min_idle - len(self._idle) - self._warming, self.max_total - self._total)
+            self._total += max(wanted, 0)
+            self._warming += max(wanted, 0)
+        for _ in range(wanted):
+            try:
+                self._workers.submit(self._warm_one)
+            except RuntimeError:
+                with self._cond:
+                    self._total -= 1
+                    self._warming -= 1
+
+    def _warm_one(self) -> None:
+        warmed_at = time.monotonic()
+        try:
+            container = self._create()
+        except Exception as e:
+            logger.warning(f"Failed to pre-warm sandbox container: {e}")
+            with self._cond:
+                self._total -= 1
+                self._warming -= 1
+                self._cond.notify()
+            return
+
+        with self._cond:
+            self._warming -= 1
+            if not self._closed:
+                self._idle.append(container)
+                self._warmed_at[container] = warmed_at
+                if self.max_idle_age is not None:
+                    timer = threading.Timer(
+                        max(self.max_idle_age - (time.monotonic() - warmed_at), 0), self._expire, (container,)
+                    )
+                    timer.daemon = True
+                    self._expiry_timers[container] = timer
+                    timer.start()
+                sandbox_pool_idle_gauge.set(len(self._idle))
+                self._cond.notify()
+                return
+        # Closed while warming
+        self._destroy_and_refill(container)
@@ -2,14 +2,18 @@
 Docker-based sandbox for code execution
 
 Provides secure isolated Python code execution using Docker containers.
-Supports resource limits, network isolation, and automatic cleanup.
+Supports resource limits, network isolation, and automatic cleanup, with an
+optional warm pool of pre-started single-use containers (container_pool.py).
 """
 
 from __future__ import annotations
 
+import codecs
+import contextlib
 import logging
+import threading
 import time
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 # Docker is an optional dependency - gracefully handle missing docker package
 try:
@@ -25,9 +29,9 @@ except ImportError:
         from docker.errors import ImageNotFound, NotFound
         from docker.models.containers import Container
 
+from mcp_server_langgraph.execution.container_pool import ContainerPool
 from mcp_server_langgraph.execution.resource_limits import ResourceLimits
-from mcp_server_langgraph.execution.sandbox import ExecutionResult, Sandbox, SandboxError
-import contextlib
+from mcp_server_langgraph.execution.sandbox import ExecutionResult, OutputEmitter, Sandbox, SandboxError
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +42,14 @@ class DockerSandbox(Sandbox):
 
     Features:
     - Ephemeral containers (created and destroyed per execution)
+    - Optional warm pool: containers are pre-started and fed code over stdin,
+      still used exactly once
     - Resource limits (CPU, memory, timeout)
     - Network isolation (none/allowlist/unrestricted)
     - Read-only root filesystem
     - No privilege escalation
     - Automatic cleanup
+    - Incremental stdout/stderr via aexecute(on_output=...)
 
     Example:
         >>> limits = ResourceLimits(timeout_seconds=30, memory_limit_mb=512)
@@ -57,6 +64,8 @@ class DockerSandbox(Sandbox):
         limits: ResourceLimits,
         image: str = "python:3.12-slim",
         socket_path: str = "/var/run/docker.sock",
+        pool_min_idle: int = 0,
+        pool_max_total: int = 8,
     ):
         """
         Initialize Docker sandbox.
@@ -65,6 +74,8 @@ class DockerSandbox(Sandbox):
             limits: Resource limits to enforce
             image: Docker image to use (default: python:3.12-slim)
             socket_path: Path to Docker socket
+            pool_min_idle: Pre-warmed containers to keep ready (0 disables the pool)
+            pool_max_total: Maximum pooled containers alive at once
 
         Raises:
             SandboxError: If Docker is not available
@@ -90,6 +101,17 @@ class DockerSandbox(Sandbox):
         # Ensure image exists
         self._ensure_image()
 
+        self.pool: ContainerPool | None = None
+        if pool_min_idle > 0:
+            self.pool = ContainerPool(
+                create=self._create_executor_container,
+                destroy=self._cleanup_container,
+                min_idle=pool_min_idle,
+                max_total=max(pool_max_total, pool_min_idle),
+                acquire_timeout=self.limits.timeout_seconds,
+                is_usable=self._is_running,
+            )
+
     def _ensure_image(self) -> None:
         """Ensure Docker image is available, pull if necessary"""
         try:
@@ -117,6 +139,10 @@ class DockerSandbox(Sandbox):
         Raises:
             SandboxError: If container creation or execution fails
         """
+        return self._execute_blocking(code, None)
+
+    def _execute_blocking(self, code: str, emit: OutputEmitter | None) -> ExecutionResult:
+        """Run code in a container, streaming its output to `emit` when given."""
         if not code or not code.strip():
             return self._create_failure_result(
                 stdout="",
@@ -130,102 +156,139 @@ class DockerSandbox(Sandbox):
         start_time = time.time()
 
         try:
-            # Create container with resource limits
-            container = self._create_container(code)
+            if self.pool is not None:
+                # Pre-started executor container, waiting for code on stdin
+                container = self.pool.acquire()
+                self._send_code(container, code)
+            else:
+                # Create container with resource limits, then start it
+                container = self._create_container(code)
+                container.start()
 
-            # Start container
-            container.start()
+            return self._collect_result(container, start_time, emit)
 
-            # Wait for completion with timeout
-            timed_out = False
-            try:
-                exit_code = container.wait(timeout=self.limits.timeout_seconds)
-                if isinstance(exit_code, dict):
-                    exit_code = exit_code.get("StatusCode", 1)
-            except Exception:
-                # Timeout occurred
-                timed_out = True
-                exit_code = 124  # Standard timeout exit code
+        except Exception as e:
+            logger.error(f"Docker execution failed: {e}", exc_info=True)
+            msg = f"Docker execution failed: {e}"
+            raise SandboxError(msg)
 
-                # Stop container
-                try:
-                    container.stop(timeout=1)
-                except Exception:
-                    container.kill()
+        finally:
+            if container is not None:
+                self._recycle(container)
 
-            execution_time = self._measure_time(start_time)
+    def _collect_result(self, container: Container, start_time: float, emit: OutputEmitter | None = None) -> ExecutionResult:
+        """
+        Wait for a started container to finish and build the execution result.
 
-            # Get logs
-            try:
-                logs = container.logs(stdout=True, stderr=True).decode("utf-8")
-                # Docker combines stdout and stderr
-                # Separate them based on content
-                if exit_code != 0 and not timed_out:
-                    # If there was an error, look for Python error output
-                    if "Traceback" in logs or "Error" in logs or "SyntaxError" in logs:
-                        # Put error output in stderr
-                        stderr = logs
-                        stdout = ""
-                    else:
-                        # No traceback, might be a simple error
-                        stderr = logs
-                        stdout = ""
-                else:
-                    # Success - everything is stdout
-                    stdout = logs
-                    stderr = ""
-            except Exception as e:
-                stdout = ""
-                stderr = f"Error retrieving logs: {e}"
+        Args:
+            container: Running container executing the code
+            start_time: time.time() when execution was requested
+            emit: Optional receiver for output chunks while the code runs
 
-            # Get memory usage (if available)
-            memory_used_mb = None
+        Returns:
+            ExecutionResult with execution status and outputs
+        """
+        # Stream output alongside the wait, so the timeout still applies
+        streamer = None
+        if emit is not None:
+            streamer = threading.Thread(target=self._stream_output, args=(container, emit), name="sandbox-output", daemon=True)
+            streamer.start()
+
+        # Wait for completion with timeout
+        timed_out = False
+        try:
+            exit_code = container.wait(timeout=self.limits.timeout_seconds)
+            if isinstance(exit_code, dict):
+                exit_code = exit_code.get("StatusCode", 1)
+        except Exception:
+            # Timeout occurred
+            timed_out = True
+            exit_code = 124  # Standard timeout exit code
+
+            # Stop container
             try:
-                stats = container.stats(stream=False)
-                if "memory_stats" in stats and "max_usage" in stats["memory_stats"]:
-                    memory_used_mb = stats["memory_stats"]["max_usage"] / (1024 * 1024)
+                container.stop(timeout=1)
             except Exception:
-                pass  # Memory stats not critical
+                container.kill()
 
-            # Cleanup container
-            self._cleanup_container(container)
+        execution_time = self._measure_time(start_time)
 
-            # Create result
-            if timed_out:
-                return self._create_failure_result(
-                    stdout=stdout,
-                    stderr=stderr or f"Execution timed out after {self.limits.timeout_seconds}s",
-                    exit_code=exit_code,
-                    execution_time=execution_time,
-                    timed_out=True,
-                    error_message=f"Timeout after {self.limits.timeout_seconds}s",
-                )
-            elif exit_code == 0:
-                return self._create_success_result(
-                    stdout=stdout,
-                    stderr=stderr,
-                    execution_time=execution_time,
-                    memory_used_mb=memory_used_mb,
-                )
-            else:
-                return self._create_failure_result(
-                    stdout=stdout,
-                    stderr=stderr,
-                    exit_code=exit_code,
-                    execution_time=execution_time,
-                    error_message=f"Process exited with code {exit_code}",
-                )
+        if streamer is not None:
+            # The attach stream ends once the container has exited or been stopped
+            streamer.join(timeout=1.0)
 
+        # Get logs
+        try:
+            logs = container.logs(stdout=True, stderr=True).decode("utf-8")
+            # Docker combines stdout and stderr - on failure everything
+            # (traceback or not) is reported as stderr
+            if exit_code != 0 and not timed_out:
+                stderr = logs
+                stdout = ""
+            else:
+                # Success - everything is stdout
+                stdout = logs
+                stderr = ""
         except Exception as e:
-            execution_time = self._measure_time(start_time)
+            stdout = ""
+            stderr = f"Error retrieving logs: {e}"
 
-            # Cleanup on error
-            if container:
-                self._cleanup_container(container)
+        # Get memory usage (if available)
+        memory_used_mb = None
+        try:
+            stats = container.stats(stream=False)
+            if "memory_stats" in stats and "max_usage" in stats["memory_stats"]:
+                memory_used_mb = stats["memory_stats"]["max_usage"] / (1024 * 1024)
+        except Exception:
+            pass  # Memory stats not critical
 
-            logger.error(f"Docker execution failed: {e}", exc_info=True)
-            msg = f"Docker execution failed: {e}"
-            raise SandboxError(msg)
+        # Create result
+        if timed_out:
+            return self._create_failure_result(
+                stdout=stdout,
+                stderr=stderr or f"Execution timed out after {self.limits.timeout_seconds}s",
+                exit_code=exit_code,
+                execution_time=execution_time,
+                timed_out=True,
+                error_message=f"Timeout after {self.limits.timeout_seconds}s",
+            )
+        elif exit_code == 0:
+            return self._create_success_result(
+                stdout=stdout,
+                stderr=stderr,
+                execution_time=execution_time,
+                memory_used_mb=memory_used_mb,
+            )
+        else:
+            return self._create_failure_result(
+                stdout=stdout,
+                stderr=stderr,
+                exit_code=exit_code,
+                execution_time=execution_time,
+                error_message=f"Process exited with code {exit_code}",
+            )
+
+    @staticmethod
+    def _stream_output(container: Container, emit: OutputEmitter) -> None:
+        """Forward a running container's stdout/stderr to `emit` until it exits."""
+        decoders = {name: codecs.getincrementaldecoder("utf-8")(errors="replace") for name in ("stdout", "stderr")}
+        try:
+            # logs=True replays anything written before the attach
+            for stdout, stderr in container.attach(stdout=True, stderr=True, stream=True, logs=True, demux=True):
+                for name, data in (("stdout", stdout), ("stderr", stderr)):
+                    if data:
+                        text = decoders[name].decode(data)
+                        if text:
+                            emit(name, text)
+        except Exception as e:
+            logger.debug(f"Output streaming for container {container.id[:12]} stopped: {e}")
+
+    def _recycle(self, container: Container) -> None:
+        """Dispose of a used container (in the background when pooled)."""
+        if self.pool is not None:
+            self.pool.release(container)
+        else:
+            self._cleanup_container(container)
 
     def _create_container(self, code: str) -> Container:
         """
@@ -241,36 +304,8 @@ class DockerSandbox(Sandbox):
             SandboxError: If container creation fails
         """
         try:
-            # Configure resource limits
-            mem_limit = f"{self.limits.memory_limit_mb}m"
-            nano_cpus = int(self.limits.cpu_quota * 1_000_000_000)  # Convert to nano CPUs
-
-            # Configure network
-            network_mode = self._get_network_mode()
-
-            # Create container
             # Note: We don't use auto_remove=True because we need to get logs after execution
-            container = self.client.containers.create(
-                image=self.image,
-                command=["python", "-c", code],
-                detach=True,
-                user="nobody",  # Run as non-root user (security best practice)
-                mem_limit=mem_limit,
-                memswap_limit=mem_limit,  # Disable swap
-                nano_cpus=nano_cpus,
-                network_mode=network_mode,
-                network_disabled=(network_mode == "none"),
-                read_only=True,  # Read-only root FS for security (OpenAI Codex Finding #4)
-                security_opt=["no-new-privileges"],  # Prevent privilege escalation
-                cap_drop=["ALL"],  # Drop all capabilities
-                pids_limit=self.limits.max_processes,
-                # Tmpfs for writable directories (ephemeral, in-memory)
-                # Python needs /tmp and /var/tmp for tempfile module
-                tmpfs={  # nosec B108 - tmpfs is ephemeral in-memory, not persistent storage
-                    "/tmp": f"size={self.limits.disk_quota_mb}m,uid=65534,gid=65534",  # nosec B108 - nobody user
-                    "/var/tmp": f"size={self.limits.disk_quota_mb}m,uid=65534,gid=65534",  # nosec B108 - nobody user
-                },
-            )
+            container = self.client.containers.create(command=["python", "-c", code], **self._container_options())
 
             return container
 
@@ -279,6 +314,89 @@ class DockerSandbox(Sandbox):
             msg = f"Failed to create Docker container: {e}"
             raise SandboxError(msg)
 
+    def _create_executor_container(self) -> Container:
+        """
+        Create and start a pooled container that runs one snippet read from stdin.
+
+        `python -` blocks reading the script until stdin reaches EOF, then
+        executes it. The container gets exactly the same limits and security
+        options as a per-execution container.
+
+        Returns:
+            Started Docker container waiting for code
+
+        Raises:
+            SandboxError: If container creation fails
+        """
+        try:
+            container = self.client.containers.create(
+                command=["python", "-"],
+                stdin_open=True,
+                stdin_once=True,  # Close stdin (EOF) once the attached client detaches
+                **self._container_options(),
+            )
+            container.start()
+            return container
+        except Exception as e:
+            logger.error(f"Failed to create pooled Docker container: {e}", exc_info=True)
+            msg = f"Failed to create Docker container: {e}"
+            raise SandboxError(msg)
+
+    def _send_code(self, container: Container, code: str) -> None:
+        """Write code to an executor container's stdin and close it."""
+        sock = container.attach_socket(params={"stdin": 1, "stream": 1})
+        raw = getattr(sock, "_sock", sock)  # SocketIO wrapper on unix sockets
+        try:
+            raw.sendall(code.encode("utf-8"))
+        finally:
+            raw.close()
+            if raw is not sock:
+                sock.close()
+
+    def _container_options(self) -> dict[str, Any]:
+        """
+        Resource limits and security settings shared by every sandbox container.
+
+        Returns:
+            Keyword arguments for containers.create() (everything except the command)
+        """
+        # Configure resource limits
+        mem_limit = f"{self.limits.memory_limit_mb}m"
+        nano_cpus = int(self.limits.cpu_quota * 1_000_000_000)  # Convert to nano CPUs
+
+        # Configure network
+        network_mode = self._get_network_mode()
+
+        return {
+            "image": self.image,
+            "detach": True,
+            "user": "nobody",  # Run as non-root user (security best practice)
+            "mem_limit": mem_limit,
+            "memswap_limit": mem_limit,  # Disable swap
+            "nano_cpus": nano_cpus,
+            "network_mode": network_mode,
+            "network_disabled": (network_mode == "none"),
+            "read_only": True,  # Read-only root FS for security (OpenAI Codex Finding #4)
+            "security_opt": ["no-new-privileges"],  # Prevent privilege escalation
+            "cap_drop": ["ALL"],  # Drop all capabilities
+            "pids_limit": self.limits.max_processes,
+            # Tmpfs for writable directories (ephemeral, in-memory)
+            # Python needs /tmp and /var/tmp for tempfile module
+            "tmpfs": {  # nosec B108 - tmpfs is ephemeral in-memory, not persistent storage
+                "/tmp": f"size={self.limits.disk_quota_mb}m,uid=65534,gid=65534",  # nosec B108 - nobody user
+                "/var/tmp": f"size={self.limits.disk_quota_mb}m,uid=65534,gid=65534",  # nosec B108 - nobody user
+            },
+        }
+
+    @staticmethod
+    def _is_running(container: Container) -> bool:
+        """Whether an idle pooled container is still alive."""
+        try:
+            container.reload()
+            return bool(container.status == "running")
+        except Exception:
+            return False
+
     def _get_network_mode(self) -> str:
         """
         Get Docker network mode from resource limits.
@@ -341,10 +459,20 @@ class DockerSandbox(Sandbox):
         except Exception as e:
             logger.warning(f"Error during container cleanup: {e}")
 
+    def close(self) -> None:
+        """Remove pooled containers and close the Docker client."""
+        pool, self.pool = getattr(self, "pool", None), None
+        if pool is not None:
+            pool.close()
+        if hasattr(self, "client"):
+            self.client.close()
+
     def __del__(self) -> None:
         """Cleanup on garbage collection"""
         try:
-            if hasattr(self, "client"):
+            if getattr(self, "pool", None) is not None:
+                self.close()
+            elif hasattr(self, "client"):
                 self.client.close()
         except Exception:
             pass
@@ -3,20 +3,37 @@ Kubernetes-based sandbox for code execution
 
 Provides secure isolated Python code execution using Kubernetes Jobs.
 Supports resource limits, automatic cleanup with TTL, and pod security policies.
+
+Optionally keeps a warm pool of pre-scheduled executor pods (see
+container_pool.py). Code is run in a pooled pod with `kubectl exec`
+semantics, and each pod is used exactly once and then deleted in the
+background. This skips pod scheduling and image start-up, so small
+snippets finish in well under a second. The pool needs the service account
+to be allowed to create, watch and delete pods and to create pods/exec.
 """
 
+import codecs
+import contextlib
 import logging
+import math
 import time
+import uuid
+from typing import Any, cast
 
-from kubernetes import client, config
+import urllib3
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from kubernetes.stream import stream as k8s_stream
 
+from mcp_server_langgraph.execution.container_pool import ContainerPool
 from mcp_server_langgraph.execution.resource_limits import ResourceLimits
-from mcp_server_langgraph.execution.sandbox import ExecutionResult, Sandbox, SandboxError
-import contextlib
+from mcp_server_langgraph.execution.sandbox import ExecutionResult, OutputEmitter, Sandbox, SandboxError
 
 logger = logging.getLogger(__name__)
 
+# How long a new pooled pod may take to be scheduled and start
+POD_STARTUP_TIMEOUT_SECONDS = 120
+
 
 class KubernetesSandbox(Sandbox):
     """
@@ -29,6 +46,9 @@ class KubernetesSandbox(Sandbox):
     - Automatic cleanup with TTL
     - Read-only root filesystem
     - No privilege escalation
+    - Job completion via the watch API (no status polling)
+    - aexecute() follows pod logs as they are written
+    - Optional warm pool of single-use executor pods
 
     Example:
         >>> limits = ResourceLimits(timeout_seconds=30, memory_limit_mb=512)
@@ -44,6 +64,8 @@ class KubernetesSandbox(Sandbox):
         namespace: str = "default",
         image: str = "python:3.12-slim",
         job_ttl: int = 300,  # TTL in seconds for job cleanup
+        pool_min_idle: int = 0,
+        pool_max_total: int = 8,
     ):
         """
         Initialize Kubernetes sandbox.
@@ -53,6 +75,8 @@ class KubernetesSandbox(Sandbox):
             namespace: Kubernetes namespace for jobs
             image: Container image to use
             job_ttl: Time to live for completed jobs (seconds)
+            pool_min_idle: Pre-scheduled executor pods to keep ready (0 disables the pool)
+            pool_max_total: Maximum pooled pods alive at once
 
         Raises:
             SandboxError: If Kubernetes is not available
@@ -81,6 +105,21 @@ class KubernetesSandbox(Sandbox):
             msg = f"Kubernetes not available: {e}"
             raise SandboxError(msg)
 
+        self.pool: ContainerPool | None = None
+        if pool_min_idle > 0:
+            self.pool = ContainerPool(
+                create=self._create_executor_pod,
+                destroy=self._delete_pod,
+                min_idle=pool_min_idle,
+                max_total=max(pool_max_total, pool_min_idle),
+                acquire_timeout=self.limits.timeout_seconds,
+                is_usable=self._pod_is_running,
+                # Executor pods hit their active deadline job_ttl + timeout after
+                # starting; replacing them at job_ttl leaves every acquired pod
+                # enough time to run a full snippet
+                max_idle_age=self.job_ttl,
+            )
+
     def _verify_namespace(self) -> None:
         """Verify that the namespace exists"""
         try:
@@ -94,7 +133,7 @@ class KubernetesSandbox(Sandbox):
 
     def execute(self, code: str) -> ExecutionResult:
         """
-        Execute Python code in a Kubernetes Job.
+        Execute Python code in a Kubernetes Job (or a pooled executor pod).
 
         Args:
             code: Python source code to execute
@@ -105,6 +144,16 @@ class KubernetesSandbox(Sandbox):
         Raises:
             SandboxError: If job creation or execution fails
         """
+        return self._execute_blocking(code, None)
+
+    def _execute_blocking(self, code: str, emit: OutputEmitter | None) -> ExecutionResult:
+        """
+        Run code, streaming its output to `emit` when given.
+
+        Job pods are followed through their log, which merges stdout and
+        stderr, so those chunks are reported as "stdout" (the final result
+        separates them). Pooled pods stream the two separately.
+        """
         if not code or not code.strip():
             return self._create_failure_result(
                 stdout="",
@@ -114,6 +163,9 @@ class KubernetesSandbox(Sandbox):
                 error_message="Empty code provided",
             )
 
+        if self.pool is not None:
+            return self._execute_in_pool(self.pool, code, emit)
+
         job_name = None
         start_time = time.time()
 
@@ -122,44 +174,26 @@ class KubernetesSandbox(Sandbox):
             job_name = self._create_job(code)
 
             # Wait for completion with timeout
-            timed_out, exit_code = self._wait_for_job(job_name, start_time)
+            timed_out, exit_code = self._watch_job(job_name, start_time, emit)
 
             execution_time = self._measure_time(start_time)
 
             # Get logs from pod
-            stdout, stderr = self._get_job_logs(job_name, exit_code, timed_out)
+            stdout, stderr = self._get_job_logs(job_name, 1 if exit_code is None else exit_code, timed_out)
 
             # Cleanup job (TTL will also clean up, but we can do it immediately)
             self._cleanup_job(job_name)
 
-            # Create result
-            if timed_out:
-                return self._create_failure_result(
-                    stdout=stdout,
-                    stderr=stderr or f"Execution timed out after {self.limits.timeout_seconds}s",
-                    exit_code=exit_code,
-                    execution_time=execution_time,
-                    timed_out=True,
-                    error_message=f"Timeout after {self.limits.timeout_seconds}s",
-                )
-            elif exit_code == 0:
-                return self._create_success_result(
-                    stdout=stdout,
-                    stderr=stderr,
-                    execution_time=execution_time,
-                )
-            else:
-                return self._create_failure_result(
-                    stdout=stdout,
-                    stderr=stderr,
-                    exit_code=exit_code,
-                    execution_time=execution_time,
-                    error_message=f"Process exited with code {exit_code}",
-                )
+            return self._build_result(
+                stdout,
+                stderr,
+                exit_code,
+                execution_time,
+                timed_out,
+                no_status_message=f"Pod for job {job_name} was deleted before it finished (evicted or removed)",
+            )
 
         except Exception as e:
-            execution_time = self._measure_time(start_time)
-
             # Cleanup on error
             if job_name:
                 self._cleanup_job(job_name)
@@ -168,6 +202,249 @@ class KubernetesSandbox(Sandbox):
             msg = f"Kubernetes execution failed: {e}"
             raise SandboxError(msg)
 
+    def _execute_in_pool(self, pool: ContainerPool, code: str, emit: OutputEmitter | None) -> ExecutionResult:
+        """Run code in a pre-scheduled executor pod, which is then discarded."""
+        pod_name = None
+        start_time = time.time()
+
+        try:
+            pod_name = pool.acquire()
+            timed_out, exit_code, stdout, stderr = self._exec_in_pod(pod_name, code, start_time, emit)
+            execution_time = self._measure_time(start_time)
+
+            return self._build_result(
+                stdout,
+                stderr,
+                exit_code,
+                execution_time,
+                timed_out,
+                no_status_message=f"Exec channel to pod {pod_name} closed without an exit status (pod evicted or connection lost)",
+            )
+
+        except Exception as e:
+            logger.error(f"Kubernetes execution failed: {e}", exc_info=True)
+            msg = f"Kubernetes execution failed: {e}"
+            raise SandboxError(msg)
+
+        finally:
+            if pod_name is not None:
+                pool.release(pod_name)
+
+    def _build_result(
+        self,
+        stdout: str,
+        stderr: str,
+        exit_code: int | None,
+        execution_time: float,
+        timed_out: bool,
+        no_status_message: str = "Execution ended without an exit status",
+    ) -> ExecutionResult:
+        """
+        Create the ExecutionResult for a finished (or timed out) job.
+
+        An exit_code of None means the code's outcome is unknown (the pod or
+        the exec channel went away first); that is reported as a failure with
+        no_status_message, never as success.
+        """
+        if timed_out:
+            return self._create_failure_result(
+                stdout=stdout,
+                stderr=stderr or f"Execution timed out after {self.limits.timeout_seconds}s",
+                exit_code=124 if exit_code is None else exit_code,  # Timeout exit code, as in the pool path
+                execution_time=execution_time,
+                timed_out=True,
+                error_message=f"Timeout after {self.limits.timeout_seconds}s",
+            )
+        elif exit_code is None:
+            logger.warning(no_status_message)
+            return self._create_failure_result(
+                stdout=stdout,
+                stderr=f"{stderr}\nError: {no_status_message}" if stderr else f"Error: {no_status_message}",
+                exit_code=1,
+                execution_time=execution_time,
+                error_message=no_status_message,
+            )
+        elif exit_code == 0:
+            return self._create_success_result(
+                stdout=stdout,
+                stderr=stderr,
+                execution_time=execution_time,
+            )
+        else:
+            return self._create_failure_result(
+                stdout=stdout,
+                stderr=stderr,
+                exit_code=exit_code,
+                execution_time=execution_time,
+                error_message=f"Process exited with code {exit_code}",
+            )
+
+    def _pod_spec(self, command: list[str], active_deadline_seconds: int | None = None) -> Any:
+        """
+        Pod spec with the sandbox's resource limits and security settings.
+
+        Shared by Job pods and pooled executor pods so both are locked down identically.
+        """
+        # Configure resource requests and limits
+        resources = client.V1ResourceRequirements(
+            requests={
+                "cpu": str(self.limits.cpu_quota),
+                "memory": f"{self.limits.memory_limit_mb}Mi",
+            },
+            limits={
+                "cpu": str(self.limits.cpu_quota),
+                "memory": f"{self.limits.memory_limit_mb}Mi",
+            },
+        )
+
+        # Configure security context
+        security_context = client.V1SecurityContext(
+            allow_privilege_escalation=False,
+            run_as_non_root=True,
+            run_as_user=1000,  # Non-root user
+            read_only_root_filesystem=False,  # Need writable /tmp
+            capabilities=client.V1Capabilities(drop=["ALL"]),
+        )
+
+        # Configure container
+        container = client.V1Container(
+            name="executor",
+            image=self.image,
+            command=command,
+            resources=resources,
+            security_context=security_context,
+        )
+
+        return client.V1PodSpec(
+            containers=[container],
+            restart_policy="Never",
+            active_deadline_seconds=active_deadline_seconds,
+            # Pod security
+            security_context=client.V1PodSecurityContext(
+                run_as_non_root=True,
+                run_as_user=1000,
+                fs_group=1000,
+            ),
+        )
+
+    def _create_executor_pod(self) -> str:
+        """
+        Create a pooled executor pod and wait until it is running.
+
+        The pod idles until code is exec'd into it. Its active deadline reaps
+        pods that outlive their use (e.g. after a crash of this process); the
+        pool replaces idle pods at job_ttl, before that deadline is reached.
+
+        Returns:
+            Pod name
+
+        Raises:
+            SandboxError: If the pod cannot be created or does not start in time
+        """
+        pod_name = f"code-exec-pool-{uuid.uuid4().hex[:12]}"
+        pod = client.V1Pod(
+            api_version="v1",
+            kind="Pod",
+            metadata=client.V1ObjectMeta(name=pod_name, labels={"app": "code-execution", "code-execution/pool": "warm"}),
+            spec=self._pod_spec(
+                ["python", "-c", "import signal; signal.pause()"],
+                active_deadline_seconds=self.job_ttl + self.limits.timeout_seconds,
+            ),
+        )
+
+        try:
+            self.core_v1.create_namespaced_pod(namespace=self.namespace, body=pod)
+            started = self._watch_pod(
+                time.time() + POD_STARTUP_TIMEOUT_SECONDS,
+                phases=("Running", "Succeeded", "Failed"),
+                field_selector=f"metadata.name={pod_name}",
+            )
+        except Exception as e:
+            self._delete_pod(pod_name)
+            msg = f"Failed to create executor pod: {e}"
+            raise SandboxError(msg)
+
+        if started is None or started.status.phase != "Running":
+            self._delete_pod(pod_name)
+            msg = f"Executor pod {pod_name} did not start within {POD_STARTUP_TIMEOUT_SECONDS}s"
+            raise SandboxError(msg)
+
+        logger.debug(f"Executor pod ready: {pod_name}")
+        return pod_name
+
+    def _exec_in_pod(
+        self, pod_name: str, code: str, start_time: float, emit: OutputEmitter | None
+    ) -> tuple[bool, int | None, str, str]:
+        """
+        Run code in a pooled pod over an exec channel.
+
+        Returns:
+            Tuple of (timed_out, exit_code, stdout, stderr). exit_code is None if the
+            channel closed without reporting an exit status (e.g. pod evicted).
+        """
+        deadline = start_time + self.limits.timeout_seconds
+        session = k8s_stream(
+            self.core_v1.connect_get_namespaced_pod_exec,
+            pod_name,
+            self.namespace,
+            container="executor",
+            command=["python", "-c", code],
+            stdin=False,
+            stdout=True,
+            stderr=True,
+            tty=False,
+            _preload_content=False,
+        )
+
+        output: dict[str, list[str]] = {"stdout": [], "stderr": []}
+
+        def drain() -> None:
+            for name, peek, read in (
+                ("stdout", session.peek_stdout, session.read_stdout),
+                ("stderr", session.peek_stderr, session.read_stderr),
+            ):
+                if peek():
+                    text = read()
+                    output[name].append(text)
+                    if emit is not None:
+                        emit(name, text)
+
+        timed_out = False
+        try:
+            while session.is_open():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    timed_out = True
+                    break
+                session.update(timeout=min(remaining, 1.0))
+                drain()
+            drain()
+            exit_code = 124 if timed_out else session.returncode
+        finally:
+            session.close()
+
+        # The pod is deleted on release, which also kills code still running after a timeout
+        return timed_out, exit_code, "".join(output["stdout"]), "".join(output["stderr"])
+
+    def _pod_is_running(self, pod_name: str) -> bool:
+        """Whether an idle pooled pod is still alive."""
+        try:
+            pod = self.core_v1.read_namespaced_pod(name=pod_name, namespace=self.namespace)
+            return pod.status is not None and pod.status.phase == "Running"
+        except Exception:
+            return False
+
+    def _delete_pod(self, pod_name: str) -> None:
+        """Delete a pooled pod immediately."""
+        try:
+            self.core_v1.delete_namespaced_pod(name=pod_name, namespace=self.namespace, grace_period_seconds=0)
+            logger.debug(f"Deleted executor pod: {pod_name}")
+        except ApiException as e:
+            if e.status != 404:  # Ignore if already deleted
+                logger.warning(f"Failed to delete pod {pod_name}: {e}")
+        except Exception as e:
+            logger.warning(f"Error during pod cleanup: {e}")
+
     def _create_job(self, code: str) -> str:
         """
         Create Kubernetes Job for code execution.
@@ -190,49 +467,9 @@ class KubernetesSandbox(Sandbox):
         job_name = f"code-exec-{timestamp}-{code_hash}"
 
         try:
-            # Configure resource requests and limits
-            resources = client.V1ResourceRequirements(
-                requests={
-                    "cpu": str(self.limits.cpu_quota),
-                    "memory": f"{self.limits.memory_limit_mb}Mi",
-                },
-                limits={
-                    "cpu": str(self.limits.cpu_quota),
-                    "memory": f"{self.limits.memory_limit_mb}Mi",
-                },
-            )
-
-            # Configure security context
-            security_context = client.V1SecurityContext(
-                allow_privilege_escalation=False,
-                run_as_non_root=True,
-                run_as_user=1000,  # Non-root user
-                read_only_root_filesystem=False,  # Need writable /tmp
-                capabilities=client.V1Capabilities(drop=["ALL"]),
-            )
-
-            # Configure container
-            container = client.V1Container(
-                name="executor",
-                image=self.image,
-                command=["python", "-c", code],
-                resources=resources,
-                security_context=security_context,
-            )
-
-            # Configure pod template
             pod_template = client.V1PodTemplateSpec(
                 metadata=client.V1ObjectMeta(labels={"app": "code-execution"}),
-                spec=client.V1PodSpec(
-                    containers=[container],
-                    restart_policy="Never",
-                    # Pod security
-                    security_context=client.V1PodSecurityContext(
-                        run_as_non_root=True,
-                        run_as_user=1000,
-                        fs_group=1000,
-                    ),
-                ),
+                spec=self._pod_spec(["python", "-c", code]),
             )
 
             # Configure job
@@ -259,49 +496,108 @@ class KubernetesSandbox(Sandbox):
             msg = f"Failed to create Kubernetes job: {e}"
             raise SandboxError(msg)
 
-    def _wait_for_job(self, job_name: str, start_time: float) -> tuple[bool, int]:
+    def _watch_job(self, job_name: str, start_time: float, emit: OutputEmitter | None = None) -> tuple[bool, int | None]:
         """
-        Wait for job to complete.
+        Wait for a job's pod to finish using the watch API.
 
         Args:
             job_name: Name of the job
             start_time: Start time for timeout calculation
+            emit: Optional receiver for log chunks while the pod runs
 
         Returns:
-            Tuple of (timed_out, exit_code)
+            Tuple of (timed_out, exit_code). exit_code is None if the pod was deleted
+            before it finished.
         """
-        timeout = self.limits.timeout_seconds
-        poll_interval = 1  # Poll every second
-
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                # Timeout - delete job
-                with contextlib.suppress(Exception):
-                    self.batch_v1.delete_namespaced_job(
-                        name=job_name,
-                        namespace=self.namespace,
-                        propagation_policy="Background",
-                    )
-                return True, 124  # Timeout exit code
+        deadline = start_time + self.limits.timeout_seconds
 
-            try:
-                # Check job status
-                job = self.batch_v1.read_namespaced_job(name=job_name, namespace=self.namespace)
+        if emit is not None:
+            pod = self._watch_pod(deadline, phases=("Running", "Succeeded", "Failed"), label_selector=f"job-name={job_name}")
+            if pod is not None:
+                self._follow_logs(pod.metadata.name, deadline, emit)
 
-                if job.status.succeeded:
-                    return False, 0
-                elif job.status.failed:
-                    return False, 1
+        pod = self._watch_pod(deadline, phases=("Succeeded", "Failed"), label_selector=f"job-name={job_name}")
+        if pod is not None:
+            return False, self._pod_exit_code(pod)
 
-                # Job still running, wait and check again
-                time.sleep(poll_interval)
+        if time.time() < deadline:
+            # Pod deleted before it finished, so its outcome is unknown
+            return False, None
 
-            except ApiException as e:
-                if e.status == 404:
-                    # Job not found (might have been deleted)
-                    return False, 1
-                raise
+        # Timeout - delete job
+        with contextlib.suppress(Exception):
+            self.batch_v1.delete_namespaced_job(
+                name=job_name,
+                namespace=self.namespace,
+                propagation_policy="Background",
+            )
+        return True, 124  # Timeout exit code
+
+    def _watch_pod(self, deadline: float, phases: tuple[str, ...], **selector: str) -> Any | None:
+        """
+        Block until the selected pod reaches one of `phases`.
+
+        Args:
+            deadline: time.time() after which to give up
+            phases: Pod phases to wait for
+            **selector: label_selector / field_selector identifying the pod
+
+        Returns:
+            The pod, or None if the deadline passed or the pod was deleted first
+        """
+        pod_watch = watch.Watch()  # type: ignore[no-untyped-call]
+        try:
+            # The stream starts with the current state, so a pod that is already done is seen immediately
+            for event in pod_watch.stream(  # type: ignore[no-untyped-call]
+                self.core_v1.list_namespaced_pod,
+                namespace=self.namespace,
+                timeout_seconds=max(1, math.ceil(deadline - time.time())),
+                **selector,
+            ):
+                pod = event["object"]
+                if event["type"] == "DELETED":
+                    return None
+                if pod.status is not None and pod.status.phase in phases:
+                    return pod
+                if time.time() >= deadline:
+                    return None
+        finally:
+            pod_watch.stop()  # type: ignore[no-untyped-call]
+        return None
+
+    def _follow_logs(self, pod_name: str, deadline: float, emit: OutputEmitter) -> None:
+        """Forward a running pod's log to `emit` until the container exits."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            # With _preload_content=False the client returns the raw response, not the log text
+            response = cast(
+                urllib3.HTTPResponse,
+                self.core_v1.read_namespaced_pod_log(
+                    name=pod_name,
+                    namespace=self.namespace,
+                    follow=True,
+                    _preload_content=False,
+                    _request_timeout=max(1.0, deadline - time.time()),
+                ),
+            )
+            try:
+                for data in response.stream():
+                    text = decoder.decode(data)
+                    if text:
+                        emit("stdout", text)
+            finally:
+                response.release_conn()
+        except Exception as e:
+            logger.debug(f"Log streaming for pod {pod_name} stopped: {e}")
+
+    @staticmethod
+    def _pod_exit_code(pod: Any) -> int:
+        """Exit code of a finished pod's executor container."""
+        for status in pod.status.container_statuses or []:
+            terminated = status.state.terminated if status.state is not None else None
+            if terminated is not None:
+                return int(terminated.exit_code)
+        return 0 if pod.status.phase == "Succeeded" else 1
 
     def _get_job_logs(self, job_name: str, exit_code: int, timed_out: bool) -> tuple[str, str]:
         """
@@ -326,7 +622,10 @@ class KubernetesSandbox(Sandbox):
             if not pods.items:
                 return "", "Error: No pod found for job"
 
-            pod_name = pods.items[0].metadata.name
+            metadata = pods.items[0].metadata
+            if metadata is None or metadata.name is None:
+                return "", "Error: Job pod has no name"
+            pod_name = metadata.name
 
             # Get logs
             logs = self.core_v1.read_namespaced_pod_log(name=pod_name, namespace=self.namespace)
@@ -370,3 +669,9 @@ class KubernetesSandbox(Sandbox):
                 logger.warning(f"Failed to delete job {job_name}: {e}")
         except Exception as e:
             logger.warning(f"Error during job cleanup: {e}")
+
+    def close(self) -> None:
+        """Delete pooled pods."""
+        pool, self.pool = getattr(self, "pool", None), None
+        if pool is not None:
+            pool.close()
@@ -4,12 +4,22 @@ Abstract sandbox interface for secure code execution
 Defines the contract for all sandbox implementations (Docker, Kubernetes, Process).
 """
 
+import asyncio
+import inspect
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 from mcp_server_langgraph.execution.resource_limits import ResourceLimits
 
+# Receives (stream, text) as the code produces output; stream is "stdout" or "stderr".
+# May be a plain function or a coroutine function.
+OutputCallback = Callable[[str, str], Awaitable[None] | None]
+
+# Thread-side counterpart of OutputCallback used by blocking backends
+OutputEmitter = Callable[[str, str], None]
+
 
 class SandboxError(Exception):
     """Raised when sandbox operations fail"""
@@ -87,6 +97,67 @@ class Sandbox(ABC):
             SandboxError: If sandbox setup or execution fails
         """
 
+    async def aexecute(self, code: str, on_output: OutputCallback | None = None) -> ExecutionResult:
+        """
+        Execute Python code without blocking the event loop.
+
+        The blocking backend call runs in a worker thread. Output chunks are
+        handed back to the event loop and passed to `on_output` in order, as
+        the backend produces them (backends that cannot stream report the
+        complete output once execution finishes).
+
+        Cancelling the caller does not stop the code: it keeps running until
+        it finishes or hits the sandbox timeout.
+
+        Args:
+            code: Python source code to execute
+            on_output: Optional callback for incremental stdout/stderr
+
+        Returns:
+            ExecutionResult with execution status and complete outputs
+
+        Raises:
+            SandboxError: If sandbox setup or execution fails
+        """
+        if on_output is None:
+            return await asyncio.to_thread(self._execute_blocking, code, None)
+
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+
+        def emit(stream: str, text: str) -> None:
+            loop.call_soon_threadsafe(chunks.put_nowait, (stream, text))
+
+        async def deliver() -> None:
+            while (chunk := await chunks.get()) is not None:
+                outcome = on_output(*chunk)
+                if inspect.isawaitable(outcome):
+                    await outcome
+
+        delivery = asyncio.create_task(deliver())
+        try:
+            return await asyncio.to_thread(self._execute_blocking, code, emit)
+        finally:
+            # Chunks emitted by the thread are queued before its result is, so they are delivered first
+            chunks.put_nowait(None)
+            await delivery
+
+    def _execute_blocking(self, code: str, emit: OutputEmitter | None) -> ExecutionResult:
+        """
+        Blocking execution behind aexecute(), run in a worker thread.
+
+        Backends that can stream output override this and call `emit` as
+        output arrives. The default runs execute() and emits the complete
+        output at the end.
+        """
+        result = self.execute(code)
+        if emit is not None:
+            if result.stdout:
+                emit("stdout", result.stdout)
+            if result.stderr:
+                emit("stderr", result.stderr)
+        return result
+
     def _create_success_result(
         self,
         stdout: str,
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 
 from mcp_server_langgraph.auth.openfga import OpenFGAClient
 from mcp_server_langgraph.core.config import settings
+from mcp_server_langgraph.infrastructure.warmup import get_warmup_state
 from mcp_server_langgraph.observability.telemetry import logger
 from mcp_server_langgraph.secrets.manager import get_secrets_manager
 
@@ -184,7 +185,7 @@ async def readiness_check() -> JSONResponse:
 
     Used by Kubernetes to determine if pod should receive traffic
     """
-    checks = {}
+    checks: dict[str, Any] = {}
     all_healthy = True
 
     # Check OpenFGA connection
@@ -229,6 +230,12 @@ async def readiness_check() -> JSONResponse:
     else:
         checks["secrets"] = {"status": "healthy", "message": "All critical secrets loaded"}
 
+    # Hold traffic back until startup warm-up has finished (see infrastructure/warmup.py)
+    warmup = get_warmup_state()
+    checks["warmup"] = {"status": warmup.status, "duration_ms": warmup.duration_ms}
+    if not warmup.ready:
+        all_healthy = False
+
     response_status = "ready" if all_healthy else "not_ready"
     http_status = status.HTTP_200_OK if all_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
 
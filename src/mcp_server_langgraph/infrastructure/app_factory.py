@@ -102,6 +102,11 @@ def create_app(
         """Health check endpoint"""
         return {"status": "healthy", "service": app_settings.service_name}
 
+    # Admin-only runtime diagnostics (/debug/*)
+    from mcp_server_langgraph.api.debug import router as debug_router
+
+    app.include_router(debug_router)
+
     # Customize OpenAPI
     app.openapi_schema = None  # Reset to trigger regeneration
 
@@ -158,12 +163,28 @@ async def create_lifespan(container: ApplicationContainer | None = None) -> Asyn
             # Re-raise to prevent application from starting without GDPR storage
             raise
 
+        # Event-loop lag histogram (and blocking-call stack sampling in debug mode)
+        from mcp_server_langgraph.observability.loop_monitor import start_loop_monitor_from_settings
+
+        start_loop_monitor_from_settings(container.settings)
+
+        # Warm one-time costs in the background; readiness waits for it
+        from mcp_server_langgraph.infrastructure.warmup import start_warmup
+
+        start_warmup(container.settings)
+
     yield
 
     # Shutdown
     if container:
         logger.info("Application shutting down")
 
+        from mcp_server_langgraph.infrastructure.warmup import stop_warmup
+        from mcp_server_langgraph.observability.loop_monitor import stop_loop_monitor
+
+        await stop_warmup()
+        stop_loop_monitor()
+
         # Reset GDPR storage on shutdown
         from mcp_server_langgraph.compliance.gdpr.factory import reset_gdpr_storage
 
@@ -0,0 +1,319 @@
+"""
+Startup warm-up and readiness gating.
+
+The first requests after a deploy used to pay for one-time costs: compiling
+the agent graph, loading the tokenizer behind litellm.token_counter,
+fetching the Keycloak JWKS, creating the OpenFGA SDK client, opening
+Redis/Postgres connections and filling the code execution container pool. The warm-up stage runs all of these
+concurrently from the application lifespan, then pushes one synthetic turn
+through a throwaway agent graph backed by a stub LLM.
+
+Readiness (/health/ready and /api/v1/health/ready) reports not ready while
+warm-up is running, so Kubernetes only routes traffic to a pod once it is
+warm. A failed or timed-out step is logged and reported but does not block
+readiness: warm-up exists to move latency, not to gate on dependencies
+(the regular readiness checks do that).
+
+Example:
+    >>> start_warmup(settings, auth=mcp_server.auth, openfga=mcp_server.openfga)
+    >>> get_warmup_state().snapshot()["status"]
+    'running'
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, UTC
+from typing import Any
+
+from mcp_server_langgraph.observability.telemetry import logger
+
+# A warm-up step returns a short detail string, or None when there was nothing to warm
+WarmupStep = Callable[[], Awaitable[str | None]]
+
+DRY_RUN_PROMPT = "warm-up: reply with OK"
+
+
+class WarmupState:
+    """
+    Progress of the warm-up stage.
+
+    Status moves from "not_started" to "running" to "complete" (or "disabled"
+    when warm-up is turned off). Only "running" holds back readiness, so
+    processes that never start warm-up (tests, one-off scripts) are ready.
+    """
+
+    def __init__(self) -> None:
+        self.status = "not_started"
+        self.steps: dict[str, dict[str, Any]] = {}
+        self.started_at: datetime | None = None
+        self.completed_at: datetime | None = None
+        self.duration_ms: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether readiness may report ready as far as warm-up is concerned."""
+        return self.status != "running"
+
+    def begin(self) -> None:
+        self.status = "running"
+        self.steps = {}
+        self.started_at = datetime.now(UTC)
+        self.completed_at = None
+        self.duration_ms = None
+
+    def finish(self, duration_ms: float) -> None:
+        self.status = "complete"
+        self.completed_at = datetime.now(UTC)
+        self.duration_ms = round(duration_ms, 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable view for the readiness endpoints."""
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_ms": self.duration_ms,
+            "steps": dict(self.steps),
+        }
+
+
+_warmup_state = WarmupState()
+_warmup_task: asyncio.Task[WarmupState] | None = None
+
+
+def get_warmup_state() -> WarmupState:
+    """Get the process-wide warm-up state."""
+    return _warmup_state
+
+
+def reset_warmup_state() -> None:
+    """Reset warm-up state (used by tests)."""
+    global _warmup_state
+    _warmup_state = WarmupState()
+
+
+async def _run_step(name: str, step: WarmupStep, timeout: float) -> dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        detail = await asyncio.wait_for(step(), timeout=timeout)
+        result: dict[str, Any] = {"status": "skipped" if detail is None else "ok", "detail": detail or "not configured"}
+    except TimeoutError:
+        result = {"status": "timeout", "detail": f"exceeded {timeout:g}s"}
+        logger.warning(f"Warm-up step {name} timed out after {timeout:g}s")
+    except Exception as e:
+        result = {"status": "failed", "detail": str(e)}
+        logger.warning(f"Warm-up step {name} failed: {e}", exc_info=True)
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+async def run_warmup(
+    steps: Mapping[str, WarmupStep],
+    timeout: float = 60.0,
+    state: WarmupState | None = None,
+) -> WarmupState:
+    """
+    Run warm-up steps concurrently and record the outcome of each.
+
+    Args:
+        steps: Step name -> coroutine function
+        timeout: Per-step timeout in seconds
+        state: State to update (defaults to the process-wide state)
+
+    Returns:
+        The updated WarmupState
+    """
+    state = state or get_warmup_state()
+    if state.status != "running":
+        state.begin()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_run_step(name, step, timeout) for name, step in steps.items()))
+    state.steps = dict(zip(steps, results, strict=True))
+    state.finish((time.perf_counter() - start) * 1000)
+
+    failed = [name for name, result in state.steps.items() if result["status"] in ("failed", "timeout")]
+    logger.info(
+        "Warm-up complete",
+        extra={"duration_ms": state.duration_ms, "failed_steps": failed, "steps": list(state.steps)},
+    )
+    return state
+
+
+# =============================================================================
+# Default steps
+# =============================================================================
+
+
+async def _warm_agent_graph() -> str:
+    from mcp_server_langgraph.core.agent import get_agent_graph
+
+    await asyncio.to_thread(get_agent_graph)
+    return "agent graph compiled"
+
+
+def _warm_tokenizer(settings: Any) -> WarmupStep:
+    async def step() -> str:
+        from mcp_server_langgraph.utils.response_optimizer import count_tokens
+
+        await asyncio.to_thread(count_tokens, DRY_RUN_PROMPT, settings.model_name)
+        return f"tokenizer loaded for {settings.model_name}"
+
+    return step
+
+
+def _warm_jwks(auth: Any) -> WarmupStep:
+    async def step() -> str | None:
+        from mcp_server_langgraph.auth.user_provider import KeycloakUserProvider
+
+        provider = getattr(auth, "user_provider", None)
+        if not isinstance(provider, KeycloakUserProvider):
+            return None
+        jwks = await provider.client.token_validator.get_jwks()
+        return f"{len(jwks.get('keys', []))} signing keys cached"
+
+    return step
+
+
+def _warm_openfga(openfga: Any) -> WarmupStep:
+    async def step() -> str | None:
+        if openfga is None:
+            return None
+        await openfga._ensure_initialized()
+        return "OpenFGA SDK client created"
+
+    return step
+
+
+async def _warm_redis() -> str | None:
+    from mcp_server_langgraph.auth import session
+    from mcp_server_langgraph.core.cache import get_cache
+    from mcp_server_langgraph.resilience.distributed import _get_redis_client, is_distributed_enabled
+
+    warmed = []
+    if is_distributed_enabled():
+        await _get_redis_client().ping()
+        warmed.append("distributed limits")
+    if isinstance(session._session_store, session.RedisSessionStore):
+        await session._session_store.redis.ping()
+        warmed.append("sessions")
+    # CacheService connects (and pings) its sync Redis client on construction
+    cache = await asyncio.to_thread(get_cache)
+    if cache.redis_available:
+        warmed.append("cache")
+    return ", ".join(warmed) if warmed else None
+
+
+async def _warm_postgres() -> str | None:
+    from mcp_server_langgraph.compliance.gdpr import factory
+
+    storage = factory._gdpr_storage
+    pool = getattr(getattr(storage, "user_profiles", None), "pool", None)
+    if pool is None:
+        return None
+    # Opening the pool already connected min_size connections; make sure one is live
+    await pool.fetchval("SELECT 1")
+    return f"GDPR pool ready ({pool.get_size()} connections)"
+
+
+def _warm_sandbox_pool(settings: Any) -> WarmupStep:
+    async def step() -> str | None:
+        if not settings.enable_code_execution:
+            return None
+        from mcp_server_langgraph.tools.code_execution_tools import _get_sandbox
+
+        sandbox = await asyncio.to_thread(_get_sandbox)
+        pool = getattr(sandbox, "pool", None)
+        if pool is None:
+            return f"{settings.code_execution_backend} client connected (pool disabled)"
+        return f"warming {pool.min_idle} sandbox containers"
+
+    return step
+
+
+def _dry_run(settings: Any) -> WarmupStep:
+    async def step() -> str:
+        from langchain_core.language_models import FakeListChatModel
+        from langchain_core.messages import HumanMessage
+
+        from mcp_server_langgraph.core.agent import _create_agent_graph_singleton
+        from mcp_server_langgraph.core.graph_instrumentation import get_graph_stats
+
+        # Same node code as the real graph, without verification, persistence
+        # or Qdrant, and with a stub model so no provider call is made
+        dry_run_settings = settings.model_copy(
+            update={"enable_verification": False, "enable_checkpointing": False, "enable_dynamic_context_loading": False}
+        )
+        graph = await asyncio.to_thread(_create_agent_graph_singleton, dry_run_settings, FakeListChatModel(responses=["OK"]))
+        result = await graph.ainvoke(
+            {"messages": [HumanMessage(content=DRY_RUN_PROMPT)], "user_id": "user:warmup", "request_id": "warmup"}
+        )
+        # Keep synthetic traffic out of /debug/graph-stats
+        get_graph_stats().reset()
+        return f"dry-run turn completed ({len(result['messages'])} messages)"
+
+    return step
+
+
+def build_warmup_steps(settings: Any, *, auth: Any = None, openfga: Any = None) -> dict[str, WarmupStep]:
+    """
+    Build the default warm-up steps.
+
+    Args:
+        settings: Application settings
+        auth: AuthMiddleware whose user provider may need its JWKS fetched
+        openfga: OpenFGAClient to initialize, if authorization is configured
+
+    Returns:
+        Step name -> coroutine function, for run_warmup()
+    """
+    steps: dict[str, WarmupStep] = {
+        "agent_graph": _warm_agent_graph,
+        "tokenizer": _warm_tokenizer(settings),
+        "jwks": _warm_jwks(auth),
+        "openfga": _warm_openfga(openfga),
+        "redis": _warm_redis,
+        "postgres": _warm_postgres,
+        "sandbox_pool": _warm_sandbox_pool(settings),
+    }
+    if settings.warmup_dry_run_enabled:
+        steps["dry_run"] = _dry_run(settings)
+    return steps
+
+
+def start_warmup(settings: Any, *, auth: Any = None, openfga: Any = None) -> asyncio.Task[WarmupState] | None:
+    """
+    Start warm-up in the background from an application lifespan.
+
+    The state is switched to "running" before returning, so readiness is
+    held back from the first probe onwards.
+
+    Returns:
+        The warm-up task, or None when warm-up is disabled
+    """
+    global _warmup_task
+    state = get_warmup_state()
+    if not settings.warmup_enabled:
+        state.status = "disabled"
+        return None
+
+    state.begin()
+    steps = build_warmup_steps(settings, auth=auth, openfga=openfga)
+    _warmup_task = asyncio.create_task(run_warmup(steps, timeout=settings.warmup_timeout_seconds, state=state))
+    logger.info("Warm-up started", extra={"steps": list(steps)})
+    return _warmup_task
+
+
+async def stop_warmup() -> None:
+    """Cancel warm-up if it is still running (application shutdown)."""
+    global _warmup_task
+    task, _warmup_task = _warmup_task, None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -1,14 +1,19 @@
 """LLM abstraction and validation modules."""
 
-from mcp_server_langgraph.llm.factory import create_llm_from_config
-from mcp_server_langgraph.llm.pydantic_agent import PydanticAIAgentWrapper, create_pydantic_agent
-from mcp_server_langgraph.llm.validators import (
-    EntityExtraction,
-    IntentClassification,
-    SentimentAnalysis,
-    SummaryExtraction,
-    validate_llm_response,
-)
+from typing import TYPE_CHECKING
+
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
+
+# LiteLLM and Pydantic AI are slow to import - load them on first use
+if TYPE_CHECKING:
+    from mcp_server_langgraph.llm.factory import create_llm_from_config as create_llm_from_config
+    from mcp_server_langgraph.llm.pydantic_agent import PydanticAIAgentWrapper as PydanticAIAgentWrapper
+    from mcp_server_langgraph.llm.pydantic_agent import create_pydantic_agent as create_pydantic_agent
+    from mcp_server_langgraph.llm.validators import EntityExtraction as EntityExtraction
+    from mcp_server_langgraph.llm.validators import IntentClassification as IntentClassification
+    from mcp_server_langgraph.llm.validators import SentimentAnalysis as SentimentAnalysis
+    from mcp_server_langgraph.llm.validators import SummaryExtraction as SummaryExtraction
+    from mcp_server_langgraph.llm.validators import validate_llm_response as validate_llm_response
 
 __all__ = [
     "EntityExtraction",
@@ -20,3 +25,17 @@ __all__ = [
     "create_pydantic_agent",
     "validate_llm_response",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "create_llm_from_config": "mcp_server_langgraph.llm.factory",
+        "PydanticAIAgentWrapper": "mcp_server_langgraph.llm.pydantic_agent",
+        "create_pydantic_agent": "mcp_server_langgraph.llm.pydantic_agent",
+        "EntityExtraction": "mcp_server_langgraph.llm.validators",
+        "IntentClassification": "mcp_server_langgraph.llm.validators",
+        "SentimentAnalysis": "mcp_server_langgraph.llm.validators",
+        "SummaryExtraction": "mcp_server_langgraph.llm.validators",
+        "validate_llm_response": "mcp_server_langgraph.llm.validators",
+    },
+)
@@ -9,17 +9,24 @@ Enhanced with resilience patterns (ADR-0026):
 - Retry logic with exponential backoff
 - Timeout enforcement
 - Bulkhead isolation (10 concurrent LLM calls max, provider-aware)
+- Optional deployment-wide provider rate limits (Redis-backed, see resilience.distributed)
+- Optional latency-driven provider concurrency (GradientLimiter, see resilience.adaptive),
+  which replaces the fixed LLM bulkhead when enabled
+- Provider timeouts and fallbacks bounded by the request deadline (resilience.deadline)
 - Exponential backoff between fallback attempts
 """
 
 import asyncio
+import functools
 import os
 
 # Fallback resilience constants
 FALLBACK_BASE_DELAY_SECONDS = 1.0  # Initial delay between fallback attempts
 FALLBACK_DELAY_MULTIPLIER = 2.0  # Exponential multiplier
 FALLBACK_MAX_DELAY_SECONDS = 8.0  # Cap for fallback delays
-from typing import Any
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any, TypeVar
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from litellm import acompletion, completion
@@ -35,8 +42,37 @@ from mcp_server_langgraph.core.exceptions import (
 from mcp_server_langgraph.llm.metrics import record_llm_request_duration, record_llm_token_usage
 from mcp_server_langgraph.observability.telemetry import logger, metrics, tracer
 from mcp_server_langgraph.resilience import circuit_breaker, retry_with_backoff, with_bulkhead, with_timeout
+from mcp_server_langgraph.resilience.adaptive import get_provider_gradient_limiter
+from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.deadline import bound_timeout, get_remaining_time
+from mcp_server_langgraph.resilience.distributed import acquire_provider_rate_limit
 from mcp_server_langgraph.resilience.retry import extract_retry_after_from_exception, is_overload_error
 
+T = TypeVar("T")
+
+
+def _adaptive_provider_limits_enabled() -> bool:
+    """Whether provider concurrency comes from the latency-gradient limiter rather than the fixed LLM bulkhead."""
+    return get_resilience_config().bulkhead.adaptive_provider_limits
+
+
+def _with_provider_rate_limit(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Take a deployment-wide provider rate limit token before each attempt.
+
+    Applied outside @with_bulkhead, so a caller waiting for a token does not
+    hold a bulkhead slot that other callers could use. No-op unless
+    distributed limits are enabled.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self: "LLMFactory", *args: Any, **kwargs: Any) -> T:
+        provider = self._get_provider_from_model(self.model_name)
+        await acquire_provider_rate_limit(provider, timeout=bound_timeout(30.0))
+        return await func(self, *args, **kwargs)
+
+    return wrapper
+
 
 class LLMFactory:
     """
@@ -373,9 +409,10 @@ class LLMFactory:
                 raise
 
     @circuit_breaker(name="llm", fail_max=5, timeout=60)
-    @retry_with_backoff(max_attempts=3, exponential_base=2)
+    @retry_with_backoff(max_attempts=3, exponential_base=2, budget="llm")
     @with_timeout(operation_type="llm")
-    @with_bulkhead(resource_type="llm")
+    @_with_provider_rate_limit
+    @with_bulkhead(resource_type="llm", bypass_when=_adaptive_provider_limits_enabled)
     async def ainvoke(self, messages: list[BaseMessage | dict[str, Any]], **kwargs) -> AIMessage:  # type: ignore[no-untyped-def]
         """
         Asynchronous LLM invocation with full resilience protection.
@@ -384,7 +421,9 @@ class LLMFactory:
         - Circuit breaker: Fail fast if LLM provider is down (5 failures → open, 60s timeout)
         - Retry logic: Up to 3 attempts with exponential backoff (1s, 2s, 4s)
         - Timeout: 60s timeout for LLM operations
-        - Bulkhead: Limit to 10 concurrent LLM calls
+        - Rate limit: Deployment-wide provider token, taken before the bulkhead
+        - Bulkhead: Limit to 10 concurrent LLM calls, or a per-provider
+          latency-gradient limit when BULKHEAD_ADAPTIVE_PROVIDER_LIMITS is set
 
         Args:
             messages: List of messages
@@ -415,12 +454,16 @@ class LLMFactory:
                 "messages": formatted_messages,
                 "temperature": kwargs.get("temperature", self.temperature),
                 "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-                "timeout": kwargs.get("timeout", self.timeout),
+                # Provider-side timeout never outlives the request deadline
+                "timeout": bound_timeout(kwargs.get("timeout", self.timeout)),
                 **self.kwargs,
             }
 
+            provider = self._get_provider_from_model(self.model_name)
+
             try:
-                response: ModelResponse = await acompletion(**params)
+                async with self._provider_concurrency(provider):
+                    response: ModelResponse = await acompletion(**params)
 
                 content = response.choices[0].message.content  # type: ignore[union-attr]
 
@@ -509,6 +552,12 @@ class LLMFactory:
                         cause=e,
                     )
 
+    def _provider_concurrency(self, provider: str) -> AbstractAsyncContextManager[Any]:
+        """Latency-gradient provider limiter when enabled, otherwise a no-op context."""
+        if _adaptive_provider_limits_enabled():
+            return get_provider_gradient_limiter(provider).acquire()
+        return nullcontext()
+
     def _try_fallback(self, messages: list[BaseMessage | dict[str, Any]], **kwargs) -> AIMessage:  # type: ignore[no-untyped-def]
         """Try fallback models if primary fails"""
         for fallback_model in self.fallback_models:
@@ -563,6 +612,13 @@ class LLMFactory:
             # Apply exponential backoff delay before attempt (except first)
             if attempt > 0:
                 delay = min(current_delay, FALLBACK_MAX_DELAY_SECONDS)
+                remaining = get_remaining_time()
+                if remaining is not None and delay >= remaining:
+                    logger.warning(
+                        "Request deadline leaves no budget for further fallback models",
+                        extra={"remaining_seconds": max(0.0, remaining), "fallback_model": fallback_model},
+                    )
+                    break
                 logger.info(
                     f"Waiting {delay:.1f}s before fallback attempt {attempt + 1}",
                     extra={"delay_seconds": delay, "fallback_model": fallback_model},
@@ -582,7 +638,7 @@ class LLMFactory:
                     messages=formatted_messages,
                     temperature=self.temperature,
                     max_tokens=self.max_tokens,
-                    timeout=self.timeout,
+                    timeout=bound_timeout(self.timeout),
                     **provider_kwargs,  # Forward provider-specific kwargs only
                 )
 
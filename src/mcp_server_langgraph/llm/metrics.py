@@ -11,6 +11,8 @@ These metrics are scraped by Alloy and displayed in the LLM Performance Grafana
 
 from typing import Any
 
+from mcp_server_langgraph.core.graph_instrumentation import record_node_llm_tokens
+
 # Lazy-load prometheus_client to handle missing dependency
 _metrics_available: bool | None = None
 _llm_token_usage_total: Any = None
@@ -71,6 +73,9 @@ def record_llm_token_usage(model: str, prompt_tokens: int, completion_tokens: in
         prompt_tokens: Number of tokens in the prompt
         completion_tokens: Number of tokens in the completion
     """
+    # Per-node attribution for the agent graph (agent.node.tokens, /debug/graph-stats)
+    record_node_llm_tokens(prompt_tokens, completion_tokens)
+
     if not _metrics_available:
         return
 
@@ -1,7 +1,13 @@
 """MCP protocol server implementations."""
 
-# Import modules so they can be accessed as attributes
-from . import server_stdio, server_streamable, streaming
+from typing import TYPE_CHECKING
+
+from mcp_server_langgraph.core.lazy_imports import lazy_exports
+
+# Transports are imported on first attribute access so that loading one entry
+# point (e.g. server_stdio) does not also import the other.
+if TYPE_CHECKING:
+    from . import server_stdio, server_streamable, streaming
 
 # Entry points for different transports
 __all__ = [
@@ -9,3 +15,12 @@ __all__ = [
     "server_streamable",  # StreamableHTTP transport
     "streaming",  # Streaming utilities
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "server_stdio": "mcp_server_langgraph.mcp.server_stdio",
+        "server_streamable": "mcp_server_langgraph.mcp.server_streamable",
+        "streaming": "mcp_server_langgraph.mcp.streaming",
+    },
+)
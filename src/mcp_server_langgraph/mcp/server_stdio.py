@@ -12,7 +12,7 @@ Implements Anthropic's best practices for writing tools for agents:
 import asyncio
 import sys
 import time
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from langchain_core.messages import HumanMessage
 from mcp.server import Server
@@ -23,11 +23,22 @@ from pydantic import AnyUrl, BaseModel, Field
 from mcp_server_langgraph.auth.factory import create_auth_middleware
 from mcp_server_langgraph.auth.middleware import AuthMiddleware
 from mcp_server_langgraph.auth.openfga import OpenFGAClient
-from mcp_server_langgraph.core.agent import AgentState, get_agent_graph
 from mcp_server_langgraph.core.config import Settings, settings
 from mcp_server_langgraph.observability.telemetry import logger, metrics, tracer
+from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.deadline import deadline_scope
 from mcp_server_langgraph.utils.response_optimizer import format_response
 
+if TYPE_CHECKING:
+    from mcp_server_langgraph.core.agent import AgentState
+
+
+def get_agent_graph() -> Any:
+    """Return the compiled agent graph, importing the agent module on first use."""
+    from mcp_server_langgraph.core.agent import get_agent_graph as _get_agent_graph
+
+    return _get_agent_graph()
+
 
 class ChatInput(BaseModel):
     """
@@ -468,7 +479,9 @@ class MCPAgentServer:
         @self.server.call_tool()  # type: ignore[untyped-decorator]
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Handle tool calls with OpenFGA authorization and tracing"""
-            return await self.call_tool_public(name, arguments)
+            # Request deadline: nested timeouts and retries stop once it is spent
+            with deadline_scope(get_resilience_config().admission.default_deadline):
+                return await self.call_tool_public(name, arguments)
 
         @self.server.list_resources()  # type: ignore[no-untyped-call, untyped-decorator]
         async def list_resources() -> list[Resource]:
@@ -510,7 +523,7 @@ class MCPAgentServer:
             conversation_resource = f"conversation:{thread_id}"
 
             # Check if conversation exists by trying to get state from checkpointer
-            graph = get_agent_graph()  # type: ignore[func-returns-value]
+            graph = get_agent_graph()
             conversation_exists = False
             if hasattr(graph, "checkpointer") and graph.checkpointer is not None:
                 try:
@@ -569,7 +582,7 @@ class MCPAgentServer:
             config = {"configurable": {"thread_id": thread_id}}
 
             try:
-                result = await get_agent_graph().ainvoke(initial_state, config)  # type: ignore[func-returns-value]
+                result = await get_agent_graph().ainvoke(initial_state, config)
 
                 # Extract response
                 response_message = result["messages"][-1]
@@ -638,7 +651,7 @@ class MCPAgentServer:
             # Retrieve conversation state from checkpointer
             try:
                 # Get the checkpointer from agent_graph
-                graph = get_agent_graph()  # type: ignore[func-returns-value]
+                graph = get_agent_graph()
                 if not hasattr(graph, "checkpointer") or graph.checkpointer is None:
                     logger.warning("Checkpointing not enabled, cannot retrieve conversation history")
                     return [
@@ -892,7 +905,7 @@ class MCPAgentServer:
 
             # Execute code
             start_time = time.time()
-            result = execute_python.invoke({"code": code, "timeout": timeout})
+            result = await execute_python.ainvoke({"code": code, "timeout": timeout})
             execution_time = time.time() - start_time
 
             span.set_attribute("code.length", len(code))
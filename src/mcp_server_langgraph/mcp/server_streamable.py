@@ -10,17 +10,18 @@ Implements Anthropic's best practices for writing tools for agents:
 - High-signal information in responses
 """
 
+import asyncio
 import json
 import logging
 import sys
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from typing import Any, Literal
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager, suppress
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from langchain_core.messages import HumanMessage
 from mcp.server import Server
 from mcp.types import Resource, TextContent, Tool
@@ -31,8 +32,8 @@ from mcp_server_langgraph.auth.factory import create_auth_middleware, create_use
 from mcp_server_langgraph.auth.middleware import AuthMiddleware
 from mcp_server_langgraph.auth.openfga import OpenFGAClient
 from mcp_server_langgraph.auth.user_provider import KeycloakUserProvider
-from mcp_server_langgraph.core.agent import AgentState, get_agent_graph
 from mcp_server_langgraph.core.config import Settings, settings
+from mcp_server_langgraph.core.exceptions import AdmissionRejectedError
 from mcp_server_langgraph.core.security import sanitize_for_logging
 from mcp_server_langgraph.mcp.elicitation import (
     ElicitationAction,
@@ -49,10 +50,30 @@ from mcp_server_langgraph.mcp.sampling import (
     SamplingMessageContent,
     SamplingRateLimiter,
 )
-from mcp_server_langgraph.middleware.rate_limiter import custom_rate_limit_exceeded_handler, limiter
+from mcp_server_langgraph.middleware.rate_limiter import custom_rate_limit_exceeded_handler, get_user_tier, limiter
+from mcp_server_langgraph.observability.profiler import run_tagged
 from mcp_server_langgraph.observability.telemetry import logger, metrics, tracer
+from mcp_server_langgraph.resilience.admission import RequestPriority, classify_request, get_admission_controller
+from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.deadline import deadline_scope
 from mcp_server_langgraph.utils.response_optimizer import format_response
 
+if TYPE_CHECKING:
+    from mcp_server_langgraph.core.agent import AgentState
+
+
+def get_agent_graph() -> Any:
+    """
+    Return the compiled agent graph.
+
+    The agent module (LangGraph, LiteLLM, Pydantic AI) is imported here rather than
+    at module level so that importing this module - and starting the ASGI app -
+    does not pay for it before the first request or warm-up.
+    """
+    from mcp_server_langgraph.core.agent import get_agent_graph as _get_agent_graph
+
+    return _get_agent_graph()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -94,8 +115,26 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.warning(f"Failed to initialize global auth middleware: {e}")
 
+    # Event-loop lag histogram (and blocking-call stack sampling in debug mode)
+    from mcp_server_langgraph.observability.loop_monitor import start_loop_monitor_from_settings, stop_loop_monitor
+
+    start_loop_monitor_from_settings(settings)
+
+    # Pre-build the graph, tokenizer, JWKS, OpenFGA client and connection pools
+    # in the background; readiness reports not ready until this completes
+    from mcp_server_langgraph.infrastructure.warmup import start_warmup, stop_warmup
+
+    try:
+        warm_server = get_mcp_server()
+        start_warmup(settings, auth=warm_server.auth, openfga=warm_server.openfga)
+    except Exception as e:
+        logger.warning(f"Failed to start warm-up: {e}")
+
     yield
 
+    await stop_warmup()
+    stop_loop_monitor()
+
     # Shutdown - cleanup observability and close connections
     from mcp_server_langgraph.observability.telemetry import shutdown_observability
 
@@ -105,7 +144,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     try:
         from mcp_server_langgraph.core.agent import cleanup_checkpointer
 
-        agent_graph = get_agent_graph()  # type: ignore[func-returns-value]
+        agent_graph = get_agent_graph()
         if agent_graph and hasattr(agent_graph, "checkpointer") and agent_graph.checkpointer:
             cleanup_checkpointer(agent_graph.checkpointer)
             logger.info("Checkpointer resources cleaned up")
@@ -166,6 +205,10 @@ app = FastAPI(
             "name": "SCIM 2.0",
             "description": "System for Cross-domain Identity Management (SCIM) 2.0 user and group provisioning",
         },
+        {
+            "name": "Debug",
+            "description": "Admin-only runtime diagnostics (event-loop lag, blocking calls)",
+        },
     ],
     responses={
         401: {"description": "Unauthorized - Invalid or missing authentication token"},
@@ -399,7 +442,8 @@ class MCPAgentStreamableServer:
 
         This wraps the internal MCP handler to avoid accessing private SDK attributes.
         """
-        return await self._call_tool_handler(name, arguments)  # type: ignore[no-any-return]
+        # Tagged so /debug/profile samples are grouped per MCP tool
+        return await run_tagged(f"tool:{name}", self._call_tool_handler(name, arguments))
 
     async def list_resources_public(self) -> list[Resource]:
         """
@@ -820,7 +864,7 @@ class MCPAgentStreamableServer:
             conversation_resource = f"conversation:{thread_id}"
 
             # Check if conversation exists by trying to get state from checkpointer
-            graph = get_agent_graph()  # type: ignore[func-returns-value]
+            graph = get_agent_graph()
             conversation_exists = False
             if hasattr(graph, "checkpointer") and graph.checkpointer is not None:
                 try:
@@ -880,7 +924,7 @@ class MCPAgentStreamableServer:
             config = {"configurable": {"thread_id": thread_id}}
 
             try:
-                result = await get_agent_graph().ainvoke(initial_state, config)  # type: ignore[func-returns-value]
+                result = await get_agent_graph().ainvoke(initial_state, config)
 
                 # Seed OpenFGA tuples for new conversations
                 if not conversation_exists and self.openfga is not None:
@@ -958,7 +1002,7 @@ class MCPAgentStreamableServer:
                 raise PermissionError(msg)
 
             # Retrieve conversation from checkpointer
-            graph = get_agent_graph()  # type: ignore[func-returns-value]
+            graph = get_agent_graph()
 
             if not hasattr(graph, "checkpointer") or graph.checkpointer is None:
                 logger.warning("No checkpointer available, cannot retrieve conversation history")
@@ -1179,7 +1223,7 @@ class MCPAgentStreamableServer:
 
             # Execute code
             start_time = time.time()
-            result = execute_python.invoke({"code": code, "timeout": timeout})
+            result = await execute_python.ainvoke({"code": code, "timeout": timeout})
             execution_time = time.time() - start_time
 
             span.set_attribute("code.length", len(code))
@@ -1508,8 +1552,63 @@ async def stream_jsonrpc_response(data: dict[str, Any]) -> AsyncIterator[str]:
     yield json.dumps(data) + "\n"
 
 
+T = TypeVar("T")
+
+# How often to check whether the client of an in-flight tool call went away
+DISCONNECT_POLL_INTERVAL_SECONDS = 0.5
+
+
+class ClientDisconnectedError(Exception):
+    """The client closed the connection before the response was ready."""
+
+
+async def _run_until_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    """
+    Await a tool call, cancelling it if the client disconnects first.
+
+    Cancellation propagates into the agent graph, LLM calls and tools, so a
+    client that gives up no longer keeps provider slots and bulkheads busy.
+
+    Raises:
+        ClientDisconnectedError: If the client disconnected before completion
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+                raise ClientDisconnectedError
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def _request_deadline_seconds(request: Request) -> float:
+    """
+    Get the deadline budget for a request.
+
+    Clients may ask for a shorter (or, up to ADMISSION_MAX_DEADLINE, longer)
+    budget with an X-Request-Timeout header in seconds.
+    """
+    admission = get_resilience_config().admission
+    header = request.headers.get("x-request-timeout")
+    if header:
+        try:
+            requested = float(header)
+            if requested > 0:
+                return min(requested, admission.max_deadline)
+        except ValueError:
+            logger.debug(f"Ignoring invalid X-Request-Timeout header: {header!r}")
+    return admission.default_deadline
+
+
 @app.post("/message", response_model=None)
-async def handle_message(request: Request) -> JSONResponse | StreamingResponse:
+async def handle_message(request: Request) -> Response:
     """
     Handle MCP messages via StreamableHTTP POST
 
@@ -1521,8 +1620,8 @@ async def handle_message(request: Request) -> JSONResponse | StreamingResponse:
         message = await request.json()
 
         with tracer.start_as_current_span("mcp.streamable.message") as span:
-            span.set_attribute("mcp.method", message.get("method", "unknown"))
-            span.set_attribute("mcp.id", str(message.get("id", "")))
+            if span.is_recording():  # Sampled-out spans skip attribute work
+                span.set_attributes({"mcp.method": message.get("method", "unknown"), "mcp.id": str(message.get("id", ""))})
 
             logger.info("Received MCP message", extra={"method": message.get("method"), "id": message.get("id")})
 
@@ -1573,8 +1672,25 @@ async def handle_message(request: Request) -> JSONResponse | StreamingResponse:
                 accept_header = request.headers.get("accept", "")
                 supports_streaming = "text/event-stream" in accept_header or "application/x-ndjson" in accept_header
 
-                # Use public API instead of private _tool_manager
-                result = await get_mcp_server().call_tool_public(tool_name, arguments)
+                # Queue by priority (tier, tool weight) and shed early when overloaded
+                admission = get_resilience_config().admission
+                priority = (
+                    classify_request(
+                        method,
+                        tool_name,
+                        get_user_tier(request),
+                        has_argument_token=isinstance(arguments, dict) and bool(arguments.get("token")),
+                    )
+                    if admission.enabled
+                    else RequestPriority.CRITICAL
+                )
+                span.set_attribute("admission.priority", priority.name.lower())
+
+                # The request deadline bounds every nested timeout, retry and tool call
+                with deadline_scope(_request_deadline_seconds(request)):
+                    async with get_admission_controller().admit(priority):
+                        # Use public API instead of private _tool_manager
+                        result = await _run_until_disconnect(request, get_mcp_server().call_tool_public(tool_name, arguments))
 
                 response_data = {
                     "jsonrpc": "2.0",
@@ -1841,6 +1957,21 @@ async def handle_message(request: Request) -> JSONResponse | StreamingResponse:
             else:
                 raise HTTPException(status_code=400, detail=f"Unknown method: {method}")
 
+    except ClientDisconnectedError:
+        # Nobody is listening: work was cancelled, just close out the request
+        logger.info("Client disconnected, cancelled in-flight tool call")
+        return Response(status_code=499)
+    except AdmissionRejectedError as e:
+        # Load shedding: tell the client when to come back instead of timing out later
+        return JSONResponse(
+            status_code=503,
+            content={
+                "jsonrpc": "2.0",
+                "id": message.get("id") if "message" in locals() else None,
+                "error": {"code": -32000, "message": e.user_message, "data": {"retry_after": e.retry_after}},
+            },
+            headers={"Retry-After": str(e.retry_after or 1)},
+        )
     except PermissionError as e:
         logger.warning(f"Permission denied: {e}")
         return JSONResponse(
@@ -1933,6 +2064,7 @@ async def root_metrics() -> Any:
 
 
 from mcp_server_langgraph.api.api_keys import router as api_keys_router  # noqa: E402
+from mcp_server_langgraph.api.debug import router as debug_router  # noqa: E402
 from mcp_server_langgraph.api.gdpr import router as gdpr_router  # noqa: E402
 from mcp_server_langgraph.api.scim import router as scim_router  # noqa: E402
 from mcp_server_langgraph.api.service_principals import router as service_principals_router  # noqa: E402
@@ -1945,6 +2077,7 @@ app.include_router(gdpr_router)
 app.include_router(api_keys_router)
 app.include_router(service_principals_router)
 app.include_router(scim_router)
+app.include_router(debug_router)
 
 
 # ==============================================================================
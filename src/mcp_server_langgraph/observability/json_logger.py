@@ -3,6 +3,9 @@ Structured JSON Logging with OpenTelemetry Integration
 
 Provides JSON-formatted logging with automatic trace context injection,
 compatible with centralized log aggregation platforms (ELK, Datadog, Splunk, CloudWatch).
+
+Serialization uses orjson when installed (several times faster than stdlib json)
+and falls back to json.dumps otherwise.
 """
 
 import json
@@ -12,6 +15,14 @@ from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
 # Type annotation for conditional base class
 if TYPE_CHECKING:
     JsonFormatterBase: type[logging.Formatter] = logging.Formatter
@@ -25,6 +36,61 @@ else:
         JsonFormatterBase = logging.Formatter
 
 
+# Standard LogRecord attributes (never emitted as extra fields)
+RESERVED_LOG_RECORD_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "taskName",
+    }
+)
+
+
+def dumps_json(obj: Any, indent: int | None = None) -> str:
+    """
+    Serialize a log record dict to JSON.
+
+    Uses orjson for compact (or 2-space indented) output when available, and
+    stdlib json for other indents or values orjson rejects (e.g. >64-bit ints).
+    Non-serializable values are rendered with str() in both cases.
+
+    Args:
+        obj: Object to serialize
+        indent: JSON indentation (None for compact)
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except TypeError:
+            pass  # orjson.JSONEncodeError: fall back to stdlib json
+    return json.dumps(obj, default=str, indent=indent)
+
+
 class CustomJSONFormatter(JsonFormatterBase):  # type: ignore[valid-type, misc]
     """
     Enhanced JSON formatter with OpenTelemetry trace context injection
@@ -61,6 +127,7 @@ class CustomJSONFormatter(JsonFormatterBase):  # type: ignore[valid-type, misc]
         self.service_name = service_name
         self.include_hostname = include_hostname
         self.indent = indent
+        self._hostname: str | None = None
 
     def add_fields(
         self,
@@ -96,23 +163,28 @@ class CustomJSONFormatter(JsonFormatterBase):  # type: ignore[valid-type, misc]
         # Add service name
         log_record["service"] = self.service_name
 
-        # Add hostname if enabled
+        # Add hostname if enabled (resolved once, then cached)
         if self.include_hostname:
-            import socket
-
-            try:
-                log_record["hostname"] = socket.gethostname()
-            except Exception:
-                log_record["hostname"] = "unknown"
-
-        # Add OpenTelemetry trace context
-        span = trace.get_current_span()
-        if span:
-            span_context = span.get_span_context()
-            if span_context and span_context.is_valid:
-                log_record["trace_id"] = format(span_context.trace_id, "032x")
-                log_record["span_id"] = format(span_context.span_id, "016x")
-                log_record["trace_flags"] = f"{span_context.trace_flags:02x}"
+            if self._hostname is None:
+                import socket
+
+                try:
+                    self._hostname = socket.gethostname()
+                except Exception:
+                    log_record["hostname"] = "unknown"
+            if self._hostname is not None:
+                log_record["hostname"] = self._hostname
+
+        # Add OpenTelemetry trace context. Records formatted off the event loop
+        # (QueueListener thread) carry the span context captured at emit time.
+        span_context = getattr(record, "_otel_span_context", None)
+        if span_context is None:
+            span = trace.get_current_span()
+            span_context = span.get_span_context() if span else None
+        if span_context and span_context.is_valid:
+            log_record["trace_id"] = format(span_context.trace_id, "032x")
+            log_record["span_id"] = format(span_context.span_id, "016x")
+            log_record["trace_flags"] = f"{span_context.trace_flags:02x}"
 
         # Add exception info if present
         if record.exc_info:
@@ -155,47 +227,25 @@ class CustomJSONFormatter(JsonFormatterBase):  # type: ignore[valid-type, misc]
         Returns:
             JSON-formatted log string
         """
-        message_dict = {}
         # Always get the formatted message (combines msg + args)
-        message_dict["message"] = record.getMessage()
+        message_dict = {"message": record.getMessage()}
 
         # Merge any extra fields passed via extra parameter
+        # (skip standard logging attributes and private fields)
         if hasattr(record, "__dict__"):
-            for key, value in record.__dict__.items():
-                # Skip standard logging attributes
-                if key not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "created",
-                    "filename",
-                    "funcName",
-                    "levelname",
-                    "levelno",
-                    "lineno",
-                    "module",
-                    "msecs",
-                    "message",
-                    "pathname",
-                    "process",
-                    "processName",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                    "taskName",
-                ]:
-                    # Add custom extra fields
-                    if not key.startswith("_"):
-                        message_dict[key] = value
+            message_dict.update(
+                {
+                    key: value
+                    for key, value in record.__dict__.items()
+                    if key not in RESERVED_LOG_RECORD_KEYS and not key.startswith("_")
+                }
+            )
 
         log_record: dict[str, Any] = {}
         self.add_fields(log_record, record, message_dict)
 
         # Serialize to JSON
-        return json.dumps(log_record, default=str, indent=self.indent)
+        return dumps_json(log_record, indent=self.indent)
 
 
 def setup_json_logging(
@@ -0,0 +1,126 @@
+"""
+Non-blocking log pipeline.
+
+Formatting a JSON record and writing it to stdout/files happens on whichever
+thread calls logger.info(), which for request handlers is the event loop. With
+LOG_ASYNC=true the root logger instead gets a QueueHandler that only captures
+the record; a QueueListener thread formats and writes it.
+
+- The queue is bounded (LOG_QUEUE_SIZE). When it is full, records are dropped
+  rather than blocking the event loop, and drops are counted per level.
+- The OpenTelemetry span context is captured when the record is enqueued, so
+  trace_id/span_id are still correct when formatted on the listener thread.
+"""
+
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, cast
+
+from opentelemetry import trace
+
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks and counts dropped records.
+
+    Unlike the stdlib QueueHandler, prepare() does not pre-format the record
+    (formatting is the expensive part we want off the caller's thread). It
+    only merges msg/args, so mutable arguments cannot change before the
+    listener gets to it, and captures the current span context.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self._dropped: dict[str, int] = {}
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot the record for hand-off to the listener thread."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        span_context = trace.get_current_span().get_span_context()
+        if span_context.is_valid:
+            record._otel_span_context = span_context
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking; drop the record if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped[record.levelname] = self._dropped.get(record.levelname, 0) + 1
+
+    @property
+    def dropped(self) -> dict[str, int]:
+        """Dropped record counts by level name."""
+        with self._dropped_lock:
+            return dict(self._dropped)
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener whose stop sentinel waits for room instead of failing on a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        # Listener thread is draining, so this unblocks (the stdlib sentinel is None)
+        cast("queue.Queue[Any]", self.queue).put(None)
+
+
+# Module-level pipeline state (one per process)
+_queue_handler: BoundedQueueHandler | None = None
+_queue_listener: _DrainingQueueListener | None = None
+
+
+def start_queue_logging(
+    handlers: list[logging.Handler],
+    maxsize: int = DEFAULT_LOG_QUEUE_SIZE,
+) -> BoundedQueueHandler:
+    """
+    Start the background listener that writes records to the given handlers.
+
+    Args:
+        handlers: Output handlers (console, files) run on the listener thread
+        maxsize: Max queued records before new records are dropped
+
+    Returns:
+        The QueueHandler to install on the root logger
+    """
+    global _queue_handler, _queue_listener
+
+    stop_queue_logging()
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=maxsize)
+    _queue_handler = BoundedQueueHandler(log_queue)
+    _queue_listener = _DrainingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    return _queue_handler
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and stop the listener thread (no-op if not running)."""
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()  # Processes remaining records before returning
+        for handler in _queue_listener.handlers:
+            handler.flush()
+        _queue_listener = None
+    _queue_handler = None
+
+
+def get_log_queue_stats() -> dict[str, int | bool | dict[str, int]]:
+    """Get queue depth and dropped record counts for the log pipeline."""
+    if _queue_handler is None:
+        return {"enabled": False, "queued": 0, "dropped": {}}
+    return {
+        "enabled": True,
+        "queued": _queue_handler.queue.qsize(),  # type: ignore[attr-defined]
+        "dropped": _queue_handler.dropped,
+    }
@@ -0,0 +1,322 @@
+"""
+Event-loop lag monitor and blocking-call detector.
+
+Lag is measured as the drift of a periodic loop.call_later callback: the
+callback is due at a known time, and anything that keeps the loop busy
+(a sync Redis call, token counting, the sync Docker SDK, smtplib) delays
+it. Each drift sample is observed in the event_loop_lag_seconds
+histogram, which /metrics exposes.
+
+Drift only shows blocks that overlap a sample's due time, so in debug
+mode a watchdog thread measures blocking directly instead. It keeps one
+probe callback posted to the loop (call_soon_threadsafe) and times how long
+the loop takes to run it. A probe still pending after the threshold means
+the loop thread is blocked right now, so the watchdog samples the loop
+thread's stack and attributes the block to the innermost first-party (or
+else third-party) module on it. Detection does not depend on the sampling
+interval: any block longer than 1.5x the threshold is caught (the watchdog
+polls every threshold / 4). The samples are exposed at /debug/loop.
+
+Example:
+    >>> monitor = start_loop_monitor(interval=0.1, blocking_threshold=0.1)
+    >>> monitor.snapshot()["blocking"]["by_module"]
+    {'mcp_server_langgraph.core.cache': 3}
+"""
+
+import asyncio
+import logging
+import math
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, UTC
+from types import FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FIRST_PARTY_PACKAGE = "mcp_server_langgraph"
+
+# Prometheus client for metrics exposition
+try:
+    from prometheus_client import REGISTRY
+    from prometheus_client import Counter as PrometheusCounter
+    from prometheus_client import Histogram as PrometheusHistogram
+
+    event_loop_lag_seconds = PrometheusHistogram(
+        name="event_loop_lag_seconds",
+        documentation="Drift of a periodic event-loop callback (time the loop was busy past its due time)",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+        registry=REGISTRY,
+    )
+    event_loop_blocking_total = PrometheusCounter(
+        name="event_loop_blocking_callbacks_total",
+        documentation="Callbacks that blocked the event loop past the debug threshold, by module",
+        labelnames=["module"],
+        registry=REGISTRY,
+    )
+
+    PROMETHEUS_CLIENT_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_CLIENT_AVAILABLE = False
+    event_loop_lag_seconds = None  # type: ignore[assignment]
+    event_loop_blocking_total = None  # type: ignore[assignment]
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+def _is_stdlib(module: str) -> bool:
+    return module.partition(".")[0] in sys.stdlib_module_names
+
+
+def attribute_module(frame: FrameType | None) -> str:
+    """
+    Name the module responsible for a blocked stack.
+
+    Walks from the innermost frame outwards and returns the first
+    first-party module, else the first non-stdlib module, else the
+    innermost module (e.g. "socket" for a bare blocking recv).
+    """
+    innermost = None
+    third_party = None
+    while frame is not None:
+        module = str(frame.f_globals.get("__name__", "?"))
+        if innermost is None:
+            innermost = module
+        if module.startswith(FIRST_PARTY_PACKAGE) and module != __name__:
+            return module
+        if third_party is None and not _is_stdlib(module) and module != __name__:
+            third_party = module
+        frame = frame.f_back
+    return third_party or innermost or "unknown"
+
+
+def _format_stack(frame: FrameType | None, limit: int) -> list[str]:
+    """Innermost-first 'module:function:line' entries."""
+    entries: list[str] = []
+    while frame is not None and len(entries) < limit:
+        entries.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return entries
+
+
+class EventLoopMonitor:
+    """
+    Periodic loop-drift sampler with an optional blocking-call watchdog.
+
+    Must be started from the event loop it monitors.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        blocking_threshold: float | None = None,
+        window: int = 600,
+        max_events: int = 100,
+        stack_limit: int = 30,
+    ):
+        """
+        Initialize monitor.
+
+        Args:
+            interval: Seconds between drift samples
+            blocking_threshold: Seconds the loop must stay unresponsive before it counts
+                as blocked and its stack is sampled (None disables the watchdog)
+            window: Number of recent drift samples kept for /debug/loop percentiles
+            max_events: Number of recent blocking events kept with their stacks
+            stack_limit: Frames kept per stack sample
+        """
+        self.interval = interval
+        self.blocking_threshold = blocking_threshold
+        self.stack_limit = stack_limit
+
+        self._lags: deque[float] = deque(maxlen=window)
+        self._max_lag = 0.0
+        self._samples = 0
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._expected = 0.0  # Loop clock
+        self._probe_sent: float | None = None  # time.monotonic of the pending watchdog probe
+
+        self._lock = threading.Lock()
+        self._events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._open_event: dict[str, Any] | None = None
+        self._blocking_by_module: Counter[str] = Counter()
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Start sampling on the running (or given) loop; call from the loop thread."""
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._schedule()
+
+        if self.blocking_threshold:
+            self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop sampling and the watchdog thread."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._probe_sent = None
+
+    def _schedule(self) -> None:
+        if self._loop is None:
+            return
+        self._expected = self._loop.time() + self.interval
+        self._handle = self._loop.call_later(self.interval, self._tick)
+
+    def _tick(self) -> None:
+        if self._loop is None:
+            return
+        lag = max(0.0, self._loop.time() - self._expected)
+        self._lags.append(lag)
+        self._samples += 1
+        self._max_lag = max(self._max_lag, lag)
+        if event_loop_lag_seconds is not None:
+            event_loop_lag_seconds.observe(lag)
+
+        self._schedule()
+
+    def _answer_probe(self, sent: float) -> None:
+        """Runs on the loop: the loop is responsive again, so close any open blocking event."""
+        blocked = time.monotonic() - sent
+        with self._lock:
+            if self._probe_sent == sent:
+                self._probe_sent = None
+            if self._open_event is not None:
+                self._open_event["blocked_ms"] = round(blocked * 1000, 2)
+                self._open_event = None
+
+    def _watch(self) -> None:
+        """Watchdog thread: keep a probe posted to the loop and sample the stack once per blocking episode."""
+        threshold = self.blocking_threshold or 0.0
+        poll = min(threshold / 4, 0.05)
+        sampled = None
+        while not self._stop.wait(poll):
+            sent = self._probe_sent
+            if sent is None:
+                if self._loop is None:
+                    return
+                sent = time.monotonic()
+                self._probe_sent = sent
+                try:
+                    self._loop.call_soon_threadsafe(self._answer_probe, sent)
+                except RuntimeError:
+                    return  # Loop closed
+                continue
+
+            overdue = time.monotonic() - sent
+            if overdue < threshold or sent == sampled:
+                continue
+            sampled = sent
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            self._record_blocking(frame, overdue, sent)
+
+    def _record_blocking(self, frame: FrameType | None, overdue: float, probe_sent: float) -> None:
+        module = attribute_module(frame)
+        event = {
+            "detected_at": datetime.now(UTC).isoformat(),
+            "module": module,
+            "blocked_ms": round(overdue * 1000, 2),  # Updated with the full duration when the loop resumes
+            "stack": _format_stack(frame, self.stack_limit),
+        }
+        with self._lock:
+            self._events.append(event)
+            # If the probe was answered meanwhile, the block already ended and overdue is final
+            if self._probe_sent == probe_sent:
+                self._open_event = event
+            self._blocking_by_module[module] += 1
+        if event_loop_blocking_total is not None:
+            event_loop_blocking_total.labels(module=module).inc()
+        logger.warning("Event loop blocked", extra={"module_name": module, "overdue_ms": event["blocked_ms"]})
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current lag statistics and recent blocking events (for /debug/loop)."""
+        lags = list(self._lags)
+        with self._lock:
+            events = [dict(event) for event in self._events]
+            by_module = dict(self._blocking_by_module.most_common())
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "samples": self._samples,
+            "lag_ms": {
+                "p50": round(_percentile(lags, 50) * 1000, 2),
+                "p99": round(_percentile(lags, 99) * 1000, 2),
+                "max": round(self._max_lag * 1000, 2),
+            },
+            "blocking": {
+                "enabled": bool(self.blocking_threshold),
+                "threshold_ms": self.blocking_threshold * 1000 if self.blocking_threshold else None,
+                "total": sum(by_module.values()),
+                "by_module": by_module,
+                "recent": events,
+            },
+        }
+
+
+# Module-level monitor (one per process)
+_monitor: EventLoopMonitor | None = None
+
+
+def start_loop_monitor(interval: float = 0.1, blocking_threshold: float | None = None) -> EventLoopMonitor:
+    """
+    Start the process-wide loop monitor on the running loop.
+
+    Idempotent: a monitor that is already running is returned unchanged.
+    """
+    global _monitor
+    if _monitor is not None and _monitor.running:
+        return _monitor
+    _monitor = EventLoopMonitor(interval=interval, blocking_threshold=blocking_threshold)
+    _monitor.start()
+    logger.info(
+        "Event loop monitor started",
+        extra={"interval_ms": interval * 1000, "blocking_threshold_ms": (blocking_threshold or 0) * 1000},
+    )
+    return _monitor
+
+
+def stop_loop_monitor() -> None:
+    """Stop the process-wide loop monitor, if running."""
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+        _monitor = None
+
+
+def get_loop_monitor() -> EventLoopMonitor | None:
+    """Return the process-wide loop monitor, or None if not started."""
+    return _monitor
+
+
+def start_loop_monitor_from_settings(settings: Any) -> EventLoopMonitor | None:
+    """Start the monitor according to event_loop_* settings (no-op when disabled)."""
+    if not getattr(settings, "event_loop_monitor_enabled", True):
+        return None
+    interval_ms = getattr(settings, "event_loop_monitor_interval_ms", 100.0)
+    threshold_ms = getattr(settings, "event_loop_blocking_threshold_ms", 0.0)
+    return start_loop_monitor(interval=interval_ms / 1000, blocking_threshold=threshold_ms / 1000 if threshold_ms else None)
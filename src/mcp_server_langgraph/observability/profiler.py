@@ -0,0 +1,240 @@
+"""
+In-process sampling profiler with agent-stage tagging.
+
+A background thread wakes every `interval` seconds and records the stack
+of every other thread from sys._current_frames(). Nothing is hooked into
+the profiled code (unlike cProfile), so overhead is one stack walk per
+thread per sample and zero when no profile is running.
+
+Stages: graph nodes and tool calls run inside tag_stage()/run_tagged()
+wrappers whose frames carry a `profile_tag` local. The sampler reads the
+tags off the sampled stack, so samples are attributed to the node or tool
+that was actually executing even though many requests interleave on one
+event loop thread.
+
+Output formats:
+- collapsed: "stage;frame;frame;... count" lines (flamegraph.pl, speedscope, inferno)
+- speedscope: speedscope.app JSON, one sampled profile per stage
+
+Example:
+    >>> profiler = StackSampler(interval=0.01)
+    >>> profiler.start(); time.sleep(5); profiler.stop()
+    >>> print(profiler.collapsed())
+"""
+
+import functools
+import inspect
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from types import CodeType, FrameType
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+UNTAGGED = "untagged"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def tag_stage(tag: str, func: Callable[P, T]) -> Callable[P, T]:
+    """
+    Wrap a sync or async callable so profile samples taken inside it carry `tag`.
+
+    Example:
+        >>> workflow.add_node("respond", tag_stage("node:generate_response", generate_response))
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_tagged(*args: P.args, **kwargs: P.kwargs) -> Any:
+            profile_tag = tag  # noqa: F841 - read from the frame by StackSampler
+            return await func(*args, **kwargs)
+
+        return async_tagged  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def sync_tagged(*args: P.args, **kwargs: P.kwargs) -> T:
+        profile_tag = tag  # noqa: F841 - read from the frame by StackSampler
+        return func(*args, **kwargs)
+
+    return sync_tagged
+
+
+async def run_tagged(tag: str, awaitable: Awaitable[T]) -> T:
+    """Await `awaitable` so profile samples taken while it runs carry `tag`."""
+    profile_tag = tag  # noqa: F841 - read from the frame by StackSampler
+    return await awaitable
+
+
+def _tagged_codes() -> frozenset[CodeType]:
+    """Code objects of the wrapper frames that hold a profile_tag local."""
+    sync_wrapper = tag_stage("", lambda: None)
+    async_wrapper = tag_stage("", run_tagged)
+    return frozenset(
+        {
+            sync_wrapper.__code__,
+            async_wrapper.__code__,
+            run_tagged.__code__,
+        }
+    )
+
+
+_TAGGED_CODES = _tagged_codes()
+
+
+def _frame_label(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+def _sample_stack(frame: FrameType | None, max_depth: int) -> tuple[str, tuple[tuple[str, str, int], ...]]:
+    """
+    Walk one thread's stack.
+
+    Only the innermost `max_depth` frames are kept, but the whole stack is
+    walked for stage tags, so outer tags survive deep stacks.
+
+    Returns:
+        (stage tag, root-first frames as (label, filename, first line)) -
+        nested tags are joined with "/", e.g. "node:use_tools/tool:search"
+    """
+    frames: list[tuple[str, str, int]] = []
+    tags: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        if code in _TAGGED_CODES:
+            tag = frame.f_locals.get("profile_tag")
+            if tag:
+                tags.append(tag)
+        elif len(frames) < max_depth:
+            frames.append((_frame_label(frame), code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    frames.reverse()
+    tags.reverse()
+    return ("/".join(tags) or UNTAGGED), tuple(frames)
+
+
+class StackSampler:
+    """Wall-clock stack sampler for all threads in the process."""
+
+    def __init__(self, interval: float = 0.01, max_depth: int = 128, threads: set[int] | None = None):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples (0.01 = 100 Hz)
+            max_depth: Frames kept per stack (innermost frames win)
+            threads: Thread idents to sample (default: every thread except the sampler)
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.threads = threads
+
+        self._samples: Counter[tuple[str, tuple[tuple[str, str, int], ...]]] = Counter()  # (stage, stack) -> count
+        self._sample_count = 0
+        self._started_at = 0.0
+        self._stopped_at = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def duration(self) -> float:
+        end = self._stopped_at if not self.running else time.monotonic()
+        return max(0.0, end - self._started_at)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._stopped_at = time.monotonic()
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for ident, frame in frames.items():
+                if ident == own_ident or (self.threads is not None and ident not in self.threads):
+                    continue
+                self._samples[_sample_stack(frame, self.max_depth)] += 1
+            self._sample_count += 1
+            del frames
+
+    def stage_totals(self) -> dict[str, int]:
+        """Sample counts per stage tag, highest first."""
+        totals: Counter[str] = Counter()
+        for (tag, _), count in self._samples.items():
+            totals[tag] += count
+        return dict(totals.most_common())
+
+    def collapsed(self) -> str:
+        """Brendan Gregg collapsed-stack format, with the stage tag as the root frame."""
+        lines = []
+        merged: Counter[str] = Counter()
+        for (tag, stack), count in self._samples.items():
+            merged[";".join([tag, *(label for label, _, _ in stack)])] += count
+        for stack_line, count in sorted(merged.items()):
+            lines.append(f"{stack_line} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def speedscope(self, name: str = "mcp-server-langgraph") -> dict[str, Any]:
+        """speedscope.app file format: one sampled profile per stage tag."""
+        frame_index: dict[tuple[str, str, int], int] = {}
+        shared_frames: list[dict[str, Any]] = []
+        profiles: dict[str, dict[str, Any]] = {}
+
+        for (tag, stack), count in sorted(self._samples.items(), key=lambda item: item[0][0]):
+            indices = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(shared_frames)
+                    label, filename, line = frame
+                    shared_frames.append({"name": label, "file": filename, "line": line})
+                indices.append(frame_index[frame])
+
+            profile = profiles.setdefault(
+                tag,
+                {
+                    "type": "sampled",
+                    "name": tag,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": 0.0,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            profile["samples"].append(indices)
+            profile["weights"].append(count * self.interval)
+            profile["endValue"] += count * self.interval
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "mcp_server_langgraph.observability.profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": shared_frames},
+            "profiles": list(profiles.values()),
+        }
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "interval_ms": self.interval * 1000,
+            "duration_seconds": round(self.duration, 3),
+            "samples": self._sample_count,
+            "stages": self.stage_totals(),
+        }
@@ -0,0 +1,337 @@
+"""
+Trace sampling: per-span-name/route head sampling plus tail sampling.
+
+Hot paths (openfga.check, context.check_compaction, mcp.streamable.message)
+produce most of the span volume. Sampling happens in two stages:
+
+- Head sampling (RuleBasedSampler): each new trace is sampled with a ratio
+  chosen by the first matching rule on span name or HTTP route, falling back
+  to OTEL_TRACES_SAMPLER_RATIO. Child spans follow their parent
+  (ParentBased), so traces are never partially exported.
+- Tail sampling (TailSamplingSpanProcessor, opt-in): traces dropped by the
+  head sampler are still recorded and buffered per trace. When the local
+  root span ends, the trace is exported anyway if any span errored or the
+  root took longer than the slow threshold.
+
+Without tail sampling, head-dropped spans are non-recording: set_attribute()
+is a no-op and callers can skip attribute work with `span.is_recording()`.
+With tail sampling on, spans must be recorded until the root decides, which
+is the price of always keeping errors and slow requests.
+
+Rule syntax (OTEL_SAMPLING_RULES), comma-separated `pattern=ratio` pairs
+matched in order with fnmatch; `route:` patterns match the HTTP route:
+
+    openfga.check=0.01,context.*=0.05,route:/health*=0
+"""
+
+import fnmatch
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    ALWAYS_ON,
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanContext, SpanKind, StatusCode, TraceFlags, get_current_span
+from opentelemetry.trace.span import TraceState
+from opentelemetry.util.types import Attributes
+
+logger = logging.getLogger(__name__)
+
+# Span attributes consulted for `route:` rules (old and new semconv)
+ROUTE_ATTRIBUTES = ("http.route", "url.path", "http.target")
+
+ROUTE_PREFIX = "route:"
+
+
+@dataclass(frozen=True)
+class SamplingRule:
+    """Sample spans matching `pattern` (span name, or route with `route:`) at `ratio`."""
+
+    pattern: str
+    ratio: float
+
+    @property
+    def is_route(self) -> bool:
+        return self.pattern.startswith(ROUTE_PREFIX)
+
+    def matches(self, name: str, attributes: Attributes) -> bool:
+        """Check whether a span about to start matches this rule."""
+        if not self.is_route:
+            return fnmatch.fnmatchcase(name, self.pattern)
+
+        route_pattern = self.pattern[len(ROUTE_PREFIX) :]
+        for key in ROUTE_ATTRIBUTES:
+            value = attributes.get(key) if attributes else None
+            if isinstance(value, str) and fnmatch.fnmatchcase(value, route_pattern):
+                return True
+        return False
+
+
+def parse_sampling_rules(spec: str) -> list[SamplingRule]:
+    """
+    Parse `pattern=ratio` pairs (comma-separated) into sampling rules.
+
+    Invalid entries are logged and skipped rather than failing startup.
+    """
+    rules: list[SamplingRule] = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pattern, sep, ratio_str = entry.rpartition("=")
+        try:
+            if not sep or not pattern.strip():
+                raise ValueError("expected pattern=ratio")
+            ratio = float(ratio_str)
+            if not 0.0 <= ratio <= 1.0:
+                raise ValueError("ratio must be between 0 and 1")
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid sampling rule {entry!r}: {e}")
+            continue
+        rules.append(SamplingRule(pattern=pattern.strip(), ratio=ratio))
+    return rules
+
+
+class RuleBasedSampler(Sampler):
+    """
+    Ratio sampler whose ratio is picked per span name or route.
+
+    Decisions are trace-id based, so every process sampling the same trace
+    with the same ratio agrees. With `record_dropped=True`, dropped spans are
+    still recorded (RECORD_ONLY) so the tail-sampling processor can keep them.
+    """
+
+    def __init__(self, rules: Sequence[SamplingRule] = (), default_ratio: float = 1.0, record_dropped: bool = False):
+        self.rules = list(rules)
+        self.default_ratio = default_ratio
+        self.record_dropped = record_dropped
+        self._default_sampler = TraceIdRatioBased(default_ratio)
+        self._rule_samplers = [TraceIdRatioBased(rule.ratio) for rule in self.rules]
+
+    def _sampler_for(self, name: str, attributes: Attributes) -> TraceIdRatioBased:
+        for rule, sampler in zip(self.rules, self._rule_samplers, strict=True):
+            if rule.matches(name, attributes):
+                return sampler
+        return self._default_sampler
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        result = self._sampler_for(name, attributes).should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision == Decision.DROP and self.record_dropped:
+            return SamplingResult(Decision.RECORD_ONLY, attributes, _parent_trace_state(parent_context))
+        return result
+
+    def get_description(self) -> str:
+        rules = ",".join(f"{rule.pattern}={rule.ratio}" for rule in self.rules)
+        return f"RuleBasedSampler{{default={self.default_ratio},rules=[{rules}]}}"
+
+
+class _RecordOnlySampler(Sampler):
+    """Record (but do not sample) children of head-dropped traces for tail sampling."""
+
+    def should_sample(
+        self,
+        parent_context: Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        if get_current_span(parent_context).is_recording():
+            return SamplingResult(Decision.RECORD_ONLY, attributes, _parent_trace_state(parent_context))
+        return SamplingResult(Decision.DROP, None, _parent_trace_state(parent_context))
+
+    def get_description(self) -> str:
+        return "RecordOnlyIfParentRecording"
+
+
+def _parent_trace_state(parent_context: Context | None) -> TraceState | None:
+    span_context = get_current_span(parent_context).get_span_context()
+    return span_context.trace_state if span_context.is_valid else None
+
+
+def create_sampler(rules: Sequence[SamplingRule] = (), default_ratio: float = 1.0, tail_sampling: bool = False) -> Sampler:
+    """
+    Build the parent-based sampler used by the tracer provider.
+
+    - New (root) traces: RuleBasedSampler
+    - Local children of sampled spans: always sampled, so traces stay whole
+    - Remote parents: honor the caller's sampled flag
+    - Local children of head-dropped traces: recorded only when tail sampling is on
+
+    Args:
+        rules: Per-span-name/route ratios (first match wins)
+        default_ratio: Ratio for root spans matching no rule
+        tail_sampling: Record head-dropped traces for the tail-sampling processor
+    """
+    return ParentBased(
+        root=RuleBasedSampler(rules, default_ratio, record_dropped=tail_sampling),
+        remote_parent_sampled=ALWAYS_ON,
+        remote_parent_not_sampled=ALWAYS_OFF,
+        local_parent_sampled=ALWAYS_ON,
+        local_parent_not_sampled=_RecordOnlySampler() if tail_sampling else ALWAYS_OFF,
+    )
+
+
+# =============================================================================
+# Tail Sampling
+# =============================================================================
+
+
+class _TraceBuffer:
+    __slots__ = ("keep", "spans")
+
+    def __init__(self) -> None:
+        self.spans: list[ReadableSpan] = []
+        self.keep = False
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Export head-dropped traces that turned out to contain errors or be slow.
+
+    Head-sampled spans pass straight through to the wrapped processor. Spans
+    recorded only for tail sampling are buffered per trace; when the trace's
+    local root ends, the buffer is either exported (as sampled spans) or
+    discarded. Buffering is bounded in traces and in spans per trace; the
+    oldest trace is evicted (dropped) when the bound is hit.
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        slow_threshold_ms: float = 2000.0,
+        max_traces: int = 2048,
+        max_spans_per_trace: int = 512,
+    ):
+        """
+        Initialize tail-sampling processor.
+
+        Args:
+            delegate: Processor that exports kept spans (e.g. BatchSpanProcessor)
+            slow_threshold_ms: Root span duration above which a trace is kept
+            max_traces: Max in-flight traces buffered
+            max_spans_per_trace: Max spans buffered per trace (extra spans are dropped)
+        """
+        self.delegate = delegate
+        self.slow_threshold_ns = int(slow_threshold_ms * 1_000_000)
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+
+        self._traces: OrderedDict[int, _TraceBuffer] = OrderedDict()
+        self._lock = threading.Lock()
+        self.kept_traces = 0
+        self.dropped_traces = 0
+        self.evicted_traces = 0
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        span_context = span.context
+        if span_context is None:
+            return
+        if span_context.trace_flags.sampled:
+            self.delegate.on_end(span)
+            return
+
+        is_local_root = span.parent is None or span.parent.is_remote
+        interesting = span.status.status_code == StatusCode.ERROR or (
+            is_local_root and _duration_ns(span) >= self.slow_threshold_ns
+        )
+
+        with self._lock:
+            buffer = self._traces.get(span_context.trace_id)
+            if buffer is None:
+                buffer = self._traces[span_context.trace_id] = _TraceBuffer()
+                while len(self._traces) > self.max_traces:
+                    self._traces.popitem(last=False)
+                    self.evicted_traces += 1
+            if len(buffer.spans) < self.max_spans_per_trace:
+                buffer.spans.append(span)
+            buffer.keep = buffer.keep or interesting
+
+            if not is_local_root:
+                return
+            del self._traces[span_context.trace_id]
+            if buffer.keep:
+                self.kept_traces += 1
+            else:
+                self.dropped_traces += 1
+
+        if buffer.keep:
+            for buffered in buffer.spans:
+                self.delegate.on_end(_as_sampled(buffered))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._traces.clear()
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get tail-sampling statistics."""
+        with self._lock:
+            return {
+                "buffered_traces": len(self._traces),
+                "kept_traces": self.kept_traces,
+                "dropped_traces": self.dropped_traces,
+                "evicted_traces": self.evicted_traces,
+            }
+
+
+def _duration_ns(span: ReadableSpan) -> int:
+    if span.start_time is None or span.end_time is None:
+        return 0
+    return span.end_time - span.start_time
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    """Copy a recorded-only span with the sampled flag set so exporters accept it."""
+    context = span.context
+    sampled_context = SpanContext(
+        trace_id=context.trace_id,
+        span_id=context.span_id,
+        is_remote=context.is_remote,
+        trace_flags=TraceFlags(context.trace_flags | TraceFlags.SAMPLED),
+        trace_state=context.trace_state,
+    )
+    return ReadableSpan(
+        name=span.name,
+        context=sampled_context,
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
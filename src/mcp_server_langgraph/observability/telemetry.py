@@ -2,57 +2,50 @@
 Unified observability setup with OpenTelemetry and LangSmith support
 """
 
+import importlib.util
 import logging
 import os
 import sys
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from opentelemetry import metrics as otel_metrics
 from opentelemetry import trace
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
+from opentelemetry.metrics import CallbackOptions, Observation
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import ConsoleMetricExporter, PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace import SpanProcessor, SynchronousMultiSpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
-# Conditional imports for OTLP exporters (optional dependencies)
-try:
-    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter as OTLPMetricExporterGRPC
-    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter as OTLPSpanExporterGRPC
+from mcp_server_langgraph.observability.json_logger import CustomJSONFormatter
+from mcp_server_langgraph.observability.log_queue import (
+    DEFAULT_LOG_QUEUE_SIZE,
+    get_log_queue_stats,
+    start_queue_logging,
+    stop_queue_logging,
+)
+from mcp_server_langgraph.observability.sampling import TailSamplingSpanProcessor, create_sampler, parse_sampling_rules
 
-    GRPC_AVAILABLE = True
-except ImportError:
-    GRPC_AVAILABLE = False
-    OTLPMetricExporterGRPC = None  # type: ignore[misc, assignment, unused-ignore]
-    OTLPSpanExporterGRPC = None  # type: ignore[misc, assignment, unused-ignore]
 
-try:
-    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
-        OTLPMetricExporter as OTLPMetricExporterHTTP,
-    )
-    from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
-        _append_metrics_path,
-    )
-    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
-        OTLPSpanExporter as OTLPSpanExporterHTTP,
-    )
-    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
-        _append_trace_path,
-    )
+def _module_available(name: str) -> bool:
+    """Check whether an optional module is installed without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
 
-    HTTP_AVAILABLE = True
-except ImportError:
-    HTTP_AVAILABLE = False
-    OTLPMetricExporterHTTP = None  # type: ignore[misc, assignment, unused-ignore]
-    OTLPSpanExporterHTTP = None  # type: ignore[misc, assignment, unused-ignore]
-    _append_metrics_path = None  # type: ignore[misc, assignment, unused-ignore]
-    _append_trace_path = None  # type: ignore[misc, assignment, unused-ignore]
 
-from mcp_server_langgraph.observability.json_logger import CustomJSONFormatter
+# OTLP exporters are optional dependencies. They are imported when the providers
+# are set up rather than here: the gRPC exporter pulls in grpcio and the HTTP
+# exporter requests + protobuf, which every `import telemetry` would pay for.
+GRPC_AVAILABLE = _module_available("opentelemetry.exporter.otlp.proto.grpc")
+HTTP_AVAILABLE = _module_available("opentelemetry.exporter.otlp.proto.http")
 
 # Configuration
 SERVICE_NAME = "mcp-server-langgraph"
@@ -75,6 +68,12 @@ class ObservabilityConfig:
         log_format: str = "json",  # "json" or "text"
         log_json_indent: int | None = None,  # None for compact, 2 for pretty-print
         enable_file_logging: bool = False,  # NEW: opt-in file logging
+        log_async: bool = False,  # Format/write logs on a background thread
+        log_queue_size: int = DEFAULT_LOG_QUEUE_SIZE,  # Records buffered before dropping
+        trace_sample_ratio: float = 1.0,  # Head-sampling ratio for new traces
+        trace_sampling_rules: str = "",  # Per-span-name/route ratios ("pattern=ratio,...")
+        tail_sampling_enabled: bool = False,  # Keep head-dropped traces that error or are slow
+        tail_sampling_slow_ms: float = 2000.0,  # Root duration that counts as slow
     ):
         self.service_name = service_name
         self.otlp_endpoint = otlp_endpoint
@@ -83,6 +82,13 @@ class ObservabilityConfig:
         self.log_format = log_format
         self.log_json_indent = log_json_indent
         self.enable_file_logging = enable_file_logging
+        self.log_async = log_async
+        self.log_queue_size = log_queue_size
+        self.trace_sample_ratio = trace_sample_ratio
+        self.trace_sampling_rules = trace_sampling_rules
+        self.tail_sampling_enabled = tail_sampling_enabled
+        self.tail_sampling_slow_ms = tail_sampling_slow_ms
+        self.tail_sampling_processor: TailSamplingSpanProcessor | None = None
 
         # Setup OpenTelemetry
         self._setup_tracing()
@@ -117,26 +123,46 @@ class ObservabilityConfig:
             {"service.name": self.service_name, "service.version": service_version, "deployment.environment": environment}
         )
 
-        provider = TracerProvider(resource=resource)
+        sampler = create_sampler(
+            rules=parse_sampling_rules(self.trace_sampling_rules),
+            default_ratio=self.trace_sample_ratio,
+            tail_sampling=self.tail_sampling_enabled,
+        )
+        provider = TracerProvider(resource=resource, sampler=sampler)
+
+        exporters: list[SpanExporter] = []
 
         # OTLP exporter for production (if available)
-        if GRPC_AVAILABLE and OTLPSpanExporterGRPC is not None:
-            grpc_span_exporter = OTLPSpanExporterGRPC(endpoint=self.otlp_endpoint)
-            provider.add_span_processor(BatchSpanProcessor(grpc_span_exporter))
-        elif HTTP_AVAILABLE and OTLPSpanExporterHTTP is not None:
+        if GRPC_AVAILABLE:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter as OTLPSpanExporterGRPC
+
+            exporters.append(OTLPSpanExporterGRPC(endpoint=self.otlp_endpoint))
+        elif HTTP_AVAILABLE:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter as OTLPSpanExporterHTTP
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import _append_trace_path
+
             # HTTP endpoint needs /v1/traces path appended (SDK only does this for env vars)
-            http_endpoint = self.otlp_endpoint.replace(":4317", ":4318")
-            if _append_trace_path is not None:
-                http_endpoint = _append_trace_path(http_endpoint)
-            http_span_exporter = OTLPSpanExporterHTTP(endpoint=http_endpoint)
-            provider.add_span_processor(BatchSpanProcessor(http_span_exporter))
+            http_endpoint = _append_trace_path(self.otlp_endpoint.replace(":4317", ":4318"))
+            exporters.append(OTLPSpanExporterHTTP(endpoint=http_endpoint))
         elif OBSERVABILITY_VERBOSE:
             print("⚠ OTLP exporters not available, using console-only tracing")
 
         # Console exporter for development
         if self.enable_console_export:
-            console_exporter = ConsoleSpanExporter()
-            provider.add_span_processor(BatchSpanProcessor(console_exporter))
+            exporters.append(ConsoleSpanExporter())
+
+        export_processors: list[SpanProcessor] = [BatchSpanProcessor(exporter) for exporter in exporters]
+        if self.tail_sampling_enabled and export_processors:
+            # One tail sampler in front of all exporters: each head-dropped trace is
+            # buffered and decided once, then fanned out to every exporter
+            fan_out = SynchronousMultiSpanProcessor()  # type: ignore[no-untyped-call]
+            for export_processor in export_processors:
+                fan_out.add_span_processor(export_processor)
+            self.tail_sampling_processor = TailSamplingSpanProcessor(fan_out, slow_threshold_ms=self.tail_sampling_slow_ms)
+            provider.add_span_processor(self.tail_sampling_processor)
+        else:
+            for export_processor in export_processors:
+                provider.add_span_processor(export_processor)
 
         trace.set_tracer_provider(provider)
 
@@ -152,15 +178,18 @@ class ObservabilityConfig:
         readers = []
 
         # OTLP metric exporter (if available)
-        if GRPC_AVAILABLE and OTLPMetricExporterGRPC is not None:
+        if GRPC_AVAILABLE:
+            from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter as OTLPMetricExporterGRPC
+
             grpc_metric_exporter = OTLPMetricExporterGRPC(endpoint=self.otlp_endpoint)
             grpc_reader = PeriodicExportingMetricReader(grpc_metric_exporter, export_interval_millis=5000)
             readers.append(grpc_reader)
-        elif HTTP_AVAILABLE and OTLPMetricExporterHTTP is not None:
+        elif HTTP_AVAILABLE:
+            from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter as OTLPMetricExporterHTTP
+            from opentelemetry.exporter.otlp.proto.http.metric_exporter import _append_metrics_path
+
             # HTTP endpoint needs /v1/metrics path appended (SDK only does this for env vars)
-            http_endpoint = self.otlp_endpoint.replace(":4317", ":4318")
-            if _append_metrics_path is not None:
-                http_endpoint = _append_metrics_path(http_endpoint)
+            http_endpoint = _append_metrics_path(self.otlp_endpoint.replace(":4317", ":4318"))
             http_metric_exporter = OTLPMetricExporterHTTP(endpoint=http_endpoint)
             http_reader = PeriodicExportingMetricReader(http_metric_exporter, export_interval_millis=5000)
             readers.append(http_reader)
@@ -237,6 +266,16 @@ class ObservabilityConfig:
             description="Total retry exhaustion events",
             unit="1",
         )
+        self.retry_budget_exhausted_counter = self.meter.create_counter(
+            name="retry.budget_exhausted",
+            description="Retries skipped because the dependency's retry budget was exhausted",
+            unit="1",
+        )
+        self.retry_budget_balance_gauge = self.meter.create_gauge(
+            name="retry.budget_balance",
+            description="Retry tokens currently available per dependency",
+            unit="1",
+        )
         self.retry_success_after_retry_counter = self.meter.create_counter(
             name="retry.success_after_retry",
             description="Total successful retries",
@@ -272,6 +311,29 @@ class ObservabilityConfig:
             unit="1",
         )
 
+        self.bulkhead_concurrency_limit_gauge = self.meter.create_gauge(
+            name="bulkhead.concurrency_limit",
+            description="Current adaptive concurrency limit per provider",
+            unit="1",
+        )
+        self.bulkhead_queue_wait_histogram = self.meter.create_histogram(
+            name="bulkhead.queue_wait",
+            description="Time spent waiting for an adaptive bulkhead slot",
+            unit="s",
+        )
+
+        # Admission control metrics
+        self.admission_rejected_counter = self.meter.create_counter(
+            name="admission.rejected.total",
+            description="Requests shed by admission control",
+            unit="1",
+        )
+        self.admission_queue_wait_histogram = self.meter.create_histogram(
+            name="admission.queue_wait",
+            description="Time spent queued in admission control",
+            unit="s",
+        )
+
         # Fallback metrics
         self.fallback_used_counter = self.meter.create_counter(
             name="fallback.used",
@@ -279,6 +341,52 @@ class ObservabilityConfig:
             unit="1",
         )
 
+        # Agent graph per-node metrics (core/graph_instrumentation.py)
+        self.agent_node_duration_histogram = self.meter.create_histogram(
+            name="agent.node.duration",
+            description="Agent graph node execution time",
+            unit="ms",
+        )
+        self.agent_node_tokens_histogram = self.meter.create_histogram(
+            name="agent.node.tokens",
+            description="LLM tokens consumed per agent graph node execution",
+            unit="1",
+        )
+        self.agent_node_cache_hits_histogram = self.meter.create_histogram(
+            name="agent.node.cache_hits",
+            description="Cache hits per agent graph node execution",
+            unit="1",
+        )
+        self.agent_node_state_size_histogram = self.meter.create_histogram(
+            name="agent.node.state_size",
+            description="Approximate size of the state returned by an agent graph node",
+            unit="By",
+        )
+
+        # Code execution sandbox pool metrics (execution/container_pool.py)
+        self.sandbox_pool_acquisitions_counter = self.meter.create_counter(
+            name="sandbox.pool.acquisitions",
+            description="Sandbox container acquisitions by result (hit = pre-warmed, miss = cold start)",
+            unit="1",
+        )
+        self.sandbox_pool_acquire_duration_histogram = self.meter.create_histogram(
+            name="sandbox.pool.acquire_duration",
+            description="Time to obtain a sandbox container from the pool",
+            unit="ms",
+        )
+        self.sandbox_pool_idle_gauge = self.meter.create_gauge(
+            name="sandbox.pool.idle",
+            description="Pre-warmed sandbox containers waiting in the pool",
+            unit="1",
+        )
+
+        # Code validation latency (execution/code_validator.py)
+        self.code_validation_duration_histogram = self.meter.create_histogram(
+            name="code.validation.duration",
+            description="CodeValidator.validate latency by path (cache hit, pre-filter reject, full AST check)",
+            unit="ms",
+        )
+
         # Error counter by type (for custom exceptions)
         self.error_counter = self.meter.create_counter(
             name="error.total",
@@ -286,6 +394,14 @@ class ObservabilityConfig:
             unit="1",
         )
 
+        # Async log pipeline: records dropped because the queue was full
+        self.log_records_dropped_counter = self.meter.create_observable_counter(
+            name="logging.records_dropped",
+            callbacks=[_observe_dropped_log_records],
+            description="Log records dropped because the async log queue was full",
+            unit="1",
+        )
+
         # Code execution metrics
         self.code_executions = self.meter.create_counter(
             name="code.executions",
@@ -391,6 +507,10 @@ class ObservabilityConfig:
             error_handler.setFormatter(formatter)
             handlers.append(error_handler)
 
+        # Non-blocking mode: callers only enqueue, a listener thread formats and writes
+        if self.log_async:
+            handlers = [start_queue_logging(handlers, maxsize=self.log_queue_size)]
+
         # Configure root logger
         logging.basicConfig(level=logging.INFO, handlers=handlers)
 
@@ -452,6 +572,12 @@ def is_initialized() -> bool:
     return _observability_config is not None
 
 
+def _observe_dropped_log_records(options: CallbackOptions) -> list[Observation]:
+    """Report async log queue drops per level (observable counter callback)."""
+    dropped = get_log_queue_stats()["dropped"]
+    return [Observation(count, {"level": level}) for level, count in dropped.items()]  # type: ignore[union-attr]
+
+
 def init_observability(
     settings: Any | None = None,
     service_name: str = SERVICE_NAME,
@@ -461,6 +587,12 @@ def init_observability(
     log_format: str = "json",
     log_json_indent: int | None = None,
     enable_file_logging: bool = False,
+    log_async: bool = False,
+    log_queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
+    trace_sample_ratio: float = 1.0,
+    trace_sampling_rules: str = "",
+    tail_sampling_enabled: bool = False,
+    tail_sampling_slow_ms: float = 2000.0,
 ) -> ObservabilityConfig:
     """
     Initialize observability system (tracing, metrics, logging).
@@ -477,6 +609,12 @@ def init_observability(
         log_format: "json" or "text"
         log_json_indent: JSON indent for pretty-printing (None for compact)
         enable_file_logging: Enable file-based log rotation (opt-in)
+        log_async: Format and write logs on a background thread (bounded queue)
+        log_queue_size: Max buffered log records before new ones are dropped
+        trace_sample_ratio: Head-sampling ratio for traces matching no rule
+        trace_sampling_rules: Per-span-name/route ratios, e.g. "openfga.check=0.01"
+        tail_sampling_enabled: Also export head-dropped traces that error or are slow
+        tail_sampling_slow_ms: Root span duration (ms) that counts as slow
 
     Returns:
         Initialized ObservabilityConfig instance
@@ -501,6 +639,12 @@ def init_observability(
         enable_console_export = getattr(settings, "enable_console_export", True)
         # enable_file_logging can be overridden via settings
         enable_file_logging = getattr(settings, "enable_file_logging", enable_file_logging)
+        log_async = getattr(settings, "log_async", log_async)
+        log_queue_size = getattr(settings, "log_queue_size", log_queue_size)
+        trace_sample_ratio = getattr(settings, "otel_traces_sampler_ratio", trace_sample_ratio)
+        trace_sampling_rules = getattr(settings, "otel_sampling_rules", trace_sampling_rules)
+        tail_sampling_enabled = getattr(settings, "otel_tail_sampling_enabled", tail_sampling_enabled)
+        tail_sampling_slow_ms = getattr(settings, "otel_tail_sampling_slow_ms", tail_sampling_slow_ms)
 
     _observability_config = ObservabilityConfig(
         service_name=service_name,
@@ -510,10 +654,19 @@ def init_observability(
         log_format=log_format,
         log_json_indent=log_json_indent,
         enable_file_logging=enable_file_logging,
+        log_async=log_async,
+        log_queue_size=log_queue_size,
+        trace_sample_ratio=trace_sample_ratio,
+        trace_sampling_rules=trace_sampling_rules,
+        tail_sampling_enabled=tail_sampling_enabled,
+        tail_sampling_slow_ms=tail_sampling_slow_ms,
     )
 
     _propagator = TraceContextTextMapPropagator()
 
+    # Point the module-level metric facades at the real instruments
+    _attach_metric_facades(_observability_config)
+
     return _observability_config
 
 
@@ -584,6 +737,9 @@ def shutdown_observability() -> None:
                 if OBSERVABILITY_VERBOSE:
                     print("✅ Shutdown meter provider", file=sys.stderr)
 
+        # Drain the async log queue so no records are lost on exit
+        stop_queue_logging()
+
         if OBSERVABILITY_VERBOSE:
             print("✅ Observability system shutdown complete", file=sys.stderr)
 
@@ -593,6 +749,7 @@ def shutdown_observability() -> None:
 
     finally:
         _observability_config = None  # Mark as shutdown
+        _attach_metric_facades(None)  # Metric facades go back to no-ops
 
 
 # Note: config is available via get_config() function or via the lazy 'config' proxy below
@@ -694,102 +851,150 @@ def extract_context(carrier: dict[str, str]) -> Any:
 
 
 # Resilience pattern metrics (convenient exports for resilience module)
-# These are lazy proxies that safely no-op if observability not initialized
+# These are facades that no-op until observability is initialized, then call
+# the real instruments directly
+
+
+def _noop_metric_operation(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for add/set/record before observability is initialized."""
 
 
-def _safe_metric_operation(metric_name: str, operation: str, *args: Any, **kwargs: Any) -> None:
+class BoundMetric:
     """
-    Safely perform metric operation, no-op if observability not initialized.
+    Metric facade with a fixed attribute set.
 
-    This allows resilience patterns to work even before observability is initialized,
-    which is common in tests and during application startup.
+    add/set/record are functools.partial objects over the real instrument
+    methods, so a hot-path increment is `bound.add(1)` with no dict built
+    per call.
     """
-    if _observability_config is None:
-        # Observability not initialized - no-op
-        return
-    try:
-        metric = getattr(_observability_config, metric_name)
-        getattr(metric, operation)(*args, **kwargs)
-    except Exception:
-        # Silently ignore metric errors to prevent breaking application logic
-        pass
-
-
-circuit_breaker_state_gauge = type(
-    "LazyMetric",
-    (),
-    {
-        "add": lambda self, *args, **kwargs: _safe_metric_operation("circuit_breaker_state_gauge", "add", *args, **kwargs),
-        "set": lambda self, *args, **kwargs: _safe_metric_operation("circuit_breaker_state_gauge", "set", *args, **kwargs),
-    },
-)()
-
-circuit_breaker_failure_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("circuit_breaker_failure_counter", "add", *args, **kwargs)},
-)()
-
-circuit_breaker_success_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("circuit_breaker_success_counter", "add", *args, **kwargs)},
-)()
-
-retry_attempt_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("retry_attempt_counter", "add", *args, **kwargs)},
-)()
-
-retry_exhausted_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("retry_exhausted_counter", "add", *args, **kwargs)},
-)()
-
-retry_success_after_retry_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("retry_success_after_retry_counter", "add", *args, **kwargs)},
-)()
-
-timeout_exceeded_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("timeout_exceeded_counter", "add", *args, **kwargs)},
-)()
-
-timeout_duration_histogram = type(
-    "LazyMetric",
-    (),
-    {"record": lambda self, *args, **kwargs: _safe_metric_operation("timeout_duration_histogram", "record", *args, **kwargs)},
-)()
-
-bulkhead_rejected_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("bulkhead_rejected_counter", "add", *args, **kwargs)},
-)()
-
-bulkhead_active_operations_gauge = type(
-    "LazyMetric",
-    (),
-    {"set": lambda self, *args, **kwargs: _safe_metric_operation("bulkhead_active_operations_gauge", "set", *args, **kwargs)},
-)()
-
-bulkhead_queue_depth_gauge = type(
-    "LazyMetric",
-    (),
-    {"set": lambda self, *args, **kwargs: _safe_metric_operation("bulkhead_queue_depth_gauge", "set", *args, **kwargs)},
-)()
-
-fallback_used_counter = type(
-    "LazyMetric",
-    (),
-    {"add": lambda self, *args, **kwargs: _safe_metric_operation("fallback_used_counter", "add", *args, **kwargs)},
-)()
-
-error_counter = type(
-    "LazyMetric", (), {"add": lambda self, *args, **kwargs: _safe_metric_operation("error_counter", "add", *args, **kwargs)}
-)()
+
+    __slots__ = ("add", "attributes", "record", "set")
+
+    def __init__(self, attributes: dict[str, Any]):
+        self.attributes = attributes
+        self.add: Callable[..., None] = _noop_metric_operation
+        self.set: Callable[..., None] = _noop_metric_operation
+        self.record: Callable[..., None] = _noop_metric_operation
+
+    def _bind(self, instrument: Any) -> None:
+        for operation in ("add", "set", "record"):
+            method = getattr(instrument, operation, None)
+            setattr(
+                self, operation, partial(method, attributes=self.attributes) if method is not None else _noop_metric_operation
+            )
+
+
+class MetricFacade:
+    """
+    Stable, importable handle to an instrument created by ObservabilityConfig.
+
+    Modules import the facade at load time, before observability is
+    initialized. init_observability() swaps add/set/record to the real
+    instrument's bound methods (and back to no-ops on shutdown), so an
+    increment is a single bound-method call: no name lookup, no try/except.
+
+    Example:
+        >>> retry_attempt_counter.add(1, attributes={"function": "call_llm"})
+        >>> success = circuit_breaker_success_counter.bind({"service": "llm"})
+        >>> success.add(1)
+    """
+
+    __slots__ = ("_bound", "_instrument", "add", "name", "record", "set")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.add: Callable[..., None] = _noop_metric_operation
+        self.set: Callable[..., None] = _noop_metric_operation
+        self.record: Callable[..., None] = _noop_metric_operation
+        self._instrument: Any = None
+        self._bound: dict[tuple[tuple[str, Any], ...], BoundMetric] = {}
+        self._attach(None)
+
+    def _attach(self, instrument: Any) -> None:
+        """Point add/set/record (and all bound attribute sets) at an instrument, or at no-ops."""
+        self._instrument = instrument
+        for operation in ("add", "set", "record"):
+            method = getattr(instrument, operation, None) if instrument is not None else None
+            setattr(self, operation, method if method is not None else _noop_metric_operation)
+        for bound in self._bound.values():
+            bound._bind(instrument)
+
+    def bind(self, attributes: dict[str, Any]) -> BoundMetric:
+        """
+        Pre-bind an attribute set (e.g. per dependency) for hot-path use.
+
+        Bound metrics are cached per attribute set and follow the facade
+        through initialization and shutdown.
+        """
+        key = tuple(sorted(attributes.items()))
+        bound = self._bound.get(key)
+        if bound is None:
+            bound = BoundMetric(dict(attributes))
+            bound._bind(self._instrument)
+            self._bound[key] = bound
+        return bound
+
+
+circuit_breaker_state_gauge = MetricFacade("circuit_breaker_state_gauge")
+circuit_breaker_failure_counter = MetricFacade("circuit_breaker_failure_counter")
+circuit_breaker_success_counter = MetricFacade("circuit_breaker_success_counter")
+retry_attempt_counter = MetricFacade("retry_attempt_counter")
+retry_exhausted_counter = MetricFacade("retry_exhausted_counter")
+retry_budget_exhausted_counter = MetricFacade("retry_budget_exhausted_counter")
+retry_budget_balance_gauge = MetricFacade("retry_budget_balance_gauge")
+retry_success_after_retry_counter = MetricFacade("retry_success_after_retry_counter")
+timeout_exceeded_counter = MetricFacade("timeout_exceeded_counter")
+timeout_duration_histogram = MetricFacade("timeout_duration_histogram")
+bulkhead_rejected_counter = MetricFacade("bulkhead_rejected_counter")
+bulkhead_active_operations_gauge = MetricFacade("bulkhead_active_operations_gauge")
+bulkhead_queue_depth_gauge = MetricFacade("bulkhead_queue_depth_gauge")
+bulkhead_concurrency_limit_gauge = MetricFacade("bulkhead_concurrency_limit_gauge")
+bulkhead_queue_wait_histogram = MetricFacade("bulkhead_queue_wait_histogram")
+admission_rejected_counter = MetricFacade("admission_rejected_counter")
+admission_queue_wait_histogram = MetricFacade("admission_queue_wait_histogram")
+fallback_used_counter = MetricFacade("fallback_used_counter")
+agent_node_duration_histogram = MetricFacade("agent_node_duration_histogram")
+agent_node_tokens_histogram = MetricFacade("agent_node_tokens_histogram")
+agent_node_cache_hits_histogram = MetricFacade("agent_node_cache_hits_histogram")
+agent_node_state_size_histogram = MetricFacade("agent_node_state_size_histogram")
+sandbox_pool_acquisitions_counter = MetricFacade("sandbox_pool_acquisitions_counter")
+sandbox_pool_acquire_duration_histogram = MetricFacade("sandbox_pool_acquire_duration_histogram")
+sandbox_pool_idle_gauge = MetricFacade("sandbox_pool_idle_gauge")
+code_validation_duration_histogram = MetricFacade("code_validation_duration_histogram")
+error_counter = MetricFacade("error_counter")
+
+_METRIC_FACADES: tuple[MetricFacade, ...] = (
+    circuit_breaker_state_gauge,
+    circuit_breaker_failure_counter,
+    circuit_breaker_success_counter,
+    retry_attempt_counter,
+    retry_exhausted_counter,
+    retry_budget_exhausted_counter,
+    retry_budget_balance_gauge,
+    retry_success_after_retry_counter,
+    timeout_exceeded_counter,
+    timeout_duration_histogram,
+    bulkhead_rejected_counter,
+    bulkhead_active_operations_gauge,
+    bulkhead_queue_depth_gauge,
+    bulkhead_concurrency_limit_gauge,
+    bulkhead_queue_wait_histogram,
+    admission_rejected_counter,
+    admission_queue_wait_histogram,
+    fallback_used_counter,
+    agent_node_duration_histogram,
+    agent_node_tokens_histogram,
+    agent_node_cache_hits_histogram,
+    agent_node_state_size_histogram,
+    sandbox_pool_acquisitions_counter,
+    sandbox_pool_acquire_duration_histogram,
+    sandbox_pool_idle_gauge,
+    code_validation_duration_histogram,
+    error_counter,
+)
+
+
+def _attach_metric_facades(config: ObservabilityConfig | None) -> None:
+    """Bind every facade to the instruments of `config` (None → no-ops)."""
+    for facade in _METRIC_FACADES:
+        facade._attach(getattr(config, facade.name, None) if config is not None else None)
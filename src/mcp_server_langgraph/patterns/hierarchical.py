@@ -31,14 +31,45 @@ Example:
     )
 
     result = hierarchy.invoke({"project": "Build AI feature"})
+
+    # Async: managers and their workers run concurrently, agents may be coroutines
+    result = await hierarchy.ainvoke("Build AI feature", checkpointer=checkpointer, config=config)
 """
 
+import asyncio
 from collections.abc import Callable
-from typing import Any
+from typing import Annotated, Any
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph
 from pydantic import BaseModel, Field
 
+from mcp_server_langgraph.patterns.utils import call_agent
+
+
+# Written by the CEO node to clear per-run fields left in a checkpointed thread
+RESET = "__reset__"
+
+
+def merge_by_manager(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge per-manager dictionaries written by concurrently running managers.
+
+    An update containing the RESET key replaces the accumulated value instead.
+    """
+    if RESET in right:
+        return {key: value for key, value in right.items() if key != RESET}
+    result = left.copy()
+    result.update(right)
+    return result
+
+
+def extend_path(left: list[str], right: list[str]) -> list[str]:
+    """Append execution path entries; an update starting with RESET starts a new path."""
+    if right[:1] == [RESET]:
+        return right[1:]
+    return left + right
+
 
 class HierarchicalState(BaseModel):
     """State for hierarchical pattern."""
@@ -46,10 +77,16 @@ class HierarchicalState(BaseModel):
     project: str = Field(description="The project or task")
     ceo_decision: str = Field(default="", description="Top-level strategic decision")
     manager_assignments: dict[str, str] = Field(default_factory=dict, description="Tasks assigned to each manager")
-    worker_results: dict[str, list[Any]] = Field(default_factory=dict, description="Results from workers by manager")
-    manager_reports: dict[str, str] = Field(default_factory=dict, description="Manager summary reports")
+    worker_results: Annotated[dict[str, list[Any]], merge_by_manager] = Field(
+        default_factory=dict, description="Results from workers by manager"
+    )
+    manager_reports: Annotated[dict[str, str], merge_by_manager] = Field(
+        default_factory=dict, description="Manager summary reports"
+    )
     final_report: str = Field(default="", description="Final consolidated report")
-    execution_path: list[str] = Field(default_factory=list, description="Execution path through hierarchy")
+    execution_path: Annotated[list[str], extend_path] = Field(
+        default_factory=list, description="Execution path through hierarchy"
+    )
 
 
 class HierarchicalCoordinator:
@@ -65,6 +102,7 @@ class HierarchicalCoordinator:
         managers: dict[str, Callable[[str], str]],
         workers: dict[str, list[Callable[[str], Any]]],
         delegation_strategy: str = "balanced",
+        worker_timeout: float | None = None,
     ):
         """
         Initialize hierarchical coordinator.
@@ -76,14 +114,17 @@ class HierarchicalCoordinator:
             delegation_strategy: How to distribute work
                 - balanced: Distribute evenly
                 - specialized: Route based on expertise
+            worker_timeout: Seconds each worker may run in ainvoke() before its
+                result is recorded as an error (None = no limit)
         """
         self.ceo_agent = ceo_agent
         self.managers = managers
         self.workers = workers
         self.delegation_strategy = delegation_strategy
+        self.worker_timeout = worker_timeout
         self._graph: StateGraph[HierarchicalState] | None = None
 
-    def _ceo_node(self, state: HierarchicalState) -> HierarchicalState:
+    def _ceo_node(self, state: HierarchicalState) -> dict[str, Any]:
         """
         CEO makes top-level decisions and delegates to managers.
 
@@ -91,26 +132,39 @@ class HierarchicalCoordinator:
         and decide delegation strategy.
         """
         # CEO analyzes the project
-        ceo_analysis = self.ceo_agent(state.project)
-        state.ceo_decision = ceo_analysis
-        state.execution_path.append("CEO")
+        return self._delegate(state, self.ceo_agent(state.project))
+
+    async def _aceo_node(self, state: HierarchicalState) -> dict[str, Any]:
+        """Async CEO node; the CEO agent may be a coroutine."""
+        return self._delegate(state, await call_agent(self.ceo_agent, state.project))
+
+    def _delegate(self, state: HierarchicalState, ceo_analysis: str) -> dict[str, Any]:
+        """Build the CEO's state update: decision and per-manager assignments."""
+        manager_assignments = {}
 
         # Delegate to managers (simplified delegation logic)
         if self.delegation_strategy == "balanced":
             # Distribute work evenly
-            managers_list = list(self.managers.keys())
-            for manager_name in managers_list:
-                state.manager_assignments[manager_name] = f"Handle aspect of '{state.project}' - assigned by CEO"
+            for manager_name in self.managers:
+                manager_assignments[manager_name] = f"Handle aspect of '{state.project}' - assigned by CEO"
         else:
             # Specialized delegation (in production, use LLM)
             for manager_name in self.managers:
-                state.manager_assignments[manager_name] = f"Specialized task for {manager_name} regarding '{state.project}'"
+                manager_assignments[manager_name] = f"Specialized task for {manager_name} regarding '{state.project}'"
 
-        return state
+        # A thread reused through a checkpointer still holds the previous run's
+        # merged fields, so the CEO starts each run from a clean slate
+        return {
+            "ceo_decision": ceo_analysis,
+            "manager_assignments": manager_assignments,
+            "worker_results": {RESET: True},
+            "manager_reports": {RESET: True},
+            "execution_path": [RESET, "CEO"],
+        }
 
     def _create_manager_node(
         self, manager_name: str, manager_func: Callable[[str], str]
-    ) -> Callable[[HierarchicalState], HierarchicalState]:
+    ) -> Callable[[HierarchicalState], dict[str, Any]]:
         """
         Create manager node that delegates to workers.
 
@@ -122,10 +176,8 @@ class HierarchicalCoordinator:
             Manager node function
         """
 
-        def manager_node(state: HierarchicalState) -> HierarchicalState:
+        def manager_node(state: HierarchicalState) -> dict[str, Any]:
             """Manager delegates to workers and summarizes results."""
-            state.execution_path.append(f"Manager:{manager_name}")
-
             # Get assignment from CEO
             assignment = state.manager_assignments.get(manager_name, "")
 
@@ -134,38 +186,93 @@ class HierarchicalCoordinator:
 
             # Collect worker results
             worker_funcs = self.workers.get(manager_name, [])
-            worker_results = []
+            worker_results = [worker_func(assignment) for worker_func in worker_funcs]
+            path = [f"Worker:{manager_name}_{i}" for i in range(len(worker_funcs))]
 
-            for i, worker_func in enumerate(worker_funcs):
-                state.execution_path.append(f"Worker:{manager_name}_{i}")
-                worker_result = worker_func(assignment)
-                worker_results.append(worker_result)
+            return self._manager_update(manager_name, assignment, manager_analysis, worker_results, path)
 
-            # Store worker results
-            state.worker_results[manager_name] = worker_results
+        return manager_node
 
-            # Manager creates summary report
-            report = f"**{manager_name.replace('_', ' ').title()} Report:**\n\n"
-            report += f"Assignment: {assignment}\n\n"
-            report += f"Manager Analysis: {manager_analysis}\n\n"
-            report += f"Team Results ({len(worker_results)} workers):\n"
+    def _create_async_manager_node(
+        self, manager_name: str, manager_func: Callable[[str], str]
+    ) -> Callable[[HierarchicalState], Any]:
+        """
+        Create async manager node whose workers run concurrently.
 
-            for i, result in enumerate(worker_results, 1):
-                report += f"{i}. {result}\n"
+        The manager's own analysis runs alongside its workers (workers get
+        the CEO's assignment, not the analysis). Worker results are collected
+        as they complete; a worker that raises or exceeds worker_timeout is
+        recorded as an error instead of failing the whole branch.
 
-            state.manager_reports[manager_name] = report
+        Args:
+            manager_name: Name of the manager
+            manager_func: Manager function (sync or coroutine)
 
-            return state
+        Returns:
+            Async manager node function
+        """
+
+        async def run_worker(index: int, worker_func: Callable[[str], Any], assignment: str) -> tuple[int, Any]:
+            try:
+                result = await asyncio.wait_for(call_agent(worker_func, assignment), timeout=self.worker_timeout)
+            except TimeoutError as e:
+                # Without worker_timeout, the worker raised TimeoutError itself
+                timeout = self.worker_timeout
+                result = f"Error: {e!s}" if timeout is None else f"Error: worker timed out after {timeout:g}s"
+            except Exception as e:
+                result = f"Error: {e!s}"
+            return index, result
+
+        async def manager_node(state: HierarchicalState) -> dict[str, Any]:
+            """Manager and workers run concurrently; results are merged as workers finish."""
+            assignment = state.manager_assignments.get(manager_name, "")
+            worker_funcs = self.workers.get(manager_name, [])
+
+            analysis_task = asyncio.create_task(call_agent(manager_func, assignment))
+            worker_tasks = [asyncio.create_task(run_worker(i, func, assignment)) for i, func in enumerate(worker_funcs)]
+
+            worker_results: list[Any] = [None] * len(worker_funcs)
+            path = []
+            try:
+                for next_done in asyncio.as_completed(worker_tasks):
+                    index, result = await next_done
+                    worker_results[index] = result
+                    path.append(f"Worker:{manager_name}_{index}")
+                manager_analysis = await analysis_task
+            finally:
+                for task in [analysis_task, *worker_tasks]:
+                    task.cancel()
+
+            return self._manager_update(manager_name, assignment, manager_analysis, worker_results, path)
 
         return manager_node
 
-    def _consolidate_node(self, state: HierarchicalState) -> HierarchicalState:
+    def _manager_update(
+        self, manager_name: str, assignment: str, manager_analysis: str, worker_results: list[Any], worker_path: list[str]
+    ) -> dict[str, Any]:
+        """Build a manager's state update: worker results, summary report and path entries."""
+        # Manager creates summary report
+        report = f"**{manager_name.replace('_', ' ').title()} Report:**\n\n"
+        report += f"Assignment: {assignment}\n\n"
+        report += f"Manager Analysis: {manager_analysis}\n\n"
+        report += f"Team Results ({len(worker_results)} workers):\n"
+
+        for i, result in enumerate(worker_results, 1):
+            report += f"{i}. {result}\n"
+
+        return {
+            "worker_results": {manager_name: worker_results},
+            "manager_reports": {manager_name: report},
+            "execution_path": [f"Manager:{manager_name}", *worker_path],
+        }
+
+    def _consolidate_node(self, state: HierarchicalState) -> dict[str, Any]:
         """
         Consolidate all manager reports into final report.
 
         In production, CEO agent would synthesize all reports.
         """
-        state.execution_path.append("Consolidation")
+        execution_path = [*state.execution_path, "Consolidation"]
 
         # Build final report
         report_parts = []
@@ -180,7 +287,7 @@ class HierarchicalCoordinator:
 
         # Add execution path
         report_parts.append("\n## Execution Path\n")
-        report_parts.append(" → ".join(state.execution_path))
+        report_parts.append(" → ".join(execution_path))
 
         # Statistics
         total_workers = sum(len(results) for results in state.worker_results.values())
@@ -189,21 +296,28 @@ class HierarchicalCoordinator:
         report_parts.append(f"- Workers: {total_workers}\n")
         report_parts.append("- Hierarchy Depth: 3 levels\n")
 
-        state.final_report = "\n".join(report_parts)
-
-        return state
+        return {"final_report": "\n".join(report_parts), "execution_path": ["Consolidation"]}
 
     def build(self) -> "StateGraph[HierarchicalState]":
-        """Build the hierarchical graph."""
+        """
+        Build the hierarchical graph.
+
+        Nodes carry both a sync and an async implementation: invoke() runs
+        each manager's workers in sequence, ainvoke() runs them concurrently.
+        Managers fan out from the CEO in a single step either way.
+        """
         graph: StateGraph[HierarchicalState] = StateGraph(HierarchicalState)
 
         # Add CEO node
-        graph.add_node("ceo", self._ceo_node)
+        graph.add_node("ceo", RunnableLambda(self._ceo_node, afunc=self._aceo_node))
 
         # Add manager nodes
         for manager_name, manager_func in self.managers.items():
-            manager_node = self._create_manager_node(manager_name, manager_func)
-            graph.add_node(f"manager_{manager_name}", manager_node)  # type: ignore[arg-type]
+            manager_node = RunnableLambda(
+                self._create_manager_node(manager_name, manager_func),
+                afunc=self._create_async_manager_node(manager_name, manager_func),
+            )
+            graph.add_node(f"manager_{manager_name}", manager_node)
 
         # Add consolidation node
         graph.add_node("consolidate", self._consolidate_node)
@@ -239,29 +353,59 @@ class HierarchicalCoordinator:
 
         return self._graph.compile(checkpointer=checkpointer)
 
-    def invoke(self, project: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+    def invoke(self, project: str, config: dict[str, Any] | None = None, checkpointer: Any = None) -> dict[str, Any]:
         """
         Execute the hierarchical pattern.
 
         Args:
             project: Project description
             config: Optional configuration
+            checkpointer: Optional checkpointer (config must then carry a thread_id)
 
         Returns:
             Final report and execution details
         """
-        compiled = self.compile()
+        compiled = self.compile(checkpointer=checkpointer)
         state = HierarchicalState(project=project)
 
         result = compiled.invoke(state, config=config or {})
 
+        return self._format_result(result)
+
+    async def ainvoke(self, project: str, config: dict[str, Any] | None = None, checkpointer: Any = None) -> dict[str, Any]:
+        """
+        Execute the hierarchical pattern asynchronously.
+
+        Independent managers and the workers under each manager run
+        concurrently, so the run takes about as long as the slowest
+        manager branch rather than the sum of all of them.
+
+        Args:
+            project: Project description
+            config: Optional configuration
+            checkpointer: Optional checkpointer, e.g. the shared one from
+                create_checkpointer() (config must then carry a thread_id)
+
+        Returns:
+            Final report and execution details
+        """
+        compiled = self.compile(checkpointer=checkpointer)
+        state = HierarchicalState(project=project)
+
+        result = await compiled.ainvoke(state, config=config or {})
+
+        return self._format_result(result)
+
+    @staticmethod
+    def _format_result(result: dict[str, Any]) -> dict[str, Any]:
+        # LangGraph 1.0.3+ returns a dict from compiled.invoke(), not the Pydantic model
         return {
-            "project": result.project,
-            "final_report": result.final_report,
-            "ceo_decision": result.ceo_decision,
-            "manager_reports": result.manager_reports,
-            "execution_path": result.execution_path,
-            "total_agents": len(result.execution_path),
+            "project": result["project"],
+            "final_report": result["final_report"],
+            "ceo_decision": result["ceo_decision"],
+            "manager_reports": result["manager_reports"],
+            "execution_path": result["execution_path"],
+            "total_agents": len(result["execution_path"]),
         }
 
 
@@ -25,14 +25,33 @@ Example:
     )
 
     result = supervisor.invoke({"task": "Write a research report"})
+
+    # Plan-then-fanout: independent sub-tasks are dispatched concurrently
+    supervisor = Supervisor(
+        agents={"research": research_agent, "writer": writer_agent},
+        routing_strategy="parallel",
+        planner=lambda task: [("research", "market size"), ("research", "competitors"), ("writer", task)],
+    )
 """
 
+import asyncio
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph
 from pydantic import BaseModel, Field
 
+from mcp_server_langgraph.patterns.utils import call_agent
+
+
+class WorkerTask(BaseModel):
+    """A sub-task planned by the supervisor for one worker."""
+
+    agent: str = Field(description="Worker agent to run")
+    task: str = Field(description="Sub-task passed to the worker")
+
 
 class SupervisorState(BaseModel):
     """State for supervisor pattern."""
@@ -45,6 +64,10 @@ class SupervisorState(BaseModel):
     final_result: str = Field(default="", description="Final aggregated result")
     routing_decision: str = Field(default="", description="Supervisor's routing decision")
     completed: bool = Field(default=False, description="Whether task is completed")
+    plan: list[WorkerTask] = Field(default_factory=list, description="Sub-tasks to fan out (parallel strategy)")
+    task_results: list[dict[str, Any]] = Field(
+        default_factory=list, description="Per sub-task results in plan order (parallel strategy)"
+    )
 
 
 class Supervisor:
@@ -59,6 +82,8 @@ class Supervisor:
         agents: dict[str, Callable[[str], Any]],
         routing_strategy: Literal["sequential", "conditional", "parallel"] = "conditional",
         supervisor_prompt: str | None = None,
+        planner: Callable[[str], list[tuple[str, str]]] | None = None,
+        max_concurrency: int = 8,
     ):
         """
         Initialize supervisor.
@@ -68,11 +93,20 @@ class Supervisor:
             routing_strategy: How to route between agents
                 - sequential: Execute all agents in order
                 - conditional: Supervisor decides next agent
-                - parallel: Execute agents in parallel (future)
+                - parallel: Plan sub-tasks upfront, then run them concurrently
             supervisor_prompt: Custom prompt for supervisor's routing logic
+            planner: Parallel strategy only - maps the task to (agent_name, sub_task)
+                pairs. Defaults to sending the whole task to every agent.
+            max_concurrency: Maximum sub-tasks running at once in the parallel strategy
         """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
         self.agents = agents
         self.routing_strategy = routing_strategy
+        self.planner = planner
+        self.max_concurrency = max_concurrency
         self.supervisor_prompt = supervisor_prompt or self._default_supervisor_prompt()
         self._graph: StateGraph[SupervisorState] | None = None
 
@@ -99,6 +133,9 @@ Choose the best agent for each sub-task."""
         Analyzes task and decides which agent to route to.
         In production, this would use an LLM for intelligent routing.
         """
+        if self.routing_strategy == "parallel":
+            return self._plan(state)
+
         # Simplified routing logic (in production, use LLM)
         task_lower = state.task.lower()
 
@@ -117,6 +154,94 @@ Choose the best agent for each sub-task."""
 
         return state
 
+    def _plan(self, state: SupervisorState) -> SupervisorState:
+        """
+        Plan independent sub-tasks for the fanout node.
+
+        In production, the planner would be an LLM call that splits the task.
+        """
+        if self.planner is not None:
+            plan = self.planner(state.task)
+        else:
+            plan = [(agent_name, state.task) for agent_name in self.agents]
+
+        state.plan = [WorkerTask(agent=agent_name, task=sub_task) for agent_name, sub_task in plan]
+        state.next_agent = "fanout"
+        agents = ", ".join(dict.fromkeys(t.agent for t in state.plan))
+        state.routing_decision = f"Dispatching {len(state.plan)} sub-tasks in parallel to {agents}"
+
+        return state
+
+    def _run_worker(self, agent_name: str, task: str) -> Any:
+        """Run one planned sub-task, recording failures as results."""
+        agent_func = self.agents.get(agent_name)
+        if agent_func is None:
+            return f"Error: unknown agent '{agent_name}'"
+        try:
+            return agent_func(task)
+        except Exception as e:
+            return f"Error: {e!s}"
+
+    async def _arun_worker(self, agent_name: str, task: str, semaphore: asyncio.Semaphore) -> Any:
+        """Async variant of _run_worker; the agent may be a coroutine."""
+        agent_func = self.agents.get(agent_name)
+        if agent_func is None:
+            return f"Error: unknown agent '{agent_name}'"
+        async with semaphore:
+            try:
+                return await call_agent(agent_func, task)
+            except Exception as e:
+                return f"Error: {e!s}"
+
+    def _fanout_node(self, state: SupervisorState) -> SupervisorState:
+        """
+        Run all planned sub-tasks concurrently in worker threads.
+
+        Identical (agent, sub-task) pairs in the plan are run once and share
+        the result.
+        """
+        unique = list(dict.fromkeys((t.agent, t.task) for t in state.plan))
+        if not unique:
+            return self._record_fanout(state, {})
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(unique))) as pool:
+            futures = {key: pool.submit(self._run_worker, *key) for key in unique}
+            memo = {key: future.result() for key, future in futures.items()}
+
+        return self._record_fanout(state, memo)
+
+    async def _afanout_node(self, state: SupervisorState) -> SupervisorState:
+        """Async variant of _fanout_node used by ainvoke()."""
+        unique = list(dict.fromkeys((t.agent, t.task) for t in state.plan))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        results = await asyncio.gather(*(self._arun_worker(agent_name, task, semaphore) for agent_name, task in unique))
+
+        return self._record_fanout(state, dict(zip(unique, results, strict=True)))
+
+    def _record_fanout(self, state: SupervisorState, memo: dict[tuple[str, str], Any]) -> SupervisorState:
+        """Write memoized sub-task results back into the state in plan order."""
+        answered: set[tuple[str, str]] = set()
+        by_agent: dict[str, list[Any]] = {}
+
+        for planned in state.plan:
+            key = (planned.agent, planned.task)
+            result = memo[key]
+            state.task_results.append(
+                {"agent": planned.agent, "task": planned.task, "result": result, "cached": key in answered}
+            )
+            if key not in answered:
+                answered.add(key)
+                by_agent.setdefault(planned.agent, []).append(result)
+                state.agent_history.append(planned.agent)
+
+        # One result per agent, or a list when an agent answered several sub-tasks
+        for agent_name, results in by_agent.items():
+            state.agent_results[agent_name] = results[0] if len(results) == 1 else results
+
+        state.next_agent = "aggregate"
+        return state
+
     def _create_worker_wrapper(
         self, agent_name: str, agent_func: Callable[[str], Any]
     ) -> Callable[[SupervisorState], SupervisorState]:
@@ -169,9 +294,19 @@ Choose the best agent for each sub-task."""
         """
         # Simple aggregation: combine all results
         results_summary = []
-        for agent_name in state.agent_history:
-            result = state.agent_results.get(agent_name, "")
-            results_summary.append(f"**{agent_name.title()}:** {result}")
+        if state.task_results:
+            # Parallel strategy: one entry per distinct sub-task
+            for entry in state.task_results:
+                if entry["cached"]:
+                    continue
+                label = entry["agent"].title()
+                if entry["task"] != state.task:
+                    label += f" ({entry['task']})"
+                results_summary.append(f"**{label}:** {entry['result']}")
+        else:
+            for agent_name in state.agent_history:
+                result = state.agent_results.get(agent_name, "")
+                results_summary.append(f"**{agent_name.title()}:** {result}")
 
         state.final_result = "\n\n".join(results_summary)
         state.completed = True
@@ -182,6 +317,8 @@ Choose the best agent for each sub-task."""
         """Determine next node based on state."""
         if state.next_agent == "aggregate":
             return "aggregate"
+        elif state.next_agent == "fanout":
+            return "fanout"
         elif state.next_agent:
             return state.next_agent
         else:
@@ -199,6 +336,11 @@ Choose the best agent for each sub-task."""
             worker_node = self._create_worker_wrapper(agent_name, agent_func)
             graph.add_node(agent_name, worker_node)  # type: ignore[arg-type]
 
+        # Fanout node for the parallel strategy (sync: threads, async: tasks)
+        if self.routing_strategy == "parallel":
+            graph.add_node("fanout", RunnableLambda(self._fanout_node, afunc=self._afanout_node))
+            graph.add_edge("fanout", "aggregate")
+
         # Add aggregator node
         graph.add_node("aggregate", self._create_aggregator_node)
 
@@ -248,12 +390,38 @@ Choose the best agent for each sub-task."""
 
         result = compiled.invoke(state, config=config or {})
 
+        return self._format_result(result)
+
+    async def ainvoke(self, task: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Execute the supervisor pattern asynchronously.
+
+        With the parallel strategy, planned sub-tasks run as concurrent
+        tasks and agents may be coroutines.
+
+        Args:
+            task: Task description
+            config: Optional configuration
+
+        Returns:
+            Results including final_result and agent_history
+        """
+        compiled = self.compile()
+        state = SupervisorState(task=task)
+
+        result = await compiled.ainvoke(state, config=config or {})
+
+        return self._format_result(result)
+
+    @staticmethod
+    def _format_result(result: dict[str, Any]) -> dict[str, Any]:
         return {
             "task": result["task"],
             "final_result": result["final_result"],
             "agent_history": result["agent_history"],
             "agent_results": result["agent_results"],
             "routing_decision": result["routing_decision"],
+            "task_results": result["task_results"],
         }
 
 
@@ -26,15 +26,25 @@ Example:
     )
 
     result = swarm.invoke({"query": "What is the capital of France?"})
+
+    # Or run agent coroutines concurrently, stopping once they agree
+    swarm = Swarm(agents=async_agents, aggregation_strategy="consensus", max_concurrency=8, early_stop=True)
+    result = await swarm.ainvoke("What is the capital of France?")
 """
 
+import asyncio
+import zlib
 from collections.abc import Callable
 from typing import Annotated, Any, Literal
 
+import numpy as np
+import numpy.typing as npt
 from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph
 from pydantic import BaseModel, Field
 
+from mcp_server_langgraph.patterns.utils import call_agent
+
 
 def merge_agent_results(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
     """Merge agent results dictionaries for concurrent updates."""
@@ -43,6 +53,70 @@ def merge_agent_results(left: dict[str, Any], right: dict[str, Any]) -> dict[str
     return result
 
 
+# MinHash parameters: 128 permutations estimate Jaccard similarity to within ~0.05
+_MINHASH_PERMUTATIONS = 128
+# (a*x + b) % p is computed in uint64: a, b and x are kept below 2**32 so the
+# product cannot wrap around before the modulo
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_rng = np.random.default_rng(seed=1)
+_MINHASH_A = _rng.integers(1, _MAX_HASH, size=_MINHASH_PERMUTATIONS, dtype=np.uint64, endpoint=True)
+_MINHASH_B = _rng.integers(0, _MAX_HASH, size=_MINHASH_PERMUTATIONS, dtype=np.uint64, endpoint=True)
+
+
+def minhash_signature(text: str) -> npt.NDArray[np.uint64] | None:
+    """
+    Compute the MinHash signature of a text's word set.
+
+    Args:
+        text: Text to sign (lowercased and split on whitespace)
+
+    Returns:
+        Signature of _MINHASH_PERMUTATIONS values, or None for text without words
+    """
+    words = set(text.lower().split())
+    if not words:
+        return None
+
+    hashes = np.fromiter((zlib.crc32(word.encode()) for word in words), dtype=np.uint64, count=len(words)) & _MAX_HASH
+    permuted = (np.outer(hashes, _MINHASH_A) + _MINHASH_B) % _MERSENNE_PRIME & _MAX_HASH
+    signature: npt.NDArray[np.uint64] = permuted.min(axis=0)
+    return signature
+
+
+def signature_consensus(signatures: list[npt.NDArray[np.uint64] | None]) -> float:
+    """
+    Mean pairwise Jaccard similarity estimated from MinHash signatures.
+
+    Rather than comparing every pair of signatures, counts how many
+    signatures share each value per permutation: a group of c equal values
+    contributes c*(c-1)/2 matching pairs. Cost is O(n*k log(n*k)) for n
+    signatures of k permutations.
+
+    Args:
+        signatures: One signature per result; None (empty result) matches nothing
+
+    Returns:
+        Consensus score (0-1)
+    """
+    n = len(signatures)
+    if n < 2:
+        return 1.0
+
+    present = [sig for sig in signatures if sig is not None]
+    if len(present) < 2:
+        return 0.0
+
+    matrix = np.stack(present)
+    # Key each value by its permutation column so only same-permutation values group together
+    keys = (np.arange(_MINHASH_PERMUTATIONS, dtype=np.uint64) << np.uint64(32)) | matrix
+    _, counts = np.unique(keys, return_counts=True)
+    matching_pairs = float((counts * (counts - 1) // 2).sum())
+
+    total_pairs = n * (n - 1) / 2
+    return matching_pairs / (_MINHASH_PERMUTATIONS * total_pairs)
+
+
 class SwarmState(BaseModel):
     """State for swarm pattern."""
 
@@ -67,6 +141,9 @@ class Swarm:
         agents: dict[str, Callable[[str], Any]],
         aggregation_strategy: Literal["consensus", "voting", "synthesis", "concatenate"] = "synthesis",
         min_agreement: float = 0.7,
+        max_concurrency: int = 10,
+        early_stop: bool = False,
+        early_stop_quorum: int | None = None,
     ):
         """
         Initialize swarm.
@@ -79,10 +156,21 @@ class Swarm:
                 - synthesis: LLM synthesizes all perspectives
                 - concatenate: Simple combination of all outputs
             min_agreement: Minimum agreement threshold for consensus (0-1)
+            max_concurrency: Maximum agents running at once in ainvoke()
+            early_stop: In ainvoke() with the consensus strategy, cancel the remaining
+                agents once the finished ones reach min_agreement
+            early_stop_quorum: Results required before stopping early (default: a majority of agents)
         """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
         self.agents = agents
         self.aggregation_strategy = aggregation_strategy
         self.min_agreement = min_agreement
+        self.max_concurrency = max_concurrency
+        self.early_stop = early_stop
+        self.early_stop_quorum = early_stop_quorum
         self._graph: StateGraph[SwarmState] | None = None
 
     def _create_agent_wrapper(
@@ -118,7 +206,9 @@ class Swarm:
         """
         Calculate consensus score between results.
 
-        Simple implementation based on common words.
+        Mean pairwise Jaccard similarity of the results' word sets. This is the
+        exact score; ainvoke() uses the MinHash estimate (signature_consensus)
+        only to decide when to stop early.
         In production, use semantic similarity with embeddings.
 
         Args:
@@ -131,10 +221,7 @@ class Swarm:
             return 1.0
 
         # Extract words from all results
-        all_words = []
-        for result in results:
-            words = set(result.lower().split())
-            all_words.append(words)
+        all_words = [set(str(result).lower().split()) for result in results]
 
         # Calculate pairwise similarity
         similarities = []
@@ -271,6 +358,75 @@ class Swarm:
             "num_agents": len(result["agent_results"]),
         }
 
+    async def ainvoke(self, query: str, config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Execute the swarm with agents running concurrently.
+
+        Coroutine agents are awaited directly; sync agents run in worker
+        threads. At most max_concurrency agents run at once. With early_stop
+        and the consensus strategy, remaining agents are cancelled as soon as
+        a quorum of finished agents reaches min_agreement (sync agents already
+        running in a thread finish in the background, their result is dropped).
+
+        Unlike invoke(), this bypasses the LangGraph graph, which always waits
+        for every branch before aggregating.
+
+        Args:
+            query: Query for all agents
+            config: Optional configuration (unused, accepted for parity with invoke)
+
+        Returns:
+            Aggregated results, plus early_stopped and cancelled_agents
+        """
+        if not self.agents:
+            msg = "Swarm requires at least one agent"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_agent(agent_name: str, agent_func: Callable[[str], Any]) -> tuple[str, Any]:
+            async with semaphore:
+                try:
+                    result = await call_agent(agent_func, query)
+                except Exception as e:
+                    result = f"Error: {e!s}"
+            return agent_name, result
+
+        tasks = [asyncio.create_task(run_agent(name, func)) for name, func in self.agents.items()]
+        check_consensus = self.early_stop and self.aggregation_strategy == "consensus"
+        quorum = max(self.early_stop_quorum or len(tasks) // 2 + 1, 2)
+
+        finished: dict[str, Any] = {}
+        signatures: list[npt.NDArray[np.uint64] | None] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                agent_name, result = await next_done
+                finished[agent_name] = result
+
+                if check_consensus:
+                    signatures.append(minhash_signature(str(result)))
+                    if len(finished) >= quorum and signature_consensus(signatures) >= self.min_agreement:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Report results in agent declaration order, independent of completion order
+        agent_results = {name: finished[name] for name in self.agents if name in finished}
+        cancelled = [name for name in self.agents if name not in finished]
+        aggregated = self._aggregate_results(SwarmState(query=query, agent_results=agent_results))
+
+        return {
+            "query": query,
+            "aggregated_result": aggregated["aggregated_result"],
+            "agent_results": agent_results,
+            "consensus_score": aggregated["consensus_score"],
+            "num_agents": len(agent_results),
+            "early_stopped": bool(cancelled),
+            "cancelled_agents": cancelled,
+        }
+
 
 # Example usage and testing
 if __name__ == "__main__":
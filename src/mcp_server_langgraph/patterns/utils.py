@@ -0,0 +1,30 @@
+"""
+Shared helpers for multi-agent patterns
+"""
+
+import asyncio
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+
+async def call_agent(agent_func: Callable[[str], Any], task: str) -> Any:
+    """
+    Run an agent from async code.
+
+    Coroutine agents are awaited directly; sync agents run in a worker thread
+    so they don't block the event loop.
+
+    Args:
+        agent_func: Agent function (sync or coroutine)
+        task: Input passed to the agent
+
+    Returns:
+        The agent's result
+    """
+    if inspect.iscoroutinefunction(agent_func):
+        return await agent_func(task)
+    result = await asyncio.to_thread(agent_func, task)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
@@ -2,7 +2,8 @@
 Adaptive bulkhead with self-tuning concurrency limits.
 
 Implements AIMD (Additive Increase Multiplicative Decrease) algorithm to
-automatically adjust concurrency limits based on observed error rates.
+automatically adjust concurrency limits based on observed error rates, and a
+latency-gradient limiter (GradientLimiter) that adjusts on observed RTT.
 
 Key features:
 - Monitors 429/529 error rates in sliding window
@@ -13,17 +14,27 @@ Key features:
 This is similar to TCP congestion control (Jacobson 1988) and provides
 self-healing behavior for rate limit issues.
 
+GradientLimiter follows Netflix concurrency-limits (Gradient2/Vegas): when
+the current RTT rises above the baseline RTT, requests are queueing upstream
+and the limit shrinks; when RTT stays near baseline, the limit grows by a
+small queue allowance. It resizes a single ResizableLimiter in place, so
+in-flight holders and waiters are never stranded on a replaced semaphore.
+
 See ADR-0026 for design rationale.
 """
 
 import asyncio
 import logging
+import math
 import threading
 import time
 from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from opentelemetry import trace
 
+from mcp_server_langgraph.observability.telemetry import bulkhead_concurrency_limit_gauge, bulkhead_queue_wait_histogram
 from mcp_server_langgraph.resilience.config import get_provider_limit
 
 logger = logging.getLogger(__name__)
@@ -300,3 +311,356 @@ def get_all_adaptive_bulkhead_stats() -> dict[str, dict[str, int | float]]:
     """
     with _bulkhead_lock:
         return {provider: bulkhead.get_stats() for provider, bulkhead in _provider_adaptive_bulkheads.items()}
+
+
+# =============================================================================
+# Resizable Limiter
+# =============================================================================
+
+
+class ResizableLimiter:
+    """
+    Async concurrency limiter whose limit can change while in use.
+
+    Unlike asyncio.Semaphore, the limit is not baked into a counter: raising
+    it wakes waiters immediately, and lowering it lets in-flight holders
+    drain naturally before new ones are admitted.
+
+    Example:
+        >>> limiter = ResizableLimiter(limit=10)
+        >>> async with limiter:
+        ...     await call_api()
+        >>> limiter.set_limit(4)  # Takes effect as holders release
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize limiter.
+
+        Args:
+            limit: Initial concurrency limit (minimum 1)
+        """
+        self._limit = max(1, limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued for a slot."""
+        return sum(1 for w in self._waiters if not w.done())
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit in place, admitting waiters if it grew."""
+        self._limit = max(1, limit)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to queued waiters in FIFO order."""
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> None:
+        """Acquire a slot, waiting in FIFO order if the limit is reached."""
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed to us just before cancellation: give it back
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        """Release a slot."""
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake_waiters()
+
+    async def __aenter__(self) -> "ResizableLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
+        self.release()
+
+
+# =============================================================================
+# Gradient Limiter (latency-driven)
+# =============================================================================
+
+DEFAULT_RTT_TOLERANCE = 1.5  # Current RTT may exceed baseline by 50% before shrinking
+DEFAULT_SMOOTHING = 0.2  # Weight of each new limit estimate
+DEFAULT_LONG_WINDOW = 600  # Samples in the baseline RTT moving average
+DEFAULT_SHORT_WINDOW = 10  # Samples in the current RTT moving average
+DEFAULT_BACKOFF_RATIO = 0.9  # Multiplicative decrease on 429/529
+MIN_RTT_SAMPLE = 1e-6  # Floor for RTT samples; a coarse clock can report 0.0
+
+
+class GradientLimiter:
+    """
+    Latency-gradient concurrency limiter (Gradient2 style).
+
+    Tracks a short-window RTT (current) against a long-window RTT (baseline).
+    The minimum RTT observed bounds how far the baseline may decay after a
+    sustained latency drop. On each sample:
+
+        gradient  = clamp(tolerance * baseline_rtt / current_rtt, 0.5, 1.0)
+        new_limit = limit * gradient + sqrt(limit)
+        limit     = limit * (1 - smoothing) + new_limit * smoothing
+
+    The sqrt(limit) queue allowance lets the limit probe upward while latency
+    is flat; rising latency pulls it down. Capacity errors (429/529) apply an
+    additional multiplicative decrease. Samples taken while the limiter is
+    under half utilized are ignored for growth (app-limited, not informative).
+
+    Example:
+        >>> limiter = GradientLimiter("anthropic", initial_limit=8, min_limit=2, max_limit=32)
+        >>> async with limiter.acquire():
+        ...     await call_anthropic_api()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        rtt_tolerance: float = DEFAULT_RTT_TOLERANCE,
+        smoothing: float = DEFAULT_SMOOTHING,
+        long_window: int = DEFAULT_LONG_WINDOW,
+        short_window: int = DEFAULT_SHORT_WINDOW,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+    ):
+        """
+        Initialize gradient limiter.
+
+        Args:
+            name: Limiter name (usually the provider), used in metrics
+            initial_limit: Starting concurrency limit
+            min_limit: Minimum concurrency limit (floor)
+            max_limit: Maximum concurrency limit (ceiling)
+            rtt_tolerance: Allowed ratio of current RTT to baseline before shrinking
+            smoothing: Weight given to each new limit estimate (0-1)
+            long_window: Samples in the baseline RTT exponential moving average
+            short_window: Samples in the current RTT exponential moving average
+            backoff_ratio: Multiplicative decrease applied on capacity errors
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.rtt_tolerance = rtt_tolerance
+        self.smoothing = smoothing
+        self.backoff_ratio = backoff_ratio
+        self._long_alpha = 2.0 / (long_window + 1)
+        self._short_alpha = 2.0 / (short_window + 1)
+
+        self._estimated_limit = float(max(min_limit, min(max_limit, initial_limit)))
+        self.limiter = ResizableLimiter(int(self._estimated_limit))
+
+        self._baseline_rtt: float | None = None
+        self._current_rtt: float | None = None
+        self._min_rtt: float | None = None
+        self._lock = threading.Lock()
+
+        attributes = {"provider": name}
+        self._limit_gauge = bulkhead_concurrency_limit_gauge.bind(attributes)
+        self._queue_wait_histogram = bulkhead_queue_wait_histogram.bind(attributes)
+        self._limit_gauge.set(self.current_limit)
+
+    @property
+    def current_limit(self) -> int:
+        """Get current concurrency limit (integer)."""
+        return self.limiter.limit
+
+    def on_sample(self, rtt: float, in_flight: int, dropped: bool = False) -> None:
+        """
+        Update the limit from one completed call.
+
+        Args:
+            rtt: Round-trip time of the call in seconds
+            in_flight: Slots held when the call started (including itself)
+            dropped: True if the call failed with a capacity error (429/529)
+        """
+        rtt = max(rtt, MIN_RTT_SAMPLE)
+
+        with self._lock:
+            old_limit = self.current_limit
+
+            if dropped:
+                self._estimated_limit = max(self.min_limit, self._estimated_limit * self.backoff_ratio)
+            else:
+                self._min_rtt = rtt if self._min_rtt is None else min(self._min_rtt, rtt)
+                self._current_rtt = (
+                    rtt if self._current_rtt is None else self._current_rtt + self._short_alpha * (rtt - self._current_rtt)
+                )
+                self._baseline_rtt = (
+                    rtt if self._baseline_rtt is None else self._baseline_rtt + self._long_alpha * (rtt - self._baseline_rtt)
+                )
+
+                # Let the baseline recover quickly after a sustained latency drop,
+                # but never below the fastest RTT actually observed
+                if self._baseline_rtt / self._current_rtt > 2:
+                    self._baseline_rtt = max(self._min_rtt, self._baseline_rtt * 0.95)
+
+                # App-limited: low utilization tells us nothing about capacity
+                if in_flight < self._estimated_limit / 2:
+                    return
+
+                gradient = max(0.5, min(1.0, self.rtt_tolerance * self._baseline_rtt / self._current_rtt))
+                new_limit = self._estimated_limit * gradient + math.sqrt(self._estimated_limit)
+                new_limit = self._estimated_limit * (1 - self.smoothing) + new_limit * self.smoothing
+                self._estimated_limit = max(self.min_limit, min(self.max_limit, new_limit))
+
+            new_int_limit = int(self._estimated_limit)
+            if new_int_limit != old_limit:
+                self.limiter.set_limit(new_int_limit)
+                self._limit_gauge.set(new_int_limit)
+                logger.debug(
+                    f"Gradient limiter {self.name}: {old_limit} -> {new_int_limit}",
+                    extra={
+                        "provider": self.name,
+                        "old_limit": old_limit,
+                        "new_limit": new_int_limit,
+                        "current_rtt": self._current_rtt,
+                        "baseline_rtt": self._baseline_rtt,
+                        "dropped": dropped,
+                    },
+                )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the block and feed its RTT back.
+
+        Queue wait time is recorded separately from RTT, so time spent waiting
+        for our own limiter never inflates the latency signal.
+        """
+        queued_at = time.monotonic()
+        await self.limiter.acquire()
+        started_at = time.monotonic()
+        self._queue_wait_histogram.record(started_at - queued_at)
+        in_flight = self.limiter.in_flight
+
+        dropped = False
+        try:
+            yield
+        except Exception as e:
+            dropped = _is_capacity_error(e)
+            raise
+        finally:
+            self.limiter.release()
+            self.on_sample(time.monotonic() - started_at, in_flight, dropped=dropped)
+
+    def get_stats(self) -> dict[str, int | float | None]:
+        """Get current limiter statistics."""
+        with self._lock:
+            return {
+                "current_limit": self.current_limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "in_flight": self.limiter.in_flight,
+                "waiting": self.limiter.waiting,
+                "min_rtt": self._min_rtt,
+                "current_rtt": self._current_rtt,
+                "baseline_rtt": self._baseline_rtt,
+            }
+
+
+def _is_capacity_error(exception: Exception) -> bool:
+    """Check whether an exception signals upstream capacity limits (429/529)."""
+    from mcp_server_langgraph.resilience.retry import is_overload_error
+
+    status_code = getattr(exception, "status_code", None)
+    if status_code == 429 or is_overload_error(exception):
+        return True
+    return "rate limit" in str(exception).lower()
+
+
+# =============================================================================
+# Provider Gradient Limiter Factory
+# =============================================================================
+
+_provider_gradient_limiters: dict[str, GradientLimiter] = {}
+
+
+def get_provider_gradient_limiter(provider: str) -> GradientLimiter:
+    """
+    Get or create a latency-gradient limiter for a specific LLM provider.
+
+    Starts at the provider's configured limit (get_provider_limit) and is free
+    to settle anywhere between 25% and 400% of it.
+
+    Args:
+        provider: LLM provider name (e.g., "anthropic", "openai")
+
+    Returns:
+        GradientLimiter configured for the provider
+    """
+    with _bulkhead_lock:
+        if provider in _provider_gradient_limiters:
+            return _provider_gradient_limiters[provider]
+
+        base_limit = get_provider_limit(provider)
+        limiter = GradientLimiter(
+            name=provider,
+            initial_limit=base_limit,
+            min_limit=max(1, base_limit // 4),
+            max_limit=base_limit * 4,
+        )
+        _provider_gradient_limiters[provider] = limiter
+
+        logger.info(
+            f"Created gradient limiter for {provider}",
+            extra={
+                "provider": provider,
+                "initial_limit": base_limit,
+                "min_limit": limiter.min_limit,
+                "max_limit": limiter.max_limit,
+            },
+        )
+
+        return limiter
+
+
+def reset_all_gradient_limiters() -> None:
+    """
+    Reset all gradient limiters (for testing).
+
+    Warning: Only use for testing! In production, limiters should not be reset.
+    """
+    with _bulkhead_lock:
+        _provider_gradient_limiters.clear()
+        logger.warning("All gradient limiters reset (testing only)")
+
+
+def get_all_gradient_limiter_stats() -> dict[str, dict[str, int | float | None]]:
+    """
+    Get statistics for all gradient limiters.
+
+    Returns:
+        Dict mapping provider to limiter stats
+    """
+    with _bulkhead_lock:
+        return {provider: limiter.get_stats() for provider, limiter in _provider_gradient_limiters.items()}
@@ -0,0 +1,322 @@
+"""
+Priority-aware admission control for MCP requests.
+
+Bulkheads bound concurrency per dependency, but a request that is admitted to
+the server and then waits behind a long queue of agent chats is wasted work:
+it times out after consuming a slot. Admission control sits in front of tool
+execution and:
+
+- Orders queued requests by priority (user tier, then tool weight), so paid
+  tiers and cheap lookups never wait behind free-tier chats
+- Estimates queue wait from an EWMA of observed service time and sheds a
+  request immediately (503 + Retry-After) when the estimate exceeds its
+  priority's queue budget or its remaining deadline
+- Lets control-plane methods (initialize, tools/list, ...) bypass the queue
+
+See ADR-0026 for design rationale.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+from mcp_server_langgraph.observability.telemetry import admission_queue_wait_histogram, admission_rejected_counter
+from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.deadline import get_remaining_time
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Admission priority (lower value is served first)."""
+
+    CRITICAL = 0  # Control plane, bypasses admission
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+# JSON-RPC methods that only read server metadata and never queue
+CONTROL_METHODS = frozenset(
+    {
+        "initialize",
+        "tools/list",
+        "resources/list",
+        "resources/read",
+        "resources/templates/list",
+        "prompts/list",
+        "prompts/get",
+    }
+)
+
+# Tools that do not call the LLM and finish quickly
+LIGHTWEIGHT_TOOLS = frozenset({"search_tools", "conversation_get", "conversation_search"})
+
+TIER_PRIORITIES: dict[str, RequestPriority] = {
+    "enterprise": RequestPriority.HIGH,
+    "premium": RequestPriority.HIGH,
+    "standard": RequestPriority.NORMAL,
+    "free": RequestPriority.LOW,
+    "anonymous": RequestPriority.LOW,
+}
+
+# Tier assumed for tool calls that carry their token in the arguments rather
+# than a Bearer header. The token is only verified inside the tool, after
+# admission, so such calls are queued like a standard user's, not as anonymous.
+UNVERIFIED_CALLER_TIER = "standard"
+
+
+def classify_request(
+    method: str, tool_name: str | None = None, tier: str = "anonymous", has_argument_token: bool = False
+) -> RequestPriority:
+    """
+    Classify an MCP request into an admission priority.
+
+    Args:
+        method: JSON-RPC method (e.g. "tools/call")
+        tool_name: Tool being called, for tools/call
+        tier: User tier from middleware.rate_limiter.get_user_tier
+        has_argument_token: Whether the tool arguments carry an auth token
+
+    Returns:
+        RequestPriority for the request
+    """
+    if method != "tools/call":
+        return RequestPriority.CRITICAL
+
+    if tier == "anonymous" and has_argument_token:
+        tier = UNVERIFIED_CALLER_TIER
+    priority = TIER_PRIORITIES.get(tier, RequestPriority.LOW)
+    if tool_name in LIGHTWEIGHT_TOOLS and priority > RequestPriority.HIGH:
+        # Cheap lookups should not wait behind chats of the same tier
+        priority = RequestPriority(priority - 1)
+    return priority
+
+
+class AdmissionController:
+    """
+    Priority queue in front of tool execution with early load shedding.
+
+    At most max_concurrent requests execute at once. Further requests wait in
+    priority order (FIFO within a priority). Before queueing, the expected wait
+    is estimated as:
+
+        waves = (requests queued at the same or higher priority + 1) / max_concurrent
+        wait  = waves * ewma_service_time
+
+    and the request is rejected straight away if that exceeds its budget.
+
+    Example:
+        >>> controller = AdmissionController(max_concurrent=20)
+        >>> async with controller.admit(RequestPriority.NORMAL):
+        ...     await run_tool()
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 50,
+        queue_timeouts: dict[RequestPriority, float] | None = None,
+        initial_service_time: float = 5.0,
+        smoothing: float = 0.2,
+    ):
+        """
+        Initialize admission controller.
+
+        Args:
+            max_concurrent: Max requests executing concurrently
+            queue_timeouts: Max queue wait per priority in seconds
+            initial_service_time: Service time estimate before any samples (seconds)
+            smoothing: EWMA weight of each new service time sample
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.queue_timeouts = queue_timeouts or {
+            RequestPriority.HIGH: 30.0,
+            RequestPriority.NORMAL: 10.0,
+            RequestPriority.LOW: 2.0,
+        }
+        self.smoothing = smoothing
+        self._service_time = initial_service_time
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently executing."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for admission."""
+        return sum(1 for _, _, w in self._waiters if not w.done())
+
+    @property
+    def service_time(self) -> float:
+        """Smoothed service time estimate in seconds."""
+        return self._service_time
+
+    def estimate_wait(self, priority: RequestPriority) -> float:
+        """
+        Estimate how long a new request at this priority would queue.
+
+        Args:
+            priority: Request priority
+
+        Returns:
+            Estimated wait in seconds (0 if a slot is free)
+        """
+        ahead = sum(1 for p, _, w in self._waiters if p <= priority and not w.done())
+        if ahead == 0 and self._in_flight < self.max_concurrent:
+            return 0.0
+        return (ahead + 1) / self.max_concurrent * self._service_time
+
+    def _budget(self, priority: RequestPriority) -> float:
+        """Queue budget: the priority's queue timeout, bounded by the request deadline."""
+        budget = self.queue_timeouts.get(priority, 0.0)
+        remaining = get_remaining_time()
+        if remaining is not None:
+            budget = min(budget, remaining)
+        return max(0.0, budget)
+
+    def _reject(self, priority: RequestPriority, estimated_wait: float, reason: str) -> None:
+        """Record a shed request and raise AdmissionRejectedError."""
+        from mcp_server_langgraph.core.exceptions import AdmissionRejectedError
+
+        self._rejected += 1
+        admission_rejected_counter.add(1, attributes={"priority": priority.name.lower(), "reason": reason})
+        retry_after = max(1, math.ceil(estimated_wait))
+        logger.warning(
+            "Request shed by admission control",
+            extra={
+                "priority": priority.name.lower(),
+                "reason": reason,
+                "estimated_wait": estimated_wait,
+                "in_flight": self._in_flight,
+                "queued": self.queued,
+            },
+        )
+        raise AdmissionRejectedError(
+            message=f"Server overloaded: estimated queue wait {estimated_wait:.1f}s exceeds budget",
+            retry_after=retry_after,
+            metadata={"priority": priority.name.lower(), "reason": reason, "retry_after": retry_after},
+        )
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to queued waiters in priority order."""
+        while self._waiters and self._in_flight < self.max_concurrent:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _release(self, elapsed: float) -> None:
+        """Release a slot and fold the request's service time into the estimate."""
+        self._service_time = (1 - self.smoothing) * self._service_time + self.smoothing * elapsed
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake_waiters()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        """Acquire an execution slot or raise AdmissionRejectedError."""
+        # Drop abandoned waiters at the head of the queue
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            return
+
+        budget = self._budget(priority)
+        estimated_wait = self.estimate_wait(priority)
+        if estimated_wait > budget:
+            self._reject(priority, estimated_wait, "estimated_wait")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(budget):
+                await waiter
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed to us just as we gave up: pass it on
+                self._release(self._service_time)
+            else:
+                waiter.cancel()
+            if isinstance(e, TimeoutError):
+                self._reject(priority, time.monotonic() - start, "queue_timeout")
+            raise
+        finally:
+            admission_queue_wait_histogram.record(time.monotonic() - start, attributes={"priority": priority.name.lower()})
+
+    @asynccontextmanager
+    async def admit(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """
+        Run the block once admitted, or raise AdmissionRejectedError.
+
+        Args:
+            priority: Request priority (CRITICAL bypasses admission)
+
+        Raises:
+            AdmissionRejectedError: If the request is shed
+        """
+        if priority == RequestPriority.CRITICAL:
+            yield
+            return
+
+        await self._acquire(priority)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - start)
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get admission controller statistics."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            "service_time": self._service_time,
+            "rejected": self._rejected,
+        }
+
+
+# =============================================================================
+# Global Controller
+# =============================================================================
+
+_admission_controller: AdmissionController | None = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide admission controller (created from resilience config)."""
+    global _admission_controller
+    if _admission_controller is None:
+        config = get_resilience_config().admission
+        _admission_controller = AdmissionController(
+            max_concurrent=config.max_concurrent,
+            queue_timeouts={
+                RequestPriority.HIGH: config.high_priority_queue_timeout,
+                RequestPriority.NORMAL: config.normal_priority_queue_timeout,
+                RequestPriority.LOW: config.low_priority_queue_timeout,
+            },
+            initial_service_time=config.initial_service_time,
+        )
+    return _admission_controller
+
+
+def reset_admission_controller() -> None:
+    """
+    Reset the admission controller (for testing).
+
+    Warning: Only use for testing! In production, the controller should persist.
+    """
+    global _admission_controller
+    _admission_controller = None
@@ -2,7 +2,8 @@
 Bulkhead isolation pattern for resource pool limits.
 
 Prevents resource exhaustion by limiting concurrent operations per resource type.
-Uses asyncio.Semaphore for concurrency control.
+Uses asyncio.Semaphore for concurrency control, plus an optional Redis-backed
+global slot (see resilience.distributed) so limits hold across replicas.
 
 See ADR-0026 for design rationale.
 """
@@ -11,12 +12,15 @@ import asyncio
 import functools
 import logging
 from collections.abc import Callable
+from contextlib import AsyncExitStack
 from typing import Any, ParamSpec, TypeVar
 
 from opentelemetry import trace
 
 from mcp_server_langgraph.observability.telemetry import bulkhead_active_operations_gauge, bulkhead_rejected_counter
 from mcp_server_langgraph.resilience.config import get_provider_limit, get_resilience_config
+from mcp_server_langgraph.resilience.deadline import bound_timeout
+from mcp_server_langgraph.resilience.distributed import get_global_bulkhead
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -151,10 +155,47 @@ def get_bulkhead(resource_type: str, limit: int | None = None) -> asyncio.Semaph
     return semaphore
 
 
+def _rejected_error(resource_type: str, function: str, limit: int, reason: str) -> Exception:
+    """Log and count a bulkhead rejection, and build the error to raise."""
+    logger.warning(
+        f"Bulkhead rejected request: {resource_type}",
+        extra={
+            "resource_type": resource_type,
+            "function": function,
+            "reason": reason,
+        },
+    )
+
+    # Emit metric
+    try:
+        bulkhead_rejected_counter.add(
+            1,
+            attributes={
+                "resource_type": resource_type,
+                "function": function,
+            },
+        )
+    except RuntimeError:
+        # Observability not initialized (can happen in tests or during shutdown)
+        pass
+
+    from mcp_server_langgraph.core.exceptions import BulkheadRejectedError
+
+    return BulkheadRejectedError(
+        message=f"Bulkhead rejected request for {resource_type} ({reason.replace('_', ' ')})",
+        metadata={
+            "resource_type": resource_type,
+            "function": function,
+            "limit": limit,
+        },
+    )
+
+
 def with_bulkhead(
     resource_type: str,
     limit: int | None = None,
     wait: bool = True,
+    bypass_when: Callable[[], bool] | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """
     Decorator to limit concurrent executions of a function.
@@ -163,6 +204,11 @@ def with_bulkhead(
         resource_type: Type of resource (llm, openfga, redis, db, custom)
         limit: Concurrency limit (overrides config)
         wait: If True, wait for slot. If False, reject immediately if no slots available.
+            Waiting for a global slot is bounded by the resource type's operation
+            timeout (and the request deadline); running out also rejects the call.
+        bypass_when: Checked on every call; when it returns True the call skips
+            the local semaphore (e.g. because an adaptive limiter sizes concurrency
+            instead) but still holds the global slot, if one is enabled
 
     Usage:
         # Limit to 10 concurrent LLM calls (default)
@@ -189,10 +235,37 @@ def with_bulkhead(
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         # Get or create bulkhead semaphore
         semaphore = get_bulkhead(resource_type, limit)
+        # The configured limit also applies deployment-wide when a global bulkhead is enabled
+        global_limit: int = (
+            limit if limit is not None else getattr(BulkheadConfig.from_resilience_config(), f"{resource_type}_limit", 10)
+        )
+        # Waiting for a global slot is bounded by the resource type's operation timeout
+        timeout_config = get_resilience_config().timeout
+        global_timeout: float = getattr(timeout_config, resource_type, timeout_config.default)
+
+        async def hold_global_slot(stack: AsyncExitStack) -> bool:
+            """Hold a cross-replica slot for the rest of the stack. Returns False if no global bulkhead is enabled."""
+            global_bulkhead = get_global_bulkhead(resource_type, global_limit)
+            if global_bulkhead is None:
+                return False
+
+            # wait=False fails fast on the global slot too (a single attempt)
+            slot_timeout = bound_timeout(global_timeout) if wait else 0.0
+            try:
+                await stack.enter_async_context(global_bulkhead.slot(timeout=slot_timeout))
+            except TimeoutError as e:
+                raise _rejected_error(resource_type, func.__name__, global_limit, reason="no_available_global_slots") from e
+            return True
 
         @functools.wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             """Async wrapper with bulkhead isolation"""
+            if bypass_when is not None and bypass_when():
+                # Only the local semaphore is bypassed; the cross-replica cap still applies
+                async with AsyncExitStack() as stack:
+                    await hold_global_slot(stack)
+                    return await func(*args, **kwargs)  # type: ignore[misc, no-any-return]
+
             # Get waiters count safely (attribute may not exist in all Python versions)
             try:
                 waiters_count = len(semaphore._waiters) if hasattr(semaphore, "_waiters") and semaphore._waiters else 0
@@ -212,40 +285,7 @@ def with_bulkhead(
                 if not wait and slots_available == 0:
                     # No slots available, reject immediately
                     span.set_attribute("bulkhead.rejected", True)
-
-                    logger.warning(
-                        f"Bulkhead rejected request: {resource_type}",
-                        extra={
-                            "resource_type": resource_type,
-                            "function": func.__name__,
-                            "reason": "no_available_slots",
-                        },
-                    )
-
-                    # Emit metric
-                    try:
-                        bulkhead_rejected_counter.add(
-                            1,
-                            attributes={
-                                "resource_type": resource_type,
-                                "function": func.__name__,
-                            },
-                        )
-                    except RuntimeError:
-                        # Observability not initialized (can happen in tests or during shutdown)
-                        pass
-
-                    # Raise our custom exception
-                    from mcp_server_langgraph.core.exceptions import BulkheadRejectedError
-
-                    raise BulkheadRejectedError(
-                        message=f"Bulkhead rejected request for {resource_type} (no available slots)",
-                        metadata={
-                            "resource_type": resource_type,
-                            "function": func.__name__,
-                            "limit": limit or 10,
-                        },
-                    )
+                    raise _rejected_error(resource_type, func.__name__, limit or 10, reason="no_available_slots")
 
                 # Acquire semaphore (wait if necessary)
                 async with semaphore:
@@ -264,8 +304,13 @@ def with_bulkhead(
                         # Observability not initialized (can happen in tests or during shutdown)
                         pass
 
-                    # Execute function
-                    result = await func(*args, **kwargs)  # type: ignore[misc]
+                    # Also hold a cross-replica slot when a global bulkhead is enabled
+                    async with AsyncExitStack() as stack:
+                        if await hold_global_slot(stack):
+                            span.set_attribute("bulkhead.global", True)
+
+                        # Execute function
+                        result = await func(*args, **kwargs)  # type: ignore[misc]
 
                     return result  # type: ignore[no-any-return]
 
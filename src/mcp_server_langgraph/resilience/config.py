@@ -7,6 +7,8 @@ Centralized configuration for all resilience patterns:
 - Timeout values per operation type
 - Bulkhead concurrency limits
 - Provider-aware concurrency limits
+- Cross-replica (Redis-backed) limiter settings
+- Request admission control and deadlines
 
 Provider rate limit references:
 - Anthropic: https://docs.anthropic.com/en/api/rate-limits (Tier 1: 50 RPM → ~8 concurrent)
@@ -136,6 +138,24 @@ class OverloadRetryConfig(BaseModel):
     retry_after_max: float = Field(default=120.0, description="Max Retry-After to honor (seconds)")
 
 
+class RetryBudgetConfig(BaseModel):
+    """Retry budget (token bucket) shared by all callers of a dependency.
+
+    Every request deposits `ratio` tokens and every retry withdraws one, so
+    retries stay below roughly ratio * requests. A small time-based reserve
+    (min_retries_per_second) keeps low-traffic dependencies retryable.
+    """
+
+    enabled: bool = Field(default=True, description="Limit retries per dependency with a retry budget")
+    ratio: float = Field(default=0.1, description="Retries allowed per request (0.1 = 10%)")
+    min_retries_per_second: float = Field(default=1.0, description="Retry reserve refilled per second")
+    max_balance: float = Field(default=10.0, description="Max retry tokens that can accumulate")
+    distributed: bool = Field(
+        default=False,
+        description="Share budgets across replicas via Redis (requires RESILIENCE_DISTRIBUTED_ENABLED)",
+    )
+
+
 class RetryConfig(BaseModel):
     """Retry configuration"""
 
@@ -147,6 +167,10 @@ class RetryConfig(BaseModel):
         default=JitterStrategy.SIMPLE,
         description="Jitter strategy for standard retries",
     )
+    budget: RetryBudgetConfig = Field(
+        default_factory=RetryBudgetConfig,
+        description="Per-dependency retry budget",
+    )
     overload: OverloadRetryConfig = Field(
         default_factory=OverloadRetryConfig,
         description="Configuration for overload (529) error handling",
@@ -170,6 +194,51 @@ class BulkheadConfig(BaseModel):
     openfga_limit: int = Field(default=50, description="Max concurrent OpenFGA checks")
     redis_limit: int = Field(default=100, description="Max concurrent Redis operations")
     db_limit: int = Field(default=20, description="Max concurrent DB queries")
+    adaptive_provider_limits: bool = Field(
+        default=False,
+        description="Size provider concurrency with the latency-gradient limiter instead of fixed limits",
+    )
+
+
+class DistributedLimitConfig(BaseModel):
+    """Cross-replica (Redis-backed) rate limit and concurrency configuration.
+
+    Token buckets and bulkhead semaphores are per process by default, so N
+    replicas together admit N times the configured provider rate. When enabled,
+    provider rate limits and the listed bulkheads are enforced globally.
+    """
+
+    enabled: bool = Field(default=False, description="Enforce provider rate limits and bulkheads across replicas")
+    redis_url: str = Field(default="redis://localhost:6379/3", description="Redis URL for shared limiter state")
+    key_prefix: str = Field(default="resilience", description="Redis key prefix for limiter state")
+    lease_size: int = Field(default=5, description="Max tokens leased from Redis per round trip")
+    lease_ttl: float = Field(default=1.0, description="Seconds a locally leased token stays valid")
+    global_bulkheads: list[str] = Field(
+        default_factory=lambda: ["llm"],
+        description="Bulkhead resource types that also enforce a global concurrency limit",
+    )
+    concurrency_lease_ttl: float = Field(
+        default=120.0,
+        description="Seconds before a global concurrency slot held by a crashed replica expires",
+    )
+
+
+class AdmissionConfig(BaseModel):
+    """Priority-aware admission control for MCP requests.
+
+    Requests beyond max_concurrent queue by priority. A request is shed with
+    503 + Retry-After as soon as its estimated queue wait exceeds its priority's
+    queue budget or its remaining deadline, instead of timing out later.
+    """
+
+    enabled: bool = Field(default=True, description="Enable admission control for tool calls")
+    max_concurrent: int = Field(default=50, description="Max tool calls executing concurrently per replica")
+    default_deadline: float = Field(default=120.0, description="Default per-request deadline in seconds")
+    max_deadline: float = Field(default=600.0, description="Upper bound for client-requested deadlines")
+    high_priority_queue_timeout: float = Field(default=30.0, description="Max queue wait for high priority")
+    normal_priority_queue_timeout: float = Field(default=10.0, description="Max queue wait for normal priority")
+    low_priority_queue_timeout: float = Field(default=2.0, description="Max queue wait for low priority")
+    initial_service_time: float = Field(default=5.0, description="Initial service time estimate in seconds")
 
 
 class ResilienceConfig(BaseModel):
@@ -197,6 +266,12 @@ class ResilienceConfig(BaseModel):
     # Bulkhead configuration
     bulkhead: BulkheadConfig = Field(default_factory=BulkheadConfig)
 
+    # Cross-replica limiter configuration
+    distributed: DistributedLimitConfig = Field(default_factory=DistributedLimitConfig)
+
+    # Admission control configuration
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+
     @classmethod
     def from_env(cls) -> "ResilienceConfig":
         """Load configuration from environment variables"""
@@ -224,6 +299,13 @@ class ResilienceConfig(BaseModel):
                 exponential_max=float(os.getenv("RETRY_EXPONENTIAL_MAX", "10.0")),
                 jitter=os.getenv("RETRY_JITTER", "true").lower() == "true",
                 jitter_strategy=jitter_strategy,
+                budget=RetryBudgetConfig(
+                    enabled=os.getenv("RETRY_BUDGET_ENABLED", "true").lower() == "true",
+                    ratio=float(os.getenv("RETRY_BUDGET_RATIO", "0.1")),
+                    min_retries_per_second=float(os.getenv("RETRY_BUDGET_MIN_RETRIES_PER_SECOND", "1.0")),
+                    max_balance=float(os.getenv("RETRY_BUDGET_MAX_BALANCE", "10.0")),
+                    distributed=os.getenv("RETRY_BUDGET_DISTRIBUTED", "false").lower() == "true",
+                ),
                 overload=OverloadRetryConfig(
                     max_attempts=int(os.getenv("RETRY_OVERLOAD_MAX_ATTEMPTS", "6")),
                     exponential_base=float(os.getenv("RETRY_OVERLOAD_EXPONENTIAL_BASE", "2.0")),
@@ -246,6 +328,26 @@ class ResilienceConfig(BaseModel):
                 openfga_limit=int(os.getenv("BULKHEAD_OPENFGA_LIMIT", "50")),
                 redis_limit=int(os.getenv("BULKHEAD_REDIS_LIMIT", "100")),
                 db_limit=int(os.getenv("BULKHEAD_DB_LIMIT", "20")),
+                adaptive_provider_limits=os.getenv("BULKHEAD_ADAPTIVE_PROVIDER_LIMITS", "false").lower() == "true",
+            ),
+            distributed=DistributedLimitConfig(
+                enabled=os.getenv("RESILIENCE_DISTRIBUTED_ENABLED", "false").lower() == "true",
+                redis_url=os.getenv("RESILIENCE_REDIS_URL", "redis://localhost:6379/3"),
+                key_prefix=os.getenv("RESILIENCE_REDIS_KEY_PREFIX", "resilience"),
+                lease_size=int(os.getenv("RESILIENCE_DISTRIBUTED_LEASE_SIZE", "5")),
+                lease_ttl=float(os.getenv("RESILIENCE_DISTRIBUTED_LEASE_TTL", "1.0")),
+                global_bulkheads=[r.strip() for r in os.getenv("RESILIENCE_GLOBAL_BULKHEADS", "llm").split(",") if r.strip()],
+                concurrency_lease_ttl=float(os.getenv("RESILIENCE_CONCURRENCY_LEASE_TTL", "120.0")),
+            ),
+            admission=AdmissionConfig(
+                enabled=os.getenv("ADMISSION_ENABLED", "true").lower() == "true",
+                max_concurrent=int(os.getenv("ADMISSION_MAX_CONCURRENT", "50")),
+                default_deadline=float(os.getenv("ADMISSION_DEFAULT_DEADLINE", "120.0")),
+                max_deadline=float(os.getenv("ADMISSION_MAX_DEADLINE", "600.0")),
+                high_priority_queue_timeout=float(os.getenv("ADMISSION_HIGH_PRIORITY_QUEUE_TIMEOUT", "30.0")),
+                normal_priority_queue_timeout=float(os.getenv("ADMISSION_NORMAL_PRIORITY_QUEUE_TIMEOUT", "10.0")),
+                low_priority_queue_timeout=float(os.getenv("ADMISSION_LOW_PRIORITY_QUEUE_TIMEOUT", "2.0")),
+                initial_service_time=float(os.getenv("ADMISSION_INITIAL_SERVICE_TIME", "5.0")),
             ),
         )
 
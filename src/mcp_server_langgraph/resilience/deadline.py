@@ -0,0 +1,91 @@
+"""
+Request-scoped deadlines.
+
+A deadline is an absolute time.monotonic() value (not loop.time()) by which
+the current request must finish. It is stored in a contextvar, so it follows
+the request through awaits and into tasks spawned from it, and every layer
+can bound its own timeout by the remaining budget instead of applying a
+fixed per-layer timeout.
+
+Usage:
+    with deadline_scope(30.0):
+        await handle_request()  # with_timeout() inside never exceeds 30s total
+
+See ADR-0026 for design rationale.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def get_deadline() -> float | None:
+    """Get the current request deadline (time.monotonic() value), or None if unbounded."""
+    return _request_deadline.get()
+
+
+def get_remaining_time() -> float | None:
+    """
+    Get the remaining request budget in seconds.
+
+    Returns:
+        Seconds left (may be negative once exceeded), or None if no deadline is set
+    """
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def is_deadline_exceeded() -> bool:
+    """Check whether the current request deadline has passed."""
+    remaining = get_remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+def bound_timeout(timeout: float) -> float:
+    """
+    Bound a per-operation timeout by the remaining request budget.
+
+    Args:
+        timeout: Operation timeout in seconds
+
+    Returns:
+        min(timeout, remaining budget), never negative
+    """
+    remaining = get_remaining_time()
+    if remaining is None:
+        return timeout
+    return max(0.0, min(timeout, remaining))
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[float | None]:
+    """
+    Set the request deadline for the duration of the block.
+
+    Nested scopes can only tighten the deadline, never extend it.
+
+    Args:
+        seconds: Budget from now in seconds (None keeps the current deadline)
+
+    Yields:
+        The effective deadline (time.monotonic() value), or None if unbounded
+    """
+    current = _request_deadline.get()
+    if seconds is None:
+        yield current
+        return
+
+    deadline = time.monotonic() + seconds
+    if current is not None:
+        deadline = min(deadline, current)
+
+    token = _request_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _request_deadline.reset(token)
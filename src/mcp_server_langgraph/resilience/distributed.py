@@ -0,0 +1,640 @@
+"""
+Distributed (cross-replica) rate limiting and concurrency control.
+
+`TokenBucket` and bulkhead semaphores live in process memory, so with N
+replicas the effective provider rate is N times what
+`get_provider_rate_config` intends. This module keeps the shared state in
+Redis so limits hold across the whole deployment.
+
+Key features:
+- Global token bucket: refill/take is a single atomic Lua script using the
+  Redis server clock, so replicas never disagree about elapsed time
+- Local token leasing: tokens are leased in small batches and spent locally,
+  so the hot path does not hit Redis on every call
+- Global concurrency: a sorted-set semaphore with per-slot expiry, so slots
+  held by a crashed replica are reclaimed automatically
+- Graceful degradation: if Redis is unreachable, falls back to the local
+  per-process limiters (same behavior as before this module existed), and
+  backs off before trying Redis again
+
+Enable with RESILIENCE_DISTRIBUTED_ENABLED=true (see DistributedLimitConfig).
+
+See ADR-0026 for design rationale.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+
+from opentelemetry import trace
+
+from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.rate_limit import TokenBucket, get_provider_rate_config, get_provider_token_bucket
+
+try:
+    import redis.asyncio as redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None  # type: ignore[assignment]
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+# =============================================================================
+# Lua Scripts
+# =============================================================================
+
+# Token bucket: refill based on elapsed server time, then grant up to ARGV[3]
+# tokens (partial grants allowed). Returns {granted, seconds_until_next_token}.
+# The wait is returned as a string because Lua numbers are truncated to integers.
+TOKEN_BUCKET_LEASE_SCRIPT = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = capacity
+  ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', key, math.ceil(capacity / rate) * 2 + 1)
+
+local wait = 0
+if granted == 0 then
+  wait = (1 - tokens) / rate
+end
+return {granted, tostring(wait)}
+"""  # noqa: S105 - Lua script, not a credential
+
+# Concurrency slot: sorted set of holders scored by lease expiry.
+# Expired holders are purged before the limit check. Returns 1 if acquired.
+SEMAPHORE_ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local holder = ARGV[2]
+local ttl = tonumber(ARGV[3])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+if redis.call('ZCARD', key) < limit then
+  redis.call('ZADD', key, now + ttl, holder)
+  redis.call('EXPIRE', key, math.ceil(ttl) + 1)
+  return 1
+end
+return 0
+"""
+
+# Lease renewal: push a held slot's expiry forward. Returns 0 if the slot
+# already expired (or was released), so the holder knows it lost the slot.
+SEMAPHORE_RENEW_SCRIPT = """
+local key = KEYS[1]
+local holder = ARGV[1]
+local ttl = tonumber(ARGV[2])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local expiry = redis.call('ZSCORE', key, holder)
+if not expiry or tonumber(expiry) <= now then
+  return 0
+end
+redis.call('ZADD', key, now + ttl, holder)
+redis.call('EXPIRE', key, math.ceil(ttl) + 1)
+return 1
+"""
+
+# Held slots: leases that have not expired by the Redis clock (the clock the
+# other scripts score leases with; replica clocks may be skewed).
+SEMAPHORE_ACTIVE_SCRIPT = """
+local key = KEYS[1]
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+return redis.call('ZCOUNT', key, '(' .. now, '+inf')
+"""
+
+
+# =============================================================================
+# Redis Outage Backoff
+# =============================================================================
+
+
+class RedisOutage:
+    """
+    Tracks Redis failures for one limiter so an outage is not retried on every call.
+
+    After a failure, Redis is skipped for `min_backoff` seconds, doubling on
+    each further failure up to `max_backoff`. The outage is logged once when
+    it starts and once when Redis recovers.
+    """
+
+    def __init__(self, name: str, kind: str, min_backoff: float = 1.0, max_backoff: float = 30.0):
+        """
+        Initialize outage tracker.
+
+        Args:
+            name: Limiter name, used in log messages
+            kind: Limiter kind ("rate limiter" or "bulkhead"), used in log messages
+            min_backoff: Seconds to skip Redis after the first failure
+            max_backoff: Upper bound for the backoff
+        """
+        self.name = name
+        self.kind = kind
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def in_outage(self) -> bool:
+        """Whether the last Redis call failed."""
+        return self._failures > 0
+
+    def available(self) -> bool:
+        """Whether Redis should be tried now (no outage, or backoff elapsed)."""
+        return time.monotonic() >= self._retry_at
+
+    def record_failure(self, error: Exception) -> None:
+        """Record a failed Redis call and schedule the next retry."""
+        if self._failures == 0:
+            logger.warning(
+                f"Distributed {self.kind} unavailable for {self.name}, using local limits",
+                extra={"limiter": self.name, "error": str(error)},
+            )
+        self._failures += 1
+        backoff = min(self.max_backoff, self.min_backoff * 2 ** (self._failures - 1))
+        self._retry_at = time.monotonic() + backoff
+
+    def record_success(self) -> None:
+        """Record a successful Redis call, ending any outage."""
+        if self._failures > 0:
+            logger.info(
+                f"Distributed {self.kind} recovered for {self.name}",
+                extra={"limiter": self.name, "failures": self._failures},
+            )
+        self._failures = 0
+        self._retry_at = 0.0
+
+
+# =============================================================================
+# Distributed Token Bucket
+# =============================================================================
+
+
+class DistributedTokenBucket:
+    """
+    Redis-backed token bucket shared by all replicas, with local leasing.
+
+    Each replica leases up to `lease_size` tokens per Redis round trip and
+    spends them locally. Leased tokens expire after `lease_ttl` seconds so an
+    idle replica cannot hoard burst capacity. The lease batch is capped at 10%
+    of the bucket capacity, so providers with small limits (e.g. Anthropic
+    Tier 1) lease one token at a time and stay exact.
+
+    Example:
+        >>> bucket = DistributedTokenBucket("anthropic", capacity=8.3, refill_rate=0.83, redis_client=client)
+        >>> await bucket.acquire(timeout=30.0)
+        >>> await call_anthropic_api()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: float,
+        refill_rate: float,
+        redis_client: Any,
+        key_prefix: str = "resilience",
+        lease_size: int = 5,
+        lease_ttl: float = 1.0,
+        fallback: TokenBucket | None = None,
+    ):
+        """
+        Initialize distributed token bucket.
+
+        Args:
+            name: Bucket name (usually the provider), used in the Redis key
+            capacity: Maximum tokens (global burst capacity)
+            refill_rate: Tokens per second (global sustained rate)
+            redis_client: redis.asyncio client
+            key_prefix: Redis key prefix
+            lease_size: Max tokens leased per Redis round trip
+            lease_ttl: Seconds a leased token stays valid locally
+            fallback: Local bucket used when Redis is unavailable
+        """
+        self.name = name
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.key = f"{key_prefix}:ratelimit:{name}"
+        self.lease_size = max(1, min(lease_size, int(capacity // 10)))
+        self.lease_ttl = lease_ttl
+        self._redis = redis_client
+        self._fallback = fallback or TokenBucket(capacity=capacity, refill_rate=refill_rate)
+        self._leased = 0
+        self._lease_expires = 0.0
+        self._lock = asyncio.Lock()
+        self._outage = RedisOutage(name, "rate limiter")
+
+    @property
+    def leased_tokens(self) -> int:
+        """Tokens currently leased locally and still valid."""
+        if time.monotonic() >= self._lease_expires:
+            return 0
+        return self._leased
+
+    def _take_leased(self) -> bool:
+        """Spend one locally leased token if any are still valid."""
+        if self._leased > 0 and time.monotonic() < self._lease_expires:
+            self._leased -= 1
+            return True
+        return False
+
+    async def _lease(self) -> tuple[int, float]:
+        """Lease a batch of tokens from Redis. Returns (granted, wait_seconds)."""
+        result = await self._redis.eval(
+            TOKEN_BUCKET_LEASE_SCRIPT,
+            1,
+            self.key,
+            self.capacity,
+            self.refill_rate,
+            self.lease_size,
+        )
+        return int(result[0]), float(result[1])
+
+    async def acquire(self, timeout: float | None = None) -> None:
+        """
+        Acquire one token, waiting if necessary.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait forever)
+
+        Raises:
+            TimeoutError: If a token cannot be acquired within timeout
+        """
+        if self._take_leased():
+            return
+
+        start = time.monotonic()
+
+        while True:
+            if not self._outage.available():
+                # Redis failed recently; skip it until the backoff elapses
+                remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
+                await self._fallback.acquire(timeout=remaining)
+                return
+
+            async with self._lock:
+                # Another waiter may have refilled the lease while we queued
+                if self._take_leased():
+                    return
+
+                try:
+                    granted, wait_time = await self._lease()
+                except Exception as e:
+                    self._outage.record_failure(e)
+                    continue
+
+                self._outage.record_success()
+
+                if granted > 0:
+                    self._leased = granted - 1
+                    self._lease_expires = time.monotonic() + self.lease_ttl
+                    return
+
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    raise TimeoutError(f"Could not acquire token for {self.name} within {timeout}s")
+                wait_time = min(wait_time, remaining)
+
+            await asyncio.sleep(max(0.01, wait_time))  # Min 10ms to avoid busy loop
+
+
+# =============================================================================
+# Distributed Semaphore (Global Bulkhead)
+# =============================================================================
+
+
+class DistributedSemaphore:
+    """
+    Redis-backed concurrency limit shared by all replicas.
+
+    Slots are members of a sorted set scored by lease expiry, so a slot held
+    by a replica that crashed mid-call frees itself after `lease_ttl`. While
+    `slot()` holds a slot, its lease is renewed every `lease_ttl / 3` seconds,
+    so calls that run longer than `lease_ttl` keep their slot.
+
+    Example:
+        >>> semaphore = DistributedSemaphore("llm", limit=10, redis_client=client)
+        >>> async with semaphore.slot():
+        ...     await call_llm()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        redis_client: Any,
+        key_prefix: str = "resilience",
+        lease_ttl: float = 120.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Initialize distributed semaphore.
+
+        Args:
+            name: Resource name, used in the Redis key
+            limit: Global concurrency limit across all replicas
+            redis_client: redis.asyncio client
+            key_prefix: Redis key prefix
+            lease_ttl: Seconds before an unreleased slot expires
+            poll_interval: Initial wait between acquisition attempts
+        """
+        self.name = name
+        self.limit = limit
+        self.key = f"{key_prefix}:bulkhead:{name}"
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        self._redis = redis_client
+        self._outage = RedisOutage(name, "bulkhead")
+
+    async def try_acquire(self) -> str | None:
+        """Try to take a slot without waiting. Returns the holder token, or None if full."""
+        holder = uuid.uuid4().hex
+        acquired = await self._redis.eval(SEMAPHORE_ACQUIRE_SCRIPT, 1, self.key, self.limit, holder, self.lease_ttl)
+        return holder if int(acquired) == 1 else None
+
+    async def acquire(self, timeout: float | None = None) -> str:
+        """
+        Take a slot, waiting if necessary.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait forever)
+
+        Returns:
+            Holder token to pass to release()
+
+        Raises:
+            TimeoutError: If no slot frees up within timeout
+        """
+        start = time.monotonic()
+        delay = self.poll_interval
+
+        while True:
+            holder = await self.try_acquire()
+            if holder is not None:
+                return holder
+
+            if timeout is not None:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    raise TimeoutError(f"Could not acquire global {self.name} slot within {timeout}s")
+                delay = min(delay, remaining)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)  # Back off up to 1s between polls
+
+    async def renew(self, holder: str) -> bool:
+        """Extend a held slot's lease by lease_ttl. Returns False if the slot already expired."""
+        renewed = await self._redis.eval(SEMAPHORE_RENEW_SCRIPT, 1, self.key, holder, self.lease_ttl)
+        return int(renewed) == 1
+
+    async def _keep_alive(self, holder: str) -> None:
+        """Renew a held slot's lease until cancelled."""
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                renewed = await self.renew(holder)
+            except Exception as e:
+                # Keep trying; the lease still has up to 2/3 of its TTL left
+                self._outage.record_failure(e)
+                continue
+
+            self._outage.record_success()
+            if not renewed:
+                logger.warning(
+                    f"Global {self.name} slot expired before renewal",
+                    extra={"resource_type": self.name, "lease_ttl": self.lease_ttl},
+                )
+                return
+
+    async def release(self, holder: str) -> None:
+        """Release a slot previously returned by acquire()."""
+        await self._redis.zrem(self.key, holder)
+
+    async def active(self) -> int:
+        """Number of slots currently held across all replicas."""
+        return int(await self._redis.eval(SEMAPHORE_ACTIVE_SCRIPT, 1, self.key))
+
+    @asynccontextmanager
+    async def slot(self, timeout: float | None = None) -> AsyncIterator[None]:
+        """
+        Hold a global slot for the duration of the block.
+
+        Fails open: if Redis is unreachable, the block runs under the local
+        bulkhead only, and Redis is not retried until the outage backoff
+        elapses. The slot's lease is renewed while the block runs.
+        """
+        holder: str | None = None
+        if self._outage.available():
+            try:
+                holder = await self.acquire(timeout=timeout)
+            except TimeoutError:
+                raise
+            except Exception as e:
+                self._outage.record_failure(e)
+            else:
+                self._outage.record_success()
+
+        renewal = asyncio.create_task(self._keep_alive(holder)) if holder is not None else None
+
+        try:
+            yield
+        finally:
+            if renewal is not None:
+                renewal.cancel()
+                with suppress(asyncio.CancelledError):
+                    await renewal
+            if holder is not None:
+                try:
+                    await self.release(holder)
+                except Exception as e:
+                    # Slot expires on its own after lease_ttl
+                    logger.warning(
+                        f"Failed to release global {self.name} slot",
+                        extra={"resource_type": self.name, "error": str(e)},
+                    )
+
+
+# =============================================================================
+# Factories
+# =============================================================================
+
+_redis_client: Any = None
+_distributed_token_buckets: dict[str, DistributedTokenBucket] = {}
+_global_bulkheads: dict[str, DistributedSemaphore] = {}
+_factory_lock = threading.Lock()
+
+
+def is_distributed_enabled() -> bool:
+    """Check whether cross-replica limits are enabled and Redis is importable."""
+    return REDIS_AVAILABLE and get_resilience_config().distributed.enabled
+
+
+def _get_redis_client() -> Any:
+    """Get or create the shared redis.asyncio client for limiter state."""
+    global _redis_client
+    if _redis_client is None:
+        config = get_resilience_config().distributed
+        _redis_client = redis.from_url(config.redis_url, decode_responses=True)  # type: ignore[no-untyped-call]
+    return _redis_client
+
+
+def get_distributed_token_bucket(provider: str) -> DistributedTokenBucket:
+    """
+    Get or create the global token bucket for an LLM provider.
+
+    Uses the same RPM/burst configuration as get_provider_token_bucket, but
+    the limit applies to the deployment as a whole rather than per replica.
+
+    Args:
+        provider: LLM provider name (e.g., "anthropic", "openai")
+
+    Returns:
+        DistributedTokenBucket for the provider
+    """
+    with _factory_lock:
+        if provider in _distributed_token_buckets:
+            return _distributed_token_buckets[provider]
+
+        config = get_resilience_config().distributed
+        rate_config = get_provider_rate_config(provider)
+        refill_rate = rate_config["rpm"] / 60.0
+        capacity = refill_rate * rate_config["burst_seconds"]
+
+        bucket = DistributedTokenBucket(
+            name=provider,
+            capacity=capacity,
+            refill_rate=refill_rate,
+            redis_client=_get_redis_client(),
+            key_prefix=config.key_prefix,
+            lease_size=config.lease_size,
+            lease_ttl=config.lease_ttl,
+            fallback=get_provider_token_bucket(provider),
+        )
+        _distributed_token_buckets[provider] = bucket
+
+        logger.info(
+            f"Created distributed token bucket for {provider}",
+            extra={
+                "provider": provider,
+                "rpm": rate_config["rpm"],
+                "capacity": capacity,
+                "lease_size": bucket.lease_size,
+            },
+        )
+
+        return bucket
+
+
+def get_global_bulkhead(resource_type: str, limit: int) -> DistributedSemaphore | None:
+    """
+    Get the global concurrency limiter for a bulkhead resource type.
+
+    Returns None when distributed limits are disabled or the resource type is
+    not listed in `global_bulkheads`, so callers can skip it cheaply.
+
+    Args:
+        resource_type: Bulkhead resource type (llm, openfga, ...)
+        limit: Global concurrency limit
+
+    Returns:
+        DistributedSemaphore, or None if not enabled for this resource type
+    """
+    if not is_distributed_enabled():
+        return None
+
+    config = get_resilience_config().distributed
+    if resource_type not in config.global_bulkheads:
+        return None
+
+    with _factory_lock:
+        if resource_type not in _global_bulkheads:
+            _global_bulkheads[resource_type] = DistributedSemaphore(
+                name=resource_type,
+                limit=limit,
+                redis_client=_get_redis_client(),
+                key_prefix=config.key_prefix,
+                lease_ttl=config.concurrency_lease_ttl,
+            )
+            logger.info(
+                f"Created global bulkhead for {resource_type}",
+                extra={"resource_type": resource_type, "limit": limit},
+            )
+        return _global_bulkheads[resource_type]
+
+
+async def acquire_provider_rate_limit(provider: str, timeout: float | None = 30.0) -> None:
+    """
+    Acquire a global rate limit token for a provider call.
+
+    No-op when distributed limits are disabled.
+
+    Args:
+        provider: LLM provider name
+        timeout: Max wait time for a token (None = wait forever)
+
+    Raises:
+        TimeoutError: If a token cannot be acquired within timeout
+    """
+    if not is_distributed_enabled():
+        return
+
+    bucket = get_distributed_token_bucket(provider)
+    with tracer.start_as_current_span(
+        "rate_limit.distributed",
+        attributes={
+            "rate_limit.provider": provider,
+            "rate_limit.capacity": bucket.capacity,
+            "rate_limit.refill_rate": bucket.refill_rate,
+            "rate_limit.leased_tokens": bucket.leased_tokens,
+        },
+    ):
+        await bucket.acquire(timeout=timeout)
+
+
+def reset_all_distributed_limiters() -> None:
+    """
+    Reset all distributed limiter objects and the Redis client (for testing).
+
+    Only clears local objects; shared state in Redis is left untouched.
+    """
+    global _redis_client
+    with _factory_lock:
+        _distributed_token_buckets.clear()
+        _global_bulkheads.clear()
+        _redis_client = None
+        logger.warning("All distributed limiters reset (testing only)")
@@ -3,7 +3,7 @@ Resilience metrics for observability.
 
 Provides OpenTelemetry metrics for all resilience patterns:
 - Circuit breaker state changes and failures
-- Retry attempts and exhaustion
+- Retry attempts, exhaustion and retry budget consumption
 - Timeout violations
 - Bulkhead rejections and active operations
 - Fallback usage
@@ -110,6 +110,18 @@ bulkhead_queue_depth_gauge = meter.create_gauge(
     unit="1",
 )
 
+bulkhead_concurrency_limit_gauge = meter.create_gauge(
+    name="bulkhead.concurrency_limit",
+    description="Current adaptive concurrency limit per provider",
+    unit="1",
+)
+
+bulkhead_queue_wait_histogram = meter.create_histogram(
+    name="bulkhead.queue_wait",
+    description="Time spent waiting for an adaptive bulkhead slot",
+    unit="s",
+)
+
 
 # ==============================================================================
 # Fallback Metrics
@@ -306,6 +318,8 @@ def get_resilience_metrics_summary() -> dict[str, Any]:
             "total_attempts": "retry.attempts (counter)",
             "exhausted": "retry.exhausted (counter)",
             "successes": "retry.success_after_retry (counter)",
+            "budget_exhausted": "retry.budget_exhausted (counter)",
+            "budget_balance": "retry.budget_balance (gauge)",
         },
         "timeouts": {
             "total_exceeded": "timeout.exceeded (counter)",
@@ -315,6 +329,8 @@ def get_resilience_metrics_summary() -> dict[str, Any]:
             "total_rejections": "bulkhead.rejections (counter)",
             "active_operations": "bulkhead.active_operations (gauge)",
             "queue_depth": "bulkhead.queue_depth (gauge)",
+            "concurrency_limit": "bulkhead.concurrency_limit (gauge)",
+            "queue_wait": "bulkhead.queue_wait (histogram)",
         },
         "fallbacks": {
             "total_used": "fallback.used (counter)",
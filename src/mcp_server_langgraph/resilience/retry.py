@@ -3,6 +3,8 @@ Retry logic with exponential backoff and jitter.
 
 Automatically retries transient failures with configurable policies.
 Uses tenacity library for declarative retry specifications.
+Async retries stop early once the request deadline (resilience.deadline) is spent
+or the dependency's retry budget (resilience.retry_budget) is exhausted.
 
 See ADR-0026 for design rationale.
 """
@@ -28,6 +30,8 @@ from tenacity import (
 
 from mcp_server_langgraph.observability.telemetry import retry_attempt_counter, retry_exhausted_counter
 from mcp_server_langgraph.resilience.config import JitterStrategy, OverloadRetryConfig, get_resilience_config
+from mcp_server_langgraph.resilience.deadline import get_remaining_time
+from mcp_server_langgraph.resilience.retry_budget import get_retry_budget
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -393,6 +397,7 @@ def retry_with_backoff(  # noqa: C901
     strategy: RetryStrategy = RetryStrategy.EXPONENTIAL,
     jitter_strategy: JitterStrategy | None = None,
     overload_aware: bool = False,
+    budget: str | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """
     Decorator to retry a function with exponential backoff.
@@ -405,6 +410,8 @@ def retry_with_backoff(  # noqa: C901
         strategy: Retry strategy (exponential, linear, fixed, random)
         jitter_strategy: Jitter strategy for randomizing delays (default: from config)
         overload_aware: Enable extended retry behavior for 529/overload errors
+        budget: Dependency whose retry budget async retries draw from
+            (default: the decorated function's qualified name)
 
     Usage:
         @retry_with_backoff(max_attempts=3, exponential_base=2)
@@ -437,6 +444,8 @@ def retry_with_backoff(  # noqa: C901
     standard_jitter_strategy = jitter_strategy or retry_config.jitter_strategy
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        budget_name = budget or f"{func.__module__}.{func.__qualname__}"
+
         @functools.wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             """Async wrapper with retry logic.
@@ -454,6 +463,11 @@ def retry_with_backoff(  # noqa: C901
             current_jitter = standard_jitter_strategy
             switched_to_overload_config = False
 
+            # Each call deposits into the dependency's retry budget; retries withdraw
+            retry_budget = get_retry_budget(budget_name)
+            if retry_budget is not None:
+                retry_budget.record_request()
+
             with tracer.start_as_current_span(
                 f"retry.{func.__name__}",
                 attributes={
@@ -465,6 +479,8 @@ def retry_with_backoff(  # noqa: C901
                 attempt_number = 0
                 last_exception: Exception | None = None
                 prev_delay: float | None = None
+                deadline_exhausted = False
+                budget_exhausted = False
 
                 while attempt_number < current_max_attempts:
                     attempt_number += 1
@@ -522,6 +538,36 @@ def retry_with_backoff(  # noqa: C901
                         )
                         prev_delay = delay
 
+                        # Don't retry if the request deadline would pass before the next attempt
+                        remaining = get_remaining_time()
+                        if remaining is not None and delay >= remaining:
+                            deadline_exhausted = True
+                            span.set_attribute("retry.deadline_exhausted", True)
+                            logger.warning(
+                                f"Request deadline leaves no budget to retry {func.__name__}",
+                                extra={
+                                    "function": func.__name__,
+                                    "attempt": attempt_number,
+                                    "delay_seconds": delay,
+                                    "remaining_seconds": max(0.0, remaining),
+                                },
+                            )
+                            break
+
+                        # Fail fast when retries for this dependency are over budget
+                        if retry_budget is not None and not await retry_budget.acquire_retry():
+                            budget_exhausted = True
+                            span.set_attribute("retry.budget_exhausted", True)
+                            logger.warning(
+                                f"Retry budget exhausted for {budget_name}, not retrying {func.__name__}",
+                                extra={
+                                    "function": func.__name__,
+                                    "dependency": budget_name,
+                                    "attempt": attempt_number,
+                                },
+                            )
+                            break
+
                         # Log retry attempt
                         log_retry_attempt_manual(attempt_number, e, delay, func.__name__)
 
@@ -540,6 +586,8 @@ def retry_with_backoff(  # noqa: C901
                         "max_attempts": current_max_attempts,
                         "function": func.__name__,
                         "switched_to_overload": switched_to_overload_config,
+                        "deadline_exhausted": deadline_exhausted,
+                        "budget_exhausted": budget_exhausted,
                     },
                 )
 
@@ -555,6 +603,8 @@ def retry_with_backoff(  # noqa: C901
                         "max_attempts": current_max_attempts,
                         "function": func.__name__,
                         "switched_to_overload": switched_to_overload_config,
+                        "deadline_exhausted": deadline_exhausted,
+                        "budget_exhausted": budget_exhausted,
                     },
                 ) from last_exception
 
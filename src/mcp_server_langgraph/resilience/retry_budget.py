@@ -0,0 +1,272 @@
+"""
+Retry budgets to prevent retry storms.
+
+retry_with_backoff retries each failing call independently, so during a
+provider brownout every request turns into max_attempts requests exactly when
+the provider is weakest. A retry budget caps retries per dependency as a
+fraction of traffic (Finagle/gRPC style):
+
+- Every request deposits `ratio` tokens (0.1 → one retry per ten requests)
+- Every retry withdraws one token; with no token left, the retry is skipped
+- A small time-based reserve keeps low-traffic dependencies retryable
+- The balance is capped, so a quiet period cannot bank an unbounded burst
+
+Budgets are process-wide per dependency. With RETRY_BUDGET_DISTRIBUTED=true
+(and RESILIENCE_DISTRIBUTED_ENABLED=true) the balance lives in Redis and is
+shared by all replicas; deposits are batched locally and flushed with the
+next retry, so Redis is only hit when a retry is attempted.
+
+See ADR-0026 for design rationale.
+"""
+
+import logging
+import threading
+import time
+from typing import Any
+
+from mcp_server_langgraph.observability.telemetry import retry_budget_balance_gauge, retry_budget_exhausted_counter
+from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.distributed import _get_redis_client, is_distributed_enabled
+
+logger = logging.getLogger(__name__)
+
+# Tolerance for float accumulation (10 deposits of 0.1 must fund one retry)
+BALANCE_EPSILON = 1e-9
+
+
+# Flush pending deposits, refill the time-based reserve, then try to withdraw
+# one retry token. Returns {granted, balance}; balance as a string because Lua
+# numbers are truncated to integers on the way out.
+RETRY_BUDGET_WITHDRAW_SCRIPT = """
+local key = KEYS[1]
+local ratio = tonumber(ARGV[1])
+local min_rate = tonumber(ARGV[2])
+local max_balance = tonumber(ARGV[3])
+local deposits = tonumber(ARGV[4])
+
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', key, 'balance', 'ts')
+local balance = tonumber(state[1])
+local ts = tonumber(state[2])
+if balance == nil then
+  balance = max_balance
+  ts = now
+end
+
+balance = math.min(max_balance, balance + math.max(0, now - ts) * min_rate + deposits * ratio)
+
+local granted = 0
+if balance >= 1 - 1e-9 then
+  balance = math.max(0, balance - 1)
+  granted = 1
+end
+
+redis.call('HSET', key, 'balance', balance, 'ts', now)
+redis.call('EXPIRE', key, 3600)
+return {granted, tostring(balance)}
+"""
+
+
+class RetryBudget:
+    """
+    Token-bucket retry budget for one dependency.
+
+    Example:
+        >>> budget = RetryBudget("llm", ratio=0.1)
+        >>> budget.record_request()
+        >>> if await budget.acquire_retry():
+        ...     ...  # retry allowed
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_balance: float = 10.0,
+        redis_client: Any = None,
+        key_prefix: str = "resilience",
+    ):
+        """
+        Initialize retry budget.
+
+        Args:
+            name: Dependency name (used in metrics and the Redis key)
+            ratio: Retry tokens deposited per request
+            min_retries_per_second: Time-based reserve refill rate
+            max_balance: Max retry tokens that can accumulate
+            redis_client: redis.asyncio client to share the budget across replicas (None = local only)
+            key_prefix: Redis key prefix
+        """
+        self.name = name
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self.redis_client = redis_client
+        self.key = f"{key_prefix}:retry_budget:{name}"
+
+        self._balance = max_balance
+        self._last_refill = time.monotonic()
+        self._pending_deposits = 0
+        self._requests = 0
+        self._retries = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+        attributes = {"dependency": name}
+        self._balance_gauge = retry_budget_balance_gauge.bind(attributes)
+        self._exhausted_counter = retry_budget_exhausted_counter.bind(attributes)
+
+    @property
+    def balance(self) -> float:
+        """Retry tokens currently available locally."""
+        with self._lock:
+            self._refill()
+            return self._balance
+
+    def _refill(self) -> None:
+        """Add the time-based reserve (caller holds the lock)."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._balance = min(self.max_balance, self._balance + elapsed * self.min_retries_per_second)
+        self._last_refill = now
+
+    def record_request(self) -> None:
+        """Deposit tokens for one original (non-retry) request."""
+        with self._lock:
+            self._requests += 1
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+            if self.redis_client is not None:
+                self._pending_deposits += 1
+
+    def try_acquire_retry(self) -> bool:
+        """Withdraw one retry token from the local balance."""
+        with self._lock:
+            self._refill()
+            if self._balance >= 1 - BALANCE_EPSILON:
+                self._balance = max(0.0, self._balance - 1)
+                self._retries += 1
+                granted = True
+            else:
+                self._rejected += 1
+                granted = False
+            balance = self._balance
+
+        self._record(granted, balance)
+        return granted
+
+    async def acquire_retry(self) -> bool:
+        """
+        Withdraw one retry token, from Redis when the budget is shared.
+
+        Falls back to the local balance if Redis is unreachable.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        if self.redis_client is None:
+            return self.try_acquire_retry()
+
+        with self._lock:
+            deposits, self._pending_deposits = self._pending_deposits, 0
+
+        try:
+            granted_raw, balance_raw = await self.redis_client.eval(
+                RETRY_BUDGET_WITHDRAW_SCRIPT,
+                1,
+                self.key,
+                self.ratio,
+                self.min_retries_per_second,
+                self.max_balance,
+                deposits,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Shared retry budget unavailable for {self.name}, using local budget: {e}",
+                extra={"dependency": self.name},
+            )
+            return self.try_acquire_retry()
+
+        granted = int(granted_raw) == 1
+        with self._lock:
+            if granted:
+                self._retries += 1
+            else:
+                self._rejected += 1
+
+        self._record(granted, float(balance_raw))
+        return granted
+
+    def _record(self, granted: bool, balance: float) -> None:
+        """Emit budget metrics."""
+        self._balance_gauge.set(balance)
+        if not granted:
+            self._exhausted_counter.add(1)
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get retry budget statistics."""
+        with self._lock:
+            self._refill()
+            return {
+                "balance": self._balance,
+                "requests": self._requests,
+                "retries": self._retries,
+                "rejected_retries": self._rejected,
+                "ratio": self.ratio,
+            }
+
+
+# =============================================================================
+# Global Registry
+# =============================================================================
+
+_retry_budgets: dict[str, RetryBudget] = {}
+_budget_lock = threading.Lock()
+
+
+def get_retry_budget(dependency: str) -> RetryBudget | None:
+    """
+    Get or create the process-wide retry budget for a dependency.
+
+    Args:
+        dependency: Dependency name (llm, openfga, ...)
+
+    Returns:
+        RetryBudget, or None if retry budgets are disabled
+    """
+    config = get_resilience_config()
+    budget_config = config.retry.budget
+    if not budget_config.enabled:
+        return None
+
+    with _budget_lock:
+        if dependency not in _retry_budgets:
+            shared = budget_config.distributed and is_distributed_enabled()
+            _retry_budgets[dependency] = RetryBudget(
+                name=dependency,
+                ratio=budget_config.ratio,
+                min_retries_per_second=budget_config.min_retries_per_second,
+                max_balance=budget_config.max_balance,
+                redis_client=_get_redis_client() if shared else None,
+                key_prefix=config.distributed.key_prefix,
+            )
+        return _retry_budgets[dependency]
+
+
+def reset_all_retry_budgets() -> None:
+    """
+    Reset all retry budgets (for testing).
+
+    Warning: Only use for testing! In production, budgets should persist.
+    """
+    with _budget_lock:
+        _retry_budgets.clear()
+
+
+def get_all_retry_budget_stats() -> dict[str, dict[str, int | float]]:
+    """Get statistics for all retry budgets."""
+    with _budget_lock:
+        budgets = list(_retry_budgets.items())
+    return {name: budget.get_stats() for name, budget in budgets}
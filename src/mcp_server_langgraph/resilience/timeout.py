@@ -3,6 +3,7 @@ Timeout enforcement for async operations.
 
 Prevents hanging requests by enforcing time limits on all async operations.
 Uses asyncio.timeout() (Python 3.11+) or asyncio.wait_for() (Python 3.10).
+Timeouts are bounded by the request deadline (resilience.deadline) when one is set.
 
 See ADR-0026 for design rationale.
 """
@@ -17,6 +18,7 @@ from opentelemetry import trace
 
 from mcp_server_langgraph.observability.telemetry import timeout_exceeded_counter
 from mcp_server_langgraph.resilience.config import get_resilience_config
+from mcp_server_langgraph.resilience.deadline import get_remaining_time
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -113,16 +115,28 @@ def with_timeout(
         @functools.wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             """Async wrapper with timeout enforcement"""
+            # Never wait past the request deadline, if one is set
+            effective_timeout: float = timeout_value
+            remaining = get_remaining_time()
+            deadline_bound = remaining is not None and remaining < timeout_value
+            if remaining is not None and deadline_bound:
+                effective_timeout = max(0.0, remaining)
+
             with tracer.start_as_current_span(
                 f"timeout.{func.__name__}",
                 attributes={
-                    "timeout.seconds": timeout_value,
+                    "timeout.seconds": effective_timeout,
                     "timeout.operation_type": operation_type or "default",
+                    "timeout.deadline_bound": deadline_bound,
                 },
             ) as span:
                 try:
+                    if effective_timeout <= 0:
+                        # Request deadline already passed: don't start the call
+                        raise TimeoutError
+
                     # Use asyncio.timeout() for Python 3.11+
-                    async with asyncio.timeout(timeout_value):
+                    async with asyncio.timeout(effective_timeout):
                         result = await func(*args, **kwargs)  # type: ignore[misc]
 
                     span.set_attribute("timeout.exceeded", False)
@@ -133,11 +147,12 @@ def with_timeout(
                     span.set_attribute("timeout.exceeded", True)
 
                     logger.warning(
-                        f"Timeout exceeded: {func.__name__} ({timeout_value}s)",
+                        f"Timeout exceeded: {func.__name__} ({effective_timeout:g}s)",
                         extra={
                             "function": func.__name__,
-                            "timeout_seconds": timeout_value,
+                            "timeout_seconds": effective_timeout,
                             "operation_type": operation_type or "default",
+                            "deadline_bound": deadline_bound,
                         },
                     )
 
@@ -155,10 +170,10 @@ def with_timeout(
                     from mcp_server_langgraph.core.exceptions import TimeoutError as MCPTimeoutError
 
                     raise MCPTimeoutError(
-                        message=f"Operation timed out after {timeout_value}s",
+                        message=f"Operation timed out after {effective_timeout:g}s",
                         metadata={
                             "function": func.__name__,
-                            "timeout_seconds": timeout_value,
+                            "timeout_seconds": effective_timeout,
                             "operation_type": operation_type or "default",
                         },
                     ) from e
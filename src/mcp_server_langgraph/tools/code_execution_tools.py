@@ -5,27 +5,32 @@ Provides secure Python code execution in sandboxed environments.
 Integrates CodeValidator and Sandbox backends (Docker, Kubernetes).
 """
 
+import asyncio
 import logging
+import threading
 
-from langchain_core.tools import tool
+from langchain_core.callbacks import adispatch_custom_event
+from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
 from mcp_server_langgraph.core.config import settings
-from mcp_server_langgraph.execution import (
-    CodeValidator,
-    DockerSandbox,
-    ExecutionResult,
-    KubernetesSandbox,
-    ResourceLimits,
-    Sandbox,
-    SandboxError,
-)
+from mcp_server_langgraph.execution import CodeValidator, ExecutionResult, ResourceLimits, Sandbox, SandboxError
 
 logger = logging.getLogger(__name__)
 
 # Maximum output size to prevent memory exhaustion
 MAX_OUTPUT_SIZE = 10000  # 10KB
 
+# Sandboxes are reused across calls (one API client and warm pool per
+# configuration) and rebuilt when the relevant settings change. Calls arrive
+# from worker threads (asyncio.to_thread), so lookup and creation are locked.
+# A replaced sandbox may still be running code, so it is only closed once its
+# last in-flight execution releases it.
+_sandbox_cache: dict[tuple[object, ...], Sandbox] = {}
+_sandbox_leases: dict[int, int] = {}  # id(sandbox) -> in-flight executions
+_retired_sandboxes: dict[int, Sandbox] = {}
+_sandbox_lock = threading.Lock()
+
 
 class ExecutePythonInput(BaseModel):
     """Input schema for execute_python tool"""
@@ -39,9 +44,16 @@ def _is_execution_enabled() -> bool:
     return settings.enable_code_execution
 
 
-def _get_sandbox() -> Sandbox:
+def _get_sandbox(lease: bool = False) -> Sandbox:
     """
-    Create sandbox instance based on configuration.
+    Get the sandbox instance for the current configuration.
+
+    The sandbox is created on first use and cached, so the Docker client and
+    its warm container pool are shared by every execute_python call.
+
+    Args:
+        lease: Hold the sandbox open until _release_sandbox() is called, even if
+            a settings change replaces it in the meantime
 
     Returns:
         Sandbox instance (Docker or Kubernetes)
@@ -63,18 +75,85 @@ def _get_sandbox() -> Sandbox:
     # Select backend
     backend = settings.code_execution_backend
 
+    key = (
+        backend,
+        limits,
+        settings.code_execution_docker_image,
+        settings.code_execution_docker_socket,
+        settings.code_execution_pool_min_idle,
+        settings.code_execution_pool_max_total,
+        settings.code_execution_k8s_namespace,
+        settings.code_execution_k8s_job_ttl,
+        settings.code_execution_k8s_pool_min_idle,
+        settings.code_execution_k8s_pool_max_total,
+    )
+    idle_sandboxes: list[Sandbox] = []
+    with _sandbox_lock:
+        sandbox = _sandbox_cache.get(key)
+        if sandbox is None:
+            sandbox = _create_sandbox(backend, limits)
+            for stale in _sandbox_cache.values():
+                if _sandbox_leases.get(id(stale)):
+                    _retired_sandboxes[id(stale)] = stale
+                else:
+                    idle_sandboxes.append(stale)
+            _sandbox_cache.clear()
+            _sandbox_cache[key] = sandbox
+        if lease:
+            _sandbox_leases[id(sandbox)] = _sandbox_leases.get(id(sandbox), 0) + 1
+
+    for stale in idle_sandboxes:
+        _close_sandbox(stale)
+    return sandbox
+
+
+def _release_sandbox(sandbox: Sandbox) -> None:
+    """Release a lease taken by _get_sandbox(lease=True), closing the sandbox if it was replaced."""
+    with _sandbox_lock:
+        remaining = _sandbox_leases.get(id(sandbox), 0) - 1
+        if remaining > 0:
+            _sandbox_leases[id(sandbox)] = remaining
+            return
+        _sandbox_leases.pop(id(sandbox), None)
+        retired = _retired_sandboxes.pop(id(sandbox), None)
+
+    if retired is not None:
+        _close_sandbox(retired)
+
+
+def _close_sandbox(sandbox: Sandbox) -> None:
+    """Close a sandbox that is no longer cached, releasing its client and warm pool."""
+    if hasattr(sandbox, "close"):
+        sandbox.close()
+
+
+def _create_sandbox(backend: str, limits: ResourceLimits) -> Sandbox:
+    """Create a sandbox for the configured backend."""
+    # Backends are imported here so the docker/kubernetes clients only load when code runs
     if backend == "docker-engine":
+        from mcp_server_langgraph.execution.docker_sandbox import DockerSandbox
+
         return DockerSandbox(
             limits=limits,
             image=settings.code_execution_docker_image,
             socket_path=settings.code_execution_docker_socket,
+            pool_min_idle=settings.code_execution_pool_min_idle,
+            pool_max_total=settings.code_execution_pool_max_total,
         )
     elif backend == "kubernetes":
+        try:
+            from mcp_server_langgraph.execution.kubernetes_sandbox import KubernetesSandbox
+        except ImportError as e:
+            msg = f"Kubernetes backend requires the kubernetes package: {e}"
+            raise SandboxError(msg) from e
+
         return KubernetesSandbox(
             limits=limits,
             namespace=settings.code_execution_k8s_namespace,
             image=settings.code_execution_docker_image,  # Same image for both
             job_ttl=settings.code_execution_k8s_job_ttl,
+            pool_min_idle=settings.code_execution_k8s_pool_min_idle,
+            pool_max_total=settings.code_execution_k8s_pool_max_total,
         )
     else:
         msg = f"Unsupported backend: {backend}"
@@ -99,8 +178,81 @@ def _truncate_output(text: str, max_size: int = MAX_OUTPUT_SIZE) -> str:
     return f"{truncated}\n\n... (output truncated, {len(text)} total characters)"
 
 
-@tool
-def execute_python(code: str, timeout: int | None = None) -> str:
+def _validate_code(code: str) -> str | None:
+    """
+    Validate code before execution.
+
+    Returns:
+        The tool response to return instead of executing, or None if the code may run
+    """
+    # Validate input
+    if not code or not code.strip():
+        return "Error: Empty code provided"
+
+    validator = CodeValidator(allowed_imports=settings.code_execution_allowed_imports)
+    validation_result = validator.validate(code)
+
+    if not validation_result.is_valid:
+        errors = "\n- ".join(validation_result.errors)
+        return f"Code validation failed:\n- {errors}"
+
+    # Log warnings if any
+    if validation_result.warnings:
+        warnings = "\n- ".join(validation_result.warnings)
+        logger.warning(f"Code validation warnings:\n- {warnings}")
+
+    return None
+
+
+def _format_result(result: ExecutionResult) -> str:
+    """Format an execution result as the tool response."""
+    if result.success:
+        output = _truncate_output(result.stdout)
+        exec_time = f"{result.execution_time:.2f}s"
+
+        response = f"Execution successful (took {exec_time}):\n"
+        if output:
+            response += f"\nOutput:\n{output}"
+        else:
+            response += "\n(no output)"
+
+        if result.memory_used_mb:
+            response += f"\n\nMemory used: {result.memory_used_mb:.1f}MB"
+
+        return response
+
+    # Execution failed
+    stderr = _truncate_output(result.stderr)
+    exec_time = f"{result.execution_time:.2f}s"
+
+    if result.timed_out:
+        return f"Execution timed out after {exec_time}:\n{stderr}"
+
+    response = f"Execution failed (exit code {result.exit_code}, took {exec_time}):\n"
+    if stderr:
+        response += f"\nError:\n{stderr}"
+    elif result.error_message:
+        response += f"\nError: {result.error_message}"
+    else:
+        response += "\n(no error details available)"
+
+    return response
+
+
+async def _dispatch_output(stream: str, text: str) -> None:
+    """
+    Surface output chunks as a "code_execution_output" custom event.
+
+    Callers consuming the graph with astream_events() see output while the
+    code is still running.
+    """
+    try:
+        await adispatch_custom_event("code_execution_output", {"stream": stream, "text": text})
+    except RuntimeError:
+        pass  # Invoked outside a runnable (no parent run to attach the event to)
+
+
+def _execute_python(code: str, timeout: int | None = None) -> str:
     """
     Execute Python code in a secure sandboxed environment.
 
@@ -131,63 +283,41 @@ def execute_python(code: str, timeout: int | None = None) -> str:
     # This provides access control without needing runtime checks here.
     # Previous _is_execution_enabled() check removed due to settings caching issues in tests.
 
-    # Validate input
-    if not code or not code.strip():
-        return "Error: Empty code provided"
-
     try:
-        # Validate code
-        validator = CodeValidator(allowed_imports=settings.code_execution_allowed_imports)
-        validation_result = validator.validate(code)
-
-        if not validation_result.is_valid:
-            errors = "\n- ".join(validation_result.errors)
-            return f"Code validation failed:\n- {errors}"
+        rejection = _validate_code(code)
+        if rejection is not None:
+            return rejection
 
-        # Log warnings if any
-        if validation_result.warnings:
-            warnings = "\n- ".join(validation_result.warnings)
-            logger.warning(f"Code validation warnings:\n- {warnings}")
+        sandbox = _get_sandbox(lease=True)
+        try:
+            result: ExecutionResult = sandbox.execute(code)
+        finally:
+            _release_sandbox(sandbox)
+        return _format_result(result)
 
-        # Get sandbox
-        sandbox = _get_sandbox()
-
-        # Execute code
-        result: ExecutionResult = sandbox.execute(code)
-
-        # Format result
-        if result.success:
-            output = _truncate_output(result.stdout)
-            exec_time = f"{result.execution_time:.2f}s"
-
-            response = f"Execution successful (took {exec_time}):\n"
-            if output:
-                response += f"\nOutput:\n{output}"
-            else:
-                response += "\n(no output)"
-
-            if result.memory_used_mb:
-                response += f"\n\nMemory used: {result.memory_used_mb:.1f}MB"
-
-            return response
+    except SandboxError as e:
+        logger.error(f"Sandbox error: {e}", exc_info=True)
+        return f"Sandbox error: {e}"
+    except Exception as e:
+        logger.error(f"Unexpected error during code execution: {e}", exc_info=True)
+        return f"Unexpected error: {e}"
 
-        else:
-            # Execution failed
-            stderr = _truncate_output(result.stderr)
-            exec_time = f"{result.execution_time:.2f}s"
-
-            if result.timed_out:
-                return f"Execution timed out after {exec_time}:\n{stderr}"
-            else:
-                response = f"Execution failed (exit code {result.exit_code}, took {exec_time}):\n"
-                if stderr:
-                    response += f"\nError:\n{stderr}"
-                elif result.error_message:
-                    response += f"\nError: {result.error_message}"
-                else:
-                    response += "\n(no error details available)"
 
-                return response
+async def _aexecute_python(code: str, timeout: int | None = None) -> str:
+    """Async execute_python: runs the sandbox off the event loop and streams output as custom events."""
+    try:
+        rejection = _validate_code(code)
+        if rejection is not None:
+            return rejection
+
+        # Building the sandbox may connect to Docker / Kubernetes, so it is offloaded too
+        sandbox = await asyncio.to_thread(_get_sandbox, lease=True)
+        try:
+            result = await sandbox.aexecute(code, on_output=_dispatch_output)
+        finally:
+            # Closing a replaced sandbox may stop pooled containers, so keep it off the loop
+            await asyncio.to_thread(_release_sandbox, sandbox)
+        return _format_result(result)
 
     except SandboxError as e:
         logger.error(f"Sandbox error: {e}", exc_info=True)
@@ -195,3 +325,13 @@ def execute_python(code: str, timeout: int | None = None) -> str:
     except Exception as e:
         logger.error(f"Unexpected error during code execution: {e}", exc_info=True)
         return f"Unexpected error: {e}"
+
+
+# Sync invoke() runs _execute_python; ainvoke() (the async agent graph and MCP
+# handlers) runs _aexecute_python without blocking the event loop
+execute_python = StructuredTool.from_function(
+    func=_execute_python,
+    coroutine=_aexecute_python,
+    name="execute_python",
+    args_schema=ExecutePythonInput,
+)
@@ -4,33 +4,64 @@ Search tools for querying information
 Provides knowledge base and web search capabilities for the agent.
 """
 
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 import httpx
-from langchain_core.tools import tool
-from pydantic import Field
-from qdrant_client import QdrantClient
+from langchain_core.tools import StructuredTool, tool
+from pydantic import BaseModel, Field
 
 from mcp_server_langgraph.core.config import settings
+from mcp_server_langgraph.core.dynamic_context_loader import ContextReference, DynamicContextLoader
 from mcp_server_langgraph.observability.telemetry import logger, metrics
 
+# Shared loader; its BM25 index is rebuilt from the collection on first use
+_knowledge_base: DynamicContextLoader | None = None
+# asyncio locks are bound to one event loop; sync invoke() runs its own loops
+_knowledge_base_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
 
-@tool
-def search_knowledge_base(
-    query: Annotated[str, Field(description="Search query to find relevant information")],
-    limit: Annotated[int, Field(ge=1, le=20, description="Maximum number of results (1-20)")] = 5,
-) -> str:
-    """
-    Search internal knowledge base for relevant information.
 
-    Use this to find:
-    - Documentation and guides
-    - Previous conversations and context
-    - System configuration
-    - Frequently asked questions
+class SearchKnowledgeBaseInput(BaseModel):
+    """Input schema for search_knowledge_base"""
 
-    Returns top matching results with relevance scores.
-    """
+    query: str = Field(description="Search query to find relevant information")
+    limit: int = Field(default=5, ge=1, le=20, description="Maximum number of results (1-20)")
+
+
+async def _get_knowledge_base() -> DynamicContextLoader:
+    """Create the knowledge base loader (connects to Qdrant and loads the embedder) once."""
+    global _knowledge_base
+    if _knowledge_base is not None:
+        return _knowledge_base
+    # Concurrent first calls wait for a single full-collection rebuild
+    loop = asyncio.get_running_loop()
+    lock = _knowledge_base_locks.get(loop)
+    if lock is None:
+        lock = _knowledge_base_locks[loop] = asyncio.Lock()
+    async with lock:
+        if _knowledge_base is None:
+            loader = await asyncio.to_thread(DynamicContextLoader)
+            await loader.rebuild_lexical_index()
+            _knowledge_base = loader
+    return _knowledge_base
+
+
+def _format_results(query: str, collection_name: str, references: list[ContextReference]) -> str:
+    """Format search hits as a numbered list with relevance scores."""
+    if not references:
+        return f'No knowledge base results for "{query}" in collection {collection_name}.'
+
+    lines = [f'Knowledge base search: "{query}"', f"Collection: {collection_name}", ""]
+    for i, ref in enumerate(references, 1):
+        score = f", score: {ref.relevance_score:.2f}" if ref.relevance_score is not None else ""
+        lines.append(f"{i}. [{ref.ref_type}] {ref.summary} (id: {ref.ref_id}{score})")
+    return "\n".join(lines)
+
+
+async def _asearch_knowledge_base(query: str, limit: int = 5) -> str:
+    """Async search_knowledge_base: searches without blocking the event loop."""
     try:
         logger.info("Knowledge base search invoked", extra={"query": query, "limit": limit})
         metrics.tool_calls.add(1, {"tool": "search_knowledge_base"})
@@ -47,45 +78,58 @@ To enable:
 
 See: docs/advanced/dynamic-context.md"""
 
-        # Query Qdrant for semantic search
         try:
-            client = QdrantClient(  # noqa: F841
-                url=settings.qdrant_url,
-                port=getattr(settings, "qdrant_port", 6333),
-            )
-
-            # Use configured collection or default
-            collection_name = getattr(settings, "qdrant_collection_name", "mcp_context")
-
-            # Perform semantic search (requires embeddings)
-            # Note: This assumes documents are already indexed
-            # For full implementation, add embedding generation here
-
-            results_text = f"""Knowledge base search: "{query}"
-
-Connected to Qdrant at {settings.qdrant_url}:{getattr(settings, "qdrant_port", 6333)}
-Collection: {collection_name}
-
-Note: Semantic search requires embeddings and indexed documents.
-Configure EMBEDDING_PROVIDER and index your knowledge base.
-
-For setup: See docs/advanced/dynamic-context.md"""
-
-            logger.info("Knowledge base search completed", extra={"query": query})
-            return results_text
-
+            loader = await _get_knowledge_base()
         except Exception as e:
-            logger.warning(f"Qdrant query failed: {e}")
+            logger.warning(f"Qdrant connection failed: {e}")
             return f"""Knowledge base search error: {e}
 
 Verify Qdrant is running and accessible at {settings.qdrant_url}"""
 
+        references = await loader.hybrid_search(query, top_k=limit)
+
+        logger.info("Knowledge base search completed", extra={"query": query, "results": len(references)})
+        return _format_results(query, loader.collection_name, references)
+
     except Exception as e:
         error_msg = f"Error searching knowledge base: {e}"
         logger.error(error_msg, exc_info=True)
         return f"Error: {e}"
 
 
+def _search_knowledge_base(query: str, limit: int = 5) -> str:
+    """
+    Search internal knowledge base for relevant information.
+
+    Use this to find:
+    - Documentation and guides
+    - Previous conversations and context
+    - System configuration
+    - Frequently asked questions
+
+    Exact IDs and code symbols are matched lexically; other queries combine
+    keyword and semantic search. Returns top matching results with relevance scores.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_asearch_knowledge_base(query, limit))
+    # This thread already runs an event loop, which asyncio.run() refuses to nest
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="search-kb") as executor:
+        return executor.submit(asyncio.run, _asearch_knowledge_base(query, limit)).result()
+
+
+# Sync invoke() runs the search in its own event loop (in a worker thread when
+# called from a running loop); ainvoke() (the async agent graph and MCP handlers)
+# awaits it directly
+search_knowledge_base = StructuredTool.from_function(
+    func=_search_knowledge_base,
+    coroutine=_asearch_knowledge_base,
+    name="search_knowledge_base",
+    args_schema=SearchKnowledgeBaseInput,
+)
+
+
 @tool
 async def web_search(
     query: Annotated[str, Field(description="Search query for web search")],
@@ -9,7 +9,6 @@ Implements Anthropic's best practices for writing tools for agents:
 
 from typing import Any, Literal
 
-import litellm
 
 from mcp_server_langgraph.observability.telemetry import logger
 
@@ -64,6 +63,9 @@ class ResponseOptimizer:
         if not text:
             return 0  # Empty text = 0 tokens
 
+        # Imported on first use: LiteLLM takes seconds to import
+        import litellm
+
         try:
             # Use LiteLLM's model-aware token counting
             token_count: int = litellm.token_counter(model=self.model, text=text)  # type: ignore[attr-defined]
@@ -1529,15 +1529,24 @@ def reset_resilience_state(request):
     except ImportError:
         reset_bulkhead = None
 
+    try:
+        from mcp_server_langgraph.resilience.retry_budget import reset_all_retry_budgets
+    except ImportError:
+        reset_all_retry_budgets = None
+
     # Reset before test
     _reset_circuit_breakers(reset_circuit_breaker)
     _reset_bulkheads(reset_bulkhead)
+    if reset_all_retry_budgets:
+        reset_all_retry_budgets()
 
     yield
 
     # Cleanup after test (helps with test isolation)
     _reset_circuit_breakers(reset_circuit_breaker)
     _reset_bulkheads(reset_bulkhead)
+    if reset_all_retry_budgets:
+        reset_all_retry_budgets()
 
 
 # ==============================================================================
@@ -0,0 +1,190 @@
+"""
+Tests for Hierarchical Pattern
+
+Covers sync execution with concurrent managers and the async variant:
+parallel fan-out, per-worker timeouts and checkpointer support.
+"""
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+from mcp_server_langgraph.patterns.hierarchical import HierarchicalCoordinator
+
+# xdist_group for integration test worker isolation
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(name="integration_patterns_hierarchical_tests")]
+
+
+def teardown_module():
+    """Force GC to prevent mock accumulation in xdist workers"""
+    gc.collect()
+
+
+@pytest.fixture(autouse=True)
+def teardown_method_hierarchical():
+    """Force GC after each teardown_method to prevent mock accumulation in xdist workers"""
+    yield
+    gc.collect()
+
+
+def _ceo(project: str) -> str:
+    return f"Plan for {project}"
+
+
+def _slow_agent(label: str, delay: float = 0.2):
+    async def agent(task: str) -> str:
+        await asyncio.sleep(delay)
+        return label
+
+    return agent
+
+
+def _coordinator(num_managers: int = 3, num_workers: int = 3, delay: float = 0.2, **kwargs) -> HierarchicalCoordinator:
+    managers = {f"manager{m}": _slow_agent(f"analysis {m}", delay) for m in range(num_managers)}
+    workers = {f"manager{m}": [_slow_agent(f"result {m}.{w}", delay) for w in range(num_workers)] for m in range(num_managers)}
+    return HierarchicalCoordinator(ceo_agent=_ceo, managers=managers, workers=workers, **kwargs)
+
+
+# ==============================================================================
+# Sync Execution Tests
+# ==============================================================================
+
+
+@pytest.mark.unit
+def test_invoke_with_multiple_managers_merges_reports():
+    """Test managers in the same step merge their reports instead of conflicting."""
+
+    def manager(task: str) -> str:
+        return "analysis"
+
+    def worker(task: str) -> str:
+        return "done"
+
+    hierarchy = HierarchicalCoordinator(
+        ceo_agent=_ceo,
+        managers={"research": manager, "dev": manager},
+        workers={"research": [worker], "dev": [worker, worker]},
+    )
+
+    result = hierarchy.invoke("Build feature")
+
+    assert set(result["manager_reports"]) == {"research", "dev"}
+    assert result["execution_path"][0] == "CEO"
+    assert result["execution_path"][-1] == "Consolidation"
+    assert result["total_agents"] == 1 + 2 + 3 + 1
+    assert "- Workers: 3" in result["final_report"]
+
+
+# ==============================================================================
+# Async Execution Tests
+# ==============================================================================
+
+
+@pytest.mark.unit
+async def test_ainvoke_takes_time_of_slowest_branch():
+    """Test 3 managers x 3 workers run concurrently rather than one after another."""
+    hierarchy = _coordinator(num_managers=3, num_workers=3, delay=0.2)
+
+    start = time.perf_counter()
+    result = await hierarchy.ainvoke("Build feature")
+    elapsed = time.perf_counter() - start
+
+    # Sequential execution would take 12 x 0.2s
+    assert elapsed < 1.0
+    assert len(result["manager_reports"]) == 3
+    assert "result 2.1" in result["manager_reports"]["manager2"]
+
+
+@pytest.mark.unit
+async def test_ainvoke_keeps_worker_order_in_reports():
+    """Test results are reported in worker order even when they finish out of order."""
+    hierarchy = HierarchicalCoordinator(
+        ceo_agent=_ceo,
+        managers={"dev": _slow_agent("analysis", 0)},
+        workers={"dev": [_slow_agent("slow", 0.1), _slow_agent("fast", 0)]},
+    )
+
+    result = await hierarchy.ainvoke("Build feature")
+
+    assert result["manager_reports"]["dev"].index("1. slow") < result["manager_reports"]["dev"].index("2. fast")
+    # Path records completion order
+    assert result["execution_path"][2:4] == ["Worker:dev_1", "Worker:dev_0"]
+
+
+@pytest.mark.unit
+async def test_ainvoke_worker_timeout_and_failure_recorded():
+    """Test a slow or failing worker is reported as an error without failing its branch."""
+
+    def failing_worker(task: str) -> str:
+        raise ValueError("worker crashed")
+
+    hierarchy = HierarchicalCoordinator(
+        ceo_agent=_ceo,
+        managers={"dev": _slow_agent("analysis", 0)},
+        workers={"dev": [_slow_agent("stuck", 5), failing_worker, _slow_agent("ok", 0)]},
+        worker_timeout=0.1,
+    )
+
+    result = await asyncio.wait_for(hierarchy.ainvoke("Build feature"), timeout=2)
+
+    report = result["manager_reports"]["dev"]
+    assert "1. Error: worker timed out after 0.1s" in report
+    assert "2. Error: worker crashed" in report
+    assert "3. ok" in report
+
+
+@pytest.mark.unit
+async def test_ainvoke_worker_raising_timeout_without_worker_timeout():
+    """Test a worker's own TimeoutError is recorded as an error when no worker_timeout is set."""
+
+    async def timing_out_worker(task: str) -> str:
+        raise TimeoutError("upstream timed out")
+
+    hierarchy = HierarchicalCoordinator(
+        ceo_agent=_ceo,
+        managers={"dev": _slow_agent("analysis", 0)},
+        workers={"dev": [timing_out_worker, _slow_agent("ok", 0)]},
+    )
+
+    result = await hierarchy.ainvoke("Build feature")
+
+    report = result["manager_reports"]["dev"]
+    assert "1. Error: upstream timed out" in report
+    assert "2. ok" in report
+
+
+@pytest.mark.unit
+async def test_ainvoke_with_checkpointer():
+    """Test ainvoke persists state through a checkpointer."""
+    from langgraph.checkpoint.memory import MemorySaver
+
+    checkpointer = MemorySaver()
+    hierarchy = _coordinator(num_managers=2, num_workers=2, delay=0)
+    config = {"configurable": {"thread_id": "hierarchy-thread"}}
+
+    result = await hierarchy.ainvoke("Build feature", config=config, checkpointer=checkpointer)
+
+    saved = await checkpointer.aget_tuple(config)
+    assert saved is not None
+    assert saved.checkpoint["channel_values"]["final_report"] == result["final_report"]
+
+
+@pytest.mark.unit
+async def test_ainvoke_twice_on_one_thread_starts_fresh():
+    """Test a second run on a checkpointed thread does not accumulate the first run's state."""
+    from langgraph.checkpoint.memory import MemorySaver
+
+    checkpointer = MemorySaver()
+    hierarchy = _coordinator(num_managers=2, num_workers=2, delay=0)
+    config = {"configurable": {"thread_id": "hierarchy-rerun"}}
+
+    first = await hierarchy.ainvoke("Build feature", config=config, checkpointer=checkpointer)
+    second = await hierarchy.ainvoke("Ship feature", config=config, checkpointer=checkpointer)
+
+    assert second["total_agents"] == first["total_agents"] == 1 + 2 * 3 + 1
+    assert second["execution_path"].count("CEO") == 1
+    assert set(second["manager_reports"]) == {"manager0", "manager1"}
+    assert "Build feature" not in second["final_report"]
+    assert second["final_report"].count("CEO → ") == 1
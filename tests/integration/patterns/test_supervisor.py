@@ -280,3 +280,102 @@ def test_supervisor_calls_agents_correctly():
     # Verify agent was called
     mock_agent.assert_called()
     assert result is not None
+
+
+# ==============================================================================
+# Parallel (Plan-then-Fanout) Tests
+# ==============================================================================
+
+
+@pytest.mark.unit
+def test_parallel_strategy_runs_planned_tasks_concurrently():
+    """Test planned sub-tasks are dispatched at the same time, not one after another."""
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def agent(task: str) -> str:
+        barrier.wait()  # Deadlocks unless all three sub-tasks run concurrently
+        return f"done: {task}"
+
+    supervisor = Supervisor(
+        agents={"research": agent, "writer": agent},
+        routing_strategy="parallel",
+        planner=lambda task: [("research", "market"), ("research", "competitors"), ("writer", task)],
+    )
+
+    result = supervisor.invoke("Write a report")
+
+    assert result["agent_results"]["research"] == ["done: market", "done: competitors"]
+    assert result["agent_results"]["writer"] == "done: Write a report"
+    assert [r["task"] for r in result["task_results"]] == ["market", "competitors", "Write a report"]
+    assert "**Research (market):** done: market" in result["final_result"]
+
+
+@pytest.mark.unit
+def test_parallel_strategy_memoizes_identical_sub_tasks():
+    """Test an identical (worker, sub-task) pair runs once per run."""
+    mock_agent = Mock(return_value="answer")
+
+    supervisor = Supervisor(
+        agents={"research": mock_agent},
+        routing_strategy="parallel",
+        planner=lambda task: [("research", "same"), ("research", "same"), ("research", "other")],
+    )
+
+    result = supervisor.invoke("test")
+
+    assert mock_agent.call_count == 2
+    assert [r["cached"] for r in result["task_results"]] == [False, True, False]
+    assert result["agent_history"] == ["research", "research"]
+
+    supervisor.invoke("test")
+    assert mock_agent.call_count == 4  # Memo does not outlive the run
+
+
+@pytest.mark.unit
+def test_parallel_strategy_defaults_to_all_agents_and_handles_errors():
+    """Test the default plan sends the task to every agent and failures become results."""
+
+    def failing_agent(task: str) -> str:
+        raise ValueError("Agent error")
+
+    supervisor = Supervisor(
+        agents={"working": lambda task: "Success", "failing": failing_agent},
+        routing_strategy="parallel",
+    )
+
+    result = supervisor.invoke("test")
+
+    assert result["agent_results"] == {"working": "Success", "failing": "Error: Agent error"}
+    assert result["agent_history"] == ["working", "failing"]
+
+
+@pytest.mark.unit
+async def test_parallel_strategy_ainvoke_with_async_agents():
+    """Test ainvoke fans out coroutine agents under the concurrency cap."""
+    import asyncio
+
+    running = 0
+    peak = 0
+
+    async def agent(task: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return task.upper()
+
+    supervisor = Supervisor(
+        agents={"worker": agent},
+        routing_strategy="parallel",
+        planner=lambda task: [("worker", f"part {i}") for i in range(6)] + [("ghost", "x")],
+        max_concurrency=3,
+    )
+
+    result = await supervisor.ainvoke("test")
+
+    assert peak == 3
+    assert result["agent_results"]["worker"] == [f"PART {i}" for i in range(6)]
+    assert result["agent_results"]["ghost"] == "Error: unknown agent 'ghost'"
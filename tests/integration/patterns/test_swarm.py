@@ -8,7 +8,7 @@ import gc
 
 import pytest
 
-from mcp_server_langgraph.patterns.swarm import Swarm, SwarmState
+from mcp_server_langgraph.patterns.swarm import Swarm, SwarmState, minhash_signature, signature_consensus
 
 # xdist_group for integration test worker isolation
 pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(name="integration_patterns_swarm_tests")]
@@ -314,3 +314,129 @@ def test_swarm_consensus_bounded():
     result = swarm.invoke("test")
 
     assert 0.0 <= result["consensus_score"] <= 1.0
+
+
+# ==============================================================================
+# Async Execution Tests
+# ==============================================================================
+
+
+@pytest.mark.unit
+async def test_ainvoke_runs_agents_concurrently_under_cap():
+    """Test ainvoke runs coroutine agents concurrently, never exceeding max_concurrency."""
+    import asyncio
+
+    running = 0
+    peak = 0
+
+    async def agent(q: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"answer to {q}"
+
+    swarm = Swarm(agents={f"agent{i}": agent for i in range(10)}, max_concurrency=3)
+
+    result = await swarm.ainvoke("test")
+
+    assert peak == 3
+    assert result["num_agents"] == 10
+    assert list(result["agent_results"]) == [f"agent{i}" for i in range(10)]
+    assert result["early_stopped"] is False
+
+
+@pytest.mark.unit
+async def test_ainvoke_mixes_sync_and_failing_agents():
+    """Test ainvoke runs sync agents in threads and records failures as errors."""
+
+    def sync_agent(q: str) -> str:
+        return "sync result"
+
+    async def failing_agent(q: str) -> str:
+        raise ValueError("Agent failed")
+
+    swarm = Swarm(agents={"sync": sync_agent, "failing": failing_agent}, aggregation_strategy="concatenate")
+
+    result = await swarm.ainvoke("test")
+
+    assert result["agent_results"]["sync"] == "sync result"
+    assert result["agent_results"]["failing"] == "Error: Agent failed"
+
+
+@pytest.mark.unit
+async def test_ainvoke_stops_early_on_consensus():
+    """Test slow agents are cancelled once a quorum of agents agrees."""
+    import asyncio
+
+    cancelled = []
+
+    async def fast_agent(q: str) -> str:
+        return "Paris is the capital of France"
+
+    async def slow_agent(q: str) -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(q)
+            raise
+        return "unreachable"
+
+    agents = {f"fast{i}": fast_agent for i in range(3)} | {f"slow{i}": slow_agent for i in range(2)}
+    swarm = Swarm(agents=agents, aggregation_strategy="consensus", early_stop=True)
+
+    result = await asyncio.wait_for(swarm.ainvoke("capital"), timeout=5)
+
+    assert result["early_stopped"] is True
+    assert result["cancelled_agents"] == ["slow0", "slow1"]
+    assert result["consensus_score"] == 1.0
+    assert len(cancelled) == 2
+
+
+@pytest.mark.unit
+async def test_ainvoke_waits_for_all_without_agreement():
+    """Test early stop does not trigger while agents disagree."""
+
+    answers = iter(["alpha beta", "gamma delta", "epsilon zeta", "eta theta"])
+
+    async def agent(q: str) -> str:
+        return next(answers)
+
+    swarm = Swarm(agents={f"a{i}": agent for i in range(4)}, aggregation_strategy="consensus", early_stop=True)
+
+    result = await swarm.ainvoke("test")
+
+    assert result["early_stopped"] is False
+    assert result["num_agents"] == 4
+
+
+@pytest.mark.unit
+def test_minhash_consensus_approximates_jaccard():
+    """Test MinHash consensus stays close to the exact mean pairwise Jaccard similarity."""
+    import itertools
+    import random
+
+    rng = random.Random(42)
+    vocabulary = [f"word{i}" for i in range(200)]
+    results = [" ".join(rng.sample(vocabulary, 80)) for _ in range(25)]
+
+    exact = []
+    for a, b in itertools.combinations([set(r.split()) for r in results], 2):
+        exact.append(len(a & b) / len(a | b))
+
+    def estimate(texts: list[str]) -> float:
+        return signature_consensus([minhash_signature(text) for text in texts])
+
+    assert estimate(results) == pytest.approx(sum(exact) / len(exact), abs=0.05)
+    assert estimate(["same words here"] * 25) == 1.0
+    assert estimate(["", ""]) == 0.0
+
+
+@pytest.mark.unit
+def test_calculate_consensus_is_exact_jaccard():
+    """Test the consensus score reported by aggregation is the exact mean pairwise Jaccard similarity."""
+    swarm = Swarm(agents={"a": lambda q: q})
+
+    assert swarm._calculate_consensus(["a b c", "b c d", "x y z"]) == pytest.approx((0.5 + 0 + 0) / 3)
+    assert swarm._calculate_consensus(["", ""]) == 0.0
@@ -351,6 +351,229 @@ class TestDynamicContextLoader:
         assert "Qdrant write error" in str(exc_info.value)
 
 
+def _ref(ref_id: str, summary: str = "") -> ContextReference:
+    return ContextReference(ref_id=ref_id, ref_type="document", summary=summary or f"About {ref_id}", metadata={})
+
+
+@pytest.mark.xdist_group(name="dynamic_context_loader_tests")
+class TestStreamingProgressiveDiscovery:
+    """Test iter_progressive_discover streaming into load_batch"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    @pytest.mark.asyncio
+    async def test_yields_new_references_per_iteration(self, context_loader):
+        """Each iteration's new references are yielded; keywords expand the query and bound iterations"""
+        queries = []
+        hits = {"q": [_ref("a"), _ref("b")], "q x": [_ref("b"), _ref("c")]}
+
+        async def search(query, top_k=5, **kwargs):
+            queries.append(query)
+            return hits.get(query, [])
+
+        with patch.object(context_loader, "semantic_search", side_effect=search):
+            refs = [ref.ref_id async for ref in context_loader.iter_progressive_discover("q", 5, ["x"])]
+            listed = await context_loader.progressive_discover("q", 5, ["x"])
+
+        assert refs == ["a", "b", "c"]
+        assert [r.ref_id for r in listed] == refs
+        assert queries[:2] == ["q", "q x"]  # Keywords exhausted after one expansion
+        assert len(queries) == 4
+
+    @pytest.mark.asyncio
+    async def test_refines_with_top_summary_without_keywords(self, context_loader):
+        """Without keywords the next query adds the most relevant new result's summary"""
+        queries = []
+
+        async def search(query, top_k=5, **kwargs):
+            queries.append(query)
+            return [_ref(f"r{len(queries)}", summary=f"topic{len(queries)}")]
+
+        with patch.object(context_loader, "semantic_search", side_effect=search):
+            refs = await context_loader.progressive_discover("base", max_iterations=3)
+
+        assert queries == ["base", "base topic1", "base topic2"]
+        assert len(refs) == 3
+
+    @pytest.mark.asyncio
+    async def test_loading_overlaps_later_searches(self, context_loader):
+        """The first references load while the next search is still running"""
+        import asyncio
+
+        events = []
+
+        async def search(query, top_k=5, **kwargs):
+            events.append(f"search start {query}")
+            await asyncio.sleep(0.05)
+            events.append(f"search end {query}")
+            return [_ref(query)]
+
+        async def load(ref):
+            events.append(f"load start {ref.ref_id}")
+            await asyncio.sleep(0.02)
+            return LoadedContext(reference=ref, content="x", token_count=10, loaded_at=time.time())
+
+        with (
+            patch.object(context_loader, "semantic_search", side_effect=search),
+            patch.object(context_loader, "load_context", side_effect=load),
+        ):
+            stream = context_loader.iter_progressive_discover("q1", max_iterations=2, expansion_keywords=["more"])
+            loaded = await context_loader.load_batch(stream, max_tokens=100)
+
+        assert [c.reference.ref_id for c in loaded] == ["q1", "q1 more"]
+        assert events.index("load start q1") < events.index("search end q1 more")
+
+    @pytest.mark.asyncio
+    async def test_budget_met_cancels_remaining_searches(self, context_loader):
+        """Once load_batch's budget is used, the stream is closed and pending searches are cancelled"""
+        import asyncio
+
+        completed = []
+
+        async def search(query, top_k=5, **kwargs):
+            if completed:
+                await asyncio.sleep(10)  # Later searches are slow
+            completed.append(query)
+            return [_ref(f"{query}-1"), _ref(f"{query}-2")]
+
+        async def load(ref):
+            return LoadedContext(reference=ref, content="x", token_count=100, loaded_at=time.time())
+
+        with (
+            patch.object(context_loader, "semantic_search", side_effect=search),
+            patch.object(context_loader, "load_context", side_effect=load),
+        ):
+            stream = context_loader.iter_progressive_discover("q", max_iterations=3)
+            loaded = await asyncio.wait_for(context_loader.load_batch(stream, max_tokens=200), timeout=2)
+
+        assert [c.reference.ref_id for c in loaded] == ["q-1", "q-2"]
+        assert completed == ["q"]
+
+
+@pytest.mark.xdist_group(name="dynamic_context_loader_tests")
+class TestHybridSearch:
+    """Test BM25 + vector hybrid_search"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def _index(self, loader, ref_id, content, ref_type="document"):
+        await loader.index_context(ref_id=ref_id, content=content, ref_type=ref_type, summary=f"Summary of {ref_id}")
+
+    @pytest.mark.asyncio
+    async def test_symbol_lookup_skips_embedding(self, context_loader, mock_qdrant_client, mock_embedder):
+        """Exact ID / code symbol hits come from the BM25 index without embedding the query"""
+        await self._index(context_loader, "code_1", "class ParallelToolExecutor: runs tools concurrently", "code")
+        await self._index(context_loader, "code_2", "Tool executor helpers")
+        mock_embedder.embed_query.reset_mock()
+
+        by_symbol = await context_loader.hybrid_search("ParallelToolExecutor")
+        by_id = await context_loader.hybrid_search("code_2")
+
+        assert [r.ref_id for r in by_symbol] == ["code_1"]
+        assert by_symbol[0].relevance_score == 1.0
+        assert [r.ref_id for r in by_id] == ["code_2"]
+        mock_embedder.embed_query.assert_not_called()
+        mock_qdrant_client.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fuses_lexical_and_vector_results(self, context_loader, mock_qdrant_client, mock_embedder):
+        """Natural-language queries fuse both rankings; hits from both retrievers rank first"""
+        await self._index(context_loader, "doc_2", "Retry with exponential backoff")
+        await self._index(context_loader, "doc_3", "Backoff jitter for retry storms")
+        mock_embedder.embed_query.reset_mock()
+
+        results = await context_loader.hybrid_search("retry backoff", top_k=3)
+
+        # Vector: doc_1, doc_2 (fixture); lexical: doc_3, doc_2 or doc_2, doc_3
+        assert results[0].ref_id == "doc_2"
+        assert {r.ref_id for r in results} == {"doc_1", "doc_2", "doc_3"}
+        assert results[0].relevance_score > results[1].relevance_score
+        mock_embedder.embed_query.assert_called_once_with("retry backoff")
+        assert mock_qdrant_client.search.call_args.kwargs["limit"] == context_loader.hybrid_candidates
+
+    @pytest.mark.asyncio
+    async def test_lexical_hits_respect_filter_and_retention(self, context_loader, mock_qdrant_client):
+        """ref_type_filter and expired retention apply to lexical hits"""
+        mock_qdrant_client.search.return_value = []
+        await self._index(context_loader, "note_1", "deploy_checklist step one", "conversation")
+        await self._index(context_loader, "note_2", "deploy_checklist step two")
+        context_loader._lexical_entries["note_2"] = (context_loader._lexical_entries["note_2"][0], time.time() - 1)
+
+        assert await context_loader.hybrid_search("deploy_checklist", ref_type_filter="document") == []
+        results = await context_loader.hybrid_search("deploy_checklist")
+
+        assert [r.ref_id for r in results] == ["note_1"]
+
+    @pytest.mark.asyncio
+    async def test_expired_contexts_removed_from_lexical_index(self, context_loader, mock_qdrant_client):
+        """Contexts past retention are dropped from the BM25 index, not just filtered from results"""
+        mock_qdrant_client.search.return_value = []
+        await self._index(context_loader, "note_1", "deploy_checklist step one")
+        later = time.time() + (context_loader.retention_days + 1) * 86400
+
+        with patch("mcp_server_langgraph.core.dynamic_context_loader.time.time", return_value=later):
+            assert await context_loader.hybrid_search("deploy_checklist") == []
+
+        assert "note_1" not in context_loader.lexical_index
+        assert "note_1" not in context_loader._lexical_entries
+        assert context_loader.lexical_index.documents_with_term("deploy_checklist") == set()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_skips_expired_contexts(self, context_loader, mock_qdrant_client):
+        """Stored contexts already past retention are not loaded into the BM25 index"""
+        payload = {"ref_id": "old_1", "ref_type": "document", "summary": "Old", "content": "legacy_token"}
+        page = [MagicMock(payload={**payload, "expires_at": time.time() - 1})]
+        mock_qdrant_client.scroll.side_effect = [(page, None)]
+
+        await context_loader.rebuild_lexical_index()
+
+        assert "old_1" not in context_loader.lexical_index
+
+    @pytest.mark.asyncio
+    async def test_reranker_orders_fused_results(self, context_loader, mock_qdrant_client):
+        """An optional re-ranker re-orders fused candidates and supplies their scores"""
+        await self._index(context_loader, "doc_3", "retry backoff")
+        context_loader.reranker = lambda query, passages: [0.9 if "code snippet" in p else 0.1 for p in passages]
+
+        results = await context_loader.hybrid_search("retry backoff")
+
+        assert results[0].ref_id == "doc_2"
+        assert results[0].relevance_score == 0.9
+
+    @pytest.mark.asyncio
+    async def test_disabled_is_semantic_search(self, context_loader, mock_embedder):
+        """With hybrid search off, only vector results are returned even for symbol queries"""
+        await self._index(context_loader, "code_1", "ParallelToolExecutor")
+        context_loader.enable_hybrid_search = False
+        mock_embedder.embed_query.reset_mock()
+
+        results = await context_loader.hybrid_search("ParallelToolExecutor")
+
+        assert [r.ref_id for r in results] == ["doc_1", "doc_2"]
+        assert results[0].relevance_score == 0.95
+        mock_embedder.embed_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_lexical_index_from_collection(self, context_loader, mock_qdrant_client, mock_embedder):
+        """Contexts already stored in Qdrant are loaded into the BM25 index page by page"""
+        page = [
+            MagicMock(payload={"ref_id": "old_1", "ref_type": "document", "summary": "Old", "content": "legacy_token"}),
+            MagicMock(payload=None),
+        ]
+        mock_qdrant_client.scroll.side_effect = [(page, "next"), ([], None)]
+
+        assert await context_loader.rebuild_lexical_index() == 1
+        results = await context_loader.hybrid_search("legacy_token")
+
+        assert [r.ref_id for r in results] == ["old_1"]
+        assert mock_qdrant_client.scroll.call_args_list[1].kwargs["offset"] == "next"
+        mock_embedder.embed_query.assert_not_called()
+
+
 @pytest.mark.xdist_group(name="dynamic_context_loader_tests")
 class TestSearchAndLoadContext:
     """Test the helper function search_and_load_context"""
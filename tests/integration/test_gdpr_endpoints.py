@@ -171,7 +171,7 @@ class TestGDPREndpoints:
 
     def test_get_user_data_success(self, client, mock_auth_user):
         """Test GET /api/v1/users/me/data returns user data."""
-        with patch("mcp_server_langgraph.api.gdpr.DataExportService") as mock_export:
+        with patch("mcp_server_langgraph.compliance.gdpr.data_export.DataExportService") as mock_export:
             # Import UserDataExport to create actual Pydantic model
             from mcp_server_langgraph.compliance.gdpr.data_export import UserDataExport
 
@@ -220,7 +220,7 @@ class TestGDPREndpoints:
 
     def test_export_user_data_json(self, client, mock_auth_user):
         """Test GET /api/v1/users/me/export?format=json."""
-        with patch("mcp_server_langgraph.api.gdpr.DataExportService") as mock_export:
+        with patch("mcp_server_langgraph.compliance.gdpr.data_export.DataExportService") as mock_export:
             mock_instance = mock_export.return_value
             mock_instance.export_user_data_portable = AsyncMock(return_value=(b'{"data": "test"}', "application/json"))
 
@@ -232,7 +232,7 @@ class TestGDPREndpoints:
 
     def test_export_user_data_csv(self, client, mock_auth_user):
         """Test GET /api/v1/users/me/export?format=csv."""
-        with patch("mcp_server_langgraph.api.gdpr.DataExportService") as mock_export:
+        with patch("mcp_server_langgraph.compliance.gdpr.data_export.DataExportService") as mock_export:
             mock_instance = mock_export.return_value
             mock_instance.export_user_data_portable = AsyncMock(return_value=(b"col1,col2\nval1,val2", "text/csv"))
 
@@ -270,7 +270,7 @@ class TestGDPREndpoints:
 
     def test_delete_user_account_success(self, client, mock_auth_user):
         """Test DELETE /api/v1/users/me with confirm=true."""
-        with patch("mcp_server_langgraph.api.gdpr.DataDeletionService") as mock_deletion:
+        with patch("mcp_server_langgraph.compliance.gdpr.data_deletion.DataDeletionService") as mock_deletion:
             mock_instance = mock_deletion.return_value
             mock_instance.delete_user_account = AsyncMock(
                 return_value=MagicMock(
@@ -306,7 +306,7 @@ class TestGDPREndpoints:
 
     def test_delete_user_account_failure(self, client, mock_auth_user):
         """Test DELETE /api/v1/users/me handles deletion failures."""
-        with patch("mcp_server_langgraph.api.gdpr.DataDeletionService") as mock_deletion:
+        with patch("mcp_server_langgraph.compliance.gdpr.data_deletion.DataDeletionService") as mock_deletion:
             mock_instance = mock_deletion.return_value
             mock_instance.delete_user_account = AsyncMock(
                 return_value=MagicMock(
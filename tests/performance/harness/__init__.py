@@ -0,0 +1,11 @@
+"""
+Offline load harness for the MCP StreamableHTTP server.
+
+- fake_llm: in-process litellm replacement with latency distributions and streaming
+- fake_openfga: OpenFGA check/write API served by a local uvicorn thread
+- driver: fixed-RPS replay of recorded /message traffic with latency,
+  event-loop lag and memory reporting
+- scenarios: named scenarios with regression budgets
+
+Run with `python -m tests.performance.harness` or `make load-test-offline`.
+"""
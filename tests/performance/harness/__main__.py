@@ -0,0 +1,63 @@
+"""
+Run offline load scenarios and print a JSON report.
+
+Usage:
+    python -m tests.performance.harness                      # all scenarios
+    python -m tests.performance.harness baseline --rps 50 --duration 30
+    python -m tests.performance.harness --output load-report.json
+
+Exits non-zero if any scenario exceeds its budget.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# Offline defaults: no exporters, no real secrets needed
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("ENVIRONMENT", "development")
+os.environ.setdefault("JWT_SECRET_KEY", "offline-load-harness-secret-key-0000000000")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def main() -> int:
+    from tests.performance.harness.driver import run_scenario
+    from tests.performance.harness.scenarios import SCENARIOS, check_budget
+
+    parser = argparse.ArgumentParser(description="Offline MCP /message load harness")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--rps", type=float, help="Override request rate")
+    parser.add_argument("--duration", type=float, help="Override duration in seconds")
+    parser.add_argument("--trace-memory", action="store_true", help="Report tracemalloc peak (slower)")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    reports = []
+    failed = False
+    for name in args.scenarios or list(SCENARIOS):
+        scenario, budget = SCENARIOS[name]
+        overrides = {"trace_memory": args.trace_memory}
+        if args.rps:
+            overrides["rps"] = args.rps
+        if args.duration:
+            overrides["duration_seconds"] = args.duration
+        report = asyncio.run(run_scenario(replace(scenario, **overrides)))
+        violations = check_budget(report, budget)
+        failed = failed or bool(violations)
+        reports.append({**report.to_dict(), "budget_violations": violations})
+        print(json.dumps(reports[-1]), flush=True)
+
+    if args.output:
+        args.output.write_text(json.dumps(reports, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
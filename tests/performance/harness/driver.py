@@ -0,0 +1,273 @@
+"""
+Fixed-rate replay driver for the MCP /message endpoint.
+
+Replays recorded JSON-RPC messages against server_streamable.app in-process
+(httpx ASGITransport) at a fixed request rate. The schedule is open-loop:
+request i is sent at start + i / rps whether or not earlier requests have
+finished, and latency is measured from the scheduled send time, so a
+stalled server shows up as latency instead of as a slower send rate
+(no coordinated omission).
+
+Per scenario it reports throughput, latency percentiles, event-loop lag
+(drift of a periodic sleep on the same loop) and memory.
+"""
+
+import asyncio
+import gc
+import json
+import logging
+import math
+import os
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+import psutil
+
+from tests.performance.harness.fake_llm import FakeLLMProvider, LatencyDistribution
+from tests.performance.harness.fake_openfga import FAKE_MODEL_ID, FAKE_STORE_ID, FakeOpenFGAServer
+
+DEFAULT_TRAFFIC = Path(__file__).resolve().parents[2] / "benchmarks" / "scenarios" / "mcp_message_traffic.jsonl"
+
+LOAD_TEST_USER = "loadtest"
+LOAD_TEST_PASSWORD = "load-test-password-123"  # noqa: S105 - throwaway in-memory user
+
+
+@dataclass
+class Scenario:
+    """One load scenario: rate, duration and fake dependency behaviour."""
+
+    name: str
+    rps: float = 20.0
+    duration_seconds: float = 5.0
+    traffic: Path = DEFAULT_TRAFFIC
+    llm_latency: LatencyDistribution = field(default_factory=lambda: LatencyDistribution("lognormal", mean=0.05))
+    llm_error_rate: float = 0.0
+    openfga_latency: LatencyDistribution = field(default_factory=lambda: LatencyDistribution(mean=0.002))
+    request_timeout_seconds: float = 30.0
+    trace_memory: bool = False  # tracemalloc peak (accurate but slows the run)
+    quiet_logs: bool = True  # Drop INFO/DEBUG records (set False to include logging cost)
+
+
+@dataclass
+class ScenarioReport:
+    """Results for one scenario (latencies in milliseconds)."""
+
+    name: str
+    target_rps: float
+    requests: int
+    errors: int
+    throughput_rps: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+    rss_start_mb: float
+    rss_end_mb: float
+    tracemalloc_peak_mb: float | None
+    llm_calls: int
+    openfga_checks: int
+    status_counts: dict[str, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+def load_traffic(path: Path) -> list[dict[str, Any]]:
+    """Load recorded JSON-RPC messages (one per line, # comments allowed)."""
+    messages = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            messages.append(json.loads(line))
+    return messages
+
+
+def render_message(template: dict[str, Any], seq: int, token: str) -> dict[str, Any]:
+    """Fill {{token}}, {{user}} and {{seq}} placeholders and assign a JSON-RPC id."""
+    rendered = json.loads(
+        json.dumps(template).replace("{{token}}", token).replace("{{user}}", LOAD_TEST_USER).replace("{{seq}}", str(seq))
+    )
+    rendered["id"] = seq
+    return rendered
+
+
+class LoopLagMonitor:
+    """Measure event-loop lag as the overshoot of a periodic sleep."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+@contextmanager
+def _server_under_test(fga: FakeOpenFGAServer) -> Iterator[Any]:
+    """Install a fresh MCP server wired to the fake OpenFGA, restoring globals afterwards."""
+    from mcp_server_langgraph.auth.openfga import OpenFGAClient
+    from mcp_server_langgraph.core.config import Settings
+    from mcp_server_langgraph.mcp import server_streamable
+    from mcp_server_langgraph.observability.telemetry import init_observability, is_initialized
+
+    if not is_initialized():
+        init_observability(
+            Settings(log_format="text", enable_console_export=False, observability_backend="opentelemetry"),
+            enable_console_export=False,
+        )
+
+    openfga = OpenFGAClient(api_url=fga.url, store_id=FAKE_STORE_ID, model_id=FAKE_MODEL_ID)
+    server = server_streamable.MCPAgentStreamableServer(openfga_client=openfga)
+    server.auth.user_provider.add_user(LOAD_TEST_USER, LOAD_TEST_PASSWORD, email="loadtest@example.com", roles=["user"])
+
+    previous = server_streamable._mcp_server_instance
+    server_streamable._mcp_server_instance = server
+    try:
+        yield server
+    finally:
+        server_streamable._mcp_server_instance = previous
+
+
+@contextmanager
+def _quiet_logs(enabled: bool) -> Iterator[None]:
+    if enabled:
+        logging.disable(logging.INFO)
+    try:
+        yield
+    finally:
+        if enabled:
+            logging.disable(logging.NOTSET)
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    message: dict[str, Any],
+    scheduled_at: float,
+    latencies: list[float],
+    status_counts: dict[str, int],
+    timeout: float,
+) -> bool:
+    """Send one message; return True on a JSON-RPC success."""
+    ok = False
+    try:
+        response = await client.post("/message", json=message, timeout=timeout)
+        status = str(response.status_code)
+        ok = response.status_code == 200 and "error" not in response.json()
+        if response.status_code == 200 and not ok:
+            status = f"200:{response.json()['error'].get('code')}"
+    except Exception as e:
+        status = type(e).__name__
+    latencies.append(time.perf_counter() - scheduled_at)
+    status_counts[status] = status_counts.get(status, 0) + 1
+    return ok
+
+
+async def run_scenario(scenario: Scenario) -> ScenarioReport:
+    """Run one scenario against server_streamable.app and report the results."""
+    from mcp_server_langgraph.mcp import server_streamable
+
+    traffic = load_traffic(scenario.traffic)
+    provider = FakeLLMProvider(latency=scenario.llm_latency, error_rate=scenario.llm_error_rate)
+    process = psutil.Process(os.getpid())
+
+    with (
+        _quiet_logs(scenario.quiet_logs),
+        FakeOpenFGAServer(latency=scenario.openfga_latency) as fga,
+        provider.installed(),
+        _server_under_test(fga) as server,
+    ):
+        token = server.auth.create_token(LOAD_TEST_USER)
+        transport = httpx.ASGITransport(app=server_streamable.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-harness") as client:
+            # Warm up (graph compile, first OpenFGA connection) outside the measurement
+            for template in traffic:
+                await _send(client, render_message(template, 0, token), time.perf_counter(), [], {}, 60.0)
+
+            gc.collect()
+            rss_start = process.memory_info().rss
+            if scenario.trace_memory:
+                tracemalloc.start()
+
+            latencies: list[float] = []
+            status_counts: dict[str, int] = {}
+            monitor = LoopLagMonitor()
+            monitor.start()
+
+            total = max(1, int(scenario.rps * scenario.duration_seconds))
+            tasks = []
+            started = time.perf_counter()
+            for seq in range(1, total + 1):
+                scheduled_at = started + (seq - 1) / scenario.rps
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                message = render_message(traffic[(seq - 1) % len(traffic)], seq, token)
+                tasks.append(
+                    asyncio.create_task(
+                        _send(client, message, scheduled_at, latencies, status_counts, scenario.request_timeout_seconds)
+                    )
+                )
+            results = await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - started
+
+            await monitor.stop()
+            tracemalloc_peak = None
+            if scenario.trace_memory:
+                tracemalloc_peak = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+            rss_end = process.memory_info().rss
+
+        await server.openfga.close()
+
+    return ScenarioReport(
+        name=scenario.name,
+        target_rps=scenario.rps,
+        requests=total,
+        errors=results.count(False),
+        throughput_rps=round(results.count(True) / elapsed, 2),
+        latency_p50_ms=round(percentile(latencies, 50) * 1000, 2),
+        latency_p95_ms=round(percentile(latencies, 95) * 1000, 2),
+        latency_p99_ms=round(percentile(latencies, 99) * 1000, 2),
+        latency_max_ms=round(max(latencies, default=0.0) * 1000, 2),
+        loop_lag_p99_ms=round(percentile(monitor.samples, 99) * 1000, 2),
+        loop_lag_max_ms=round(max(monitor.samples, default=0.0) * 1000, 2),
+        rss_start_mb=round(rss_start / 1e6, 1),
+        rss_end_mb=round(rss_end / 1e6, 1),
+        tracemalloc_peak_mb=round(tracemalloc_peak, 1) if tracemalloc_peak is not None else None,
+        llm_calls=provider.calls,
+        openfga_checks=fga.checks,
+        status_counts=status_counts,
+    )
@@ -0,0 +1,165 @@
+"""
+In-process fake LLM provider for load tests.
+
+Replaces litellm.acompletion (as imported by llm.factory) with a coroutine
+that sleeps for a sampled latency and returns a real litellm ModelResponse,
+so the agent graph, resilience wrappers and metrics run unchanged without a
+network call. stream=True yields ModelResponseStream chunks with a
+time-to-first-token delay followed by per-token delays.
+"""
+
+import asyncio
+import random
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import patch
+
+from litellm import ModelResponse
+from litellm.types.utils import ModelResponseStream
+
+# Passing verdict in the format llm/verifier.py asks the judge model for, so
+# the agent's verify step accepts the first answer instead of refining
+JUDGE_RESPONSE = """SCORES:
+- accuracy: 0.9
+- completeness: 0.9
+- clarity: 0.9
+- relevance: 0.9
+- safety: 1.0
+- sources: 0.8
+
+OVERALL: 0.9
+
+REQUIRES_REFINEMENT: no
+
+FEEDBACK:
+Clear and accurate."""
+
+# Prompt marker -> canned reply (first match wins, else response_text)
+DEFAULT_CANNED_RESPONSES = {"OVERALL: [0.0-1.0]": JUDGE_RESPONSE}
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    Latency distribution in seconds.
+
+    kind:
+        constant: always `mean`
+        uniform: uniform in [low, high]
+        lognormal: lognormal with median `mean` and shape `sigma` (long tail, like real providers)
+    """
+
+    kind: str = "constant"
+    mean: float = 0.05
+    low: float = 0.0
+    high: float = 0.0
+    sigma: float = 0.5
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.low, self.high)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(0.0, self.sigma) * self.mean
+        return self.mean
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parse "constant:0.05", "uniform:0.02:0.2" or "lognormal:0.08:0.6"."""
+        kind, *values = spec.split(":")
+        numbers = [float(value) for value in values]
+        if kind == "uniform":
+            return cls(kind=kind, low=numbers[0], high=numbers[1])
+        if kind == "lognormal":
+            return cls(kind=kind, mean=numbers[0], sigma=numbers[1] if len(numbers) > 1 else 0.5)
+        return cls(kind="constant", mean=numbers[0] if numbers else 0.05)
+
+
+class FakeLLMProvider:
+    """
+    Fake litellm completion endpoint.
+
+    Example:
+        >>> provider = FakeLLMProvider(latency=LatencyDistribution("lognormal", mean=0.08))
+        >>> with provider.installed():
+        ...     ...  # LLMFactory.ainvoke now hits the fake
+    """
+
+    def __init__(
+        self,
+        latency: LatencyDistribution | None = None,
+        inter_token_latency: LatencyDistribution | None = None,
+        response_text: str = "This is a canned response from the fake provider.",
+        error_rate: float = 0.0,
+        canned_responses: dict[str, str] | None = None,
+        seed: int = 0,
+    ):
+        """
+        Initialize fake provider.
+
+        Args:
+            latency: Full-response latency (time to first token when streaming)
+            inter_token_latency: Delay between streamed tokens
+            response_text: Assistant message content (streamed word by word)
+            error_rate: Fraction of calls raising a provider error
+            canned_responses: Prompt substring -> reply (defaults answer verifier prompts)
+            seed: RNG seed for reproducible latency samples
+        """
+        self.latency = latency or LatencyDistribution()
+        self.inter_token_latency = inter_token_latency or LatencyDistribution(mean=0.0)
+        self.response_text = response_text
+        self.error_rate = error_rate
+        self.canned_responses = DEFAULT_CANNED_RESPONSES if canned_responses is None else canned_responses
+        self._rng = random.Random(seed)
+        self.calls = 0
+
+    async def acompletion(self, **params: Any) -> ModelResponse | AsyncIterator[ModelResponseStream]:
+        """Drop-in replacement for litellm.acompletion."""
+        self.calls += 1
+        if self.error_rate and self._rng.random() < self.error_rate:
+            await asyncio.sleep(self.latency.sample(self._rng))
+            msg = "fake provider: service unavailable (503)"
+            raise ConnectionError(msg)
+
+        prompt = "\n".join(str(message.get("content", "")) for message in params.get("messages", []))
+        text = self._reply_for(prompt)
+
+        if params.get("stream"):
+            return self._stream(params.get("model", "fake"), text)
+
+        await asyncio.sleep(self.latency.sample(self._rng))
+        prompt_tokens = len(prompt.split())
+        completion_tokens = len(text.split())
+        return ModelResponse(
+            model=params.get("model", "fake"),
+            choices=[{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": text}}],
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+
+    def _reply_for(self, prompt: str) -> str:
+        for marker, reply in self.canned_responses.items():
+            if marker in prompt:
+                return reply
+        return self.response_text
+
+    async def _stream(self, model: str, text: str) -> AsyncIterator[ModelResponseStream]:
+        await asyncio.sleep(self.latency.sample(self._rng))
+        for index, word in enumerate(text.split(" ")):
+            if index:
+                await asyncio.sleep(self.inter_token_latency.sample(self._rng))
+            content = word if index == 0 else f" {word}"
+            yield ModelResponseStream(model=model, choices=[{"index": 0, "delta": {"content": content}}])
+
+    @contextmanager
+    def installed(self) -> Iterator["FakeLLMProvider"]:
+        """Patch litellm.acompletion where the LLM factory imported it."""
+        with (
+            patch("mcp_server_langgraph.llm.factory.acompletion", self.acompletion),
+            patch("litellm.acompletion", self.acompletion),
+        ):
+            yield self
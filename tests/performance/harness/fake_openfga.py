@@ -0,0 +1,140 @@
+"""
+Fake OpenFGA HTTP server for load tests.
+
+Serves the subset of the OpenFGA API the SDK client uses (check,
+batch-check, write, authorization model read) from a uvicorn server on a
+background thread, so the real OpenFGAClient (aiohttp, retries, circuit
+breaker) is exercised end to end without a running OpenFGA.
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from tests.performance.harness.fake_llm import LatencyDistribution
+
+# Valid ULIDs (the SDK validates store/model id format)
+FAKE_STORE_ID = "01HVMMBCMGZNT3SED4Z17ECXCA"
+FAKE_MODEL_ID = "01HVMMBD123456789ABCDEFGHJ"
+
+
+class FakeOpenFGAServer:
+    """
+    Fake OpenFGA server (allow-all by default).
+
+    Example:
+        >>> with FakeOpenFGAServer(latency=LatencyDistribution(mean=0.002)) as fga:
+        ...     client = OpenFGAClient(api_url=fga.url, store_id=FAKE_STORE_ID, model_id=FAKE_MODEL_ID)
+    """
+
+    def __init__(self, latency: LatencyDistribution | None = None, allow: bool = True, seed: int = 0):
+        """
+        Initialize fake server.
+
+        Args:
+            latency: Per-request latency added before responding
+            allow: Result returned for every check
+            seed: RNG seed for reproducible latency samples
+        """
+        self.latency = latency or LatencyDistribution(mean=0.0)
+        self.allow = allow
+        self._rng = random.Random(seed)
+        self.checks = 0
+        self.writes = 0
+
+        self.host = "127.0.0.1"
+        self.port = _free_port()
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _delay(self) -> None:
+        delay = self.latency.sample(self._rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _check(self, request: Request) -> JSONResponse:
+        await self._delay()
+        self.checks += 1
+        return JSONResponse({"allowed": self.allow, "resolution": ""})
+
+    async def _batch_check(self, request: Request) -> JSONResponse:
+        await self._delay()
+        body = await request.json()
+        results: dict[str, Any] = {}
+        for check in body.get("checks", []):
+            self.checks += 1
+            results[check["correlation_id"]] = {"allowed": self.allow}
+        return JSONResponse({"result": results})
+
+    async def _write(self, request: Request) -> JSONResponse:
+        await self._delay()
+        self.writes += 1
+        return JSONResponse({})
+
+    async def _read_model(self, request: Request) -> JSONResponse:
+        return JSONResponse(
+            {
+                "authorization_model": {
+                    "id": request.path_params["model_id"],
+                    "schema_version": "1.1",
+                    "type_definitions": [],
+                }
+            }
+        )
+
+    def _app(self) -> Starlette:
+        return Starlette(
+            routes=[
+                Route("/stores/{store_id}/check", self._check, methods=["POST"]),
+                Route("/stores/{store_id}/batch-check", self._batch_check, methods=["POST"]),
+                Route("/stores/{store_id}/write", self._write, methods=["POST"]),
+                Route("/stores/{store_id}/authorization-models/{model_id}", self._read_model, methods=["GET"]),
+            ]
+        )
+
+    def start(self) -> "FakeOpenFGAServer":
+        config = uvicorn.Config(self._app(), host=self.host, port=self.port, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="fake-openfga", daemon=True)
+        self._thread.start()
+
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                msg = "fake OpenFGA server did not start"
+                raise RuntimeError(msg)
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "FakeOpenFGAServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
@@ -0,0 +1,65 @@
+"""
+Named load scenarios for the offline harness.
+
+Each scenario exercises server_streamable with the fake LLM provider and
+fake OpenFGA server. Budgets are deliberately loose: they catch order-of-
+magnitude regressions (a blocking call on the event loop, a retry storm),
+not noise between CI runners.
+"""
+
+from dataclasses import dataclass
+
+from tests.performance.harness.driver import Scenario, ScenarioReport
+from tests.performance.harness.fake_llm import LatencyDistribution
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Pass/fail thresholds for a scenario report."""
+
+    max_error_rate: float = 0.0
+    max_p99_ms: float = 2000.0
+    max_loop_lag_ms: float = 250.0
+
+
+SCENARIOS: dict[str, tuple[Scenario, Budget]] = {
+    "baseline": (
+        Scenario("baseline", rps=20, duration_seconds=10),
+        Budget(max_p99_ms=1000.0),
+    ),
+    "slow_provider": (
+        Scenario(
+            "slow_provider",
+            rps=20,
+            duration_seconds=10,
+            llm_latency=LatencyDistribution("lognormal", mean=0.4, sigma=0.8),
+        ),
+        Budget(max_p99_ms=10000.0),
+    ),
+    "provider_brownout": (
+        Scenario("provider_brownout", rps=20, duration_seconds=10, llm_error_rate=0.2),
+        Budget(max_error_rate=0.5, max_p99_ms=15000.0),
+    ),
+    "slow_openfga": (
+        Scenario(
+            "slow_openfga",
+            rps=20,
+            duration_seconds=10,
+            openfga_latency=LatencyDistribution("uniform", low=0.02, high=0.1),
+        ),
+        Budget(max_p99_ms=2000.0),
+    ),
+}
+
+
+def check_budget(report: ScenarioReport, budget: Budget) -> list[str]:
+    """Return budget violations (empty when the scenario passes)."""
+    violations = []
+    error_rate = report.errors / max(1, report.requests)
+    if error_rate > budget.max_error_rate:
+        violations.append(f"error rate {error_rate:.1%} > {budget.max_error_rate:.1%}")
+    if report.latency_p99_ms > budget.max_p99_ms:
+        violations.append(f"p99 {report.latency_p99_ms:.0f}ms > {budget.max_p99_ms:.0f}ms")
+    if report.loop_lag_max_ms > budget.max_loop_lag_ms:
+        violations.append(f"event-loop lag {report.loop_lag_max_ms:.0f}ms > {budget.max_loop_lag_ms:.0f}ms")
+    return violations
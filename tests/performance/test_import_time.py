@@ -0,0 +1,111 @@
+"""
+Import-time regression tests for the server and CLI entry points.
+
+Each entry point is imported in a fresh interpreter under `python -X importtime`.
+Two things are checked:
+- heavy optional subsystems (LiteLLM, Qdrant, sandboxes, Pydantic AI, ...) are not
+  imported at module load - they must stay behind first-use imports
+- the interpreter's CPU time for startup + import stays within a per-entry-point budget
+
+The budget is CPU time rather than wall clock so that xdist workers competing for
+cores do not fail it; it is still loose enough to only catch gross regressions (the
+module checks catch the common case of a new eager import). On failure the slowest
+imports from the -X importtime report are listed. Scale budgets with
+IMPORT_TIME_BUDGET_SCALE on slow machines.
+"""
+
+import gc
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Mark as unit test to ensure it runs in CI
+pytestmark = pytest.mark.unit
+
+BUDGET_SCALE = float(os.getenv("IMPORT_TIME_BUDGET_SCALE", "1.0"))
+
+# Loaded on first use by every entry point
+LAZY_MODULES = [
+    "litellm",
+    "qdrant_client",
+    "pydantic_ai",
+    "langgraph",
+    "docker",
+    "kubernetes",
+    "sentence_transformers",
+    "mcp_server_langgraph.core.agent",
+    "mcp_server_langgraph.core.dynamic_context_loader",
+    "mcp_server_langgraph.execution.docker_sandbox",
+    "mcp_server_langgraph.execution.kubernetes_sandbox",
+    "mcp_server_langgraph.compliance.retention",
+    "mcp_server_langgraph.compliance.soc2.evidence",
+    "mcp_server_langgraph.compliance.gdpr.data_deletion",
+    "mcp_server_langgraph.compliance.gdpr.data_export",
+]
+
+# Additionally not needed by `import mcp_server_langgraph` or the CLI
+SERVER_ONLY_MODULES = ["fastapi", "langchain_core", "openfga_sdk"]
+
+# (entry point, CPU budget in seconds, modules that must not be imported)
+# Eager imports used to cost 9-13s of CPU for every entry point.
+ENTRY_POINTS = [
+    ("mcp_server_langgraph", 4.0, LAZY_MODULES + SERVER_ONLY_MODULES),
+    ("mcp_server_langgraph.cli", 4.0, LAZY_MODULES + SERVER_ONLY_MODULES),
+    ("mcp_server_langgraph.infrastructure.app_factory", 5.0, LAZY_MODULES),
+    ("mcp_server_langgraph.mcp.server_streamable", 9.0, LAZY_MODULES),
+    ("mcp_server_langgraph.mcp.server_stdio", 9.0, LAZY_MODULES),
+]
+
+
+def _import_profile(module: str, forbidden: list[str]) -> tuple[float, list[str], list[str]]:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        (CPU seconds, forbidden modules that were loaded, slowest imports from -X importtime)
+    """
+    script = (
+        f"import sys, time, {module}; "
+        f"print('loaded:', *(m for m in {forbidden!r} if m in sys.modules)); "
+        "print('cpu:', time.process_time())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=55,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    report = dict(line.split(":", 1) for line in result.stdout.splitlines() if line.startswith(("loaded:", "cpu:")))
+    timings = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "self [us]" not in line:
+            _, cumulative, name = line.split("|")
+            if "." not in name.strip() and not name.strip().startswith(module.split(".")[0]):
+                timings.append((int(cumulative), name.strip()))
+    slowest = [f"{name} {us / 1_000_000:.2f}s" for us, name in sorted(timings, reverse=True)[:5]]
+    return float(report["cpu"]), report["loaded"].split(), slowest
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="import_time_tests")
+class TestEntryPointImportTime:
+    """Cold-import budget for each entry point"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    @pytest.mark.parametrize(("module", "budget", "forbidden"), ENTRY_POINTS, ids=[entry[0] for entry in ENTRY_POINTS])
+    def test_entry_point_import(self, module, budget, forbidden):
+        """Heavy subsystems stay lazy and the import fits its budget"""
+        cpu_seconds, loaded, slowest = _import_profile(module, forbidden)
+
+        assert loaded == [], f"{module} eagerly imports {loaded}; move these imports to first use"
+        assert cpu_seconds <= budget * BUDGET_SCALE, (
+            f"{module} used {cpu_seconds:.2f}s CPU to import (budget {budget}s); slowest imports: {slowest}"
+        )
@@ -0,0 +1,83 @@
+"""Tests for the offline load harness (fake LLM, fake OpenFGA, fixed-RPS driver)."""
+
+import gc
+import math
+from dataclasses import replace
+
+import pytest
+
+# Mark as unit test to ensure it runs in CI
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.xdist_group(name="load_harness_tests")
+class TestHarnessComponents:
+    """Tests for the harness building blocks."""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    def test_latency_distribution_parse(self):
+        """CLI-style specs map to distributions."""
+        from tests.performance.harness.fake_llm import LatencyDistribution
+
+        assert LatencyDistribution.parse("constant:0.1") == LatencyDistribution(mean=0.1)
+        assert LatencyDistribution.parse("uniform:0.02:0.2") == LatencyDistribution("uniform", low=0.02, high=0.2)
+        assert LatencyDistribution.parse("lognormal:0.08:0.6") == LatencyDistribution("lognormal", mean=0.08, sigma=0.6)
+
+    def test_percentile_nearest_rank(self):
+        """Percentiles use nearest rank over the samples."""
+        from tests.performance.harness.driver import percentile
+
+        samples = [float(i) for i in range(1, 101)]
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+    async def test_fake_provider_streams_tokens(self):
+        """stream=True yields the response word by word."""
+        from tests.performance.harness.fake_llm import FakeLLMProvider, LatencyDistribution
+
+        provider = FakeLLMProvider(latency=LatencyDistribution(mean=0.0), response_text="one two three")
+        stream = await provider.acompletion(model="fake", messages=[{"role": "user", "content": "hi"}], stream=True)
+
+        chunks = [chunk.choices[0].delta.content async for chunk in stream]
+
+        assert "".join(chunks) == "one two three"
+        assert len(chunks) == 3
+
+    async def test_fake_provider_answers_verifier_prompts(self):
+        """Judge prompts get a passing verdict so the agent does not refine forever."""
+        from tests.performance.harness.fake_llm import FakeLLMProvider, LatencyDistribution
+
+        provider = FakeLLMProvider(latency=LatencyDistribution(mean=0.0))
+        response = await provider.acompletion(model="fake", messages=[{"role": "user", "content": "OVERALL: [0.0-1.0]"}])
+
+        assert "OVERALL: 0.9" in response.choices[0].message.content
+
+
+@pytest.mark.performance
+@pytest.mark.xdist_group(name="load_harness_tests")
+class TestLoadScenarios:
+    """Short end-to-end runs of the harness scenarios against server_streamable."""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.timeout(120)
+    async def test_baseline_scenario_within_budget(self):
+        """A short baseline run succeeds end to end and stays within its error budget."""
+        from tests.performance.harness.driver import run_scenario
+        from tests.performance.harness.scenarios import SCENARIOS, check_budget
+
+        scenario, budget = SCENARIOS["baseline"]
+        report = await run_scenario(replace(scenario, rps=10, duration_seconds=2))
+
+        assert report.requests == 20
+        assert report.llm_calls > 0
+        assert report.openfga_checks > 0
+        # Latency budgets are enforced by `make load-test-offline`; under a loaded
+        # parallel test run they would only measure CPU contention
+        assert check_budget(report, replace(budget, max_p99_ms=math.inf, max_loop_lag_ms=math.inf)) == []
@@ -328,3 +328,88 @@ class TestAgentState:
 
         assert "messages" in hints
         # The type should be Annotated with operator.add
+
+
+@pytest.mark.xdist_group(name="agent_core")
+class TestToolDagExecution:
+    """Test the agent graph with enable_tool_dag_execution."""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @staticmethod
+    def _graph(enable_tool_dag: bool, model: MagicMock):
+        from mcp_server_langgraph.core.agent import _create_agent_graph_singleton
+        from mcp_server_langgraph.core.config import settings
+
+        dag_settings = settings.model_copy(
+            update={
+                "enable_tool_dag_execution": enable_tool_dag,
+                "enable_verification": False,
+                "enable_checkpointing": False,
+                "enable_dynamic_context_loading": False,
+                "enable_context_compaction": False,
+            }
+        )
+        return _create_agent_graph_singleton(dag_settings, model)
+
+    @staticmethod
+    def _model() -> MagicMock:
+        from unittest.mock import AsyncMock
+
+        from langchain_core.messages import AIMessage
+
+        model = MagicMock()
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="OK"))
+        return model
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("enable_tool_dag", [True, False])
+    async def test_prompt_describes_result_references_when_enabled(self, enable_tool_dag):
+        """Test the model is told the "$<n>.result" convention only in DAG mode."""
+        from langchain_core.messages import SystemMessage
+
+        from mcp_server_langgraph.core.prompts import TOOL_PLAN_PROMPT
+
+        model = self._model()
+        graph = self._graph(enable_tool_dag, model)
+
+        await graph.ainvoke({"messages": [HumanMessage(content="hello")], "user_id": "user:alice", "request_id": "r1"})
+
+        sent = model.ainvoke.call_args.args[0]
+        has_plan_prompt = any(isinstance(m, SystemMessage) and m.content == TOOL_PLAN_PROMPT for m in sent)
+        assert has_plan_prompt is enable_tool_dag
+        assert "$<n>.result" in TOOL_PLAN_PROMPT
+
+    @pytest.mark.unit
+    async def test_unresolvable_references_are_not_run_with_placeholders(self):
+        """Test a cyclic plan reports the referencing calls as errors instead of running them with raw placeholders."""
+        from unittest.mock import AsyncMock
+
+        from langchain_core.messages import AIMessage, ToolMessage
+
+        tool = MagicMock()
+        tool.ainvoke = AsyncMock(return_value="searched")
+        graph = self._graph(True, self._model())
+        tool_calls = [
+            {"name": "search", "args": {"query": "$2.result"}, "id": "call_a"},
+            {"name": "search", "args": {"query": "$1.result"}, "id": "call_b"},
+            {"name": "search", "args": {"query": "plain"}, "id": "call_c"},
+        ]
+
+        with patch("mcp_server_langgraph.tools.get_tool_by_name", return_value=tool):
+            result = await graph.ainvoke(
+                {
+                    "messages": [HumanMessage(content="find it"), AIMessage(content="", tool_calls=tool_calls)],
+                    "next_action": "use_tools",
+                    "user_id": "user:alice",
+                    "request_id": "r1",
+                }
+            )
+
+        tool.ainvoke.assert_awaited_once_with({"query": "plain"})
+        tool_messages = {m.tool_call_id: m.content for m in result["messages"] if isinstance(m, ToolMessage)}
+        assert tool_messages["call_c"] == "searched"
+        assert "could not be resolved" in tool_messages["call_a"]
+        assert "could not be resolved" in tool_messages["call_b"]
@@ -0,0 +1,248 @@
+"""
+Tests for compact checkpoint serialization.
+
+Covers:
+- msgpack encoding with compression above the size threshold
+- Message deltas against keyframe checkpoints, and when a keyframe is forced
+- Conversations round-trip through sync and async graphs, including after a
+  process restart (no in-memory lineage)
+- _create_checkpointer honours checkpoint_serializer="compact"
+"""
+
+import gc
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class _State(TypedDict):
+    messages: Annotated[list, operator.add]
+
+
+def _graph(checkpointer):
+    from langchain_core.messages import AIMessage
+    from langgraph.graph import END, START, StateGraph
+
+    def respond(state: _State) -> _State:
+        return {"messages": [AIMessage(content=f"answer {len(state['messages'])} " + "lorem ipsum " * 20)]}
+
+    workflow = StateGraph(_State)
+    workflow.add_node("respond", respond)
+    workflow.add_edge(START, "respond")
+    workflow.add_edge("respond", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _turn(graph, i, thread_id="thread-1"):
+    from langchain_core.messages import HumanMessage
+
+    return graph.invoke({"messages": [HumanMessage(content=f"question {i}")]}, {"configurable": {"thread_id": thread_id}})
+
+
+def _raw_marker(saver, thread_id="thread-1"):
+    """Stored (unexpanded) messages value of the latest checkpoint"""
+    from langgraph.checkpoint.memory import MemorySaver
+
+    return MemorySaver.get_tuple(saver, {"configurable": {"thread_id": thread_id}}).checkpoint["channel_values"]["messages"]
+
+
+@pytest.mark.xdist_group(name="checkpoint_serializer_tests")
+class TestCompactSerializer:
+    """Tests for CompactSerializer"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_compresses_above_threshold(self):
+        """Large payloads are zstd-compressed, small ones stay plain msgpack"""
+        from langchain_core.messages import AIMessage, HumanMessage
+
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactSerializer
+
+        serde = CompactSerializer(compression="zstd", min_bytes=256)
+        messages = [HumanMessage(content="hi"), AIMessage(content="hello " * 200)]
+
+        type_, data = serde.dumps_typed(messages)
+        assert type_ == "msgpack+zstd"
+        assert serde.loads_typed((type_, data)) == messages
+
+        assert serde.dumps_typed([HumanMessage(content="hi")])[0] == "msgpack"
+
+    def test_compressed_payloads_readable_without_compression_setting(self):
+        """The stored type tag, not the current setting, decides how to decode"""
+        from langchain_core.messages import AIMessage
+
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactSerializer
+
+        stored = CompactSerializer(compression="zstd", min_bytes=0).dumps_typed([AIMessage(content="x" * 500)])
+
+        assert CompactSerializer(compression="none").loads_typed(stored)[0].content == "x" * 500
+
+    def test_rejects_unknown_compression(self):
+        """Unknown compression names fail fast"""
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactSerializer
+
+        with pytest.raises(ValueError, match="brotli"):
+            CompactSerializer(compression="brotli")
+
+
+@pytest.mark.xdist_group(name="checkpoint_serializer_tests")
+class TestCompactCheckpointSaver:
+    """Tests for CompactCheckpointMixin via CompactMemorySaver"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_conversation_round_trips(self):
+        """A multi-turn conversation reads back exactly as with the default saver"""
+        from langgraph.checkpoint.memory import MemorySaver
+
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+        compact, plain = _graph(CompactMemorySaver().configure(keyframe_interval=4)), _graph(MemorySaver())
+        for i in range(10):
+            _turn(compact, i)
+            _turn(plain, i)
+
+        config = {"configurable": {"thread_id": "thread-1"}}
+        assert compact.get_state(config).values == plain.get_state(config).values
+        assert len(compact.get_state(config).values["messages"]) == 20
+        history = list(compact.get_state_history(config))
+        assert [len(s.values.get("messages", [])) for s in history] == [
+            len(s.values.get("messages", [])) for s in plain.get_state_history(config)
+        ]
+
+    def test_writes_deltas_between_keyframes(self):
+        """Only messages after the keyframe are stored until the next keyframe"""
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+        saver = CompactMemorySaver().configure(compression="none", keyframe_interval=100)
+        graph = _graph(saver)
+        for i in range(5):
+            _turn(graph, i)
+        delta = _raw_marker(saver)
+
+        assert delta["base"] is not None
+        assert delta["seq"] > 1
+        assert len(saver._decode(delta)) == 10 - delta["base_count"]
+
+    def test_keyframe_interval(self):
+        """A full keyframe is written after keyframe_interval - 1 deltas"""
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+        saver = CompactMemorySaver().configure(keyframe_interval=3)
+        markers = []
+        for i in range(4):
+            checkpoint = {"id": f"cp-{i}", "channel_values": {"messages": list(range(i + 1))}}
+            parent = f"cp-{i - 1}" if i else None
+            config = {"configurable": {"thread_id": "t", "checkpoint_ns": "", "checkpoint_id": parent}}
+            markers.append(saver._compact(config, checkpoint)["channel_values"]["messages"])
+
+        assert [m["base"] for m in markers] == [None, "cp-0", "cp-0", None]
+        assert [m["seq"] for m in markers] == [0, 1, 2, 0]
+
+    def test_changed_history_forces_keyframe(self):
+        """Branching from another checkpoint or rewriting earlier messages writes a keyframe"""
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+        saver = CompactMemorySaver()
+
+        def compact(checkpoint_id, parent, messages):
+            config = {"configurable": {"thread_id": "t", "checkpoint_ns": "", "checkpoint_id": parent}}
+            checkpoint = {"id": checkpoint_id, "channel_values": {"messages": messages}}
+            return saver._compact(config, checkpoint)["channel_values"]["messages"]
+
+        compact("cp-0", None, ["a", "b"])
+        assert compact("cp-1", "cp-0", ["a", "b", "c"])["base"] == "cp-0"
+        assert compact("cp-2", "cp-1", ["summary", "c", "d"])["base"] is None  # compaction rewrote history
+        assert compact("cp-3", "cp-0", ["summary", "c", "d", "e"])["base"] is None  # not the lineage head
+
+    def test_restart_resumes_deltas_after_load(self):
+        """A process without lineage state reads deltas and continues writing them"""
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+        saver = CompactMemorySaver().configure(keyframe_interval=50)
+        graph = _graph(saver)
+        for i in range(3):
+            _turn(graph, i)
+
+        saver._lineages.clear()  # As if another replica picked up the thread
+        _turn(graph, 3)
+
+        assert _raw_marker(saver)["base"] is not None
+        assert len(graph.get_state({"configurable": {"thread_id": "thread-1"}}).values["messages"]) == 8
+
+    def test_missing_keyframe_is_reported(self):
+        """A delta whose keyframe is gone raises DataIntegrityError rather than dropping history"""
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+        from mcp_server_langgraph.core.exceptions import DataIntegrityError
+
+        saver = CompactMemorySaver()
+        graph = _graph(saver)
+        for i in range(3):
+            _turn(graph, i)
+        keyframe_id = _raw_marker(saver)["base"]
+        del saver.storage["thread-1"][""][keyframe_id]
+
+        with pytest.raises(DataIntegrityError, match=keyframe_id):
+            graph.get_state({"configurable": {"thread_id": "thread-1"}})
+
+    async def test_async_graph(self):
+        """ainvoke goes through aput/aget_tuple and round-trips the history"""
+        from langchain_core.messages import HumanMessage
+
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+
+        saver = CompactMemorySaver().configure(keyframe_interval=3)
+        graph = _graph(saver)
+        config = {"configurable": {"thread_id": "async-thread"}}
+        for i in range(5):
+            await graph.ainvoke({"messages": [HumanMessage(content=f"question {i}")]}, config)
+
+        state = await graph.aget_state(config)
+        assert [m.content for m in state.values["messages"][::2]] == [f"question {i}" for i in range(5)]
+        assert len([s async for s in graph.aget_state_history(config)]) == 15  # input, respond, end per turn
+
+
+@pytest.mark.xdist_group(name="checkpoint_serializer_tests")
+class TestCheckpointerFactory:
+    """Tests for checkpoint_serializer in _create_checkpointer"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_compact_memory_checkpointer(self):
+        """checkpoint_serializer='compact' selects the compact saver with configured options"""
+        from mcp_server_langgraph.core.agent import _create_checkpointer
+        from mcp_server_langgraph.core.checkpoint_serializer import CompactMemorySaver
+        from mcp_server_langgraph.core.config import Settings
+
+        settings = Settings(
+            checkpoint_backend="memory",
+            checkpoint_serializer="compact",
+            checkpoint_compression="none",
+            checkpoint_keyframe_interval=7,
+        )
+
+        checkpointer = _create_checkpointer(settings)
+
+        assert isinstance(checkpointer, CompactMemorySaver)
+        assert checkpointer.keyframe_interval == 7
+        assert checkpointer.compact_serde.compression == "none"
+
+    def test_default_is_unchanged(self):
+        """The default serializer keeps the plain MemorySaver"""
+        from langgraph.checkpoint.memory import MemorySaver
+
+        from mcp_server_langgraph.core.agent import _create_checkpointer
+        from mcp_server_langgraph.core.config import Settings
+
+        checkpointer = _create_checkpointer(Settings(checkpoint_backend="memory"))
+
+        assert type(checkpointer) is MemorySaver
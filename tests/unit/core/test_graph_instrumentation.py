@@ -0,0 +1,163 @@
+"""
+Tests for per-node agent graph instrumentation.
+
+Covers:
+- Duration, tokens, cache hits and state size recorded per node
+- Ranking by cumulative cost for /debug/graph-stats
+- Wrapped nodes still compile and run inside a LangGraph StateGraph
+"""
+
+import gc
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class _State(TypedDict):
+    messages: Annotated[list, operator.add]
+    next_action: str
+
+
+@pytest.mark.xdist_group(name="graph_instrumentation_tests")
+class TestInstrumentNode:
+    """Tests for instrument_node and GraphStats"""
+
+    def setup_method(self):
+        from mcp_server_langgraph.core.graph_instrumentation import get_graph_stats
+
+        get_graph_stats().reset()
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def test_records_tokens_and_cache_hits_inside_node(self):
+        """LLM tokens and cache lookups made inside a node are attributed to it"""
+        from mcp_server_langgraph.core.graph_instrumentation import get_graph_stats, instrument_node
+        from mcp_server_langgraph.llm.metrics import record_llm_token_usage
+
+        async def generate_response(state):
+            from mcp_server_langgraph.core.graph_instrumentation import record_node_cache_access
+
+            record_llm_token_usage("test-model", 100, 20)
+            record_node_cache_access(hit=True)
+            record_node_cache_access(hit=False)
+            return {**state, "next_action": "verify"}
+
+        node = instrument_node("generate_response", generate_response)
+        result = await node({"messages": [], "next_action": ""})
+
+        assert result["next_action"] == "verify"
+        [row] = get_graph_stats().ranked()
+        assert row["node"] == "generate_response"
+        assert row["calls"] == 1
+        assert row["total_tokens"] == 120
+        assert row["llm_calls"] == 1
+        assert row["cache_hits"] == 1
+        assert row["cache_misses"] == 1
+        assert row["mean_state_bytes"] > 0
+
+    async def test_usage_outside_nodes_is_ignored(self):
+        """Token usage outside a node does not leak into node stats"""
+        from mcp_server_langgraph.core.graph_instrumentation import get_graph_stats, record_node_llm_tokens
+
+        record_node_llm_tokens(10, 10)
+
+        assert get_graph_stats().ranked() == []
+
+    async def test_errors_are_counted_and_reraised(self):
+        """A failing node is recorded as an error and the exception propagates"""
+        from mcp_server_langgraph.core.graph_instrumentation import get_graph_stats, instrument_node
+
+        async def verify_response(state):
+            msg = "judge unavailable"
+            raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="judge unavailable"):
+            await instrument_node("verify_response", verify_response)({"messages": []})
+
+        [row] = get_graph_stats().ranked()
+        assert row["errors"] == 1
+
+    def test_ranking_by_cost(self):
+        """Nodes are ranked by the requested cumulative cost with their share"""
+        from mcp_server_langgraph.core.graph_instrumentation import GraphStats, NodeUsage
+
+        stats = GraphStats()
+        stats.record("route_input", 5.0, NodeUsage(), 100, error=False)
+        stats.record("generate_response", 800.0, NodeUsage(prompt_tokens=900, completion_tokens=100), 400, error=False)
+        stats.record("verify_response", 300.0, NodeUsage(prompt_tokens=2000), 400, error=False)
+
+        by_duration = stats.ranked("duration")
+        by_tokens = stats.ranked("tokens")
+
+        assert [row["node"] for row in by_duration] == ["generate_response", "verify_response", "route_input"]
+        assert [row["node"] for row in by_tokens][0] == "verify_response"
+        assert sum(row["share"] for row in by_duration) == pytest.approx(1.0, abs=0.001)
+
+    def test_estimate_state_bytes(self):
+        """Message content dominates the estimate; other keys are JSON-sized"""
+        from langchain_core.messages import HumanMessage
+
+        from mcp_server_langgraph.core.graph_instrumentation import estimate_state_bytes
+
+        state = {"messages": [HumanMessage(content="x" * 1000)], "next_action": "respond"}
+
+        assert 1000 < estimate_state_bytes(state) < 1100
+        assert estimate_state_bytes(None) == 0
+
+    async def test_instrumented_nodes_run_in_state_graph(self):
+        """LangGraph accepts the wrapper and the node is recorded under its name"""
+        from langchain_core.messages import AIMessage, HumanMessage
+        from langgraph.graph import END, START, StateGraph
+
+        from mcp_server_langgraph.core.graph_instrumentation import get_graph_stats, instrument_node
+
+        async def route_input(state: _State) -> _State:
+            return {"messages": [AIMessage(content="routed")], "next_action": "respond"}
+
+        workflow = StateGraph(_State)
+        workflow.add_node("router", instrument_node("route_input", route_input))
+        workflow.add_edge(START, "router")
+        workflow.add_edge("router", END)
+
+        result = await workflow.compile().ainvoke({"messages": [HumanMessage(content="hi")], "next_action": ""})
+
+        assert result["next_action"] == "respond"
+        assert [row["node"] for row in get_graph_stats().ranked()] == ["route_input"]
+
+
+@pytest.mark.xdist_group(name="graph_instrumentation_tests")
+class TestGraphStatsEndpoint:
+    """Tests for GET /debug/graph-stats"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_ranked_nodes_for_admin(self):
+        """Admins get the ranked node list; reset clears it"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from mcp_server_langgraph.api.debug import get_current_user, router
+        from mcp_server_langgraph.core.graph_instrumentation import NodeUsage, get_graph_stats
+
+        get_graph_stats().reset()
+        get_graph_stats().record("generate_response", 50.0, NodeUsage(prompt_tokens=10), 10, error=False)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": "user:alice", "roles": ["admin"]}
+        client = TestClient(app)
+
+        response = client.get("/debug/graph-stats?by=tokens&reset=true")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ranked_by"] == "tokens"
+        assert body["nodes"][0]["node"] == "generate_response"
+        assert client.get("/debug/graph-stats").json()["nodes"] == []
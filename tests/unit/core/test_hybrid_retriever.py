@@ -0,0 +1,130 @@
+"""
+Unit tests for hybrid retrieval building blocks.
+
+Covers:
+- Identifier-aware tokenization and symbol query detection
+- Incremental BM25 indexing, replacement and removal
+- Reciprocal-rank fusion
+"""
+
+import gc
+
+import pytest
+
+from mcp_server_langgraph.core.hybrid_retriever import BM25Index, reciprocal_rank_fusion, symbol_term, tokenize
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.xdist_group(name="testhybridretriever")
+class TestTokenization:
+    """Tests for tokenize() and symbol_term()"""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_compound_identifiers_kept_whole_and_split(self):
+        """Identifiers index as a whole term plus their parts"""
+        assert tokenize("Use ParallelToolExecutor.") == ["use", "paralleltoolexecutor", "parallel", "tool", "executor"]
+        assert tokenize("see core.agent and user-042") == [
+            "see",
+            "core.agent",
+            "core",
+            "agent",
+            "and",
+            "user-042",
+            "user",
+            "042",
+        ]
+        assert tokenize("HTTPServer get_tool_by_name") == [
+            "httpserver",
+            "http",
+            "server",
+            "get_tool_by_name",
+            "get",
+            "tool",
+            "by",
+            "name",
+        ]
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("ref_8f2c", "ref_8f2c"),
+            ("`ParallelToolExecutor`", "paralleltoolexecutor"),
+            ("getUser()", "getuser"),
+            ("core.dynamic_context_loader", "core.dynamic_context_loader"),
+            ("timeout", None),
+            ("how do retries work", None),
+            ("", None),
+        ],
+    )
+    def test_symbol_term(self, query, expected):
+        """Only single ID-like tokens are treated as symbol lookups"""
+        assert symbol_term(query) == expected
+
+
+@pytest.mark.xdist_group(name="testhybridretriever")
+class TestBM25Index:
+    """Tests for the incremental BM25 index"""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_ranks_by_term_relevance(self):
+        """Rarer terms and higher term frequency rank documents higher"""
+        index = BM25Index()
+        index.add("a", "retry policy for the http client retry retry")
+        index.add("b", "the http client sends requests")
+        index.add("c", "unrelated notes about the weather")
+
+        results = index.search("retry client")
+
+        assert [doc_id for doc_id, _ in results] == ["a", "b"]
+        assert results[0][1] > results[1][1] > 0
+
+    def test_add_replaces_and_remove_drops(self):
+        """Re-adding a document replaces its terms; removed documents stop matching"""
+        index = BM25Index()
+        index.add("a", "old wording")
+        index.add("a", "new wording")
+        index.add("b", "other text")
+
+        assert index.search("old") == []
+        assert [doc_id for doc_id, _ in index.search("new")] == ["a"]
+
+        index.remove("a")
+        index.remove("missing")
+
+        assert len(index) == 1
+        assert "a" not in index
+        assert index.documents_with_term("wording") == set()
+
+    def test_filter_and_top_k(self):
+        """doc_filter excludes documents and top_k bounds the results"""
+        index = BM25Index()
+        for i in range(5):
+            index.add(f"d{i}", "shared term " * (i + 1))
+
+        results = index.search("shared", top_k=2, doc_filter=lambda doc_id: doc_id != "d4")
+
+        assert len(results) == 2
+        assert "d4" not in {doc_id for doc_id, _ in results}
+
+
+@pytest.mark.xdist_group(name="testhybridretriever")
+class TestReciprocalRankFusion:
+    """Tests for reciprocal_rank_fusion()"""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_items_ranked_by_both_lists_win(self):
+        """An item ranked in both lists beats items ranked first in only one"""
+        fused = reciprocal_rank_fusion([["x", "shared"], ["y", "shared"]], k=60)
+
+        assert fused[0] == ("shared", pytest.approx(2 / 62))
+        assert {doc_id for doc_id, _ in fused[1:]} == {"x", "y"}
@@ -0,0 +1,164 @@
+"""
+Unit tests for DAG tool execution with result references.
+
+Covers:
+- Tools start as soon as their own dependencies finish, not per level
+- "$<id>.result" placeholders become dependencies and are substituted
+- Positional aliases, failed and unknown references
+"""
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+from mcp_server_langgraph.core.parallel_executor import (
+    ParallelToolExecutor,
+    ToolInvocation,
+    find_references,
+    substitute_references,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.xdist_group(name="testparallelexecutordag")
+class TestDagScheduling:
+    """Tests for as-soon-as-ready scheduling"""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def test_dependent_starts_before_slow_sibling_finishes(self):
+        """A dependent of a fast tool does not wait for an unrelated slow tool in the same level"""
+        started: dict[str, float] = {}
+
+        async def tool(name: str, args: dict) -> str:
+            started[name] = time.perf_counter()
+            await asyncio.sleep({"slow": 0.3, "fast": 0.01, "after_fast": 0.01}[name])
+            return name
+
+        invocations = [
+            ToolInvocation(tool_name="slow", arguments={}, invocation_id="a"),
+            ToolInvocation(tool_name="fast", arguments={}, invocation_id="b"),
+            ToolInvocation(tool_name="after_fast", arguments={}, invocation_id="c", dependencies=["b"]),
+        ]
+
+        begin = time.perf_counter()
+        results = await ParallelToolExecutor(max_parallelism=5).execute_parallel(invocations, tool)
+
+        assert [r.result for r in results] == ["slow", "fast", "after_fast"]
+        assert started["after_fast"] - begin < 0.2
+
+    async def test_cycle_rejected(self):
+        """A reference cycle is reported before anything runs"""
+
+        async def tool(name: str, args: dict) -> str:
+            raise AssertionError("should not run")
+
+        invocations = [
+            ToolInvocation(tool_name="a", arguments={"x": "$2.result"}, invocation_id="1"),
+            ToolInvocation(tool_name="b", arguments={"x": "$1.result"}, invocation_id="2"),
+        ]
+
+        with pytest.raises(ValueError, match="Circular"):
+            await ParallelToolExecutor().execute_parallel(invocations, tool, resolve_references=True)
+
+
+@pytest.mark.xdist_group(name="testparallelexecutordag")
+class TestResultReferences:
+    """Tests for placeholder dependencies and substitution"""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_find_and_substitute_nested(self):
+        """Whole-value placeholders keep the result type; embedded ones are interpolated"""
+        args = {"ids": "$a.result", "query": "summarize $b.result please", "nested": [{"v": "$a.result"}], "n": 3}
+
+        assert find_references(args) == {"a", "b"}
+        assert substitute_references(args, {"a": [1, 2], "b": "text"}) == {
+            "ids": [1, 2],
+            "query": "summarize text please",
+            "nested": [{"v": [1, 2]}],
+            "n": 3,
+        }
+
+    async def test_outputs_flow_into_dependent_calls(self):
+        """A chain search -> summarize -> translate runs in one pass with outputs substituted"""
+        calls = []
+
+        async def tool(name: str, args: dict) -> str:
+            calls.append((name, args))
+            return {"search": "raw docs", "summarize": f"summary of {args.get('text')}"}.get(name, f"fr: {args.get('text')}")
+
+        invocations = [
+            ToolInvocation(tool_name="translate", arguments={"text": "$call_2.result"}, invocation_id="call_3"),
+            ToolInvocation(tool_name="search", arguments={"query": "LangGraph"}, invocation_id="call_1"),
+            ToolInvocation(tool_name="summarize", arguments={"text": "$call_1.result"}, invocation_id="call_2"),
+        ]
+
+        results = await ParallelToolExecutor().execute_parallel(invocations, tool, resolve_references=True)
+
+        assert [name for name, _ in calls] == ["search", "summarize", "translate"]
+        assert results[0].result == "fr: summary of raw docs"
+        assert results[0].invocation_id == "call_3"
+
+    async def test_positional_aliases(self):
+        """Placeholders may use 1-based positions mapped through aliases"""
+
+        async def tool(name: str, args: dict) -> str:
+            return f"{name}({args.get('input', '')})"
+
+        invocations = [
+            ToolInvocation(tool_name="first", arguments={}, invocation_id="toolu_abc"),
+            ToolInvocation(tool_name="second", arguments={"input": "$1.result"}, invocation_id="toolu_def"),
+        ]
+
+        results = await ParallelToolExecutor().execute_parallel(
+            invocations, tool, resolve_references=True, aliases={"1": "toolu_abc", "2": "toolu_def"}
+        )
+
+        assert results[1].result == "second(first())"
+
+    async def test_failed_or_unknown_reference_skips_call(self):
+        """Dependents of a failed call, and calls referencing unknown IDs, are skipped with an error"""
+        ran = []
+
+        async def tool(name: str, args: dict) -> str:
+            ran.append(name)
+            if name == "broken":
+                raise RuntimeError("boom")
+            return "ok"
+
+        invocations = [
+            ToolInvocation(tool_name="broken", arguments={}, invocation_id="1"),
+            ToolInvocation(tool_name="needs_broken", arguments={"x": "$1.result"}, invocation_id="2"),
+            ToolInvocation(tool_name="needs_missing", arguments={"x": "$9.result"}, invocation_id="3"),
+        ]
+
+        results = await ParallelToolExecutor().execute_parallel(invocations, tool, resolve_references=True)
+
+        assert ran == ["broken"]
+        assert "dependency failed" in str(results[1].error)
+        assert "unknown tool result reference" in str(results[2].error)
+
+    async def test_placeholders_left_alone_without_resolution(self):
+        """Without resolve_references, placeholder strings are passed through unchanged"""
+        seen = []
+
+        async def tool(name: str, args: dict) -> str:
+            seen.append(args)
+            return "ok"
+
+        invocations = [
+            ToolInvocation(tool_name="a", arguments={}, invocation_id="1"),
+            ToolInvocation(tool_name="b", arguments={"x": "$1.result"}, invocation_id="2"),
+        ]
+
+        await ParallelToolExecutor().execute_parallel(invocations, tool)
+
+        assert {"x": "$1.result"} in seen
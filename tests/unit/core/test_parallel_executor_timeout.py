@@ -122,6 +122,22 @@ class TestParallelExecutorTimeouts:
         assert results[0].result == "completed"
         assert results[0].error is None
 
+    async def test_tool_raised_timeout_without_configured_timeout(self):
+        """A tool's own TimeoutError is reported as its error when no timeout or deadline applies"""
+        executor = ParallelToolExecutor(max_parallelism=1, task_timeout_seconds=None)
+
+        async def http_tool(name: str, args: dict):
+            raise TimeoutError("upstream read timed out")
+
+        invocations = [ToolInvocation(tool_name="http", arguments={}, invocation_id="inv1")]
+
+        results = await executor.execute_parallel(invocations, http_tool)
+
+        assert len(results) == 1
+        assert isinstance(results[0].error, TimeoutError)
+        assert str(results[0].error) == "upstream read timed out"
+        assert results[0].result is None
+
     async def test_timeout_value_in_tool_result(self):
         """
         Test that timeout errors are properly recorded in ToolResult.
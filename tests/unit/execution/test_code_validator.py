@@ -6,6 +6,7 @@ Following TDD best practices - these tests should FAIL until implementation is c
 """
 
 import gc
+from unittest.mock import MagicMock
 
 import pytest
 from hypothesis import given
@@ -512,3 +513,132 @@ class TestCodeValidationError:
         """Test that CodeValidationError inherits from Exception"""
         error = CodeValidationError("Test error")
         assert isinstance(error, Exception)
+
+
+@pytest.mark.unit
+@pytest.mark.xdist_group(name="testcodevalidatorcache")
+class TestValidationCacheAndPrefilter:
+    """Test result caching and the regex pre-filter"""
+
+    def setup_method(self) -> None:
+        CodeValidator.clear_cache()
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers"""
+        CodeValidator.clear_cache()
+        gc.collect()
+
+    def test_repeated_code_is_not_reparsed(self):
+        """A second validation of the same code (even from a new validator) is a cache hit"""
+        from unittest.mock import patch
+
+        from mcp_server_langgraph.execution import code_validator
+
+        code = "import json\nprint(json.dumps({'a': 1}))"
+        with patch.object(code_validator.ast, "parse", wraps=code_validator.ast.parse) as parse:
+            first = CodeValidator(allowed_imports=["json"]).validate(code)
+            second = CodeValidator(allowed_imports=["json"]).validate(code)
+
+        assert parse.call_count == 1
+        assert first.is_valid and second.is_valid
+
+    def test_cache_is_keyed_by_allowlist(self):
+        """The same code is re-validated under a different import allowlist"""
+        code = "import json"
+
+        assert CodeValidator(allowed_imports=["json"]).validate(code).is_valid is True
+        assert CodeValidator(allowed_imports=["math"]).validate(code).is_valid is False
+
+    def test_cached_results_are_not_shared(self):
+        """Mutating a returned result does not affect later cache hits"""
+        validator = CodeValidator(allowed_imports=[])
+        first = validator.validate("import json")
+        first.errors.clear()
+
+        assert validator.validate("import json").errors
+
+    def test_cache_is_bounded(self):
+        """The least recently used entry is evicted past VALIDATION_CACHE_SIZE"""
+        from unittest.mock import patch
+
+        from mcp_server_langgraph.execution import code_validator
+
+        validator = CodeValidator(allowed_imports=[])
+        with patch.object(code_validator, "VALIDATION_CACHE_SIZE", 2):
+            for i in range(3):
+                validator.validate(f"x = {i}")
+
+        assert len(CodeValidator._cache) == 2
+
+    def test_prefilter_rejects_without_parsing(self):
+        """Blocked imports and builtin calls are rejected with the same errors the AST check reports"""
+        from unittest.mock import patch
+
+        from mcp_server_langgraph.execution import code_validator
+
+        code = "import os\nfrom subprocess import run\nresult = eval('1')"
+        expected = CodeValidator(allowed_imports=[])._validate_ast(code).errors
+
+        with patch.object(code_validator.ast, "parse") as parse:
+            result = CodeValidator(allowed_imports=[]).validate(code)
+
+        parse.assert_not_called()
+        assert result.is_valid is False
+        assert set(result.errors) <= set(expected)
+        assert len(result.errors) == 3
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "print('do not call eval(x)')",
+            "# open() is blocked\nx = 1",
+            "def open(self):\n    return 1",
+            "import osmosis",
+            "value = record.id",
+        ],
+    )
+    def test_prefilter_leaves_lookalikes_to_the_ast_check(self, code):
+        """Strings, comments, definitions and similar names are not rejected by the pre-filter"""
+        assert CodeValidator._prefilter_errors(code) == []
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            'doc = """\nimport os\n"""\nprint(doc)',
+            'doc = """\nrun eval(x) here\n"""',
+            "doc = '''\nfrom subprocess import run\n'''",
+            'note = """\n    open(path)\n"""  # eval(x)',
+        ],
+    )
+    def test_prefilter_ignores_multiline_strings(self, code):
+        """Blocked names inside triple-quoted strings are not rejected, and the result matches the AST check"""
+        validator = CodeValidator(allowed_imports=[])
+
+        assert CodeValidator._prefilter_errors(code) == []
+        assert validator.validate(code).is_valid is validator._validate_ast(code).is_valid is True
+        # The cached result is the AST verdict too
+        assert validator.validate(code).is_valid is True
+
+    def test_prefilter_defers_untokenizable_code_to_the_ast_check(self):
+        """Code that does not tokenize is never rejected by the pre-filter"""
+        code = 'import os\ndoc = """unterminated'
+
+        assert CodeValidator._prefilter_errors(code) == []
+        assert CodeValidator(allowed_imports=[]).validate(code).is_valid is False
+
+    def test_latency_recorded_by_outcome(self):
+        """Validation latency is recorded per path taken"""
+        from unittest.mock import patch
+
+        from mcp_server_langgraph.execution import code_validator
+
+        with patch.dict(code_validator._validation_latency, {k: MagicMock() for k in code_validator._validation_latency}):
+            validator = CodeValidator(allowed_imports=["json"])
+            validator.validate("import json")
+            validator.validate("import json")
+            validator.validate("import os")
+
+            latency = code_validator._validation_latency
+            assert latency["parsed"].record.call_count == 1
+            assert latency["cache_hit"].record.call_count == 1
+            assert latency["prefilter"].record.call_count == 1
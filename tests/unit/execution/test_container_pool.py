@@ -0,0 +1,255 @@
+"""
+Unit tests for the warm sandbox container pool.
+
+Covers:
+- ContainerPool warms min_idle containers, hands them out once and replaces them
+- Misses create inline; max_total bounds live containers and acquire() times out
+- Dead idle containers are discarded; idle containers are replaced at max_idle_age
+- DockerSandbox feeds code to pooled executor containers over stdin with the
+  same security options as per-execution containers
+"""
+
+import gc
+import itertools
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    from docker.errors import NotFound  # noqa: F401
+
+    DOCKER_AVAILABLE = True
+except ImportError:
+    DOCKER_AVAILABLE = False
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeBackend:
+    """Counts containers created and destroyed by the pool"""
+
+    def __init__(self):
+        self._ids = itertools.count()
+        self.created = []
+        self.destroyed = []
+        self.lock = threading.Lock()
+
+    def create(self):
+        container = f"c{next(self._ids)}"
+        with self.lock:
+            self.created.append(container)
+        return container
+
+    def destroy(self, container):
+        with self.lock:
+            self.destroyed.append(container)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+@pytest.mark.xdist_group(name="container_pool_tests")
+class TestContainerPool:
+    """Tests for ContainerPool"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_warms_min_idle_and_records_hits(self):
+        """Idle containers are pre-created and served as hits, then replaced"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=2, max_total=4)
+        _wait_for(lambda: pool.idle_count == 2)
+
+        with patch("mcp_server_langgraph.execution.container_pool._pool_hits") as hits:
+            container = pool.acquire()
+
+        hits.add.assert_called_once_with(1)
+        assert container in backend.created
+        _wait_for(lambda: pool.idle_count == 2)  # Topped back up
+        pool.close()
+
+    def test_containers_are_single_use(self):
+        """Released containers are destroyed, never handed out again"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=1, max_total=2)
+
+        seen = []
+        for _ in range(5):
+            container = pool.acquire()
+            seen.append(container)
+            pool.release(container)
+
+        assert len(set(seen)) == 5
+        _wait_for(lambda: set(seen) <= set(backend.destroyed))
+        pool.close()
+
+    def test_miss_creates_inline(self):
+        """With no idle container, acquire() creates one and counts a miss"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=0, max_total=2)
+
+        with patch("mcp_server_langgraph.execution.container_pool._pool_misses") as misses:
+            container = pool.acquire()
+
+        misses.add.assert_called_once_with(1)
+        assert backend.created == [container]
+        assert pool.total_count == 1
+        pool.close()
+
+    def test_max_total_bounds_live_containers(self):
+        """At max_total, acquire() waits and then fails with SandboxError"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+        from mcp_server_langgraph.execution.sandbox import SandboxError
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=0, max_total=2, acquire_timeout=0.05)
+        held = [pool.acquire(), pool.acquire()]
+
+        with pytest.raises(SandboxError, match="exhausted"):
+            pool.acquire()
+
+        pool.release(held[0])
+        pool.acquire_timeout = 2.0
+        assert pool.acquire() not in held
+        pool.close()
+
+    def test_dead_idle_container_is_discarded(self):
+        """Idle containers failing is_usable are removed instead of handed out"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=1, max_total=3, is_usable=lambda c: c != "c0")
+        _wait_for(lambda: pool.idle_count == 1)
+
+        assert pool.acquire() != "c0"
+        _wait_for(lambda: "c0" in backend.destroyed)
+        pool.close()
+
+    def test_idle_containers_replaced_at_max_idle_age(self):
+        """Idle containers are recycled before max_idle_age, so a warm one is always available"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=1, max_total=2, max_idle_age=0.2)
+        _wait_for(lambda: "c0" in backend.destroyed)
+        _wait_for(lambda: pool.idle_count == 1)
+
+        with patch("mcp_server_langgraph.execution.container_pool._pool_hits") as hits:
+            container = pool.acquire()
+
+        hits.add.assert_called_once_with(1)
+        assert container != "c0"
+        pool.close()
+
+    def test_expired_idle_container_is_not_handed_out(self):
+        """A container past max_idle_age at acquire() is discarded, even before its timer fires"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        backend = _FakeBackend()
+        pool = ContainerPool(backend.create, backend.destroy, min_idle=1, max_total=3, max_idle_age=60)
+        _wait_for(lambda: pool.idle_count == 1)
+
+        with patch("mcp_server_langgraph.execution.container_pool.time.monotonic", return_value=time.monotonic() + 120):
+            assert pool.acquire() != "c0"
+        _wait_for(lambda: "c0" in backend.destroyed)
+        pool.close()
+
+    def test_invalid_sizes_rejected(self):
+        """min_idle above max_total is a configuration error"""
+        from mcp_server_langgraph.execution.container_pool import ContainerPool
+
+        with pytest.raises(ValueError, match="min_idle"):
+            ContainerPool(lambda: None, lambda c: None, min_idle=5, max_total=2)
+
+
+@pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker package not installed")
+@pytest.mark.xdist_group(name="container_pool_tests")
+class TestPooledDockerSandbox:
+    """Tests for DockerSandbox with the warm pool enabled"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def _client(self):
+        client = MagicMock()
+        container = client.containers.create.return_value
+        container.wait.return_value = {"StatusCode": 0}
+        container.logs.return_value = b"4\n"
+        container.stats.return_value = {}
+        container.status = "running"
+        return client, container
+
+    def test_executes_via_stdin(self):
+        """Code is written to a pre-started executor container and the container is recycled"""
+        from mcp_server_langgraph.execution import docker_sandbox
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+        client, container = self._client()
+        with patch.object(docker_sandbox.docker, "DockerClient", return_value=client):
+            sandbox = docker_sandbox.DockerSandbox(limits=ResourceLimits.testing(), pool_min_idle=1, pool_max_total=2)
+            _wait_for(lambda: sandbox.pool.idle_count == 1)
+
+            result = sandbox.execute("print(2 + 2)")
+
+            assert result.success
+            assert result.stdout == "4\n"
+            sock = container.attach_socket.return_value
+            sock._sock.sendall.assert_called_once_with(b"print(2 + 2)")
+            sock._sock.close.assert_called_once()
+            _wait_for(lambda: container.remove.called)
+            sandbox.close()
+
+    def test_pooled_containers_keep_security_options(self):
+        """Executor containers are created with the same locked-down options"""
+        from mcp_server_langgraph.execution import docker_sandbox
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+        client, _ = self._client()
+        with patch.object(docker_sandbox.docker, "DockerClient", return_value=client):
+            sandbox = docker_sandbox.DockerSandbox(limits=ResourceLimits.testing(), pool_min_idle=1)
+            _wait_for(lambda: client.containers.create.called)
+            pooled = client.containers.create.call_args.kwargs
+            sandbox.close()
+
+            plain = docker_sandbox.DockerSandbox(limits=ResourceLimits.testing())
+            plain._create_container("print(1)")
+            direct = client.containers.create.call_args.kwargs
+
+        assert pooled.pop("command") == ["python", "-"]
+        assert pooled.pop("stdin_open") is True
+        assert pooled.pop("stdin_once") is True
+        direct.pop("command")
+        assert pooled == direct
+        assert pooled["read_only"] is True
+        assert pooled["cap_drop"] == ["ALL"]
+        assert pooled["network_disabled"] is True
+
+    def test_pool_disabled_by_default(self):
+        """Without pool_min_idle the sandbox creates a container per execution"""
+        from mcp_server_langgraph.execution import docker_sandbox
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+        client, container = self._client()
+        with patch.object(docker_sandbox.docker, "DockerClient", return_value=client):
+            sandbox = docker_sandbox.DockerSandbox(limits=ResourceLimits.testing())
+            result = sandbox.execute("print(2 + 2)")
+
+        assert sandbox.pool is None
+        assert result.success
+        container.attach_socket.assert_not_called()
+        container.remove.assert_called_once_with(force=True)
@@ -0,0 +1,239 @@
+"""
+Unit tests for Kubernetes sandbox with mocked Kubernetes API.
+
+Covers:
+- execute() waits on the watch API instead of polling job status
+- Warm pool of single-use executor pods: scheduling, exec, cleanup
+- Pooled pods get the same resource limits and security context as Job pods
+- Timeouts inside a pooled pod
+- Lost exit statuses (pod deleted, exec channel dropped) are failures
+"""
+
+import gc
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+kubernetes_sandbox = pytest.importorskip("mcp_server_langgraph.execution.kubernetes_sandbox")
+
+pytestmark = pytest.mark.unit
+
+
+def _pod(phase, exit_code=None, name="code-exec-pod"):
+    pod = MagicMock()
+    pod.metadata.name = name
+    pod.status.phase = phase
+    status = MagicMock()
+    status.state.terminated = None if exit_code is None else MagicMock(exit_code=exit_code)
+    pod.status.container_statuses = [status]
+    return pod
+
+
+class _FakeExec:
+    """Stand-in for the exec websocket: delivers one frame per update()"""
+
+    def __init__(self, frames, returncode=0, hang=False):
+        self.frames = list(frames)
+        self.pending = {"stdout": [], "stderr": []}
+        self.returncode = returncode
+        self.hang = hang
+        self.closed = False
+
+    def is_open(self):
+        return bool(self.frames) or self.hang
+
+    def update(self, timeout=0):
+        if self.frames:
+            channel, text = self.frames.pop(0)
+            self.pending[channel].append(text)
+        else:
+            time.sleep(min(timeout, 0.05))
+
+    def peek_stdout(self):
+        return bool(self.pending["stdout"])
+
+    def read_stdout(self):
+        return self.pending["stdout"].pop(0)
+
+    def peek_stderr(self):
+        return bool(self.pending["stderr"])
+
+    def read_stderr(self):
+        return self.pending["stderr"].pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+def _sandbox(**kwargs):
+    from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+    with (
+        patch.object(kubernetes_sandbox, "config"),
+        patch.object(kubernetes_sandbox.client, "BatchV1Api"),
+        patch.object(kubernetes_sandbox.client, "CoreV1Api"),
+    ):
+        return kubernetes_sandbox.KubernetesSandbox(limits=kwargs.pop("limits", ResourceLimits.testing()), **kwargs)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+@pytest.mark.xdist_group(name="kubernetes_sandbox_unit")
+class TestKubernetesJobExecution:
+    """Tests for Job-based execution"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_execute_uses_watch_not_polling(self):
+        """The sync path waits on pod watch events"""
+        sandbox = _sandbox()
+        sandbox.core_v1.list_namespaced_pod.return_value.items = [_pod("Succeeded", 0)]
+        sandbox.core_v1.read_namespaced_pod_log.return_value = "hello\n"
+
+        with patch.object(
+            kubernetes_sandbox.watch.Watch, "stream", return_value=iter([{"type": "MODIFIED", "object": _pod("Succeeded", 0)}])
+        ) as stream:
+            result = sandbox.execute("print('hello')")
+
+        assert result.success
+        assert result.stdout == "hello\n"
+        assert stream.call_args.kwargs["label_selector"].startswith("job-name=code-exec-")
+        sandbox.batch_v1.read_namespaced_job.assert_not_called()
+        sandbox.batch_v1.delete_namespaced_job.assert_called_once()
+
+    def test_pod_deleted_before_finishing_is_reported(self):
+        """A job pod deleted mid-run is a distinct failure, not a generic exit code 1"""
+        sandbox = _sandbox()
+        sandbox.core_v1.list_namespaced_pod.return_value.items = []
+
+        with patch.object(
+            kubernetes_sandbox.watch.Watch, "stream", return_value=iter([{"type": "DELETED", "object": _pod("Running")}])
+        ):
+            result = sandbox.execute("print('hello')")
+
+        assert not result.success
+        assert result.exit_code == 1
+        assert "deleted before it finished" in result.error_message
+
+
+@pytest.mark.xdist_group(name="kubernetes_sandbox_unit")
+class TestKubernetesPodPool:
+    """Tests for the warm executor pod pool"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    @staticmethod
+    def _running_watch(*args, **kwargs):
+        name = kwargs["field_selector"].split("=", 1)[1]
+        return iter([{"type": "MODIFIED", "object": _pod("Running", name=name)}])
+
+    def test_executes_in_prewarmed_pod_and_deletes_it(self):
+        """Code runs over exec in a pooled pod; stdout/stderr stay separate; the pod is single-use"""
+        with patch.object(kubernetes_sandbox.watch.Watch, "stream", side_effect=self._running_watch):
+            sandbox = _sandbox(pool_min_idle=1, pool_max_total=2)
+            _wait_for(lambda: sandbox.pool.idle_count == 1)
+            sandbox.core_v1.read_namespaced_pod.return_value.status.phase = "Running"
+
+            session = _FakeExec([("stdout", "4\n"), ("stderr", "warning\n")])
+            seen = []
+            with patch.object(kubernetes_sandbox, "k8s_stream", return_value=session) as k8s_stream:
+                result = sandbox._execute_blocking("print(2 + 2)", lambda stream, text: seen.append((stream, text)))
+
+            pod_name = k8s_stream.call_args.args[1]
+            assert result.success
+            assert (result.stdout, result.stderr) == ("4\n", "warning\n")
+            assert seen == [("stdout", "4\n"), ("stderr", "warning\n")]
+            assert k8s_stream.call_args.kwargs["command"] == ["python", "-c", "print(2 + 2)"]
+            assert session.closed
+            _wait_for(lambda: any(c.kwargs["name"] == pod_name for c in sandbox.core_v1.delete_namespaced_pod.call_args_list))
+            sandbox.close()
+
+        sandbox.batch_v1.create_namespaced_job.assert_not_called()
+
+    def test_pooled_pods_share_job_pod_security(self):
+        """Executor pods use the same container limits and security context as Job pods"""
+        with patch.object(kubernetes_sandbox.watch.Watch, "stream", side_effect=self._running_watch):
+            sandbox = _sandbox(pool_min_idle=1)
+            _wait_for(lambda: sandbox.core_v1.create_namespaced_pod.called)
+            pooled_spec = sandbox.core_v1.create_namespaced_pod.call_args.kwargs["body"].spec
+            sandbox.close()
+
+        job_spec = sandbox._pod_spec(["python", "-c", "pass"])
+        pooled, job = pooled_spec.containers[0], job_spec.containers[0]
+
+        assert pooled.security_context == job.security_context
+        assert pooled.resources == job.resources
+        assert pooled_spec.security_context == job_spec.security_context
+        assert pooled.security_context.allow_privilege_escalation is False
+        assert pooled_spec.active_deadline_seconds is not None
+
+    def test_idle_pods_recycled_before_active_deadline(self):
+        """Idle pods are replaced early enough that an acquired pod can run a full snippet"""
+        with patch.object(kubernetes_sandbox.watch.Watch, "stream", side_effect=self._running_watch):
+            sandbox = _sandbox(pool_min_idle=1, job_ttl=300)
+            _wait_for(lambda: sandbox.core_v1.create_namespaced_pod.called)
+            deadline = sandbox.core_v1.create_namespaced_pod.call_args.kwargs["body"].spec.active_deadline_seconds
+            max_idle_age = sandbox.pool.max_idle_age
+            sandbox.close()
+
+        assert max_idle_age is not None
+        assert max_idle_age + sandbox.limits.timeout_seconds <= deadline
+
+    def test_exec_without_exit_status_is_a_failure(self):
+        """An exec channel that closes without an exit status (pod evicted) is not reported as success"""
+        with patch.object(kubernetes_sandbox.watch.Watch, "stream", side_effect=self._running_watch):
+            sandbox = _sandbox(pool_min_idle=1)
+            _wait_for(lambda: sandbox.pool.idle_count == 1)
+            sandbox.core_v1.read_namespaced_pod.return_value.status.phase = "Running"
+
+            session = _FakeExec([("stdout", "partial\n")], returncode=None)
+            with patch.object(kubernetes_sandbox, "k8s_stream", return_value=session):
+                result = sandbox.execute("print('partial')")
+            sandbox.close()
+
+        assert not result.success
+        assert result.exit_code == 1
+        assert result.stdout == "partial\n"
+        assert "without an exit status" in result.error_message
+        assert "without an exit status" in result.stderr
+
+    def test_timeout_in_pooled_pod(self):
+        """Code that outlives the timeout is reported as timed out and its pod deleted"""
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+        limits = ResourceLimits(timeout_seconds=1)
+        with patch.object(kubernetes_sandbox.watch.Watch, "stream", side_effect=self._running_watch):
+            sandbox = _sandbox(limits=limits, pool_min_idle=1)
+            _wait_for(lambda: sandbox.pool.idle_count == 1)
+            sandbox.core_v1.read_namespaced_pod.return_value.status.phase = "Running"
+
+            with patch.object(kubernetes_sandbox, "k8s_stream", return_value=_FakeExec([], hang=True)):
+                result = sandbox.execute("while True: pass")
+
+            assert result.timed_out
+            assert result.exit_code == 124
+            _wait_for(lambda: sandbox.core_v1.delete_namespaced_pod.called)
+            sandbox.close()
+
+    def test_pod_that_fails_to_start_is_reported(self):
+        """A pod that never reaches Running fails acquisition and is deleted"""
+        from mcp_server_langgraph.execution.sandbox import SandboxError
+
+        sandbox = _sandbox()
+        with patch.object(
+            kubernetes_sandbox.watch.Watch, "stream", return_value=iter([{"type": "MODIFIED", "object": _pod("Failed")}])
+        ):
+            with pytest.raises(SandboxError, match="did not start"):
+                sandbox._create_executor_pod()
+
+        sandbox.core_v1.delete_namespaced_pod.assert_called_once()
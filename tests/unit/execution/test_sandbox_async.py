@@ -0,0 +1,242 @@
+"""
+Unit tests for the async sandbox API.
+
+Covers:
+- Sandbox.aexecute offloads execution and keeps the event loop responsive
+- Output chunks reach sync and async callbacks in order
+- DockerSandbox streams demultiplexed container output
+- KubernetesSandbox waits on a pod watch (no polling) and follows pod logs
+- execute_python.ainvoke uses aexecute and emits output as custom events
+"""
+
+import asyncio
+import gc
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+try:
+    from docker.errors import NotFound  # noqa: F401
+
+    DOCKER_AVAILABLE = True
+except ImportError:
+    DOCKER_AVAILABLE = False
+
+
+def _streaming_sandbox(chunks, delay=0.0):
+    from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+    from mcp_server_langgraph.execution.sandbox import ExecutionResult, Sandbox
+
+    class _Streaming(Sandbox):
+        def execute(self, code):
+            return self._execute_blocking(code, None)
+
+        def _execute_blocking(self, code, emit):
+            for chunk in chunks:
+                time.sleep(delay)
+                if emit is not None:
+                    emit("stdout", chunk)
+            return ExecutionResult(success=True, stdout="".join(chunks))
+
+    return _Streaming(ResourceLimits.testing())
+
+
+@pytest.mark.xdist_group(name="sandbox_async_tests")
+class TestSandboxAexecute:
+    """Tests for Sandbox.aexecute"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def test_does_not_block_event_loop(self):
+        """Other coroutines keep running while the sandbox executes"""
+        sandbox = _streaming_sandbox(["a", "b", "c"], delay=0.05)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await sandbox.aexecute("print(1)")
+        task.cancel()
+
+        assert result.stdout == "abc"
+        assert ticks >= 5
+
+    async def test_chunks_delivered_in_order(self):
+        """Sync and async callbacks both receive every chunk, in order, before aexecute returns"""
+        chunks = [str(i) for i in range(50)]
+        sync_seen, async_seen = [], []
+
+        async def async_callback(stream, text):
+            await asyncio.sleep(0)
+            async_seen.append(text)
+
+        await _streaming_sandbox(chunks).aexecute("x", on_output=lambda stream, text: sync_seen.append(text))
+        await _streaming_sandbox(chunks).aexecute("x", on_output=async_callback)
+
+        assert sync_seen == chunks
+        assert async_seen == chunks
+
+    async def test_default_reports_complete_output(self):
+        """Backends without streaming emit the full output once"""
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+        from mcp_server_langgraph.execution.sandbox import ExecutionResult, Sandbox
+
+        class _Blocking(Sandbox):
+            def execute(self, code):
+                self.thread = threading.current_thread()
+                return ExecutionResult(success=False, stdout="out", stderr="err", exit_code=1)
+
+        sandbox = _Blocking(ResourceLimits.testing())
+        seen = []
+        result = await sandbox.aexecute("x", on_output=lambda stream, text: seen.append((stream, text)))
+
+        assert seen == [("stdout", "out"), ("stderr", "err")]
+        assert result.exit_code == 1
+        assert sandbox.thread is not threading.main_thread()
+
+
+@pytest.mark.skipif(not DOCKER_AVAILABLE, reason="Docker package not installed")
+@pytest.mark.xdist_group(name="sandbox_async_tests")
+class TestDockerStreaming:
+    """Tests for DockerSandbox output streaming"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def test_streams_stdout_and_stderr(self):
+        """Demultiplexed chunks are decoded (across chunk boundaries) and forwarded"""
+        from mcp_server_langgraph.execution import docker_sandbox
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+        client = MagicMock()
+        container = client.containers.create.return_value
+        container.attach.return_value = iter([(b"line 1\n", None), (None, b"warn\n"), (b"caf\xc3", None), (b"\xa9\n", None)])
+        container.wait.return_value = {"StatusCode": 0}
+        container.logs.return_value = b"line 1\nwarn\ncaf\xc3\xa9\n"
+        container.stats.return_value = {}
+
+        with patch.object(docker_sandbox.docker, "DockerClient", return_value=client):
+            sandbox = docker_sandbox.DockerSandbox(limits=ResourceLimits.testing())
+            seen = []
+            result = await sandbox.aexecute("print(1)", on_output=lambda stream, text: seen.append((stream, text)))
+
+        assert seen == [("stdout", "line 1\n"), ("stderr", "warn\n"), ("stdout", "caf"), ("stdout", "é\n")]
+        assert result.success
+        assert container.attach.call_args.kwargs["demux"] is True
+
+
+@pytest.mark.xdist_group(name="sandbox_async_tests")
+class TestKubernetesWatch:
+    """Tests for KubernetesSandbox watch-based waiting"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    @staticmethod
+    def _pod(phase, exit_code=None):
+        pod = MagicMock()
+        pod.metadata.name = "code-exec-pod"
+        pod.status.phase = phase
+        state = MagicMock()
+        state.state.terminated = None if exit_code is None else MagicMock(exit_code=exit_code)
+        pod.status.container_statuses = [state]
+        return pod
+
+    def _sandbox(self, kubernetes_sandbox):
+        from mcp_server_langgraph.execution.resource_limits import ResourceLimits
+
+        with patch.object(kubernetes_sandbox, "config"), patch.object(kubernetes_sandbox, "client"):
+            sandbox = kubernetes_sandbox.KubernetesSandbox(limits=ResourceLimits.testing())
+        sandbox.batch_v1 = MagicMock()
+        sandbox.core_v1 = MagicMock()
+        return sandbox
+
+    async def test_aexecute_watches_pod_and_streams_logs(self):
+        """Completion comes from pod watch events; logs are followed while running"""
+        kubernetes_sandbox = pytest.importorskip("mcp_server_langgraph.execution.kubernetes_sandbox")
+        sandbox = self._sandbox(kubernetes_sandbox)
+
+        pods = sandbox.core_v1.list_namespaced_pod.return_value
+        pods.items = [self._pod("Succeeded", 0)]
+        sandbox.core_v1.read_namespaced_pod_log.side_effect = [
+            MagicMock(stream=MagicMock(return_value=iter([b"partial ", b"output\n"]))),
+            "partial output\n",
+        ]
+        events = [
+            [{"type": "ADDED", "object": self._pod("Pending")}, {"type": "MODIFIED", "object": self._pod("Running")}],
+            [{"type": "MODIFIED", "object": self._pod("Succeeded", 0)}],
+        ]
+
+        seen = []
+        with (
+            patch.object(kubernetes_sandbox, "client"),
+            patch.object(kubernetes_sandbox.watch.Watch, "stream", side_effect=[iter(e) for e in events]),
+        ):
+            result = await sandbox.aexecute("print('x')", on_output=lambda stream, text: seen.append(text))
+
+        assert result.success
+        assert result.stdout == "partial output\n"
+        assert seen == ["partial ", "output\n"]
+        sandbox.batch_v1.read_namespaced_job.assert_not_called()  # No polling
+
+    async def test_exit_code_from_terminated_container(self):
+        """A failed pod reports its container's exit code"""
+        kubernetes_sandbox = pytest.importorskip("mcp_server_langgraph.execution.kubernetes_sandbox")
+        sandbox = self._sandbox(kubernetes_sandbox)
+
+        with patch.object(
+            kubernetes_sandbox.watch.Watch,
+            "stream",
+            return_value=iter([{"type": "MODIFIED", "object": self._pod("Failed", 3)}]),
+        ):
+            assert sandbox._watch_job("job", time.time()) == (False, 3)
+
+
+@pytest.mark.xdist_group(name="sandbox_async_tests")
+class TestExecutePythonAsync:
+    """Tests for execute_python.ainvoke"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def test_ainvoke_streams_custom_events(self):
+        """Output chunks surface as code_execution_output events while the tool runs"""
+        from mcp_server_langgraph.tools.code_execution_tools import execute_python
+
+        sandbox = _streaming_sandbox(["hello ", "world\n"])
+        with patch("mcp_server_langgraph.tools.code_execution_tools._get_sandbox", return_value=sandbox):
+            events = [
+                event
+                async for event in execute_python.astream_events({"code": "print('hello world')"}, version="v2")
+                if event["event"] in ("on_custom_event", "on_tool_end")
+            ]
+
+        assert [e["data"] for e in events[:-1]] == [
+            {"stream": "stdout", "text": "hello "},
+            {"stream": "stdout", "text": "world\n"},
+        ]
+        assert events[-1]["event"] == "on_tool_end"
+        assert "hello world" in events[-1]["data"]["output"]
+
+    async def test_ainvoke_rejects_invalid_code_without_sandbox(self):
+        """Validation failures return before any sandbox is created"""
+        from mcp_server_langgraph.tools.code_execution_tools import execute_python
+
+        with patch("mcp_server_langgraph.tools.code_execution_tools._get_sandbox") as get_sandbox:
+            result = await execute_python.ainvoke({"code": "import os; os.system('ls')"})
+
+        assert "validation failed" in result.lower()
+        get_sandbox.assert_not_called()
@@ -640,7 +640,7 @@ class TestExecutePythonHandler:
             mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(return_value=None)
 
             with patch("mcp_server_langgraph.tools.code_execution_tools.execute_python") as mock_exec:
-                mock_exec.invoke = MagicMock(return_value=mock_result)
+                mock_exec.ainvoke = AsyncMock(return_value=mock_result)
 
                 with patch("mcp_server_langgraph.mcp.server_streamable.metrics"):
                     result = await server._handle_execute_python(
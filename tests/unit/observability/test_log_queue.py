@@ -0,0 +1,122 @@
+"""
+Tests for the non-blocking log pipeline and fast JSON encoding.
+
+Covers:
+- Records are formatted on the listener thread and flushed on stop
+- A full queue drops records (counted per level) instead of blocking
+- Span context captured at enqueue time survives the thread hop
+- dumps_json falls back to stdlib json for values orjson rejects
+"""
+
+import gc
+import io
+import json
+import logging
+
+import pytest
+
+from mcp_server_langgraph.observability.json_logger import CustomJSONFormatter, dumps_json
+from mcp_server_langgraph.observability.log_queue import get_log_queue_stats, start_queue_logging, stop_queue_logging
+
+pytestmark = pytest.mark.unit
+
+
+def _make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+@pytest.mark.xdist_group(name="log_queue_tests")
+class TestQueueLogging:
+    """Tests for QueueHandler/QueueListener logging"""
+
+    def teardown_method(self):
+        """Stop the listener and force GC to prevent mock accumulation in xdist workers"""
+        stop_queue_logging()
+        gc.collect()
+
+    def test_records_written_by_listener(self):
+        """Queued records are formatted with extras and flushed on stop"""
+        stream = io.StringIO()
+        output = logging.StreamHandler(stream)
+        output.setFormatter(CustomJSONFormatter(service_name="test", include_hostname=False))
+
+        logger = _make_logger("test.log_queue.written", start_queue_logging([output]))
+        logger.info("User %s logged in", "alice", extra={"user_id": "alice"})
+        stop_queue_logging()
+
+        log_data = json.loads(stream.getvalue().splitlines()[0])
+        assert log_data["message"] == "User alice logged in"
+        assert log_data["user_id"] == "alice"
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        """Records beyond the queue bound are dropped and counted"""
+
+        class BlockedHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                import threading
+
+                self.unblocked = threading.Event()
+
+            def emit(self, record):
+                self.unblocked.wait(timeout=5)
+
+        blocked = BlockedHandler()
+        logger = _make_logger("test.log_queue.dropped", start_queue_logging([blocked], maxsize=2))
+
+        for i in range(20):
+            logger.warning("event %d", i)
+
+        dropped = get_log_queue_stats()["dropped"]
+        blocked.unblocked.set()
+
+        assert dropped["WARNING"] >= 17
+
+    def test_span_context_captured_at_enqueue(self):
+        """trace_id is taken from the caller's span, not the listener thread"""
+        from opentelemetry import trace
+        from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+        stream = io.StringIO()
+        output = logging.StreamHandler(stream)
+        output.setFormatter(CustomJSONFormatter(service_name="test", include_hostname=False))
+        logger = _make_logger("test.log_queue.trace", start_queue_logging([output]))
+
+        span_context = SpanContext(
+            trace_id=0x0AF7651916CD43DD8448EB211C80319C,
+            span_id=0x00F067AA0BA902B7,
+            is_remote=False,
+            trace_flags=TraceFlags(TraceFlags.SAMPLED),
+        )
+        with trace.use_span(NonRecordingSpan(span_context)):
+            logger.info("inside span")
+        stop_queue_logging()
+
+        log_data = json.loads(stream.getvalue().splitlines()[0])
+        assert log_data["trace_id"] == "0af7651916cd43dd8448eb211c80319c"
+
+
+@pytest.mark.xdist_group(name="log_queue_tests")
+class TestDumpsJson:
+    """Tests for the fast JSON encoder"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_non_serializable_values_rendered_as_str(self):
+        """Unknown types are stringified, matching json.dumps(default=str)"""
+        assert json.loads(dumps_json({"value": object}))["value"] == str(object)
+
+    def test_falls_back_for_big_integers(self):
+        """Values orjson rejects are serialized by stdlib json"""
+        assert json.loads(dumps_json({"big": 2**70}))["big"] == 2**70
+
+    def test_indent_is_honored(self):
+        """Indented output is produced for any indent"""
+        assert "\n    " in dumps_json({"a": 1}, indent=4)
+        assert "\n  " in dumps_json({"a": 1}, indent=2)
@@ -0,0 +1,173 @@
+"""
+Tests for the event-loop lag monitor and blocking-call detector.
+
+Covers:
+- Drift samples are recorded (and land in the Prometheus histogram)
+- Blocking callbacks are detected, stack-sampled and attributed to a module,
+  including blocks shorter than the sampling interval
+- /debug/loop is admin-only
+"""
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _block_loop(seconds: float) -> None:
+    time.sleep(seconds)  # Deliberately blocking call on the event loop
+
+
+@pytest.mark.xdist_group(name="loop_monitor_tests")
+class TestEventLoopMonitor:
+    """Tests for EventLoopMonitor"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    async def test_records_lag_samples(self):
+        """Each interval produces a drift sample"""
+        from mcp_server_langgraph.observability.loop_monitor import EventLoopMonitor
+
+        monitor = EventLoopMonitor(interval=0.01)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            monitor.stop()
+
+        snapshot = monitor.snapshot()
+        assert snapshot["samples"] >= 3
+        assert snapshot["running"] is False
+        assert snapshot["blocking"]["enabled"] is False
+
+    async def test_blocking_call_shows_up_as_lag(self):
+        """A blocking call on the loop delays the next sample by about its duration"""
+        from mcp_server_langgraph.observability.loop_monitor import EventLoopMonitor
+
+        monitor = EventLoopMonitor(interval=0.01)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            _block_loop(0.1)
+            await asyncio.sleep(0.03)
+        finally:
+            monitor.stop()
+
+        assert monitor.snapshot()["lag_ms"]["max"] >= 80
+
+    async def test_blocking_callback_is_stack_sampled_and_attributed(self):
+        """Debug mode samples the blocked stack and attributes it to the calling module"""
+        from mcp_server_langgraph.observability.loop_monitor import EventLoopMonitor
+
+        monitor = EventLoopMonitor(interval=0.01, blocking_threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            _block_loop(0.25)
+            await asyncio.sleep(0.03)
+        finally:
+            monitor.stop()
+
+        blocking = monitor.snapshot()["blocking"]
+        assert blocking["total"] == 1
+        assert blocking["by_module"] == {__name__: 1}
+        event = blocking["recent"][0]
+        assert event["module"] == __name__
+        assert any("_block_loop" in entry for entry in event["stack"])
+        assert event["blocked_ms"] >= 200  # Final duration, filled in when the loop resumed
+
+    async def test_block_between_samples_is_detected(self):
+        """A block that starts and ends between two drift samples is still caught by the watchdog"""
+        from mcp_server_langgraph.observability.loop_monitor import EventLoopMonitor
+
+        # The first drift sample is due after 1s, long after the block has ended
+        monitor = EventLoopMonitor(interval=1.0, blocking_threshold=0.05)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            _block_loop(0.12)
+            await asyncio.sleep(0.03)
+        finally:
+            monitor.stop()
+
+        snapshot = monitor.snapshot()
+        assert snapshot["samples"] == 0
+        assert snapshot["blocking"]["total"] == 1
+        assert snapshot["blocking"]["recent"][0]["blocked_ms"] >= 80
+
+    def test_attribution_prefers_first_party_frames(self):
+        """Frames in mcp_server_langgraph win over third-party and stdlib frames"""
+        from types import SimpleNamespace
+
+        from mcp_server_langgraph.observability.loop_monitor import attribute_module
+
+        def frame(module, back=None):
+            return SimpleNamespace(f_globals={"__name__": module}, f_back=back)
+
+        app = frame("mcp_server_langgraph.core.cache", frame("asyncio.events"))
+        stack = frame("socket", frame("redis.connection", app))
+
+        assert attribute_module(stack) == "mcp_server_langgraph.core.cache"
+        assert attribute_module(frame("socket", frame("redis.connection"))) == "redis.connection"
+        assert attribute_module(frame("socket")) == "socket"
+
+    async def test_start_loop_monitor_from_settings(self):
+        """Settings control whether the process-wide monitor runs"""
+        from types import SimpleNamespace
+
+        from mcp_server_langgraph.observability.loop_monitor import (
+            get_loop_monitor,
+            start_loop_monitor_from_settings,
+            stop_loop_monitor,
+        )
+
+        assert start_loop_monitor_from_settings(SimpleNamespace(event_loop_monitor_enabled=False)) is None
+
+        monitor = start_loop_monitor_from_settings(
+            SimpleNamespace(event_loop_monitor_interval_ms=20.0, event_loop_blocking_threshold_ms=0.0)
+        )
+        try:
+            assert get_loop_monitor() is monitor
+            assert monitor.interval == pytest.approx(0.02)
+            assert monitor.blocking_threshold is None
+        finally:
+            stop_loop_monitor()
+        assert get_loop_monitor() is None
+
+
+@pytest.mark.xdist_group(name="loop_monitor_tests")
+class TestDebugLoopEndpoint:
+    """Tests for GET /debug/loop"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def _client(self, roles):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from mcp_server_langgraph.api.debug import get_current_user, router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": "user:alice", "roles": roles}
+        return TestClient(app)
+
+    def test_requires_admin(self):
+        """Non-admin users get 403"""
+        response = self._client(["user"]).get("/debug/loop")
+
+        assert response.status_code == 403
+
+    def test_reports_monitor_state_for_admin(self):
+        """Admins get the monitor snapshot (or a not-running notice)"""
+        response = self._client(["admin"]).get("/debug/loop")
+
+        assert response.status_code == 200
+        assert "running" in response.json()
@@ -0,0 +1,172 @@
+"""
+Tests for the sampling profiler and /debug/profile.
+
+Covers:
+- Samples are attributed to tag_stage()/run_tagged() stages, including nesting
+- Collapsed and speedscope output formats
+- /debug/profile is opt-in and admin-only
+"""
+
+import asyncio
+import gc
+import sys
+import threading
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.mark.xdist_group(name="profiler_tests")
+class TestStackSampler:
+    """Tests for StackSampler and stage tagging"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_sync_stage_tagging(self):
+        """Samples inside a tag_stage() wrapper carry its tag"""
+        from mcp_server_langgraph.observability.profiler import StackSampler, tag_stage
+
+        sampler = StackSampler(interval=0.002, threads={threading.get_ident()})
+        sampler.start()
+        tag_stage("node:busy", _busy)(0.2)
+        sampler.stop()
+
+        stages = sampler.stage_totals()
+        assert stages.get("node:busy", 0) > 0
+        assert max(stages, key=stages.get) == "node:busy"
+
+    async def test_async_nested_tags(self):
+        """A tool awaited inside a tagged node is attributed to node/tool"""
+        from mcp_server_langgraph.observability.profiler import StackSampler, run_tagged, tag_stage
+
+        async def tool():
+            _busy(0.2)
+            return "ok"
+
+        async def node():
+            return await run_tagged("tool:search", tool())
+
+        sampler = StackSampler(interval=0.002, threads={threading.get_ident()})
+        sampler.start()
+        result = await tag_stage("node:use_tools", node)()
+        sampler.stop()
+
+        assert result == "ok"
+        assert sampler.stage_totals().get("node:use_tools/tool:search", 0) > 0
+
+    def test_outer_tags_survive_max_depth(self):
+        """Stacks deeper than max_depth keep their innermost frames and their outer stage tags"""
+        from mcp_server_langgraph.observability.profiler import _sample_stack, tag_stage
+
+        def recurse(depth: int):
+            if depth == 0:
+                return _sample_stack(sys._getframe(), max_depth=8)
+            return recurse(depth - 1)
+
+        tag, frames = tag_stage("node:deep", recurse)(50)
+
+        assert tag == "node:deep"
+        assert len(frames) == 8
+        assert all(label.endswith(":recurse") for label, _, _ in frames)
+
+    def test_wrapper_preserves_signature(self):
+        """Tagged nodes keep the wrapped function's name and annotations (LangGraph inspects them)"""
+        from mcp_server_langgraph.observability.profiler import tag_stage
+
+        async def generate_response(state: dict) -> dict:
+            return state
+
+        tagged = tag_stage("node:generate_response", generate_response)
+
+        assert tagged.__name__ == "generate_response"
+        assert asyncio.iscoroutinefunction(tagged)
+        assert tagged.__annotations__ == generate_response.__annotations__
+
+    def test_collapsed_and_speedscope_output(self):
+        """Both export formats include the stage and the sampled frames"""
+        from mcp_server_langgraph.observability.profiler import SPEEDSCOPE_SCHEMA, StackSampler, tag_stage
+
+        sampler = StackSampler(interval=0.002, threads={threading.get_ident()})
+        sampler.start()
+        tag_stage("node:busy", _busy)(0.1)
+        sampler.stop()
+
+        collapsed = sampler.collapsed()
+        busy_lines = [line for line in collapsed.splitlines() if line.startswith("node:busy;")]
+        assert busy_lines
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in busy_lines)
+        assert any(f"{__name__}:_busy" in line for line in busy_lines)
+
+        profile = sampler.speedscope()
+        assert profile["$schema"] == SPEEDSCOPE_SCHEMA
+        busy_profile = next(p for p in profile["profiles"] if p["name"] == "node:busy")
+        assert busy_profile["type"] == "sampled"
+        assert len(busy_profile["samples"]) == len(busy_profile["weights"])
+        frame_names = {profile["shared"]["frames"][i]["name"] for sample in busy_profile["samples"] for i in sample}
+        assert f"{__name__}:_busy" in frame_names
+
+
+@pytest.mark.xdist_group(name="profiler_tests")
+class TestDebugProfileEndpoint:
+    """Tests for GET /debug/profile"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def _client(self, roles):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from mcp_server_langgraph.api.debug import get_current_user, router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_current_user] = lambda: {"user_id": "user:alice", "roles": roles}
+        return TestClient(app)
+
+    def test_disabled_by_default(self, monkeypatch):
+        """The profiler is opt-in"""
+        from mcp_server_langgraph.api import debug
+
+        monkeypatch.setattr(debug.settings, "debug_profiler_enabled", False)
+
+        assert self._client(["admin"]).get("/debug/profile?seconds=0.1").status_code == 404
+
+    def test_requires_admin(self, monkeypatch):
+        """Non-admin users get 403 even when enabled"""
+        from mcp_server_langgraph.api import debug
+
+        monkeypatch.setattr(debug.settings, "debug_profiler_enabled", True)
+
+        assert self._client(["user"]).get("/debug/profile?seconds=0.1").status_code == 403
+
+    def test_rejects_long_profiles(self, monkeypatch):
+        """seconds is capped by debug_profiler_max_seconds"""
+        from mcp_server_langgraph.api import debug
+
+        monkeypatch.setattr(debug.settings, "debug_profiler_enabled", True)
+        monkeypatch.setattr(debug.settings, "debug_profiler_max_seconds", 5)
+
+        assert self._client(["admin"]).get("/debug/profile?seconds=10").status_code == 400
+
+    def test_returns_speedscope_profile(self, monkeypatch):
+        """Admins get a speedscope document"""
+        from mcp_server_langgraph.api import debug
+
+        monkeypatch.setattr(debug.settings, "debug_profiler_enabled", True)
+
+        response = self._client(["admin"]).get("/debug/profile?seconds=0.2&interval_ms=5&format=speedscope")
+
+        assert response.status_code == 200
+        assert response.json()["$schema"].startswith("https://www.speedscope.app")
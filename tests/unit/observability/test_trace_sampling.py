@@ -0,0 +1,193 @@
+"""
+Tests for head (rule-based, parent-based) and tail trace sampling.
+
+Covers:
+- Sampling rules parse from "pattern=ratio" and match span names and routes
+- Children follow the parent's decision
+- Head-dropped spans are non-recording unless tail sampling is on
+- The tail processor exports only error/slow traces, at root end
+"""
+
+import gc
+
+import pytest
+
+from mcp_server_langgraph.observability.sampling import (
+    RuleBasedSampler,
+    SamplingRule,
+    TailSamplingSpanProcessor,
+    create_sampler,
+    parse_sampling_rules,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def enable_otel_sdk(monkeypatch):
+    """conftest disables the SDK; these tests need real (local) tracer providers"""
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "false")
+
+
+class RecordingProcessor:
+    """Minimal SpanProcessor capturing exported spans."""
+
+    def __init__(self):
+        self.ended = []
+
+    def on_start(self, span, parent_context=None):
+        pass
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+    def shutdown(self):
+        pass
+
+    def force_flush(self, timeout_millis=30000):
+        return True
+
+
+def _provider(sampler, processor):
+    from opentelemetry.sdk.trace import TracerProvider
+
+    provider = TracerProvider(sampler=sampler)
+    provider.add_span_processor(processor)
+    return provider.get_tracer(__name__)
+
+
+@pytest.mark.xdist_group(name="trace_sampling_tests")
+class TestHeadSampling:
+    """Tests for rule-based, parent-based head sampling"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_parse_rules_skips_invalid_entries(self):
+        """Valid pairs are kept in order; malformed or out-of-range ones are ignored"""
+        rules = parse_sampling_rules("openfga.check=0.01, route:/health*=0,bogus,x=2")
+
+        assert rules == [SamplingRule("openfga.check", 0.01), SamplingRule("route:/health*", 0.0)]
+
+    def test_rules_match_name_then_route(self):
+        """First matching rule wins; route rules look at HTTP route attributes"""
+        from opentelemetry.sdk.trace.sampling import Decision
+
+        sampler = RuleBasedSampler(parse_sampling_rules("openfga.*=0,route:/health*=0"), default_ratio=1.0)
+        trace_id = 0x0AF7651916CD43DD8448EB211C80319C
+
+        assert sampler.should_sample(None, trace_id, "openfga.check").decision == Decision.DROP
+        health = sampler.should_sample(None, trace_id, "GET", attributes={"http.route": "/health/ready"})
+        assert health.decision == Decision.DROP
+        assert sampler.should_sample(None, trace_id, "mcp.streamable.message").decision == Decision.RECORD_AND_SAMPLE
+
+    def test_children_follow_parent(self):
+        """A child whose name would be dropped is still sampled under a sampled parent"""
+        processor = RecordingProcessor()
+        tracer = _provider(create_sampler(parse_sampling_rules("openfga.check=0")), processor)
+
+        with tracer.start_as_current_span("mcp.streamable.message"):
+            with tracer.start_as_current_span("openfga.check"):
+                pass
+
+        assert [span.name for span in processor.ended] == ["openfga.check", "mcp.streamable.message"]
+
+    def test_dropped_spans_skip_attribute_work(self):
+        """Without tail sampling, head-dropped spans are non-recording"""
+        processor = RecordingProcessor()
+        tracer = _provider(create_sampler(default_ratio=0.0), processor)
+
+        with tracer.start_as_current_span("openfga.check") as span:
+            assert span.is_recording() is False
+
+        assert processor.ended == []
+
+
+@pytest.mark.xdist_group(name="trace_sampling_tests")
+class TestTailSampling:
+    """Tests for the tail-sampling span processor"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    def test_error_trace_exported_at_root_end(self):
+        """A head-dropped trace with an error child is exported whole, marked sampled"""
+        from opentelemetry.trace import Status, StatusCode
+
+        exported = RecordingProcessor()
+        tail = TailSamplingSpanProcessor(exported, slow_threshold_ms=60_000)
+        tracer = _provider(create_sampler(default_ratio=0.0, tail_sampling=True), tail)
+
+        with tracer.start_as_current_span("mcp.streamable.message"):
+            with tracer.start_as_current_span("openfga.check") as child:
+                child.set_status(Status(StatusCode.ERROR))
+            assert exported.ended == []  # Nothing leaves before the root decides
+
+        assert [span.name for span in exported.ended] == ["openfga.check", "mcp.streamable.message"]
+        assert all(span.context.trace_flags.sampled for span in exported.ended)
+        assert tail.get_stats()["kept_traces"] == 1
+
+    def test_fast_successful_trace_dropped(self):
+        """Head-dropped traces without errors or slowness are discarded"""
+        exported = RecordingProcessor()
+        tail = TailSamplingSpanProcessor(exported, slow_threshold_ms=60_000)
+        tracer = _provider(create_sampler(default_ratio=0.0, tail_sampling=True), tail)
+
+        with tracer.start_as_current_span("mcp.streamable.message"):
+            with tracer.start_as_current_span("openfga.check"):
+                pass
+
+        assert exported.ended == []
+        assert tail.get_stats() == {"buffered_traces": 0, "kept_traces": 0, "dropped_traces": 1, "evicted_traces": 0}
+
+    def test_slow_root_exported(self):
+        """Roots slower than the threshold are kept"""
+        exported = RecordingProcessor()
+        tail = TailSamplingSpanProcessor(exported, slow_threshold_ms=0)
+        tracer = _provider(create_sampler(default_ratio=0.0, tail_sampling=True), tail)
+
+        with tracer.start_as_current_span("mcp.streamable.message"):
+            pass
+
+        assert [span.name for span in exported.ended] == ["mcp.streamable.message"]
+
+    def test_buffer_is_bounded(self):
+        """The oldest in-flight trace is evicted past max_traces"""
+        exported = RecordingProcessor()
+        tail = TailSamplingSpanProcessor(exported, max_traces=1)
+        tracer = _provider(create_sampler(default_ratio=0.0, tail_sampling=True), tail)
+
+        from opentelemetry import trace
+
+        roots = [tracer.start_span(f"root-{i}") for i in range(2)]
+        for root in roots:
+            with trace.use_span(root):
+                tracer.start_span("child").end()
+
+        assert tail.get_stats()["buffered_traces"] == 1
+        assert tail.get_stats()["evicted_traces"] == 1
+
+    def test_one_tail_sampler_fronts_all_exporters(self, monkeypatch):
+        """With several exporters, each trace is buffered and decided once, then fanned out"""
+        pytest.importorskip("opentelemetry.exporter.otlp.proto.http")
+        from opentelemetry.sdk.trace import SynchronousMultiSpanProcessor
+
+        from mcp_server_langgraph.observability import telemetry
+
+        monkeypatch.setattr(telemetry, "GRPC_AVAILABLE", False)
+        monkeypatch.setattr(telemetry, "HTTP_AVAILABLE", True)
+        monkeypatch.setattr(telemetry.trace, "set_tracer_provider", lambda provider: None)
+        monkeypatch.setattr(telemetry.ObservabilityConfig, "_setup_metrics", lambda self: None)
+        monkeypatch.setattr(telemetry.ObservabilityConfig, "_setup_logging", lambda self, enable_file_logging=False: None)
+
+        config = telemetry.ObservabilityConfig(enable_console_export=True, tail_sampling_enabled=True)
+        try:
+            processors = config.tracer_provider._active_span_processor._span_processors
+            assert processors == (config.tail_sampling_processor,)
+            fan_out = config.tail_sampling_processor.delegate
+            assert isinstance(fan_out, SynchronousMultiSpanProcessor)
+            assert len(fan_out._span_processors) == 2  # OTLP/HTTP + console
+        finally:
+            config.tracer_provider.shutdown()
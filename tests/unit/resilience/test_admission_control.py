@@ -0,0 +1,190 @@
+"""
+Unit tests for priority-aware admission control and request deadlines.
+
+Tests:
+- Control-plane methods bypass admission
+- Higher tiers are served before lower tiers once queued
+- Requests are shed early (with retry_after) when estimated wait exceeds budget
+- Request deadlines bound queue budgets and with_timeout()
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.xdist_group(name="admission_control")
+class TestRequestClassification:
+    """Test mapping of MCP requests to priorities."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    def test_control_methods_bypass_admission(self):
+        """initialize and tools/list should never queue."""
+        from mcp_server_langgraph.resilience.admission import RequestPriority, classify_request
+
+        assert classify_request("initialize") == RequestPriority.CRITICAL
+        assert classify_request("tools/list", tier="free") == RequestPriority.CRITICAL
+
+    @pytest.mark.unit
+    def test_tier_and_tool_weight(self):
+        """Paid tiers rank higher; lightweight tools get one level of boost."""
+        from mcp_server_langgraph.resilience.admission import RequestPriority, classify_request
+
+        assert classify_request("tools/call", "agent_chat", "enterprise") == RequestPriority.HIGH
+        assert classify_request("tools/call", "agent_chat", "standard") == RequestPriority.NORMAL
+        assert classify_request("tools/call", "agent_chat", "anonymous") == RequestPriority.LOW
+        assert classify_request("tools/call", "search_tools", "free") == RequestPriority.NORMAL
+
+    def test_token_in_arguments_is_not_anonymous(self):
+        """Tool calls authenticating through their arguments are not queued as anonymous"""
+        from mcp_server_langgraph.resilience.admission import RequestPriority, classify_request
+
+        assert classify_request("tools/call", "agent_chat", "anonymous", has_argument_token=True) == RequestPriority.NORMAL
+        # A tier the middleware did verify takes precedence
+        assert classify_request("tools/call", "agent_chat", "premium", has_argument_token=True) == RequestPriority.HIGH
+
+
+@pytest.mark.xdist_group(name="admission_control")
+class TestAdmissionController:
+    """Test queueing and load shedding."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    async def test_high_priority_served_before_low(self):
+        """When a slot frees up, the highest priority waiter gets it."""
+        from mcp_server_langgraph.resilience.admission import AdmissionController, RequestPriority
+
+        controller = AdmissionController(
+            max_concurrent=1,
+            queue_timeouts=dict.fromkeys(RequestPriority, 5.0),
+            initial_service_time=0.01,
+        )
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.admit(RequestPriority.NORMAL):
+                await release.wait()
+
+        async def request(name: str, priority):
+            async with controller.admit(priority):
+                order.append(name)
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        low = asyncio.create_task(request("low", RequestPriority.LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(request("high", RequestPriority.HIGH))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holding, low, high)
+
+        assert order == ["high", "low"]
+        assert controller.in_flight == 0
+
+    @pytest.mark.unit
+    async def test_sheds_when_estimated_wait_exceeds_budget(self):
+        """Low priority requests are rejected immediately when the queue is too long."""
+        from mcp_server_langgraph.core.exceptions import AdmissionRejectedError
+        from mcp_server_langgraph.resilience.admission import AdmissionController, RequestPriority
+
+        controller = AdmissionController(
+            max_concurrent=1,
+            queue_timeouts={RequestPriority.HIGH: 30.0, RequestPriority.NORMAL: 10.0, RequestPriority.LOW: 2.0},
+            initial_service_time=5.0,
+        )
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.admit(RequestPriority.NORMAL):
+                await release.wait()
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            async with controller.admit(RequestPriority.LOW):
+                pass
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.retry_after == 5
+        assert controller.get_stats()["rejected"] == 1
+
+        release.set()
+        await holding
+
+    @pytest.mark.unit
+    async def test_deadline_bounds_queue_budget(self):
+        """A request whose deadline is shorter than the estimated wait is shed."""
+        from mcp_server_langgraph.core.exceptions import AdmissionRejectedError
+        from mcp_server_langgraph.resilience.admission import AdmissionController, RequestPriority
+        from mcp_server_langgraph.resilience.deadline import deadline_scope
+
+        controller = AdmissionController(
+            max_concurrent=1,
+            queue_timeouts=dict.fromkeys(RequestPriority, 60.0),
+            initial_service_time=1.0,
+        )
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.admit(RequestPriority.NORMAL):
+                await release.wait()
+
+        holding = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        with deadline_scope(0.5), pytest.raises(AdmissionRejectedError):
+            async with controller.admit(RequestPriority.HIGH):
+                pass
+
+        release.set()
+        await holding
+
+
+@pytest.mark.xdist_group(name="admission_control")
+class TestRequestDeadline:
+    """Test the request-scoped deadline contextvar."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    def test_nested_scope_only_tightens(self):
+        """An inner scope cannot extend the outer deadline."""
+        from mcp_server_langgraph.resilience.deadline import deadline_scope, get_deadline, get_remaining_time
+
+        assert get_deadline() is None
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(100.0) as inner:
+                assert inner == outer
+            assert get_remaining_time() <= 1.0
+        assert get_deadline() is None
+
+    @pytest.mark.unit
+    async def test_with_timeout_bounded_by_deadline(self):
+        """with_timeout() should fire at the deadline, not its own (longer) timeout."""
+        from mcp_server_langgraph.core.exceptions import TimeoutError as MCPTimeoutError
+        from mcp_server_langgraph.resilience.deadline import deadline_scope
+        from mcp_server_langgraph.resilience.timeout import with_timeout
+
+        @with_timeout(seconds=30)
+        async def slow():
+            await asyncio.sleep(5)
+
+        with deadline_scope(0.05), pytest.raises(MCPTimeoutError) as exc_info:
+            await slow()
+
+        assert exc_info.value.metadata["timeout_seconds"] <= 0.05
@@ -0,0 +1,86 @@
+"""
+Unit tests for request deadline propagation.
+
+Tests that a request-scoped deadline is honored by:
+- retry_with_backoff (no retry when the backoff would outlive the deadline)
+- ParallelToolExecutor (task timeouts bounded by the deadline)
+- The /message handler (tool calls cancelled when the client disconnects)
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.xdist_group(name="deadline_propagation")
+class TestDeadlinePropagation:
+    """Test deadline consumption across resilience layers."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    async def test_retry_stops_when_deadline_exhausted(self):
+        """Retries whose backoff exceeds the remaining budget are skipped."""
+        from mcp_server_langgraph.core.exceptions import RetryExhaustedError
+        from mcp_server_langgraph.resilience.deadline import deadline_scope
+        from mcp_server_langgraph.resilience.retry import RetryStrategy, retry_with_backoff
+
+        calls = 0
+
+        @retry_with_backoff(max_attempts=5, exponential_base=2.0, retry_on=ConnectionError, strategy=RetryStrategy.FIXED)
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("down")
+
+        with deadline_scope(0.5), pytest.raises(RetryExhaustedError) as exc_info:
+            await flaky()
+
+        assert calls == 1
+        assert exc_info.value.metadata["deadline_exhausted"] is True
+
+    @pytest.mark.unit
+    async def test_parallel_executor_bounded_by_deadline(self):
+        """Tool tasks time out at the request deadline even without a task timeout."""
+        from mcp_server_langgraph.core.parallel_executor import ParallelToolExecutor, ToolInvocation
+        from mcp_server_langgraph.resilience.deadline import deadline_scope
+
+        async def slow_tool(name, args):
+            await asyncio.sleep(5)
+
+        executor = ParallelToolExecutor(max_parallelism=2)
+        invocations = [ToolInvocation(tool_name="slow", arguments={}, invocation_id="1")]
+
+        with deadline_scope(0.05):
+            results = await asyncio.wait_for(executor.execute_parallel(invocations, slow_tool), timeout=2.0)
+
+        assert isinstance(results[0].error, TimeoutError)
+
+    @pytest.mark.unit
+    async def test_tool_call_cancelled_on_client_disconnect(self, monkeypatch):
+        """An in-flight tool call is cancelled once the client goes away."""
+        from mcp_server_langgraph.mcp import server_streamable
+
+        monkeypatch.setattr(server_streamable, "DISCONNECT_POLL_INTERVAL_SECONDS", 0.01)
+        cancelled = asyncio.Event()
+
+        class DisconnectedRequest:
+            async def is_disconnected(self) -> bool:
+                return True
+
+        async def long_tool_call():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(server_streamable.ClientDisconnectedError):
+            await server_streamable._run_until_disconnect(DisconnectedRequest(), long_tool_call())
+
+        assert cancelled.is_set()
@@ -0,0 +1,346 @@
+"""
+Unit tests for distributed (cross-replica) rate limiting and bulkheads.
+
+Redis is replaced by an in-memory fake that mirrors the Lua scripts, so these
+tests cover the leasing/fallback logic without a running Redis:
+- Tokens are leased in batches and spent locally between Redis round trips
+- Several "replicas" share one global budget
+- Global concurrency slots are shared and released
+- Redis failures degrade to local per-process limits, with backoff
+- Global slots held longer than the lease TTL are renewed
+- with_bulkhead bounds (or, with wait=False, skips) waiting for a global slot
+"""
+
+import asyncio
+import gc
+import time
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class FakeLimiterRedis:
+    """In-memory stand-in for the Lua scripts used by resilience.distributed."""
+
+    def __init__(self):
+        self.buckets: dict[str, dict[str, float]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.eval_calls = 0
+        self.fail = False
+        self.clock_skew = 0.0  # Redis TIME minus the local clock
+
+    async def eval(self, script, numkeys, key, *args):
+        from mcp_server_langgraph.resilience.distributed import (
+            SEMAPHORE_ACQUIRE_SCRIPT,
+            SEMAPHORE_ACTIVE_SCRIPT,
+            SEMAPHORE_RENEW_SCRIPT,
+            TOKEN_BUCKET_LEASE_SCRIPT,
+        )
+
+        self.eval_calls += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+
+        now = time.time() + self.clock_skew
+        if script == TOKEN_BUCKET_LEASE_SCRIPT:
+            capacity, rate, requested = float(args[0]), float(args[1]), int(args[2])
+            state = self.buckets.setdefault(key, {"tokens": capacity, "ts": now})
+            tokens = min(capacity, state["tokens"] + max(0.0, now - state["ts"]) * rate)
+            granted = min(requested, int(tokens))
+            tokens -= granted
+            self.buckets[key] = {"tokens": tokens, "ts": now}
+            wait = (1 - tokens) / rate if granted == 0 else 0
+            return [granted, str(wait)]
+
+        if script == SEMAPHORE_ACQUIRE_SCRIPT:
+            limit, holder, ttl = int(args[0]), args[1], float(args[2])
+            zset = self.zsets.setdefault(key, {})
+            for member, expiry in list(zset.items()):
+                if expiry <= now:
+                    del zset[member]
+            if len(zset) < limit:
+                zset[holder] = now + ttl
+                return 1
+            return 0
+
+        if script == SEMAPHORE_RENEW_SCRIPT:
+            holder, ttl = args[0], float(args[1])
+            zset = self.zsets.setdefault(key, {})
+            if zset.get(holder, 0) <= now:
+                return 0
+            zset[holder] = now + ttl
+            return 1
+
+        if script == SEMAPHORE_ACTIVE_SCRIPT:
+            return len([expiry for expiry in self.zsets.get(key, {}).values() if expiry > now])
+
+        raise AssertionError("unexpected script")
+
+    async def zrem(self, key, member):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.zsets.get(key, {}).pop(member, None)
+
+
+@pytest.mark.xdist_group(name="distributed_rate_limit")
+class TestDistributedTokenBucket:
+    """Test the Redis-backed token bucket with local leasing."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    def test_lease_size_capped_at_ten_percent_of_capacity(self):
+        """Small buckets lease one token at a time to stay exact."""
+        from mcp_server_langgraph.resilience.distributed import DistributedTokenBucket
+
+        small = DistributedTokenBucket("anthropic", capacity=8.3, refill_rate=0.83, redis_client=FakeLimiterRedis())
+        large = DistributedTokenBucket("openai", capacity=1000, refill_rate=100, redis_client=FakeLimiterRedis())
+
+        assert small.lease_size == 1
+        assert large.lease_size == 5
+
+    @pytest.mark.unit
+    async def test_leased_tokens_avoid_redis_round_trips(self):
+        """A batch lease should serve several acquisitions with one eval."""
+        from mcp_server_langgraph.resilience.distributed import DistributedTokenBucket
+
+        fake = FakeLimiterRedis()
+        bucket = DistributedTokenBucket("openai", capacity=100, refill_rate=10, redis_client=fake, lease_size=5)
+
+        for _ in range(5):
+            await bucket.acquire(timeout=1.0)
+
+        assert fake.eval_calls == 1
+        assert bucket.leased_tokens == 0
+
+    @pytest.mark.unit
+    async def test_replicas_share_global_budget(self):
+        """Two buckets on the same key must not exceed the shared capacity."""
+        from mcp_server_langgraph.resilience.distributed import DistributedTokenBucket
+
+        fake = FakeLimiterRedis()
+        replica_a = DistributedTokenBucket("p", capacity=3, refill_rate=0.001, redis_client=fake)
+        replica_b = DistributedTokenBucket("p", capacity=3, refill_rate=0.001, redis_client=fake)
+
+        await replica_a.acquire(timeout=0.1)
+        await replica_b.acquire(timeout=0.1)
+        await replica_a.acquire(timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            await replica_b.acquire(timeout=0.05)
+
+    @pytest.mark.unit
+    async def test_falls_back_to_local_bucket_when_redis_fails(self):
+        """Redis errors should degrade to the local per-process bucket."""
+        from mcp_server_langgraph.resilience.distributed import DistributedTokenBucket
+        from mcp_server_langgraph.resilience.rate_limit import TokenBucket
+
+        fake = FakeLimiterRedis()
+        fake.fail = True
+        local = TokenBucket(capacity=2, refill_rate=1.0)
+        bucket = DistributedTokenBucket("p", capacity=2, refill_rate=1.0, redis_client=fake, fallback=local)
+
+        await bucket.acquire(timeout=0.1)
+
+        assert local.tokens == pytest.approx(1, abs=0.1)
+
+    @pytest.mark.unit
+    async def test_redis_outage_backs_off_and_logs_once(self, caplog):
+        """While Redis is down, calls use the local bucket without retrying Redis each time."""
+        from mcp_server_langgraph.resilience.distributed import DistributedTokenBucket
+
+        fake = FakeLimiterRedis()
+        fake.fail = True
+        bucket = DistributedTokenBucket("p", capacity=100, refill_rate=100, redis_client=fake)
+
+        with caplog.at_level("WARNING", logger="mcp_server_langgraph.resilience.distributed"):
+            for _ in range(5):
+                await bucket.acquire(timeout=0.1)
+
+        assert fake.eval_calls == 1
+        assert len([r for r in caplog.records if "unavailable" in r.message]) == 1
+
+    @pytest.mark.unit
+    async def test_redis_retried_after_backoff(self):
+        """Once the backoff elapses, Redis is tried again and the outage ends."""
+        from mcp_server_langgraph.resilience.distributed import DistributedTokenBucket
+
+        fake = FakeLimiterRedis()
+        fake.fail = True
+        bucket = DistributedTokenBucket("p", capacity=100, refill_rate=100, redis_client=fake, lease_size=1)
+        bucket._outage.min_backoff = 0.05
+
+        await bucket.acquire(timeout=0.1)
+        fake.fail = False
+        time.sleep(0.06)
+        await bucket.acquire(timeout=0.1)
+
+        assert fake.eval_calls == 2
+        assert bucket._outage.in_outage is False
+
+
+@pytest.mark.xdist_group(name="distributed_rate_limit")
+class TestDistributedSemaphore:
+    """Test the Redis-backed global concurrency limit."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    async def test_limit_is_shared_and_released(self):
+        """Slots are shared across instances and freed on release."""
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        replica_a = DistributedSemaphore("llm", limit=1, redis_client=fake, poll_interval=0.01)
+        replica_b = DistributedSemaphore("llm", limit=1, redis_client=fake, poll_interval=0.01)
+
+        holder = await replica_a.acquire(timeout=0.1)
+        assert await replica_b.try_acquire() is None
+
+        await replica_a.release(holder)
+        assert await replica_b.try_acquire() is not None
+
+    @pytest.mark.unit
+    async def test_slot_fails_open_when_redis_down(self):
+        """The slot context manager runs the block if Redis is unreachable."""
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        fake.fail = True
+        semaphore = DistributedSemaphore("llm", limit=1, redis_client=fake)
+
+        ran = False
+        async with semaphore.slot(timeout=0.1):
+            ran = True
+
+        assert ran is True
+
+    @pytest.mark.unit
+    async def test_slot_skips_redis_during_outage(self):
+        """After a failure, further slots run locally without another Redis call."""
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        fake.fail = True
+        semaphore = DistributedSemaphore("llm", limit=1, redis_client=fake)
+
+        for _ in range(3):
+            async with semaphore.slot(timeout=0.1):
+                pass
+
+        assert fake.eval_calls == 1
+
+    @pytest.mark.unit
+    async def test_slot_lease_renewed_while_held(self):
+        """A slot held past lease_ttl must not be handed to another replica."""
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        replica_a = DistributedSemaphore("llm", limit=1, redis_client=fake, lease_ttl=0.15)
+        replica_b = DistributedSemaphore("llm", limit=1, redis_client=fake, lease_ttl=0.15)
+
+        async with replica_a.slot(timeout=0.1):
+            await asyncio.sleep(0.4)
+            assert await replica_b.try_acquire() is None
+
+        assert await replica_b.try_acquire() is not None
+
+    @pytest.mark.unit
+    async def test_renew_reports_expired_slot(self):
+        """Renewing a slot that already expired returns False instead of resurrecting it."""
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        semaphore = DistributedSemaphore("llm", limit=1, redis_client=fake, lease_ttl=0.05)
+
+        holder = await semaphore.acquire(timeout=0.1)
+        assert await semaphore.renew(holder) is True
+        await asyncio.sleep(0.1)
+
+        assert await semaphore.renew(holder) is False
+
+    @pytest.mark.unit
+    async def test_active_counts_leases_by_redis_clock(self):
+        """Held slots are counted against Redis TIME, not the (possibly skewed) local clock."""
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        semaphore = DistributedSemaphore("llm", limit=2, redis_client=fake, lease_ttl=30)
+
+        await semaphore.acquire(timeout=0.1)
+        assert await semaphore.active() == 1
+
+        # Redis clock is past the lease expiry while the local clock is not
+        fake.clock_skew = 60.0
+        assert await semaphore.active() == 0
+
+    @pytest.mark.unit
+    async def test_bulkhead_fail_fast_applies_to_global_slot(self, monkeypatch):
+        """wait=False rejects immediately when the global slot is full, even with local slots free."""
+        from mcp_server_langgraph.core.exceptions import BulkheadRejectedError
+        from mcp_server_langgraph.resilience import bulkhead
+        from mcp_server_langgraph.resilience.bulkhead import reset_all_bulkheads, with_bulkhead
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        semaphore = DistributedSemaphore("global_fail_fast_test", limit=1, redis_client=fake)
+        await semaphore.acquire(timeout=0.1)  # Another replica holds the only slot
+        monkeypatch.setattr(bulkhead, "get_global_bulkhead", lambda resource_type, limit: semaphore)
+        reset_all_bulkheads()
+
+        @with_bulkhead(resource_type="global_fail_fast_test", limit=5, wait=False)
+        async def call() -> None:
+            raise AssertionError("must not run without a global slot")
+
+        try:
+            start = time.monotonic()
+            with pytest.raises(BulkheadRejectedError):
+                await call()
+            assert time.monotonic() - start < 0.5
+        finally:
+            reset_all_bulkheads()
+
+    @pytest.mark.unit
+    async def test_bulkhead_global_slot_wait_is_bounded(self, monkeypatch):
+        """Waiting for a global slot is bounded by the operation timeout (or request deadline)."""
+        from mcp_server_langgraph.core.exceptions import BulkheadRejectedError
+        from mcp_server_langgraph.resilience import bulkhead
+        from mcp_server_langgraph.resilience.bulkhead import reset_all_bulkheads, with_bulkhead
+        from mcp_server_langgraph.resilience.deadline import deadline_scope
+        from mcp_server_langgraph.resilience.distributed import DistributedSemaphore
+
+        fake = FakeLimiterRedis()
+        semaphore = DistributedSemaphore("global_wait_test", limit=1, redis_client=fake, poll_interval=0.01)
+        await semaphore.acquire(timeout=0.1)
+        monkeypatch.setattr(bulkhead, "get_global_bulkhead", lambda resource_type, limit: semaphore)
+        reset_all_bulkheads()
+
+        @with_bulkhead(resource_type="global_wait_test", limit=5)
+        async def call() -> None:
+            raise AssertionError("must not run without a global slot")
+
+        try:
+            with deadline_scope(0.1), pytest.raises(BulkheadRejectedError):
+                await call()
+            # The local slot is released after the rejection
+            assert bulkhead.get_bulkhead("global_wait_test")._value == 5
+        finally:
+            reset_all_bulkheads()
+
+    @pytest.mark.unit
+    def test_global_bulkhead_disabled_by_default(self):
+        """Without RESILIENCE_DISTRIBUTED_ENABLED, no global bulkhead is used."""
+        from mcp_server_langgraph.resilience.config import ResilienceConfig, set_resilience_config
+        from mcp_server_langgraph.resilience.distributed import get_global_bulkhead, reset_all_distributed_limiters
+
+        set_resilience_config(ResilienceConfig())
+        try:
+            assert get_global_bulkhead("llm", 10) is None
+        finally:
+            set_resilience_config(None)  # type: ignore[arg-type]
+            reset_all_distributed_limiters()
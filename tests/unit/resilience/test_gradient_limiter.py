@@ -0,0 +1,265 @@
+"""
+Unit tests for the latency-gradient concurrency limiter.
+
+Tests for RTT-driven limit adjustment (Netflix concurrency-limits Gradient2 style):
+- ResizableLimiter changes its limit in place without dropping waiters
+- Flat latency under load grows the limit
+- Rising latency shrinks the limit
+- Capacity errors (429/529) apply a multiplicative decrease
+- Zero-RTT samples are clamped rather than dividing by zero
+- App-limited samples (low utilization) do not grow the limit
+- The fixed bulkhead is bypassed when adaptive limits size concurrency,
+  but the global (cross-replica) slot is still taken
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.xdist_group(name="gradient_limiter")
+class TestResizableLimiter:
+    """Test the in-place resizable limiter."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    async def test_limits_concurrency(self):
+        """Limiter should cap concurrent holders at the limit."""
+        from mcp_server_langgraph.resilience.adaptive import ResizableLimiter
+
+        limiter = ResizableLimiter(limit=2)
+        concurrent = 0
+        max_concurrent = 0
+
+        async def work():
+            nonlocal concurrent, max_concurrent
+            async with limiter:
+                concurrent += 1
+                max_concurrent = max(max_concurrent, concurrent)
+                await asyncio.sleep(0.01)
+                concurrent -= 1
+
+        await asyncio.gather(*[work() for _ in range(6)])
+
+        assert max_concurrent == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.unit
+    async def test_raising_limit_wakes_waiters(self):
+        """Growing the limit should admit queued waiters immediately."""
+        from mcp_server_langgraph.resilience.adaptive import ResizableLimiter
+
+        limiter = ResizableLimiter(limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        limiter.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert limiter.in_flight == 2
+
+    @pytest.mark.unit
+    async def test_lowering_limit_drains_in_flight(self):
+        """Shrinking the limit should hold new callers until holders drain."""
+        from mcp_server_langgraph.resilience.adaptive import ResizableLimiter
+
+        limiter = ResizableLimiter(limit=3)
+        for _ in range(3):
+            await limiter.acquire()
+
+        limiter.set_limit(1)
+        waiter = asyncio.create_task(limiter.acquire())
+
+        limiter.release()
+        limiter.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert limiter.in_flight == 1
+
+    @pytest.mark.unit
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """Cancelling a queued waiter must not consume a slot."""
+        from mcp_server_langgraph.resilience.adaptive import ResizableLimiter
+
+        limiter = ResizableLimiter(limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+        assert limiter.waiting == 0
+
+
+@pytest.mark.xdist_group(name="gradient_limiter")
+class TestGradientLimiter:
+    """Test RTT-driven limit adjustment."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    def test_flat_latency_under_load_grows_limit(self):
+        """Stable RTT at full utilization should probe the limit upward."""
+        from mcp_server_langgraph.resilience.adaptive import GradientLimiter
+
+        limiter = GradientLimiter("test", initial_limit=10, min_limit=2, max_limit=50)
+
+        for _ in range(50):
+            limiter.on_sample(rtt=1.0, in_flight=limiter.current_limit)
+
+        assert limiter.current_limit > 10
+
+    @pytest.mark.unit
+    def test_rising_latency_shrinks_limit(self):
+        """RTT well above baseline should pull the limit down."""
+        from mcp_server_langgraph.resilience.adaptive import GradientLimiter
+
+        limiter = GradientLimiter("test", initial_limit=20, min_limit=2, max_limit=50)
+        for _ in range(100):
+            limiter.on_sample(rtt=1.0, in_flight=limiter.current_limit)
+        grown = limiter.current_limit
+
+        for _ in range(30):
+            limiter.on_sample(rtt=5.0, in_flight=limiter.current_limit)
+
+        assert limiter.current_limit < grown
+        assert limiter.get_stats()["min_rtt"] == 1.0
+
+    @pytest.mark.unit
+    def test_zero_rtt_sample_does_not_raise(self):
+        """A 0.0 RTT (coarse clock, mocked call) is clamped instead of dividing by zero."""
+        from mcp_server_langgraph.resilience.adaptive import GradientLimiter
+
+        limiter = GradientLimiter("p", initial_limit=10, min_limit=2, max_limit=50)
+        limiter.on_sample(0.0, 1)
+        for _ in range(20):
+            limiter.on_sample(rtt=0.0, in_flight=limiter.current_limit)
+
+        assert limiter.get_stats()["min_rtt"] > 0
+        assert 2 <= limiter.current_limit <= 50
+
+    @pytest.mark.unit
+    def test_capacity_error_decreases_limit(self):
+        """A dropped (429/529) sample should decrease the limit multiplicatively."""
+        from mcp_server_langgraph.resilience.adaptive import GradientLimiter
+
+        limiter = GradientLimiter("test", initial_limit=20, min_limit=2, max_limit=50, backoff_ratio=0.5)
+        limiter.on_sample(rtt=1.0, in_flight=20, dropped=True)
+
+        assert limiter.current_limit == 10
+
+    @pytest.mark.unit
+    def test_app_limited_samples_do_not_grow_limit(self):
+        """Low utilization should leave the limit unchanged."""
+        from mcp_server_langgraph.resilience.adaptive import GradientLimiter
+
+        limiter = GradientLimiter("test", initial_limit=20, min_limit=2, max_limit=50)
+        for _ in range(50):
+            limiter.on_sample(rtt=1.0, in_flight=1)
+
+        assert limiter.current_limit == 20
+
+    @pytest.mark.unit
+    async def test_acquire_classifies_rate_limit_errors(self):
+        """Exceptions with status 429 inside acquire() count as drops."""
+        from mcp_server_langgraph.resilience.adaptive import GradientLimiter
+
+        class RateLimited(Exception):
+            status_code = 429
+
+        limiter = GradientLimiter("test", initial_limit=10, min_limit=2, max_limit=50, backoff_ratio=0.5)
+        with pytest.raises(RateLimited):
+            async with limiter.acquire():
+                raise RateLimited("slow down")
+
+        assert limiter.current_limit == 5
+        assert limiter.limiter.in_flight == 0
+
+    @pytest.mark.unit
+    def test_provider_limiter_starts_at_provider_limit(self):
+        """Provider limiters start at get_provider_limit and are cached."""
+        from mcp_server_langgraph.resilience.adaptive import get_provider_gradient_limiter, reset_all_gradient_limiters
+        from mcp_server_langgraph.resilience.config import get_provider_limit
+
+        reset_all_gradient_limiters()
+        try:
+            limiter = get_provider_gradient_limiter("anthropic")
+            assert limiter.current_limit == get_provider_limit("anthropic")
+            assert get_provider_gradient_limiter("anthropic") is limiter
+        finally:
+            reset_all_gradient_limiters()
+
+    @pytest.mark.unit
+    async def test_bulkhead_bypassed_for_adaptive_limits(self):
+        """A bulkhead with bypass_when does not cap calls the adaptive limiter already sizes."""
+        from mcp_server_langgraph.resilience.bulkhead import reset_all_bulkheads, with_bulkhead
+
+        reset_all_bulkheads()
+        bypass = True
+        running = 0
+        peak = 0
+
+        @with_bulkhead(resource_type="gradient_bypass_test", limit=1, bypass_when=lambda: bypass)
+        async def call() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        try:
+            await asyncio.gather(*(call() for _ in range(3)))
+            assert peak == 3
+
+            bypass, peak = False, 0
+            await asyncio.gather(*(call() for _ in range(3)))
+            assert peak == 1
+        finally:
+            reset_all_bulkheads()
+
+    @pytest.mark.unit
+    async def test_bulkhead_bypass_still_takes_global_slot(self, monkeypatch):
+        """Bypassing the local semaphore must not skip the cross-replica slot."""
+        from contextlib import asynccontextmanager
+
+        from mcp_server_langgraph.resilience import bulkhead
+        from mcp_server_langgraph.resilience.bulkhead import reset_all_bulkheads, with_bulkhead
+
+        slots_taken = []
+
+        class FakeGlobalBulkhead:
+            @asynccontextmanager
+            async def slot(self, timeout=None):
+                slots_taken.append(timeout)
+                yield
+
+        monkeypatch.setattr(bulkhead, "get_global_bulkhead", lambda resource_type, limit: FakeGlobalBulkhead())
+        reset_all_bulkheads()
+
+        @with_bulkhead(resource_type="gradient_bypass_global_test", limit=1, bypass_when=lambda: True)
+        async def call() -> str:
+            return "ok"
+
+        try:
+            assert await call() == "ok"
+            assert len(slots_taken) == 1
+        finally:
+            reset_all_bulkheads()
@@ -0,0 +1,128 @@
+"""
+Unit tests for per-dependency retry budgets.
+
+Tests:
+- Requests deposit a fraction of a retry token; retries withdraw one
+- An exhausted budget makes retry_with_backoff fail fast
+- The shared (Redis) budget flushes batched deposits and falls back locally
+"""
+
+import gc
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class FakeBudgetRedis:
+    """In-memory stand-in for RETRY_BUDGET_WITHDRAW_SCRIPT."""
+
+    def __init__(self, balance: float):
+        self.balance = balance
+        self.deposits_seen: list[int] = []
+        self.fail = False
+
+    async def eval(self, script, numkeys, key, ratio, min_rate, max_balance, deposits):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.deposits_seen.append(deposits)
+        self.balance = min(max_balance, self.balance + deposits * ratio)
+        if self.balance >= 1:
+            self.balance -= 1
+            return [1, str(self.balance)]
+        return [0, str(self.balance)]
+
+
+@pytest.mark.xdist_group(name="retry_budget")
+class TestRetryBudget:
+    """Test the token-bucket retry budget."""
+
+    def teardown_method(self) -> None:
+        """Force GC to prevent mock accumulation in xdist workers."""
+        gc.collect()
+
+    @pytest.mark.unit
+    def test_requests_fund_retries(self):
+        """Ten requests at ratio 0.1 should fund exactly one retry."""
+        from mcp_server_langgraph.resilience.retry_budget import RetryBudget
+
+        budget = RetryBudget("llm", ratio=0.1, min_retries_per_second=0.0, max_balance=10.0)
+        budget._balance = 0.0
+
+        assert budget.try_acquire_retry() is False
+        for _ in range(10):
+            budget.record_request()
+        assert budget.try_acquire_retry() is True
+        assert budget.try_acquire_retry() is False
+
+        stats = budget.get_stats()
+        assert stats["retries"] == 1
+        assert stats["rejected_retries"] == 2
+
+    @pytest.mark.unit
+    def test_balance_is_capped(self):
+        """Deposits cannot bank more than max_balance tokens."""
+        from mcp_server_langgraph.resilience.retry_budget import RetryBudget
+
+        budget = RetryBudget("llm", ratio=1.0, min_retries_per_second=0.0, max_balance=3.0)
+        for _ in range(100):
+            budget.record_request()
+
+        assert budget.balance == 3.0
+
+    @pytest.mark.unit
+    async def test_exhausted_budget_fails_fast(self):
+        """retry_with_backoff stops retrying once the dependency budget is spent."""
+        from mcp_server_langgraph.core.exceptions import RetryExhaustedError
+        from mcp_server_langgraph.resilience.retry import RetryStrategy, retry_with_backoff
+        from mcp_server_langgraph.resilience.retry_budget import get_retry_budget
+
+        budget = get_retry_budget("test-dependency")
+        budget.min_retries_per_second = 0.0
+        budget._balance = 0.0
+        calls = 0
+
+        @retry_with_backoff(
+            max_attempts=5,
+            exponential_base=0.01,
+            retry_on=ConnectionError,
+            strategy=RetryStrategy.FIXED,
+            budget="test-dependency",
+        )
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("brownout")
+
+        with pytest.raises(RetryExhaustedError) as exc_info:
+            await flaky()
+
+        assert calls == 1
+        assert exc_info.value.metadata["budget_exhausted"] is True
+
+    @pytest.mark.unit
+    async def test_shared_budget_flushes_deposits(self):
+        """Pending deposits are sent with the next retry withdrawal."""
+        from mcp_server_langgraph.resilience.retry_budget import RetryBudget
+
+        fake = FakeBudgetRedis(balance=0.0)
+        budget = RetryBudget("llm", ratio=0.1, redis_client=fake)
+        for _ in range(10):
+            budget.record_request()
+
+        assert await budget.acquire_retry() is True
+        assert fake.deposits_seen == [10]
+        assert await budget.acquire_retry() is False
+        assert fake.deposits_seen == [10, 0]
+
+    @pytest.mark.unit
+    async def test_shared_budget_falls_back_locally(self):
+        """Redis errors degrade to the local budget."""
+        from mcp_server_langgraph.resilience.retry_budget import RetryBudget
+
+        fake = FakeBudgetRedis(balance=0.0)
+        fake.fail = True
+        budget = RetryBudget("llm", max_balance=5.0, redis_client=fake)
+
+        assert await budget.acquire_retry() is True
+        assert budget.get_stats()["retries"] == 1
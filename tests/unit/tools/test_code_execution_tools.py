@@ -252,3 +252,90 @@ class TestCodeExecutionToolIntegration:
 
             # Should use Kubernetes sandbox
             mock_get_sandbox.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.xdist_group(name="unit_tools_code_execution_tools_tests")
+class TestSandboxCache:
+    """Test the shared sandbox cache behind _get_sandbox"""
+
+    def teardown_method(self):
+        """Force GC to prevent mock accumulation in xdist workers"""
+        gc.collect()
+
+    @pytest.fixture
+    def create_sandbox(self):
+        """Empty the cache and replace backend creation with a slow mock"""
+        import time
+
+        from mcp_server_langgraph.tools import code_execution_tools
+
+        def create(backend, limits):
+            time.sleep(0.05)  # Widen the window for concurrent first calls
+            return MagicMock(name=f"sandbox-{limits.timeout_seconds}")
+
+        with (
+            patch.dict(code_execution_tools._sandbox_cache, clear=True),
+            patch.dict(code_execution_tools._sandbox_leases, clear=True),
+            patch.dict(code_execution_tools._retired_sandboxes, clear=True),
+            patch.object(code_execution_tools, "_create_sandbox", side_effect=create) as create_mock,
+        ):
+            yield create_mock
+
+    def test_sandbox_is_reused(self, create_sandbox):
+        """Repeated calls with unchanged settings share one sandbox"""
+        from mcp_server_langgraph.tools.code_execution_tools import _get_sandbox
+
+        assert _get_sandbox() is _get_sandbox()
+        create_sandbox.assert_called_once()
+
+    def test_concurrent_first_calls_create_one_sandbox(self, create_sandbox):
+        """Threads racing on the first call get the same sandbox and none is closed"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from mcp_server_langgraph.tools.code_execution_tools import _get_sandbox
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sandboxes = list(executor.map(lambda _: _get_sandbox(), range(8)))
+
+        assert len({id(sandbox) for sandbox in sandboxes}) == 1
+        create_sandbox.assert_called_once()
+        sandboxes[0].close.assert_not_called()
+
+    def test_settings_change_rebuilds_and_closes_stale_sandbox(self, create_sandbox):
+        """A changed setting builds a new sandbox and closes the old one"""
+        from mcp_server_langgraph.tools import code_execution_tools
+        from mcp_server_langgraph.tools.code_execution_tools import _get_sandbox
+
+        first = _get_sandbox()
+        with patch.object(
+            code_execution_tools.settings,
+            "code_execution_timeout",
+            code_execution_tools.settings.code_execution_timeout + 1,
+        ):
+            second = _get_sandbox()
+
+        assert second is not first
+        first.close.assert_called_once()
+        assert list(code_execution_tools._sandbox_cache.values()) == [second]
+
+    def test_settings_change_defers_close_until_in_flight_execution_finishes(self, create_sandbox):
+        """A replaced sandbox still running code is closed only when that execution releases it"""
+        from mcp_server_langgraph.tools import code_execution_tools
+        from mcp_server_langgraph.tools.code_execution_tools import _get_sandbox, _release_sandbox
+
+        first = _get_sandbox(lease=True)
+        with patch.object(
+            code_execution_tools.settings,
+            "code_execution_timeout",
+            code_execution_tools.settings.code_execution_timeout + 1,
+        ):
+            second = _get_sandbox()
+
+        assert second is not first
+        first.close.assert_not_called()
+
+        _release_sandbox(first)
+        first.close.assert_called_once()
+        assert not code_execution_tools._retired_sandboxes
+        assert not code_execution_tools._sandbox_leases
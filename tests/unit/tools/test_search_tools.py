@@ -4,12 +4,15 @@ Unit tests for search tools
 Tests knowledge base and web search functionality.
 """
 
+import asyncio
 import gc
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
+from mcp_server_langgraph.core.dynamic_context_loader import ContextReference
+from mcp_server_langgraph.tools import search_tools
 from mcp_server_langgraph.tools.search_tools import search_knowledge_base, web_search
 
 pytestmark = pytest.mark.unit
@@ -68,60 +71,115 @@ class TestSearchKnowledgeBase:
         result = search_knowledge_base.invoke({"query": long_query, "limit": 5})
         assert isinstance(result, str)
 
-    @patch("mcp_server_langgraph.tools.search_tools.QdrantClient")
+    @staticmethod
+    def _loader(references):
+        loader = MagicMock()
+        loader.collection_name = "test_collection"
+        loader.rebuild_lexical_index = AsyncMock(return_value=len(references))
+        loader.hybrid_search = AsyncMock(return_value=references)
+        return loader
+
+    @patch.object(search_tools, "_knowledge_base", None)
+    @patch("mcp_server_langgraph.tools.search_tools.DynamicContextLoader")
     @patch("mcp_server_langgraph.tools.search_tools.settings")
-    def test_search_with_qdrant_configured(self, mock_settings, mock_qdrant_client):
-        """Test search when Qdrant is properly configured"""
-        # Configure Qdrant settings
+    def test_search_with_qdrant_configured(self, mock_settings, mock_loader_class):
+        """Test search runs hybrid retrieval and lists the hits"""
         mock_settings.qdrant_url = "http://localhost"
-        mock_settings.qdrant_port = 6333
-        mock_settings.qdrant_collection_name = "test_collection"
-
-        # Mock Qdrant client
-        mock_client_instance = MagicMock()
-        mock_qdrant_client.return_value = mock_client_instance
+        refs = [
+            ContextReference(ref_id="doc_1", ref_type="document", summary="Intro to ML", relevance_score=0.91),
+            ContextReference(ref_id="doc_2", ref_type="code", summary="Training loop", relevance_score=0.5),
+        ]
+        loader = self._loader(refs)
+        mock_loader_class.return_value = loader
 
         result = search_knowledge_base.invoke({"query": "machine learning", "limit": 5})
 
-        # Verify Qdrant client was created with correct params
-        mock_qdrant_client.assert_called_once_with(url="http://localhost", port=6333)
-        assert isinstance(result, str)
+        loader.hybrid_search.assert_awaited_once_with("machine learning", top_k=5)
         assert "machine learning" in result
         assert "test_collection" in result
+        assert "1. [document] Intro to ML (id: doc_1, score: 0.91)" in result
+        assert "2. [code] Training loop" in result
+
+    @patch.object(search_tools, "_knowledge_base", None)
+    @patch("mcp_server_langgraph.tools.search_tools.DynamicContextLoader")
+    @patch("mcp_server_langgraph.tools.search_tools.settings")
+    async def test_loader_created_once_and_lexical_index_rebuilt(self, mock_settings, mock_loader_class):
+        """Test the loader is shared across calls and its BM25 index is rebuilt on first use"""
+        mock_settings.qdrant_url = "http://localhost"
+        loader = self._loader([])
+        mock_loader_class.return_value = loader
+
+        first = await search_knowledge_base.ainvoke({"query": "ref_123"})
+        await search_knowledge_base.ainvoke({"query": "ref_456"})
+
+        mock_loader_class.assert_called_once()
+        loader.rebuild_lexical_index.assert_awaited_once()
+        assert first == 'No knowledge base results for "ref_123" in collection test_collection.'
+
+    @patch.object(search_tools, "_knowledge_base", None)
+    @patch("mcp_server_langgraph.tools.search_tools.DynamicContextLoader")
+    @patch("mcp_server_langgraph.tools.search_tools.settings")
+    async def test_concurrent_first_calls_rebuild_once(self, mock_settings, mock_loader_class):
+        """Test concurrent first searches share one loader and one full-collection rebuild"""
+        mock_settings.qdrant_url = "http://localhost"
+        loader = self._loader([])
+
+        async def slow_rebuild():
+            await asyncio.sleep(0.05)
+            return 0
 
-    @patch("mcp_server_langgraph.tools.search_tools.QdrantClient")
+        loader.rebuild_lexical_index.side_effect = slow_rebuild
+        mock_loader_class.return_value = loader
+
+        await asyncio.gather(*(search_knowledge_base.ainvoke({"query": f"q{i}"}) for i in range(5)))
+
+        mock_loader_class.assert_called_once()
+        loader.rebuild_lexical_index.assert_awaited_once()
+
+    @patch.object(search_tools, "_knowledge_base", None)
+    @patch("mcp_server_langgraph.tools.search_tools.DynamicContextLoader")
     @patch("mcp_server_langgraph.tools.search_tools.settings")
-    def test_search_qdrant_connection_error(self, mock_settings, mock_qdrant_client):
+    async def test_sync_invoke_inside_running_loop(self, mock_settings, mock_loader_class):
+        """Test sync invoke() works from a thread that is already running an event loop"""
+        mock_settings.qdrant_url = "http://localhost"
+        mock_loader_class.return_value = self._loader([])
+
+        result = search_knowledge_base.invoke({"query": "ref_123"})
+
+        assert result == 'No knowledge base results for "ref_123" in collection test_collection.'
+
+    @patch.object(search_tools, "_knowledge_base", None)
+    @patch("mcp_server_langgraph.tools.search_tools.DynamicContextLoader")
+    @patch("mcp_server_langgraph.tools.search_tools.settings")
+    def test_search_qdrant_connection_error(self, mock_settings, mock_loader_class):
         """Test search handles Qdrant connection errors gracefully"""
         mock_settings.qdrant_url = "http://localhost"
         mock_settings.qdrant_port = 6333
 
         # Simulate connection error
-        mock_qdrant_client.side_effect = ConnectionError("Connection refused")
+        mock_loader_class.side_effect = ConnectionError("Connection refused")
 
         result = search_knowledge_base.invoke({"query": "test", "limit": 5})
 
         assert isinstance(result, str)
         assert "error" in result.lower()
         assert "Connection refused" in result
+        assert "Qdrant" in result
+        assert search_tools._knowledge_base is None  # Retried on the next call
 
-    @patch("mcp_server_langgraph.tools.search_tools.QdrantClient")
+    @patch.object(search_tools, "_knowledge_base", None)
+    @patch("mcp_server_langgraph.tools.search_tools.DynamicContextLoader")
     @patch("mcp_server_langgraph.tools.search_tools.settings")
-    def test_search_qdrant_query_error(self, mock_settings, mock_qdrant_client):
-        """Test search handles Qdrant query errors"""
+    def test_search_query_error(self, mock_settings, mock_loader_class):
+        """Test search reports errors raised while searching"""
         mock_settings.qdrant_url = "http://localhost"
-        mock_settings.qdrant_port = 6333
-
-        # Mock client that raises on query
-        mock_client_instance = MagicMock()
-        mock_client_instance.search.side_effect = Exception("Collection not found")
-        mock_qdrant_client.return_value = mock_client_instance
+        loader = self._loader([])
+        loader.hybrid_search.side_effect = Exception("Collection not found")
+        mock_loader_class.return_value = loader
 
         result = search_knowledge_base.invoke({"query": "test", "limit": 5})
 
-        assert isinstance(result, str)
-        # Should show configured message even if query fails
-        assert "Qdrant" in result
+        assert result == "Error: Collection not found"
 
 
 @pytest.mark.unit